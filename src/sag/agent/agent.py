@@ -625,7 +625,7 @@ class SetupAgent:
             # Step 1: Setup Docker environment
             self._emit(EventType.PHASE_START, "Setting up environment", phase=PhaseType.SETUP)
 
-            if not self._setup_docker_environment(project_name):
+            if not self._setup_docker_environment(project_name, repository_url=project_url):
                 return self._close_open_setup_run("docker environment setup failed")
 
             # Step 1.5: Initialize context manager and tools now that Docker is ready
@@ -809,6 +809,13 @@ class SetupAgent:
                     except Exception as inner:
                         logger.warning(f"UIManager.stop() also failed: {inner}")
 
+            close_exec_agent = getattr(self.orchestrator, "close_exec_agent", None)
+            if callable(close_exec_agent):
+                try:
+                    logger.info(f"Container exec stats: {close_exec_agent()}")
+                except Exception as e:
+                    logger.warning(f"close_exec_agent failed: {e}")
+
             # Always release the command-specific loguru handler.
             session_logger = get_session_logger()
             if session_logger:
@@ -1061,7 +1068,9 @@ I should:
 Do not generate a final setup report unless the TASK explicitly asks for one.
 """
 
-    def _setup_docker_environment(self, project_name: str) -> bool:
+    def _setup_docker_environment(
+        self, project_name: str, repository_url: Optional[str] = None
+    ) -> bool:
         """Setup the Docker environment for the project."""
 
         if self.config.ui_mode:
@@ -1074,7 +1083,7 @@ Do not generate a final setup report unless the TASK explicitly asks for one.
             self._emit(EventType.STATUS_UPDATE, "Creating container...", phase=PhaseType.SETUP)
 
             try:
-                success = self.orchestrator.create_and_start_container()
+                success = self.orchestrator.create_and_start_container(repository_url)
 
                 if success:
                     self._emit(
@@ -1122,7 +1131,7 @@ Do not generate a final setup report unless the TASK explicitly asks for one.
 
                 try:
                     # Create and start container
-                    success = self.orchestrator.create_and_start_container()
+                    success = self.orchestrator.create_and_start_container(repository_url)
 
                     if success:
                         progress.update(task, description="✅ Docker environment ready")
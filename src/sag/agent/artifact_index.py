@@ -0,0 +1,267 @@
+"""Incremental, mtime-keyed index of a project's compiled build artifacts.
+
+The artifact checks used to walk the whole project once per question: one
+``find`` to count ``.class`` files, another to list them, one for JARs, one more
+for the complete-artifact count, and a recency check that forked ``stat`` once
+per class file. The index answers all of them from a single walk.
+
+``ARTIFACT_INDEX_SCRIPT`` runs inside the container. The first pass records
+path, size and mtime for every ``.class``/``.jar`` under the project with one
+``find -printf`` and persists it under ``.setup_agent``. Later passes only ask
+``find`` for what changed since the recorded scan time (``-newerct``: unlike
+``-newermt`` it also catches files moved in with an old mtime), re-list the
+directories whose entries changed, and drop entries that vanished with a
+deleted file or subtree. The script prints a compact summary, never the index
+itself, so the transfer stays small however large the project is.
+"""
+
+from __future__ import annotations
+
+import json
+import shlex
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+ARTIFACT_INDEX_DIRNAME = ".setup_agent/artifact_index"
+
+# Class files sampled into the summary for evidence and debugging.
+CLASS_SAMPLE_SIZE = 100
+
+# Runs with the container's python3: argv = project_dir, index_path, full ("1"/"0").
+ARTIFACT_INDEX_SCRIPT = """\
+import json
+import os
+import subprocess
+import sys
+import time
+
+project_dir = sys.argv[1].rstrip("/") or "/"
+index_path = sys.argv[2]
+full = sys.argv[3] == "1"
+stamp_path = index_path + ".stamp"
+SUFFIXES = (".class", ".jar")
+OUTPUT_DIRS = ("target", "build")
+
+
+def emit(payload):
+    print(json.dumps(payload, separators=(",", ":")))
+    sys.exit(0)
+
+
+if subprocess.run(
+    ["find", "/", "-maxdepth", "0", "-printf", ""],
+    stdout=subprocess.DEVNULL,
+    stderr=subprocess.DEVNULL,
+).returncode != 0:
+    emit({"error": "find -printf is not supported"})
+if not os.path.isdir(project_dir):
+    emit({"error": "project directory does not exist"})
+
+files = None
+since = None
+if not full:
+    try:
+        with open(index_path) as handle:
+            payload = json.load(handle)
+        with open(stamp_path) as handle:
+            since = float(json.load(handle)["scanned_at"])
+        if payload.get("version") == 1 and payload.get("project_dir") == project_dir:
+            files = payload["files"]
+    except Exception:
+        files = None
+
+# Taken BEFORE the walk: anything written while find runs is re-seen next pass.
+scanned_at = time.time()
+match = ["(", "-name", "*.class", "-o", "-name", "*.jar", ")"]
+record = ["-printf", "F\\t%p\\t%s\\t%T@\\n"]
+if files is None:
+    rebuilt = True
+    files = {}
+    command = ["find", project_dir, "-type", "f"] + match + record
+else:
+    rebuilt = False
+    # One second of overlap absorbs coarse filesystem timestamps.
+    newer = ["-newerct", "@%.6f" % (since - 1.0)]
+    command = (
+        ["find", project_dir, "(", "-type", "d"] + newer + ["-printf", "D\\t%p\\n", ")", "-o"]
+        + ["(", "-type", "f"] + match + newer + record + [")"]
+    )
+listing = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL).stdout
+
+changed_files = 0
+changed_dirs = set()
+for line in listing.decode("utf-8", "surrogateescape").splitlines():
+    kind, _, rest = line.partition("\\t")
+    if kind == "D":
+        changed_dirs.add(rest)
+        continue
+    try:
+        path, size, mtime = rest.rsplit("\\t", 2)
+        entry = [int(size), float(mtime)]
+    except ValueError:
+        continue
+    if files.get(path) != entry:
+        files[path] = entry
+        changed_files += 1
+
+# A changed directory gained or lost entries: re-list its direct children and
+# re-check every indexed file beneath it (a removed subtree only touches the
+# mtime of its parent).
+removed = 0
+if changed_dirs:
+    for directory in changed_dirs:
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.endswith(SUFFIXES) and entry.is_file(follow_symlinks=False):
+                        stat = entry.stat(follow_symlinks=False)
+                        value = [stat.st_size, stat.st_mtime]
+                        if files.get(entry.path) != value:
+                            files[entry.path] = value
+                            changed_files += 1
+        except OSError:
+            continue
+    by_parent = {}
+    for path in files:
+        by_parent.setdefault(os.path.dirname(path), []).append(path)
+    for parent, paths in by_parent.items():
+        probe = parent
+        touched = False
+        while True:
+            if probe in changed_dirs:
+                touched = True
+                break
+            if probe == project_dir or probe in ("", "/"):
+                break
+            probe = os.path.dirname(probe)
+        if not touched:
+            continue
+        for path in paths:
+            if not os.path.isfile(path) or os.path.islink(path):
+                del files[path]
+                removed += 1
+
+
+def output_root(path):
+    # The compiler output a class belongs to: target/classes or build/classes
+    # below the project (a module may itself be named build), else the first
+    # target/ or build/ segment plus one more, else the file's own directory.
+    parts = path[len(project_dir) + 1:].split("/")[:-1]
+    candidates = [position for position, part in enumerate(parts[:-1]) if part in OUTPUT_DIRS]
+    for position in candidates:
+        if parts[position + 1] == "classes":
+            return project_dir + "/" + "/".join(parts[: position + 2])
+    if candidates:
+        return project_dir + "/" + "/".join(parts[: candidates[0] + 2])
+    return os.path.dirname(path)
+
+
+classes = sorted(path for path in files if path.endswith(".class"))
+class_roots = {}
+for path in classes:
+    root = output_root(path)
+    class_roots[root] = class_roots.get(root, 0) + 1
+
+stored = True
+if rebuilt or changed_files or removed:
+    try:
+        os.makedirs(os.path.dirname(index_path), exist_ok=True)
+        staged = index_path + ".tmp"
+        with open(staged, "w") as handle:
+            json.dump(
+                {"version": 1, "project_dir": project_dir, "files": files},
+                handle,
+                separators=(",", ":"),
+            )
+        os.replace(staged, index_path)
+    except OSError:
+        stored = False
+# The stamp vouches for the index on disk: after a failed index write, drop it
+# so the next pass rebuilds instead of trusting a stale or missing index.
+try:
+    if stored:
+        with open(stamp_path + ".tmp", "w") as handle:
+            json.dump({"scanned_at": scanned_at}, handle)
+        os.replace(stamp_path + ".tmp", stamp_path)
+    else:
+        os.remove(stamp_path)
+except OSError:
+    pass
+
+emit(
+    {
+        "indexed": len(files),
+        "rebuilt": rebuilt,
+        "changed": changed_files,
+        "removed": removed,
+        "class_count": len(classes),
+        "class_sample": classes[:CLASS_SAMPLE_SIZE],
+        "newest_class_mtime": max((files[path][1] for path in classes), default=None),
+        "class_roots": class_roots,
+        "jars": sorted(path for path in files if path.endswith(".jar")),
+    }
+)
+""".replace(
+    "CLASS_SAMPLE_SIZE", str(CLASS_SAMPLE_SIZE)
+)
+
+
+@dataclass(frozen=True)
+class ArtifactSnapshot:
+    """What the index knows about a project's compiled outputs after one refresh."""
+
+    class_count: int
+    class_sample: Tuple[str, ...]
+    newest_class_mtime: Optional[float]
+    class_roots: Dict[str, int]
+    jars: Tuple[str, ...]
+    indexed: int = 0
+    changed: int = 0
+    rebuilt: bool = False
+
+    def class_count_under(self, directory: str) -> int:
+        """Class files at or below ``directory`` (``find <dir> -name '*.class'``)."""
+        prefix = directory.rstrip("/")
+        return sum(
+            count
+            for root, count in self.class_roots.items()
+            if root == prefix or root.startswith(prefix + "/")
+        )
+
+    def jars_under(self, directory: str) -> List[str]:
+        """JARs at or below ``directory``."""
+        prefix = directory.rstrip("/") + "/"
+        return [path for path in self.jars if path.startswith(prefix)]
+
+
+def artifact_index_command(project_dir: str, index_path: str, *, full: bool = False) -> str:
+    arguments = " ".join(shlex.quote(value) for value in (project_dir, index_path))
+    script = shlex.quote(ARTIFACT_INDEX_SCRIPT)
+    return f"python3 -c {script} {arguments} {'1' if full else '0'}"
+
+
+def parse_artifact_index(output: str) -> Optional[ArtifactSnapshot]:
+    """The script's summary, or None when it did not run or reported an error."""
+    text = (output or "").strip()
+    start = text.rfind("\n{")
+    candidate = text[start + 1 :] if start >= 0 else text
+    try:
+        payload = json.loads(candidate)
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(payload, dict) or payload.get("error"):
+        return None
+    try:
+        newest = payload.get("newest_class_mtime")
+        return ArtifactSnapshot(
+            class_count=int(payload["class_count"]),
+            class_sample=tuple(payload.get("class_sample") or ()),
+            newest_class_mtime=float(newest) if newest is not None else None,
+            class_roots={str(k): int(v) for k, v in (payload.get("class_roots") or {}).items()},
+            jars=tuple(payload.get("jars") or ()),
+            indexed=int(payload.get("indexed") or 0),
+            changed=int(payload.get("changed") or 0),
+            rebuilt=bool(payload.get("rebuilt")),
+        )
+    except (KeyError, TypeError, ValueError):
+        return None
@@ -0,0 +1,83 @@
+"""Append-only event log next to each branch history snapshot.
+
+``add_to_branch_history`` used to reload ``<task>.json``, append one entry and
+rewrite the whole pretty-printed document, so every ReAct iteration paid for
+the full history again. A branch is now stored as two files:
+
+* ``<task>.json`` — the ``BranchContextHistory`` snapshot, rewritten only on
+  compaction (every ``COMPACT_EVERY_EVENTS`` appends, an explicit
+  ``compact_branch_history``, or when the branch completes);
+* ``<task>.events.jsonl`` — one ``{"gen", "seq", "at", "entry"}`` line per
+  entry added since that snapshot.
+
+``seq`` is the entry's 1-based position in the history and ``gen`` the
+snapshot's ``log_generation``. A reader folds in only the lines of the current
+generation that continue the snapshot's history, so a log left behind by a
+compaction that crashed before truncating it, a duplicated line, or a torn
+final line is skipped instead of replayed.
+"""
+
+import json
+from typing import Any, Dict, Optional, Tuple
+
+BRANCH_LOG_SUFFIX = ".events.jsonl"
+COMPACT_EVERY_EVENTS = 64
+
+
+def branch_log_path(branch_file: str) -> str:
+    """``phase_build.json`` -> ``phase_build.events.jsonl``."""
+    stem = branch_file[: -len(".json")] if branch_file.endswith(".json") else branch_file
+    return stem + BRANCH_LOG_SUFFIX
+
+
+def encode_branch_event(generation: str, seq: int, at: str, entry: Dict[str, Any]) -> str:
+    """One log line (no trailing newline)."""
+    return json.dumps(
+        {"gen": generation, "seq": seq, "at": at, "entry": entry},
+        default=str,
+        ensure_ascii=False,
+    )
+
+
+def merge_branch_log(
+    snapshot: Dict[str, Any], log_text: Optional[str]
+) -> Tuple[Dict[str, Any], int]:
+    """The snapshot with its log folded in, and how many log entries were applied."""
+    merged = dict(snapshot)
+    generation = str(merged.get("log_generation") or "")
+    merged["log_generation"] = generation
+    history = merged.get("history")
+    history = list(history) if isinstance(history, list) else []
+    merged["history"] = history
+    applied = 0
+    for line in (log_text or "").splitlines():
+        if not line.strip():
+            continue
+        try:
+            event = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if not isinstance(event, dict) or str(event.get("gen") or "") != generation:
+            continue
+        entry = event.get("entry")
+        if event.get("seq") != len(history) + 1 or not isinstance(entry, dict):
+            continue
+        history.append(entry)
+        merged["token_count"] = int(merged.get("token_count") or 0) + (
+            len(json.dumps(entry, ensure_ascii=False)) // 4
+        )
+        if event.get("at"):
+            merged["last_updated"] = event["at"]
+        applied += 1
+    if applied:
+        merged["entry_count"] = len(history)
+    return merged, applied
+
+
+__all__ = [
+    "BRANCH_LOG_SUFFIX",
+    "COMPACT_EVERY_EVENTS",
+    "branch_log_path",
+    "encode_branch_event",
+    "merge_branch_log",
+]
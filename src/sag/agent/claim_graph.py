@@ -46,6 +46,7 @@ from loguru import logger
 
 from sag.agent.claim_records import CLAIM_DIR, EVIDENCE_STATUSES
 from sag.agent.control_events import canonical_json
+from sag.agent.evidence_store import stored_records
 
 CLAIM_GRAPH_SCHEMA_VERSION = 1
 CLAIM_GRAPH_PATH = "/workspace/.setup_agent/claim_graph.json"
@@ -477,20 +478,24 @@ def read_claim_files(
     A line that does not parse is skipped rather than failing the read: a
     corrupt neighbour must not hide the claims we do understand.
     """
-    try:
-        probe = execute(f"cat {shlex.quote(CLAIM_DIR)}/*.json 2>/dev/null") or {}
-    except Exception as exc:  # an unreadable directory is an absent fact
-        logger.debug(f"claim files unavailable for the graph: {exc}")
-        return []
-    claims: Dict[str, Dict[str, Any]] = {}
-    for line in str(probe.get("output") or "").splitlines():
-        stripped = line.strip()
-        if not stripped.startswith("{"):
-            continue
+    payloads = stored_records(execute, CLAIM_DIR)
+    if payloads is None:
         try:
-            payload = json.loads(stripped)
-        except (TypeError, ValueError):
-            continue
+            probe = execute(f"cat {shlex.quote(CLAIM_DIR)}/*.json 2>/dev/null") or {}
+        except Exception as exc:  # an unreadable directory is an absent fact
+            logger.debug(f"claim files unavailable for the graph: {exc}")
+            return []
+        payloads = []
+        for line in str(probe.get("output") or "").splitlines():
+            stripped = line.strip()
+            if not stripped.startswith("{"):
+                continue
+            try:
+                payloads.append(json.loads(stripped))
+            except (TypeError, ValueError):
+                continue
+    claims: Dict[str, Dict[str, Any]] = {}
+    for payload in payloads:
         identifier = _text(payload.get("claim_id")) if isinstance(payload, Mapping) else ""
         if identifier:
             claims[identifier] = dict(payload)
@@ -73,6 +73,7 @@ from loguru import logger
 from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, model_validator
 
 from sag.agent.control_events import canonical_sha256
+from sag.agent.evidence_store import lookup_evidence, note_evidence_written
 
 CLAIM_SCHEMA_VERSION = 1
 CLAIM_DIR = "/workspace/.setup_agent/claims"
@@ -1393,8 +1394,11 @@ def write_claim(execute: Callable[..., Any], claim: Any) -> bool:
         result = execute(command) or {}
     except Exception as exc:
         logger.debug(f"claim {identifier} not persisted: {exc}")
+        note_evidence_written(execute, final, body, False)
         return False
-    return _succeeded(result)
+    written = _succeeded(result)
+    note_evidence_written(execute, final, body, written)
+    return written
 
 
 def _read_existing(execute: Callable[..., Any], path: str) -> dict[str, Any] | None:
@@ -1403,6 +1407,9 @@ def _read_existing(execute: Callable[..., Any], path: str) -> dict[str, Any] | N
     An unparseable file is reported as a body that matches nothing, so the
     caller refuses instead of overwriting bytes it cannot account for.
     """
+    cached = lookup_evidence(execute, path)
+    if cached is not None:
+        return cached
     try:
         result = execute(f"cat {shlex.quote(path)}") or {}
     except Exception as exc:
@@ -3,22 +3,25 @@
 Context files live inside the docker by design: the agent is superuser
 in-container and can introspect/manage its own context — including asking
 what compaction removed (the refs it points to are in-container too).
-Same heredoc-append pattern as OutputStorageManager. Best-effort: journal
-I/O must never break a run."""
+Same heredoc-append pattern as OutputStorageManager, but write-behind: lines
+are buffered in a WriteBehindQueue and flushed off the agent loop (the engine
+flushes at phase boundaries and before sealing, and closes it with the flow).
+Best-effort: journal I/O must never break a run."""
 
 import json
-import shlex
 from typing import Any, Dict, Optional
 
 from loguru import logger
 
+from sag.agent.write_behind import WriteBehindQueue
+
 JOURNAL_DIR = "/workspace/.setup_agent/contexts/journal"
 
 
 class ContextJournal:
-    def __init__(self, orchestrator):
+    def __init__(self, orchestrator, queue: Optional[WriteBehindQueue] = None):
         self.orchestrator = orchestrator
-        self._dir_ready = False
+        self.queue = queue if queue is not None else WriteBehindQueue(orchestrator)
 
     def record(self, phase: str, iteration: int, segments: Dict[str, Any],
                delta: Dict[str, Any], total_chars: int,
@@ -38,13 +41,20 @@ class ContextJournal:
                 payload["ledger_text"] = ledger_text
             if step_span is not None:
                 payload["step_span"] = step_span
-            line = json.dumps(payload)
-            prefix = "" if self._dir_ready else f"mkdir -p {JOURNAL_DIR} && "
-            path = f"{JOURNAL_DIR}/phase_{phase}.journal.jsonl"
-            self.orchestrator.execute_command(
-                f"{prefix}printf '%s\\n' {shlex.quote(line)} >> {path}",
-                workdir=None, timeout=30,
-            )
-            self._dir_ready = True
+            self.queue.append(f"{JOURNAL_DIR}/phase_{phase}.journal.jsonl", json.dumps(payload))
         except Exception as exc:
             logger.debug(f"context journal write skipped: {exc}")
+
+    def flush(self, wait: bool = False) -> None:
+        """Write buffered records now (``wait``) or in the background."""
+        try:
+            self.queue.flush(wait=wait)
+        except Exception as exc:
+            logger.debug(f"context journal flush skipped: {exc}")
+
+    def close(self) -> None:
+        """Write everything buffered and stop the background flusher."""
+        try:
+            self.queue.close()
+        except Exception as exc:
+            logger.debug(f"context journal close skipped: {exc}")
@@ -2,6 +2,7 @@
 
 import json
 import re
+import uuid
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
@@ -10,7 +11,14 @@ from typing import Any, Dict, List, Optional
 from loguru import logger
 from pydantic import BaseModel, Field
 
+from sag.agent.branch_log import (
+    COMPACT_EVERY_EVENTS,
+    branch_log_path,
+    encode_branch_event,
+    merge_branch_log,
+)
 from sag.evidence import EvidenceAssessment, EvidenceFinding, coerce_evidence_status
+from sag.runtime.container_io import archive_orchestrator, read_container_text
 from sag.utils.container_io import write_container_text
 
 
@@ -315,6 +323,9 @@ class BranchContextHistory(BaseModel):
     entry_count: int = 0
     context_window_threshold: int = 15000  # Token threshold for compression reminder
 
+    # Events in <task>.events.jsonl apply only to the snapshot of the same generation
+    log_generation: str = Field(default_factory=lambda: uuid.uuid4().hex[:12])
+
     def add_entry(self, entry: Dict[str, Any]) -> bool:
         """Add new history entry, returns whether compression is needed"""
         self.history.append(entry)
@@ -369,6 +380,11 @@ class ContextManager:
         self.current_task_id: Optional[str] = None  # Currently executing task ID
         self.trunk_context_file: Optional[str] = None  # Trunk context file path
 
+        # Authoritative in-memory branch histories; the files are the durable copy.
+        self._branches: Dict[str, BranchContextHistory] = {}
+        # Log entries appended per branch since its snapshot was last written.
+        self._unfolded_events: Dict[str, int] = {}
+
     def _ensure_contexts_dir_in_container(self):
         """
         Ensure the contexts directory exists in the container.
@@ -649,30 +665,18 @@ CONTEXT_EOF"""
         使用Docker API直接从容器文件系统读取JSON文件
         这比使用cat命令更高效，也避免了truncation问题
         """
+        transport = archive_orchestrator(self.orchestrator)
+        if transport is None:
+            return None
         try:
-            container = self.orchestrator.client.containers.get(self.orchestrator.container_name)
-
-            # 直接从容器文件系统获取文件
-            archive, stat = container.get_archive(file_path)
-
-            # 解压tar数据
-            import io
-            import tarfile
-
-            tar_stream = io.BytesIO()
-            for chunk in archive:
-                tar_stream.write(chunk)
-            tar_stream.seek(0)
-
-            # 提取JSON文件内容
-            with tarfile.open(fileobj=tar_stream, mode="r") as tar:
-                # 获取文件名（去掉路径）
-                filename = file_path.split("/")[-1]
-                file_data = tar.extractfile(filename).read()
-                json_data = json.loads(file_data.decode("utf-8"))
+            # 直接从容器文件系统获取文件 (one get_archive call, no exec)
+            file_data = transport.read_archive_file(file_path)
+            if file_data is None:
+                return None
+            json_data = json.loads(file_data.decode("utf-8"))
 
-                logger.debug(f"Successfully loaded JSON via Docker API: {file_path}")
-                return json_data
+            logger.debug(f"Successfully loaded JSON via Docker API: {file_path}")
+            return json_data
 
         except Exception as e:
             logger.debug(
@@ -681,51 +685,84 @@ CONTEXT_EOF"""
             return None
 
     def load_branch_history(self, task_id: str) -> Optional[BranchContextHistory]:
-        """Load branch history from file with improved Docker API access."""
+        """Load branch history: the in-memory copy, else snapshot plus event log."""
+        cached = self._branches.get(task_id)
+        if cached is not None:
+            return cached.model_copy(deep=True)
+        branch_history = self._read_branch_history(task_id)
+        if branch_history is not None:
+            self._branches[task_id] = branch_history
+            return branch_history.model_copy(deep=True)
+        return None
+
+    def _read_branch_history(self, task_id: str) -> Optional[BranchContextHistory]:
+        """Read ``<task>.json`` and fold ``<task>.events.jsonl`` into it."""
         branch_file = str(self.contexts_dir / f"{task_id}.json")
 
         try:
-            if self.orchestrator:
-                # IMPROVED: Try Docker API first, fallback to cat command
-                json_data = self._load_json_via_docker_api(branch_file)
+            data = self._read_branch_snapshot(task_id, branch_file)
+            if data is None:
+                return None
+            log_text = self._read_branch_log(branch_log_path(branch_file))
+            merged, applied = merge_branch_log(data, log_text)
+            # A torn last line (the writer died mid-append) would swallow the
+            # next appended event: compact on the next append instead.
+            torn = bool(log_text) and not log_text.endswith("\n")
+            self._unfolded_events[task_id] = COMPACT_EVERY_EVENTS if torn else applied
+            return BranchContextHistory(**merged)
+        except Exception as e:
+            logger.error(f"Failed to load branch history for {task_id}: {e}")
+        return None
 
-                if json_data:
-                    return BranchContextHistory(**json_data)
+    def _read_branch_snapshot(self, task_id: str, branch_file: str) -> Optional[dict]:
+        if self.orchestrator:
+            # IMPROVED: Try Docker API first, fallback to cat command
+            json_data = self._load_json_via_docker_api(branch_file)
 
-                # Fallback to original cat method if Docker API fails
-                logger.info(f"Using fallback cat method for {task_id}")
+            if json_data:
+                return json_data
 
-                # Check file existence in container
-                check_cmd = f"test -f {branch_file}"
-                check_result = self.orchestrator.execute_command(check_cmd)
-                if not (check_result.get("success") or check_result.get("exit_code") == 0):
-                    logger.warning(f"Branch history file not found in container: {branch_file}")
-                    return None
+            # Fallback to original cat method if Docker API fails
+            logger.info(f"Using fallback cat method for {task_id}")
 
-                # Load from container using cat (with improved truncation protection)
-                cat_result = self.orchestrator.execute_command(f"cat {branch_file}")
-                if cat_result.get("success") or cat_result.get("exit_code") == 0:
-                    data = json.loads(cat_result["output"])
-                    return BranchContextHistory(**data)
-                else:
-                    logger.error(
-                        f"Failed to read branch history from container: {cat_result.get('output')}"
-                    )
-                    return None
-            else:
-                # Load from local file system
-                if Path(branch_file).exists():
-                    with open(branch_file, "r") as f:
-                        data = json.load(f)
-                        return BranchContextHistory(**data)
-        except Exception as e:
-            logger.error(f"Failed to load branch history for {task_id}: {e}")
+            # Check file existence in container
+            check_cmd = f"test -f {branch_file}"
+            check_result = self.orchestrator.execute_command(check_cmd)
+            if not (check_result.get("success") or check_result.get("exit_code") == 0):
+                logger.warning(f"Branch history file not found in container: {branch_file}")
+                return None
+
+            # Load from container using cat (with improved truncation protection)
+            cat_result = self.orchestrator.execute_command(f"cat {branch_file}")
+            if cat_result.get("success") or cat_result.get("exit_code") == 0:
+                return json.loads(cat_result["output"])
+            logger.error(
+                f"Failed to read branch history from container: {cat_result.get('output')}"
+            )
+            return None
+
+        # Load from local file system
+        if Path(branch_file).exists():
+            with open(branch_file, "r") as f:
+                return json.load(f)
         return None
 
+    def _read_branch_log(self, log_file: str) -> Optional[str]:
+        if self.orchestrator:
+            return read_container_text(self.orchestrator, log_file, exact_bytes=True)
+        path = Path(log_file)
+        return path.read_text(encoding="utf-8") if path.exists() else None
+
     def _save_branch_history(self, branch_history: BranchContextHistory, branch_file: str):
-        """Save branch history to file."""
+        """Write a branch snapshot and retire its event log (compaction)."""
+        # A new generation per snapshot: should the log removal below not
+        # happen, readers still ignore the previous generation's events.
+        generation = uuid.uuid4().hex[:12]
+        log_file = branch_log_path(branch_file)
         try:
-            context_data = json.dumps(branch_history.model_dump(), default=str, indent=2)
+            snapshot = branch_history.model_dump()
+            snapshot["log_generation"] = generation
+            context_data = json.dumps(snapshot, default=str, indent=2)
 
             if self.orchestrator:
                 # SIMPLIFIED: Save in container using cat with heredoc (much cleaner!)
@@ -744,6 +781,7 @@ CONTEXT_EOF"""
                 # base64 chunks; small content still takes the fast heredoc path.
                 if not write_container_text(self.orchestrator, branch_file, context_data):
                     raise Exception(f"Failed to save branch history to {branch_file}")
+                self.orchestrator.execute_command(f"rm -f {log_file}")
 
                 logger.debug(f"Saved branch history to: {branch_file}")
             else:
@@ -751,16 +789,44 @@ CONTEXT_EOF"""
                 Path(branch_file).parent.mkdir(parents=True, exist_ok=True)
                 with open(branch_file, "w") as f:
                     f.write(context_data)
+                Path(log_file).unlink(missing_ok=True)
 
             logger.debug(f"Saved branch history to: {branch_file}")
         except Exception as e:
             logger.error(f"Failed to save branch history: {e}")
             raise
+        branch_history.log_generation = generation
+        self._branches[branch_history.task_id] = branch_history.model_copy(deep=True)
+        self._unfolded_events[branch_history.task_id] = 0
+
+    def _append_branch_event(
+        self, branch_history: BranchContextHistory, branch_file: str, entry: Dict[str, Any]
+    ) -> bool:
+        """Append one entry to the branch event log; O(entry), not O(history)."""
+        line = encode_branch_event(
+            branch_history.log_generation,
+            branch_history.entry_count,
+            branch_history.last_updated.isoformat(),
+            entry,
+        )
+        log_file = branch_log_path(branch_file)
+        try:
+            if self.orchestrator:
+                return write_container_text(self.orchestrator, log_file, line, append=True)
+            Path(log_file).parent.mkdir(parents=True, exist_ok=True)
+            with open(log_file, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to append to branch log {log_file}: {e}")
+            return False
 
     def add_to_branch_history(self, task_id: str, new_entry: Dict[str, Any]) -> Dict[str, Any]:
         """Add entry to branch history with type safety, returns status info (including compression needs)"""
-        # Load branch history
-        branch_history = self.load_branch_history(task_id)
+        # The in-memory copy is authoritative; only a fresh manager reads the files
+        branch_history = self._branches.get(task_id)
+        if branch_history is None and self.load_branch_history(task_id) is not None:
+            branch_history = self._branches[task_id]
         if not branch_history:
             raise ValueError(f"No branch history found for task {task_id}")
 
@@ -783,9 +849,16 @@ CONTEXT_EOF"""
         # Add entry and check if compression is needed
         needs_compression = branch_history.add_entry(new_entry)
 
-        # Save updated history
+        # Append the entry to the event log; fold the log into a fresh snapshot
+        # every COMPACT_EVERY_EVENTS entries (or when the append failed).
         branch_file = str(self.contexts_dir / f"{task_id}.json")
-        self._save_branch_history(branch_history, branch_file)
+        unfolded = self._unfolded_events.get(task_id, 0) + 1
+        if unfolded >= COMPACT_EVERY_EVENTS or not self._append_branch_event(
+            branch_history, branch_file, new_entry
+        ):
+            self._save_branch_history(branch_history, branch_file)
+        else:
+            self._unfolded_events[task_id] = unfolded
 
         result = {
             "success": True,
@@ -814,7 +887,7 @@ CONTEXT_EOF"""
         # Replace history
         branch_history.replace_history(compacted_history)
 
-        # Save updated history
+        # Save updated history (a new snapshot retires the event log)
         branch_file = str(self.contexts_dir / f"{task_id}.json")
         self._save_branch_history(branch_history, branch_file)
 
@@ -823,6 +896,17 @@ CONTEXT_EOF"""
         )
         return True
 
+    def _fold_branch_log(self, task_id: str) -> None:
+        """Write a finished branch back as a single snapshot file."""
+        branch_history = self._branches.get(task_id)
+        if branch_history is None or not self._unfolded_events.get(task_id):
+            return
+        try:
+            self._save_branch_history(branch_history, str(self.contexts_dir / f"{task_id}.json"))
+        except Exception as e:
+            # The event log still holds every entry; readers merge it.
+            logger.warning(f"Could not fold branch log for {task_id}: {e}")
+
     def complete_branch(self, task_id: str, summary: str) -> Dict[str, Any]:
         """Complete branch task, update trunk context, and return next task info"""
         # Load trunk context
@@ -830,6 +914,8 @@ CONTEXT_EOF"""
         if not trunk_context:
             raise ValueError("No trunk context exists")
 
+        self._fold_branch_log(task_id)
+
         # Update task status and key results
         trunk_context.update_task_status(task_id, TaskStatus.COMPLETED, summary)
         trunk_context.update_task_key_results(task_id, summary)
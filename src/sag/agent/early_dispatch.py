@@ -0,0 +1,76 @@
+"""Execute a streamed executor turn's tool calls while the model still writes.
+
+With ``stream_native_turns`` the LLM client hands over each tool call as soon
+as its arguments are complete. ``EarlyDispatch`` queues them for one worker
+thread that runs them through the engine's ordinary native-call path, so a
+long dispatch (a Maven build) starts before the model's trailing prose has
+arrived, while pairing, gates and batch cancellation stay exactly those of a
+buffered turn.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+from types import SimpleNamespace
+from typing import Any, Callable, List, Optional
+
+from .react_types import StepType
+
+
+class EarlyDispatch:
+    """One streamed turn: calls go in via ``submit``, ``finish`` collects the steps."""
+
+    def __init__(
+        self,
+        execute_calls: Callable[[Any], List[Any]],
+        steps: Callable[[], List[Any]],
+        *,
+        model: str,
+    ):
+        self._calls: "queue.Queue[Any]" = queue.Queue()
+        self._steps = steps
+        self._submitted_ids: set[str] = set()
+        self._executed: List[Any] = []
+        self._error: Optional[BaseException] = None
+        # The prose is only final once the stream ends; `finish` stamps it.
+        turn = SimpleNamespace(text="", model_used=model, tool_calls=iter(self._calls.get, None))
+        self._worker = threading.Thread(
+            target=self._run,
+            args=(execute_calls, turn),
+            name="sag-early-dispatch",
+            daemon=True,
+        )
+        self._worker.start()
+
+    def _run(self, execute_calls: Callable[[Any], List[Any]], turn: Any) -> None:
+        try:
+            self._executed = execute_calls(turn)
+        except BaseException as exc:  # re-raised on the loop's thread by finish()
+            self._error = exc
+
+    def submit(self, call: Any) -> None:
+        self._submitted_ids.add(call.id)
+        self._calls.put(call)
+
+    def finish(self, turn: Any = None) -> List[Any]:
+        """Wait for every submitted call; stamp ``turn``'s prose and model on its steps.
+
+        ``turn`` is None when the stream failed: calls already handed over
+        still settle (each keeps its observation), but nothing is stamped.
+        """
+        self._calls.put(None)
+        self._worker.join()
+        if turn is not None:
+            # Newest first: a synthetic `call_<index>` id recurs across turns.
+            unstamped = set(self._submitted_ids)
+            for step in reversed(self._steps()):
+                if not unstamped:
+                    break
+                if step.step_type == StepType.ACTION and step.tool_call_id in unstamped:
+                    unstamped.discard(step.tool_call_id)
+                    step.native_text = turn.text
+                    step.model_used = turn.model_used
+        if self._error is not None:
+            raise self._error
+        return self._executed
@@ -46,6 +46,11 @@ from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
 
 from loguru import logger
 
+from sag.agent.evidence_store import (
+    evidence_store_for,
+    lookup_evidence,
+    note_evidence_written,
+)
 from sag.agent.invocation_receipts import RECEIPT_DIR
 
 ASSESSMENT_SCHEMA_VERSION = 1
@@ -274,8 +279,11 @@ def write_assessment(execute, assessment) -> bool:
         result = execute(command) or {}
     except Exception as exc:
         logger.debug(f"evidence assessment {identifier} not persisted: {exc}")
+        note_evidence_written(execute, final, body, False)
         return False
-    return _succeeded(result)
+    written = _succeeded(result)
+    note_evidence_written(execute, final, body, written)
+    return written
 
 
 # ---------------------------------------------------------------------------
@@ -324,6 +332,10 @@ def ensure_receipt_assessed(
 def _list_assessment_files(
     execute: Callable[..., Optional[Mapping[str, Any]]],
 ) -> List[str]:
+    store = evidence_store_for(execute)
+    names = store.names(ASSESSMENT_DIR) if store is not None else None
+    if names is not None:
+        return names
     try:
         result = execute(f"ls {ASSESSMENT_DIR} 2>/dev/null") or {}
     except Exception:
@@ -789,6 +801,9 @@ def _read_existing(execute, path: str) -> Optional[Dict[str, Any]]:
     An unparseable file is reported as a body that matches nothing, so the
     caller refuses instead of overwriting bytes it cannot account for.
     """
+    cached = lookup_evidence(execute, path)
+    if cached is not None:
+        return cached
     try:
         result = execute(f"cat {shlex.quote(path)}") or {}
     except Exception as exc:
@@ -0,0 +1,325 @@
+"""Indexed per-workspace store over the evidence directories.
+
+Claims, assessments, repair contracts, job obligations and invocation receipts
+each live in their own container directory, one single-line JSON file per
+record, and every reader used to pay one glob ``cat`` plus a parse of the whole
+directory — several times per engine iteration. Every writer also paid one
+``cat`` of the target file first, to honour the append-only contract.
+
+An ``EvidenceStore`` is an in-memory SQLite database attached to ONE
+workspace's orchestrator. It mirrors the directories it has been asked about:
+
+* a directory is hydrated on first read with the same glob ``cat`` every reader
+  already used, and is never re-read after that;
+* the writers in this package report every body they persisted, so the store
+  stays current without another round trip;
+* rows carry typed, indexed columns (``receipt_id``, ``typed_code``,
+  ``fact_epoch``) next to the exact body bytes, and a read returns fresh dicts
+  parsed from those bytes — never an object another caller could mutate.
+
+The files stay the durable record and are written exactly as before, so
+``sag inspect``, replay and a resumed run in another process read the same
+layout; the store is the read path of the process that wrote them. Single
+files the same readers revisit (frozen contracts, the retry ledger) are kept
+as documents keyed by path.
+
+Only the production ``DockerOrchestrator`` gets a store implicitly; test
+doubles keep the plain file path unless a test attaches one. A read that cannot
+hydrate answers None, and the caller falls back to its own read, so every
+tri-state answer (``None`` = could not read) is unchanged.
+"""
+
+import json
+import posixpath
+import shlex
+import sqlite3
+import threading
+from typing import Any, Dict, List, Mapping, Optional
+
+from loguru import logger
+
+from sag.runtime.container_io import archive_orchestrator
+
+# Evidence directory (by basename) -> the field its files are named after.
+RECORD_KEYS = {
+    "claims": "claim_id",
+    "evidence_assessments": "assessment_id",
+    "invocation_receipts": "receipt_id",
+    "job_obligations": "job_id",
+    "repair_contracts": "repair_id",
+}
+
+_SCHEMA = """
+CREATE TABLE records (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    directory TEXT NOT NULL,
+    name TEXT,
+    receipt_id TEXT,
+    typed_code TEXT,
+    fact_epoch TEXT,
+    body TEXT NOT NULL
+);
+CREATE UNIQUE INDEX records_name ON records (directory, name);
+CREATE INDEX records_receipt ON records (directory, receipt_id);
+CREATE INDEX records_code ON records (directory, typed_code);
+CREATE INDEX records_epoch ON records (directory, fact_epoch);
+CREATE TABLE hydrated (directory TEXT PRIMARY KEY);
+CREATE TABLE documents (path TEXT PRIMARY KEY, body TEXT NOT NULL);
+"""
+
+
+class EvidenceStore:
+    """The evidence records one workspace's orchestrator has read or written."""
+
+    def __init__(self, orchestrator: Any):
+        self.orchestrator = orchestrator
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(":memory:", check_same_thread=False, isolation_level=None)
+        self._db.executescript(_SCHEMA)
+        # Bumped by every write a directory reports; a hydration that raced one
+        # is discarded rather than cached without it.
+        self._writes = 0
+
+    # -- records ------------------------------------------------------------
+
+    def records(
+        self, directory: str, *, receipt_id: Optional[str] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Every record in ``directory`` in file-name order, or None if unreadable."""
+        if not self._hydrate(directory):
+            return None
+        query = "SELECT body FROM records WHERE directory = ?"
+        params: List[Any] = [directory]
+        if receipt_id is not None:
+            query += " AND receipt_id = ?"
+            params.append(receipt_id)
+        with self._lock:
+            rows = self._db.execute(query + " ORDER BY name, seq", params).fetchall()
+        return [json.loads(body) for (body,) in rows]
+
+    def names(self, directory: str) -> Optional[List[str]]:
+        """The file names ``ls`` would list for ``directory``, or None if unreadable."""
+        if not self._hydrate(directory):
+            return None
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT name FROM records WHERE directory = ? AND name IS NOT NULL "
+                "ORDER BY name",
+                (directory,),
+            ).fetchall()
+        return [name for (name,) in rows]
+
+    def lookup(self, path: str) -> Optional[Dict[str, Any]]:
+        """The stored body at ``path``, or None when the store cannot vouch for one.
+
+        None never means "absent": the caller still reads the file, so a file
+        the index skipped (unparseable bytes) is refused exactly as before.
+        """
+        directory, name = posixpath.split(path)
+        if posixpath.basename(directory) in RECORD_KEYS:
+            if not self._hydrate(directory):
+                return None
+            with self._lock:
+                row = self._db.execute(
+                    "SELECT body FROM records WHERE directory = ? AND name = ?",
+                    (directory, name),
+                ).fetchone()
+        else:
+            with self._lock:
+                row = self._db.execute(
+                    "SELECT body FROM documents WHERE path = ?", (path,)
+                ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, path: str, body: str) -> None:
+        """Record that ``path`` now holds ``body`` (single-line JSON)."""
+        directory, name = posixpath.split(path)
+        with self._lock:
+            if posixpath.basename(directory) not in RECORD_KEYS:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO documents (path, body) VALUES (?, ?)", (path, body)
+                )
+                return
+            self._writes += 1
+            hydrated = self._db.execute(
+                "SELECT 1 FROM hydrated WHERE directory = ?", (directory,)
+            ).fetchone()
+            if not hydrated:
+                # The first read hydrates from the files, this write included.
+                return
+            self._upsert(directory, name, body)
+
+    def forget(self, path: str) -> None:
+        """Drop what the store knows about ``path``'s directory (or document)."""
+        directory = posixpath.dirname(path)
+        with self._lock:
+            self._writes += 1
+            self._db.execute("DELETE FROM documents WHERE path = ?", (path,))
+            if posixpath.basename(directory) in RECORD_KEYS:
+                self._db.execute("DELETE FROM records WHERE directory = ?", (directory,))
+                self._db.execute("DELETE FROM hydrated WHERE directory = ?", (directory,))
+
+    def reset(self) -> None:
+        """Forget everything; the next read of each directory hydrates again."""
+        with self._lock:
+            self._writes += 1
+            self._db.executescript(
+                "DELETE FROM records; DELETE FROM hydrated; DELETE FROM documents;"
+            )
+
+    # -- internals ----------------------------------------------------------
+
+    def _hydrate(self, directory: str) -> bool:
+        with self._lock:
+            if self._db.execute(
+                "SELECT 1 FROM hydrated WHERE directory = ?", (directory,)
+            ).fetchone():
+                return True
+            writes = self._writes
+        output = self._read_directory(directory)
+        if output is None:
+            return False
+        key = RECORD_KEYS.get(posixpath.basename(directory))
+        with self._lock:
+            if self._db.execute(
+                "SELECT 1 FROM hydrated WHERE directory = ?", (directory,)
+            ).fetchone():
+                return True
+            if self._writes != writes:
+                return False
+            self._db.execute("BEGIN")
+            try:
+                for line in output.splitlines():
+                    stripped = line.strip()
+                    if not stripped.startswith("{"):
+                        continue
+                    try:
+                        payload = json.loads(stripped)
+                    except (TypeError, ValueError):
+                        continue
+                    if not isinstance(payload, Mapping):
+                        continue
+                    identifier = str(payload.get(key) or "").strip() if key else ""
+                    self._upsert(directory, f"{identifier}.json" if identifier else None, stripped)
+                self._db.execute("INSERT INTO hydrated (directory) VALUES (?)", (directory,))
+                self._db.execute("COMMIT")
+            except Exception:
+                self._db.execute("ROLLBACK")
+                raise
+        return True
+
+    def _read_directory(self, directory: str) -> Optional[str]:
+        execute = getattr(self.orchestrator, "execute_command", None)
+        if not callable(execute):
+            return None
+        try:
+            probe = execute(f"cat {shlex.quote(directory)}/*.json 2>/dev/null") or {}
+        except Exception as exc:
+            logger.debug(f"{directory} not indexed: {exc}")
+            return None
+        # The two signatures of a read that did not run (see `read_obligations`).
+        if isinstance(probe, Mapping) and (
+            probe.get("exit_code") == -1 or probe.get("dispatch_status")
+        ):
+            return None
+        return str(probe.get("output") or "")
+
+    def _upsert(self, directory: str, name: Optional[str], body: str) -> None:
+        payload = json.loads(body)
+        if name is not None:
+            self._db.execute(
+                "DELETE FROM records WHERE directory = ? AND name = ?", (directory, name)
+            )
+        self._db.execute(
+            "INSERT INTO records (directory, name, receipt_id, typed_code, fact_epoch, body) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                directory,
+                name,
+                _column(payload.get("receipt_id")),
+                _column(payload.get("typed_code")),
+                _column(payload.get("fact_epoch")),
+                body,
+            ),
+        )
+
+
+def _column(value: Any) -> Optional[str]:
+    if value is None or isinstance(value, (dict, list)):
+        return None
+    text = str(value).strip()
+    return text or None
+
+
+def attach_evidence_store(orchestrator: Any) -> EvidenceStore:
+    """The store attached to ``orchestrator``, creating it on first use."""
+    store = getattr(orchestrator, "_evidence_store", None)
+    if not isinstance(store, EvidenceStore):
+        store = EvidenceStore(orchestrator)
+        orchestrator._evidence_store = store
+    return store
+
+
+def evidence_store_for(source: Any) -> Optional[EvidenceStore]:
+    """The store behind an orchestrator or its bound ``execute_command``, if any.
+
+    The production ``DockerOrchestrator`` gets one on first use; any other
+    orchestrator only has one when it was attached explicitly.
+    """
+    orchestrator = getattr(source, "__self__", source)
+    if orchestrator is None:
+        return None
+    store = getattr(orchestrator, "_evidence_store", None)
+    if isinstance(store, EvidenceStore):
+        return store
+    if archive_orchestrator(orchestrator) is None:
+        return None
+    return attach_evidence_store(orchestrator)
+
+
+def stored_records(
+    source: Any, directory: str, *, receipt_id: Optional[str] = None
+) -> Optional[List[Dict[str, Any]]]:
+    """``EvidenceStore.records`` through ``source``'s store; None without one."""
+    store = evidence_store_for(source)
+    return store.records(directory, receipt_id=receipt_id) if store is not None else None
+
+
+def lookup_evidence(source: Any, path: str) -> Optional[Dict[str, Any]]:
+    """``EvidenceStore.lookup`` through ``source``'s store; None without one."""
+    store = evidence_store_for(source)
+    return store.lookup(path) if store is not None else None
+
+
+def note_evidence_written(source: Any, path: str, body: str, written: bool) -> None:
+    """Tell ``source``'s store what a writer just did at ``path``.
+
+    A write that did not report success may still have landed (the ``mv`` ran
+    and the transport failed after it), so its directory is re-read next time.
+    """
+    store = evidence_store_for(source)
+    if store is None:
+        return
+    if written:
+        store.put(path, body)
+    else:
+        store.forget(path)
+
+
+def remember_evidence(source: Any, path: str, payload: Mapping[str, Any]) -> None:
+    """Keep a single file a reader just parsed, so the next read skips the ``cat``."""
+    store = evidence_store_for(source)
+    if store is not None:
+        store.put(path, json.dumps(dict(payload), sort_keys=True))
+
+
+__all__ = [
+    "RECORD_KEYS",
+    "EvidenceStore",
+    "attach_evidence_store",
+    "evidence_store_for",
+    "lookup_evidence",
+    "note_evidence_written",
+    "remember_evidence",
+    "stored_records",
+]
@@ -53,6 +53,7 @@ from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
 from loguru import logger
 
 from sag.agent.control_events import canonical_json, canonical_sha256
+from sag.agent.evidence_store import note_evidence_written
 from sag.agent.invocation_receipts import target_sha as probe_target_sha
 
 CONTRACT_SCHEMA_VERSION = 1
@@ -271,8 +272,11 @@ def write_contract(
         result = execute(command) or {}
     except Exception as exc:
         logger.debug(f"invocation contract {identifier} not persisted: {exc}")
+        note_evidence_written(execute, final, body, False)
         return False
-    return _succeeded(result)
+    written = _succeeded(result)
+    note_evidence_written(execute, final, body, written)
+    return written
 
 
 def freeze_contract(
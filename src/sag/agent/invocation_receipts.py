@@ -43,7 +43,9 @@ from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Seque
 
 from loguru import logger
 
+from sag.agent.evidence_store import note_evidence_written
 from sag.agent.receipt_structure import promote_structure
+from sag.runtime.container_io import archive_orchestrator
 
 RECEIPT_SCHEMA_VERSION = 2
 RECEIPT_DIR = "/workspace/.setup_agent/invocation_receipts"
@@ -89,6 +91,131 @@ REPORT_PATH_MARKERS = (
     "/.setup_agent/pytest-reports/",
 )
 
+# Persistent stat -> sha256 cache for report snapshots. Both sides of every
+# invocation rehash every report under its roots, and nearly all of them are
+# byte-identical to the previous snapshot; the cache lets a snapshot hash only
+# the files whose stat moved. Like the report parse cache it stays out of
+# /workspace/.setup_agent, which is copied into every session mirror.
+REPORT_HASH_CACHE = "/tmp/sag-report-hash/cache.json"
+REPORT_HASH_STATS_MARKER = "#SAGHASHSTATS"
+
+# Runs with the container's python3: argv = cache_path, markers (newline
+# separated), roots... Prints `sha256sum` lines and one stats line. An entry is
+# reused only when (size, mtime_ns, ctime_ns, inode) all match, and a file
+# modified within the last two seconds is hashed but not cached: a rewrite
+# inside the filesystem's timestamp granularity would otherwise keep its stale
+# digest (git's "racily clean" problem).
+REPORT_HASH_SCRIPT = """\
+import fnmatch
+import hashlib
+import json
+import os
+import sys
+import time
+
+cache_path = sys.argv[1]
+patterns = ["*" + marker + "*.xml" for marker in sys.argv[2].split("\\n") if marker]
+roots = sys.argv[3:]
+RACY_NS = 2 * 10**9
+
+try:
+    with open(cache_path) as handle:
+        cache = json.load(handle)
+    if not isinstance(cache, dict) or cache.get("version") != 1:
+        raise ValueError
+    entries = cache["entries"]
+except Exception:
+    entries = {}
+
+started_ns = time.time_ns()
+hashed = reused = 0
+dirty = False
+seen = {}
+
+
+def matches(path):
+    return any(fnmatch.fnmatchcase(path, pattern) for pattern in patterns)
+
+
+def candidates(root):
+    # `find <root> -type f` without -L: a symlinked root or file is not followed.
+    if os.path.islink(root):
+        return
+    if not os.path.isdir(root):
+        yield root
+        return
+    for directory, _dirs, names in os.walk(root):
+        for name in names:
+            yield os.path.join(directory, name)
+
+
+for root in roots:
+    for path in candidates(root):
+        if path in seen or "\\n" in path or not matches(path):
+            continue
+        try:
+            stat = os.lstat(path)
+        except OSError:
+            continue
+        if (stat.st_mode & 0o170000) != 0o100000:
+            continue
+        key = [stat.st_size, stat.st_mtime_ns, stat.st_ctime_ns, stat.st_ino]
+        cached = entries.get(path)
+        if cached and cached[0] == key:
+            seen[path] = cached[1]
+            reused += 1
+            continue
+        digest = hashlib.sha256()
+        try:
+            with open(path, "rb") as handle:
+                for chunk in iter(lambda: handle.read(1 << 20), b""):
+                    digest.update(chunk)
+        except OSError:
+            continue
+        seen[path] = digest.hexdigest()
+        hashed += 1
+        if started_ns - stat.st_mtime_ns > RACY_NS:
+            entries[path] = [key, seen[path]]
+            dirty = True
+        elif path in entries:
+            del entries[path]
+            dirty = True
+
+# Forget entries under the scanned roots whose files are gone.
+prefixes = tuple(root.rstrip("/") + "/" for root in roots)
+for path in [path for path in entries if path.startswith(prefixes) and path not in seen]:
+    del entries[path]
+    dirty = True
+
+if dirty:
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        staged = "%s.%d.tmp" % (cache_path, os.getpid())
+        with open(staged, "w") as handle:
+            json.dump({"version": 1, "entries": entries}, handle, separators=(",", ":"))
+        os.replace(staged, cache_path)
+    except OSError:
+        pass
+
+lines = ["%s  %s" % (digest, path) for path, digest in seen.items()]
+lines.append("STATS_MARKER " + json.dumps({"hashed": hashed, "reused": reused}))
+sys.stdout.write("\\n".join(lines) + "\\n")
+""".replace(
+    "STATS_MARKER", REPORT_HASH_STATS_MARKER
+)
+
+
+class ReportSnapshot(Dict[str, str]):
+    """A report snapshot (path -> sha256) that remembers how it was hashed.
+
+    `hashing` is `{"hashed": n, "reused": m}` when the stat cache answered the
+    snapshot, None when the plain `sha256sum` scan did. A plain dict in every
+    other respect, so obligations persist it and `report_delta` reads it as is.
+    """
+
+    hashing: Optional[Dict[str, int]] = None
+
+
 _SEQUENCE = itertools.count(1)
 _SEQUENCE_LOCK = threading.Lock()
 
@@ -114,6 +241,11 @@ def snapshot_reports(
     shapes itself (no xargs, no second `cat` pass) and hashes what it kept.
     A transport failure yields an empty snapshot rather than an exception —
     an unmeasurable delta must not break the build the model asked for.
+
+    Against the production container the round trip runs `REPORT_HASH_SCRIPT`
+    first, which hashes only the reports whose stat changed since the last
+    snapshot; the `find` scan stays behind `||` for a container without
+    python3, and is the only path a test double ever sees.
     """
     roots = _unique_roots(scan_roots)
     if not roots:
@@ -121,11 +253,16 @@ def snapshot_reports(
     predicates = " -o ".join(
         f"-path {shlex.quote(f'*{marker}*.xml')}" for marker in REPORT_PATH_MARKERS
     )
+    quoted_roots = " ".join(shlex.quote(root) for root in roots)
     command = (
-        "find "
-        + " ".join(shlex.quote(root) for root in roots)
-        + f" -type f \\( {predicates} \\) -exec sha256sum {{}} + 2>/dev/null"
+        f"find {quoted_roots} -type f \\( {predicates} \\) -exec sha256sum {{}} + 2>/dev/null"
     )
+    if archive_orchestrator(getattr(execute, "__self__", None)) is not None:
+        markers = shlex.quote("\n".join(REPORT_PATH_MARKERS))
+        command = (
+            f"python3 -c {shlex.quote(REPORT_HASH_SCRIPT)} {shlex.quote(REPORT_HASH_CACHE)} "
+            f"{markers} {quoted_roots} 2>/dev/null || {command}"
+        )
     try:
         # The MACHINE path, not the presentation path: DockerOrchestrator
         # truncates ordinary output beyond ~10,000 characters, and 260 report
@@ -144,7 +281,10 @@ def snapshot_reports(
     except Exception as exc:  # evidence collection never breaks the runner
         logger.debug(f"report snapshot skipped: {exc}")
         return {}
-    return _parse_sha256sum(result.get("output") or "")
+    output = result.get("output") or ""
+    snapshot = ReportSnapshot(_parse_sha256sum(output))
+    snapshot.hashing = _parse_hash_stats(output)
+    return snapshot
 
 
 def report_delta(
@@ -465,6 +605,15 @@ def build_receipt(
     if isinstance(excluded_claimed_paths, int) and not isinstance(excluded_claimed_paths, bool):
         if excluded_claimed_paths > 0:
             receipt["excluded_claimed_paths"] = excluded_claimed_paths
+    # How the bracketing snapshots were paid for: reports hashed versus digests
+    # the stat cache reused, summed over both sides. Absent when neither side
+    # ran the cached scan, so a double's receipt stays field-for-field v2.
+    sides = [getattr(side, "hashing", None) for side in (before, after)]
+    sides = [side for side in sides if side]
+    if sides:
+        receipt["report_hashing"] = {
+            key: sum(side[key] for side in sides) for key in ("hashed", "reused")
+        }
     return receipt
 
 
@@ -496,8 +645,11 @@ def write_receipt(
         result = execute(command) or {}
     except Exception as exc:
         logger.debug(f"invocation receipt {receipt_id} not persisted: {exc}")
+        note_evidence_written(execute, final, body, False)
         return False
-    return _succeeded(result)
+    written = _succeeded(result)
+    note_evidence_written(execute, final, body, written)
+    return written
 
 
 def record_invocation(
@@ -628,6 +780,19 @@ def _parse_sha256sum(output: str) -> Dict[str, str]:
     return snapshot
 
 
+def _parse_hash_stats(output: str) -> Optional[Dict[str, int]]:
+    """The stat cache's `{"hashed", "reused"}` line; None when it did not run."""
+    for line in reversed((output or "").splitlines()):
+        if not line.startswith(REPORT_HASH_STATS_MARKER):
+            continue
+        try:
+            stats = json.loads(line[len(REPORT_HASH_STATS_MARKER) :])
+            return {key: int(stats[key]) for key in ("hashed", "reused")}
+        except (ValueError, TypeError, KeyError):
+            return None
+    return None
+
+
 def _parse_testcase_tags(output: str) -> Tuple[List[Dict[str, str]], int]:
     """The container's tag token stream -> (sorted nodes, nodes seen).
 
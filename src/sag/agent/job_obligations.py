@@ -40,6 +40,7 @@ from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Set,
 from loguru import logger
 
 from .evidence_assessments import ensure_receipt_assessed
+from .evidence_store import lookup_evidence, note_evidence_written, stored_records
 from .invocation_contracts import contract_receipt_fields
 from .invocation_receipts import (
     RECEIPT_DIR,
@@ -223,8 +224,11 @@ def write_obligation(
         result = execute(command) or {}
     except Exception as exc:
         logger.debug(f"job obligation {identifier} not persisted: {exc}")
+        note_evidence_written(execute, final, body, False)
         return False
-    return _succeeded(result)
+    written = _succeeded(result)
+    note_evidence_written(execute, final, body, written)
+    return written
 
 
 # The §3.3 cap's stand-in job id when the ledger itself could not be read.
@@ -253,6 +257,12 @@ def read_obligations(orchestrator: Any) -> Optional[List[Dict[str, Any]]]:
         execute = orchestrator if callable(orchestrator) else None
     if execute is None:
         return []
+    stored = stored_records(execute, OBLIGATION_DIR)
+    if stored is not None:
+        return sorted(
+            (record for record in stored if _text(record.get("job_id"))),
+            key=lambda record: _text(record.get("job_id")),
+        )
     try:
         probe = execute(f"cat {shlex.quote(OBLIGATION_DIR)}/*.json 2>/dev/null")
     except Exception as exc:
@@ -614,22 +624,26 @@ def _receipt_claims(
     ordinal is what makes the list ORDERED against a dispatch, which is the
     whole basis of the first-claim rule.
     """
-    try:
-        probe = execute(f"cat {shlex.quote(RECEIPT_DIR)}/*.json 2>/dev/null") or {}
-    except Exception as exc:
-        logger.debug(f"{RECEIPT_DIR} unavailable for attribution: {exc}")
-        return []
-    claims: List[Tuple[Optional[int], Tuple[str, ...]]] = []
-    for line in str(probe.get("output") or "").splitlines():
-        stripped = line.strip()
-        if not stripped.startswith("{"):
-            continue
+    payloads = stored_records(execute, RECEIPT_DIR)
+    if payloads is None:
         try:
-            payload = json.loads(stripped)
-        except (TypeError, ValueError):
-            continue
-        if not isinstance(payload, Mapping):
-            continue
+            probe = execute(f"cat {shlex.quote(RECEIPT_DIR)}/*.json 2>/dev/null") or {}
+        except Exception as exc:
+            logger.debug(f"{RECEIPT_DIR} unavailable for attribution: {exc}")
+            return []
+        payloads = []
+        for line in str(probe.get("output") or "").splitlines():
+            stripped = line.strip()
+            if not stripped.startswith("{"):
+                continue
+            try:
+                payload = json.loads(stripped)
+            except (TypeError, ValueError):
+                continue
+            if isinstance(payload, Mapping):
+                payloads.append(payload)
+    claims: List[Tuple[Optional[int], Tuple[str, ...]]] = []
+    for payload in payloads:
         paths = tuple(_delta_paths(payload.get("report_delta")))
         if paths:
             claims.append((_receipt_sequence(payload.get("receipt_id")), paths))
@@ -711,6 +725,9 @@ def _read_existing(
     An unparseable file is reported as a body that matches nothing, so the
     caller refuses instead of overwriting bytes it cannot account for.
     """
+    cached = lookup_evidence(execute, path)
+    if cached is not None:
+        return cached
     try:
         result = execute(f"cat {shlex.quote(path)}") or {}
     except Exception as exc:
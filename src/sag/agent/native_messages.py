@@ -32,6 +32,11 @@ Rendering rules (Plan 2 Task 2; each is covered by ``tests/test_native_messages.
    exact bug this replaces.
 8. Legacy OBSERVATION steps without a ``tool_call_id`` become
    ``{"role": "user", "content": "[observation] " + <clamped>}``.
+
+Rendering is deterministic, so consecutive requests of one phase share a
+byte-identical prefix (system prompt, phase intro, the ledger, every earlier
+turn). ``add_cache_breakpoints`` marks that prefix for providers whose prompt
+cache needs explicit breakpoints; OpenAI-style providers cache it unmarked.
 """
 
 from __future__ import annotations
@@ -47,6 +52,10 @@ _CLAMP_TAIL = 3000
 
 _CANCELLED = "[cancelled by harness: no result was produced for this call]"
 
+CACHE_CONTROL = {"type": "ephemeral"}
+# Marks the compaction ledger, which sits right after the phase intro.
+_LEDGER_MARKER = "ATTEMPT LEDGER"
+
 
 def _clamp(content: Optional[str]) -> str:
     """Truncate long tool output through the middle, keeping head and tail."""
@@ -148,3 +157,49 @@ def _repair_pairing(messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
             answered.add(call_id)
             repaired.append(reply if reply is not None else _cancellation(call_id))
     return repaired
+
+
+def add_cache_breakpoints(messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Copy of ``messages`` with prompt-cache breakpoints (at most three;
+    Anthropic accepts four).
+
+    1. The system prompt: identical for the whole run.
+    2. The window head: the phase intro, or the compaction ledger right after
+       it. It is identical until the next phase or compaction.
+    3. The last message: each request writes the conversation so far, and
+       the next request, which only extends it, reads that prefix back.
+
+    A breakpoint that lands on a message with no text content (an assistant
+    turn that only calls tools) moves to the nearest earlier message that has
+    some. ``messages`` itself is not modified.
+    """
+    marked = [dict(message) for message in messages]
+    if not marked:
+        return marked
+    head = 1 if len(marked) > 1 and marked[1]["role"] == "user" else None
+    if (
+        head is not None
+        and len(marked) > 2
+        and marked[2]["role"] == "user"
+        and _LEDGER_MARKER in str(marked[2].get("content") or "")
+    ):
+        head = 2
+    positions = {0, len(marked) - 1}
+    if head is not None:
+        positions.add(head)
+    for position in sorted(positions, reverse=True):
+        # A message already marked no longer has string content, so two
+        # breakpoints that land together spread out instead of merging.
+        while position >= 0 and not _has_text(marked[position]):
+            position -= 1
+        if position >= 0:
+            message = marked[position]
+            message["content"] = [
+                {"type": "text", "text": message["content"], "cache_control": dict(CACHE_CONTROL)}
+            ]
+    return marked
+
+
+def _has_text(message: Dict[str, Any]) -> bool:
+    content = message.get("content")
+    return isinstance(content, str) and bool(content)
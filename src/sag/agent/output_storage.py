@@ -8,6 +8,7 @@ in the main context files. It provides indexing and search capabilities.
 import hashlib
 import json
 import re
+import threading
 from collections.abc import Mapping
 from datetime import datetime
 from pathlib import Path
@@ -15,7 +16,15 @@ from typing import Any, Dict, List, Optional
 
 from loguru import logger
 
+from sag.agent.output_trigrams import (
+    TrigramPostings,
+    decode_trigrams,
+    encode_trigrams,
+    required_trigrams,
+    text_trigrams,
+)
 from sag.project_fact_sheet import project_fact_sheet_identity
+from sag.runtime.container_io import archive_orchestrator, read_container_text
 from sag.tools.base import (
     OutputPersistenceError,
     ToolResult,
@@ -185,7 +194,18 @@ def atomic_write_container_text(orchestrator, path: str, content: str) -> None:
 
 
 class OutputStorageManager:
-    """Manages storage of full outputs with indexing for efficient retrieval."""
+    """Manages storage of full outputs with indexing for efficient retrieval.
+
+    ``full_outputs.jsonl`` holds one record per line and is the source of
+    truth. ``output_index.jsonl`` is an append-only log of index rows (last
+    row per ref wins) carrying each record's byte ``offset`` and ``length``,
+    so a retrieval is one ranged read and a store appends one index row
+    instead of rewriting the whole index. Rows from the legacy
+    ``output_index.json`` (line numbers, no offsets) are merged under the
+    JSONL rows and still resolve through a line read. ``output_trigrams.jsonl``
+    holds one trigram row per output so pattern searches only load outputs
+    that can match.
+    """
 
     def __init__(self, storage_dir: Path, orchestrator=None):
         """
@@ -202,7 +222,13 @@ class OutputStorageManager:
         # These are the actual paths inside the container, not host paths
         self.container_storage_dir = "/workspace/.setup_agent/contexts"
         self.container_storage_file = f"{self.container_storage_dir}/full_outputs.jsonl"
-        self.container_index_file = f"{self.container_storage_dir}/output_index.json"
+        self.container_index_file = f"{self.container_storage_dir}/output_index.jsonl"
+        self.container_legacy_index_file = f"{self.container_storage_dir}/output_index.json"
+        self.container_trigram_file = f"{self.container_storage_dir}/output_trigrams.jsonl"
+        # Concurrent read-only tool calls store outputs from worker threads; a
+        # record's byte offset is only meaningful if its append and index row
+        # are not interleaved with another store.
+        self._store_lock = threading.Lock()
 
         # If we have an orchestrator, ensure directory exists in container
         if self.orchestrator:
@@ -240,14 +266,22 @@ class OutputStorageManager:
                 )
                 # Update file paths after changing storage_dir
                 self.storage_file = self.storage_dir / "full_outputs.jsonl"
-                self.index_file = self.storage_dir / "output_index.json"
+                self.index_file = self.storage_dir / "output_index.jsonl"
             except Exception as e:
                 logger.error(f"Failed to create storage directory {self.storage_dir}: {e}")
 
         # Set file paths for local operations (may have been updated in exception handler)
         if not hasattr(self, "storage_file"):
             self.storage_file = self.storage_dir / "full_outputs.jsonl"
-            self.index_file = self.storage_dir / "output_index.json"
+            self.index_file = self.storage_dir / "output_index.jsonl"
+        self.legacy_index_file = self.storage_dir / "output_index.json"
+        self.trigram_file = self.storage_dir / "output_trigrams.jsonl"
+        # Posting lists folded from output_trigrams.jsonl; only rows past
+        # _trigram_offset (appended by any manager since) are read again.
+        self._trigrams = TrigramPostings()
+        self._trigram_offset = 0
+        # Nothing writes the legacy index any more: it is read once.
+        self._legacy_index: Optional[Dict[str, Dict[str, Any]]] = None
 
         # Log initialization - show both container and local paths when using orchestrator
         if self.orchestrator:
@@ -264,36 +298,84 @@ class OutputStorageManager:
     def _load_index(self) -> Dict[str, Dict[str, Any]]:
         """Load the existing index or create a new one."""
         if self.orchestrator:
-            # Check if index exists in container using container path
-            check_cmd = f"test -f {self.container_index_file} && cat {self.container_index_file}"
-            check_result = self.orchestrator.execute_command(check_cmd)
-
-            if check_result.get("exit_code") == 0 and check_result.get("output"):
-                try:
-                    return json.loads(check_result["output"])
-                except Exception as e:
-                    logger.warning(f"Failed to parse output index from container: {e}")
+            index_text = self._read_container_file(self.container_index_file)
         else:
             # Local filesystem fallback
-            if self.index_file.exists():
-                try:
-                    with open(self.index_file, "r") as f:
-                        return json.load(f)
-                except Exception as e:
-                    logger.warning(f"Failed to load output index: {e}")
+            index_text = None
+            try:
+                if self.index_file.exists():
+                    index_text = self.index_file.read_text(encoding="utf-8")
+            except Exception as e:
+                logger.warning(f"Failed to load output index: {e}")
+
+        # Refs stored before the JSONL index existed are only in the legacy
+        # one; JSONL rows (newer, with offsets) win for refs in both.
+        index: Dict[str, Dict[str, Any]] = dict(self._load_legacy_index())
+        for line in (index_text or "").splitlines():
+            try:
+                row = json.loads(line)
+            except ValueError:
+                # A torn final row from an interrupted append; the JSONL
+                # store still holds the record, so recovery can find it.
+                continue
+            if isinstance(row, dict) and is_output_storage_ref(row.get("ref_id")):
+                index[row.pop("ref_id")] = row
+        if index:
+            return index
         return self._rebuild_index_from_storage()
 
-    def _save_index(self):
-        """Save the current index to disk."""
+    def _load_legacy_index(self) -> Dict[str, Dict[str, Any]]:
+        """Rows of the legacy ``output_index.json``, read on first use."""
+        if self._legacy_index is not None:
+            return self._legacy_index
+        legacy_text = None
+        if self.orchestrator:
+            legacy_text = self._read_container_file(self.container_legacy_index_file)
+        else:
+            try:
+                if self.legacy_index_file.exists():
+                    legacy_text = self.legacy_index_file.read_text(encoding="utf-8")
+            except Exception as e:
+                logger.warning(f"Failed to load legacy output index: {e}")
+        legacy: Dict[str, Dict[str, Any]] = {}
+        if legacy_text:
+            try:
+                parsed = json.loads(legacy_text)
+                legacy = {
+                    ref_id: dict(row)
+                    for ref_id, row in parsed.items()
+                    if is_output_storage_ref(ref_id) and isinstance(row, dict)
+                }
+            except Exception as e:
+                logger.warning(f"Failed to parse legacy output index: {e}")
+        self._legacy_index = legacy
+        return legacy
+
+    def _read_container_file(self, path: str) -> Optional[str]:
+        """Whole container file, or None when it is absent or unreadable."""
+        transport = archive_orchestrator(self.orchestrator)
+        if transport is not None:
+            try:
+                data = transport.read_archive_file(path)
+                return None if data is None else data.decode("utf-8", errors="replace")
+            except Exception as e:
+                logger.debug(f"Archive read of {path} fell back to cat: {e}")
+        result = self.orchestrator.execute_command(f"test -f {path} && cat {path}")
+        if result.get("exit_code") == 0 and result.get("output"):
+            return result["output"]
+        return None
+
+    def _append_index_entry(self, ref_id: str, entry: Dict[str, Any]) -> None:
+        """Append one index row; concurrent writers never clobber each other's rows."""
+        row = json.dumps({"ref_id": ref_id, **entry})
         try:
             if self.orchestrator:
-                index_json = json.dumps(self.current_index, indent=2)
-                if not self._write_container_text(self.container_index_file, index_json):
-                    raise OSError("failed to save output index to container")
+                if not self._write_container_text(self.container_index_file, row, append=True):
+                    raise OSError("failed to append output index row in container")
             else:
                 # Local filesystem fallback
-                with open(self.index_file, "w") as f:
-                    json.dump(self.current_index, f, indent=2)
+                with open(self.index_file, "a", encoding="utf-8") as f:
+                    f.write(row + "\n")
         except Exception as exc:
             raise OSError(f"failed to save output index: {exc}") from exc
 
@@ -303,10 +385,78 @@ class OutputStorageManager:
         # payload never trips the kernel per-arg limit ("argument list too long").
         return write_container_text(self.orchestrator, path, content, append=append)
 
+    def _append_trigram_row(self, ref_id: str, output: str) -> None:
+        """Index ``output``'s trigrams; a ref without a row is simply always scanned."""
+        grams = text_trigrams(output)
+        row = json.dumps({"ref_id": ref_id, "trigrams": encode_trigrams(grams)})
+        try:
+            if self.orchestrator:
+                if not self._write_container_text(self.container_trigram_file, row, append=True):
+                    logger.warning(f"Failed to index trigrams for {ref_id}")
+                    return
+            else:
+                with open(self.trigram_file, "a", encoding="utf-8") as f:
+                    f.write(row + "\n")
+        except Exception as exc:
+            logger.warning(f"Failed to index trigrams for {ref_id}: {exc}")
+            return
+        self._trigrams.add(ref_id, grams)
+
+    def _read_trigram_tail(self) -> str:
+        """output_trigrams.jsonl from ``_trigram_offset`` on ("" when absent)."""
+        if not self.orchestrator:
+            if not self.trigram_file.exists():
+                return ""
+            with open(self.trigram_file, "rb") as f:
+                f.seek(self._trigram_offset)
+                return f.read().decode("utf-8", errors="replace")
+
+        command = f"tail -c +{self._trigram_offset + 1} {self.container_trigram_file} 2>/dev/null"
+        # Many rows are far past the presentation truncation threshold.
+        try:
+            result = self.orchestrator.execute_command(command, truncate_output=False)
+        except TypeError as exc:
+            if "truncate_output" not in str(exc):
+                raise
+            result = self.orchestrator.execute_command(command)
+        if result.get("exit_code") != 0:
+            return ""
+        return str(result.get("output") or "")
+
+    def _refresh_trigrams(self) -> None:
+        try:
+            tail = self._read_trigram_tail()
+        except Exception as exc:
+            logger.warning(f"Failed to read output trigram index: {exc}")
+            return
+        for line in tail.splitlines():
+            try:
+                row = json.loads(line)
+                ref_id, encoded = row["ref_id"], row["trigrams"]
+            except (ValueError, TypeError, KeyError):
+                # A row still being appended: pick it up on the next refresh.
+                break
+            self._trigrams.add(ref_id, decode_trigrams(encoded))
+            self._trigram_offset += len(line.encode("utf-8")) + 1
+
+    def may_contain(self, ref_id: str, pattern: str) -> bool:
+        """False only when the trigram index proves ``pattern`` cannot match ``ref_id``."""
+        required = required_trigrams(pattern)
+        if not required:
+            return True
+        self._refresh_trigrams()
+        return bool(self._trigrams.may_match([ref_id], required))
+
     @staticmethod
-    def _index_entry(record: Dict[str, Any], line_number: int) -> Dict[str, Any]:
+    def _index_entry(
+        record: Dict[str, Any],
+        line_number: int = 0,
+        *,
+        offset: Optional[int] = None,
+        length: Optional[int] = None,
+    ) -> Dict[str, Any]:
         output = str(record.get("output") or "")
-        return {
+        entry = {
             "task_id": record.get("task_id"),
             "tool_name": record.get("tool_name"),
             "timestamp": record.get("timestamp"),
@@ -316,6 +466,29 @@ class OutputStorageManager:
             "last_100_chars": output[-100:] if len(output) > 100 else output,
             "metadata": record.get("metadata") or {},
         }
+        if offset is not None and length is not None:
+            entry["offset"] = offset
+            entry["length"] = length
+        return entry
+
+    def _read_storage_range(self, offset: int, length: int) -> Optional[Dict[str, Any]]:
+        """Read one record by byte range: a seek, not a scan of the whole store."""
+        try:
+            if self.orchestrator:
+                result = self.orchestrator.execute_command(
+                    f"tail -c +{int(offset) + 1} {self.container_storage_file} "
+                    f"| head -c {int(length)}"
+                )
+                if result.get("exit_code") != 0 or not result.get("output"):
+                    return None
+                return json.loads(result["output"])
+
+            with open(self.storage_file, "rb") as storage_file:
+                storage_file.seek(int(offset))
+                return json.loads(storage_file.read(int(length)))
+        except Exception as exc:
+            logger.warning(f"Failed to read output storage range {offset}+{length}: {exc}")
+        return None
 
     def _read_storage_line(self, line_number: int) -> Optional[Dict[str, Any]]:
         try:
@@ -337,28 +510,89 @@ class OutputStorageManager:
             logger.warning(f"Failed to read output storage line {line_number}: {exc}")
         return None
 
+    def _read_indexed_record(self, ref_id: str, info: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """The record an index row points at, verified against ``ref_id``."""
+        if info.get("offset") is not None and info.get("length") is not None:
+            record = self._read_storage_range(info["offset"], info["length"])
+            if isinstance(record, dict) and record.get("ref_id") == ref_id:
+                return record
+        line_number = int(info.get("line_number", 0) or 0)
+        if line_number > 0:
+            record = self._read_storage_line(line_number)
+            if isinstance(record, dict) and record.get("ref_id") == ref_id:
+                return record
+        return None
+
     def _rebuild_index_from_storage(self) -> Dict[str, Dict[str, Any]]:
-        """Recover searchable metadata from the append-only JSONL source of truth."""
+        """Recover searchable metadata from the append-only JSONL source of truth.
+
+        One read of the whole store; byte offsets are recomputed on the way.
+        """
         rebuilt: Dict[str, Dict[str, Any]] = {}
-        for line_number in range(1, self._count_lines_in_file() + 1):
-            record = self._read_storage_line(line_number)
+        try:
+            if self.orchestrator:
+                text = read_container_text(
+                    self.orchestrator, self.container_storage_file, exact_bytes=True
+                )
+                data = (text or "").encode("utf-8")
+            elif self.storage_file.exists():
+                data = self.storage_file.read_bytes()
+            else:
+                data = b""
+        except Exception as exc:
+            logger.warning(f"Failed to read output storage for index recovery: {exc}")
+            return rebuilt
+
+        offset = 0
+        for line_number, line in enumerate(data.split(b"\n"), 1):
+            start, offset = offset, offset + len(line) + 1
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
             if not isinstance(record, dict):
                 continue
             ref_id = record.get("ref_id")
             if not is_output_storage_ref(ref_id):
                 continue
-            rebuilt[ref_id] = self._index_entry(record, line_number)
+            rebuilt[ref_id] = self._index_entry(
+                record, line_number, offset=start, length=len(line)
+            )
         return rebuilt
 
+    def _storage_size(self) -> Optional[int]:
+        """Byte size of the JSONL store (``wc -c`` on a file is a stat, not a scan)."""
+        if self.orchestrator:
+            result = self.orchestrator.execute_command(
+                f"test -f {self.container_storage_file} && wc -c < {self.container_storage_file} "
+                "|| echo 0"
+            )
+            if result.get("exit_code") != 0:
+                return None
+            try:
+                return int(str(result.get("output", "")).strip())
+            except ValueError:
+                return None
+        try:
+            return self.storage_file.stat().st_size if self.storage_file.exists() else 0
+        except OSError:
+            return None
+
     def _index_may_be_stale(self) -> bool:
-        indexed_line = max(
+        rows = [info for info in self.current_index.values() if isinstance(info, dict)]
+        indexed_end = max(
             (
-                int(info.get("line_number", 0) or 0)
-                for info in self.current_index.values()
-                if isinstance(info, dict)
+                int(info["offset"]) + int(info["length"]) + 1
+                for info in rows
+                if info.get("offset") is not None and info.get("length") is not None
             ),
-            default=0,
+            default=None,
         )
+        if indexed_end is not None:
+            size = self._storage_size()
+            if size is not None:
+                return size > indexed_end
+        indexed_line = max((int(info.get("line_number", 0) or 0) for info in rows), default=0)
         return self._count_lines_in_file() > indexed_line
 
     def store_output(
@@ -382,6 +616,17 @@ class OutputStorageManager:
         Returns:
             Reference ID for retrieving this output
         """
+        with self._store_lock:
+            return self._store_output(task_id, tool_name, output, timestamp, metadata)
+
+    def _store_output(
+        self,
+        task_id: str,
+        tool_name: str,
+        output: str,
+        timestamp: Optional[str],
+        metadata: Optional[Dict[str, Any]],
+    ) -> str:
         # Generate a unique ID for this output
         timestamp = timestamp or datetime.now().isoformat()
         metadata = _storage_metadata(metadata)
@@ -401,26 +646,30 @@ class OutputStorageManager:
             "metadata": metadata,
         }
 
-        # Append to storage file (JSONL format for efficient appending)
+        # Append to storage file (JSONL format for efficient appending).
+        # json.dumps escapes non-ASCII, so character and byte lengths agree.
+        json_line = json.dumps(record)
+        offset: Optional[int] = None
+        line_number = 0
         try:
             # Store in container if orchestrator is available
             if self.orchestrator:
-                json_line = json.dumps(record)
                 if self._write_container_text(self.container_storage_file, json_line, append=True):
                     logger.debug(
                         f"Stored output in container: ref_id={ref_id}, task={task_id}, tool={tool_name}, length={len(output)}"
                     )
                 else:
                     return ""
+                size = self._storage_size()
+                if size is not None and size > len(json_line):
+                    offset = size - len(json_line) - 1
+                else:
+                    line_number = self._count_lines_in_file()
             else:
                 # Fallback to local filesystem (for testing)
-                # Ensure file exists before appending
-                if not self.storage_file.exists():
-                    self.storage_file.touch()
-                    logger.debug(f"Created storage file locally: {self.storage_file}")
-
-                with open(self.storage_file, "a") as f:
-                    f.write(json.dumps(record) + "\n")
+                with open(self.storage_file, "ab") as f:
+                    offset = f.tell()
+                    f.write(json_line.encode("utf-8") + b"\n")
                     logger.debug(
                         f"Stored output locally: ref_id={ref_id}, task={task_id}, tool={tool_name}, length={len(output)}"
                     )
@@ -428,30 +677,21 @@ class OutputStorageManager:
             logger.error(f"Failed to store output to {self.storage_file}: {e}")
             return ""
 
-        # Reload-and-merge before saving: _save_index() overwrites the shared
-        # container index file from this instance's in-memory copy. Other
-        # OutputStorageManager instances (each tool builds its own) append to the
-        # SAME jsonl/index, so saving a stale cache would clobber their refs — e.g.
-        # the build tool's manager wiping the maven compile-log ref, after which the
-        # agent's output_search returns "No output found" and it cannot diagnose the
-        # build. Refresh from disk so we add to the union, never overwrite it. The
-        # jsonl is global/append-only, so the line_number below stays valid.
-        self.current_index = self._load_index()
-
-        # Update index with searchable metadata
-        self.current_index[ref_id] = {
-            "task_id": task_id,
-            "tool_name": tool_name,
-            "timestamp": timestamp,
-            "output_length": len(output),
-            "line_number": self._count_lines_in_file(),  # Line number in JSONL file
-            "first_100_chars": output[:100],
-            "last_100_chars": output[-100:] if len(output) > 100 else output,
-            "metadata": metadata,
-        }
+        # Index rows are appended, never rewritten, so other
+        # OutputStorageManager instances (each tool builds its own) appending
+        # to the same jsonl/index cannot clobber each other's refs — e.g. the
+        # build tool's manager wiping the maven compile-log ref, after which
+        # the agent's output_search returns "No output found".
+        entry = self._index_entry(
+            record,
+            line_number,
+            offset=offset,
+            length=len(json_line) if offset is not None else None,
+        )
+        self.current_index[ref_id] = entry
 
         try:
-            self._save_index()
+            self._append_index_entry(ref_id, entry)
         except OSError as exc:
             recovered = self._rebuild_index_from_storage()
             if ref_id not in recovered:
@@ -460,6 +700,7 @@ class OutputStorageManager:
                 ) from exc
             self.current_index = recovered
             logger.warning(f"Output index write failed; using JSONL recovery: {exc}")
+        self._append_trigram_row(ref_id, output)
         logger.debug(f"Stored full output with ref_id: {ref_id} ({len(output)} chars)")
         return ref_id
 
@@ -587,8 +828,7 @@ class OutputStorageManager:
         # retrieval path; this index row only avoids a pre-filter filesystem
         # scan after restart.
         try:
-            self.current_index = self._load_index()
-            self.current_index[ref_id] = {
+            entry = {
                 "task_id": task_id,
                 "tool_name": tool_name,
                 "timestamp": timestamp,
@@ -599,7 +839,8 @@ class OutputStorageManager:
                 "metadata": metadata,
                 "storage_mode": "emergency",
             }
-            self._save_index()
+            self.current_index[ref_id] = entry
+            self._append_index_entry(ref_id, entry)
         except Exception as exc:
             # The content-addressed emergency record still round-trips by ref.
             # Search has a bounded legacy-record scan as a secondary recovery
@@ -663,22 +904,17 @@ class OutputStorageManager:
                 logger.warning(f"Reference ID not found in index or JSONL: {ref_id}")
                 return None
 
-        index_info = self.current_index[ref_id]
-        line_number = index_info.get("line_number", 0)
-
         try:
-            if self.orchestrator:
-                # Retrieve from container using container path
-                record = self._read_storage_line(line_number)
-                if record and record.get("ref_id") == ref_id:
-                    return record.get("output", "")
-            else:
-                # Local filesystem fallback
-                with open(self.storage_file, "r") as f:
-                    for i, line in enumerate(f, 1):
-                        if i == line_number:
-                            record = json.loads(line)
-                            return record.get("output", "")
+            record = self._read_indexed_record(ref_id, self.current_index[ref_id])
+            if record is None:
+                # A row whose range no longer holds its record (an interleaved
+                # append from another writer): recover offsets from the store.
+                recovered = self._rebuild_index_from_storage().get(ref_id)
+                if recovered is not None:
+                    self.current_index[ref_id] = recovered
+                    record = self._read_indexed_record(ref_id, recovered)
+            if record is not None:
+                return record.get("output", "")
         except Exception as e:
             logger.error(f"Failed to retrieve output: {e}")
 
@@ -784,6 +1020,15 @@ class OutputStorageManager:
                 logger.error(f"Invalid regex pattern: {e}")
                 return []
 
+            # Only load outputs that contain every trigram the pattern needs.
+            required = required_trigrams(pattern)
+            if required:
+                self._refresh_trigrams()
+                possible = self._trigrams.may_match(
+                    (ref_id for ref_id, _info in candidates), required
+                )
+                candidates = [(ref_id, info) for ref_id, info in candidates if ref_id in possible]
+
             for ref_id, info in candidates:
                 if len(results) >= limit:
                     break
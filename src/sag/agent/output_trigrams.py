@@ -0,0 +1,125 @@
+"""Trigram index over stored tool outputs.
+
+``OutputStorageManager.search_outputs`` used to load every candidate output
+(one container round trip each) and regex-scan it, so a pattern search late in
+a long run paid for every build log ever stored. Each stored output now gets
+one row listing its distinct trigrams; the rows fold into in-memory posting
+lists, and a search only loads the outputs that contain every trigram the
+pattern requires.
+
+Narrowing is conservative: it may keep an output the regex then rejects, but
+it never drops one the regex would match. Searches are case-insensitive, so
+text is indexed case-folded, and only ASCII trigrams are kept — the required
+trigrams come from ASCII literal runs in the pattern, the only ones whose
+``re.IGNORECASE`` equivalence classes ``_FOLD`` reproduces exactly.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional, Set
+
+try:  # Python 3.11+
+    from re import _parser as _sre_parse
+except ImportError:  # pragma: no cover - Python 3.10
+    import sre_parse as _sre_parse
+
+# Non-ASCII characters that re.IGNORECASE treats as equal to an ASCII letter.
+_FOLD = str.maketrans({"İ": "i", "ı": "i", "ſ": "s", "K": "k"})
+
+_REPEATS = (_sre_parse.MAX_REPEAT, _sre_parse.MIN_REPEAT)
+_POSSESSIVE_REPEAT = getattr(_sre_parse, "POSSESSIVE_REPEAT", None)
+_ZERO_WIDTH = (_sre_parse.AT,)
+
+
+def _fold(text: str) -> str:
+    return text.translate(_FOLD).lower()
+
+
+def text_trigrams(text: str) -> Set[str]:
+    """Distinct case-folded ASCII trigrams of ``text``."""
+    folded = _fold(text)
+    return {
+        folded[i : i + 3]
+        for i in range(len(folded) - 2)
+        if folded[i : i + 3].isascii()
+    }
+
+
+def encode_trigrams(grams: Iterable[str]) -> str:
+    """Trigrams as one sorted string (every trigram is exactly three characters)."""
+    return "".join(sorted(grams))
+
+
+def decode_trigrams(encoded: str) -> Set[str]:
+    return {encoded[i : i + 3] for i in range(0, len(encoded) - 2, 3)}
+
+
+def _literal_runs(parsed) -> List[str]:
+    """ASCII literal strings every match of ``parsed`` must contain."""
+    runs: List[str] = []
+    current: List[str] = []
+
+    def flush():
+        if current:
+            runs.append("".join(current))
+            current.clear()
+
+    for op, av in parsed:
+        if op is _sre_parse.LITERAL and av < 128:
+            current.append(chr(av))
+        elif op in _ZERO_WIDTH:
+            # Anchors consume nothing: "^foo" and "\bfoo" keep "foo" contiguous.
+            continue
+        elif op is _sre_parse.SUBPATTERN:
+            flush()
+            runs.extend(_literal_runs(av[-1]))
+        elif (op in _REPEATS or op is _POSSESSIVE_REPEAT) and av[0] >= 1:
+            # Body occurs at least once; its neighbours are no longer adjacent.
+            flush()
+            runs.extend(_literal_runs(av[2]))
+        else:
+            flush()
+    flush()
+    return runs
+
+
+def required_trigrams(pattern: str) -> Optional[Set[str]]:
+    """Trigrams any text matching ``pattern`` must contain; None when none are known."""
+    try:
+        parsed = _sre_parse.parse(pattern)
+    except Exception:
+        return None
+    grams: Set[str] = set()
+    for run in _literal_runs(parsed):
+        grams |= text_trigrams(run)
+    return grams or None
+
+
+class TrigramPostings:
+    """Posting lists ``trigram -> refs`` for every indexed output."""
+
+    def __init__(self):
+        self._postings: Dict[str, Set[str]] = {}
+        self._indexed: Set[str] = set()
+
+    def add(self, ref_id: str, grams: Iterable[str]) -> None:
+        self._indexed.add(ref_id)
+        for gram in grams:
+            self._postings.setdefault(gram, set()).add(ref_id)
+
+    def is_indexed(self, ref_id: str) -> bool:
+        return ref_id in self._indexed
+
+    def may_match(self, ref_ids: Iterable[str], required: Optional[Set[str]]) -> Set[str]:
+        """The subset of ``ref_ids`` that may match; unindexed refs always may."""
+        ref_ids = set(ref_ids)
+        if not required:
+            return ref_ids
+        matching: Optional[Set[str]] = None
+        # Rarest trigram first keeps the intersection small.
+        for gram in sorted(required, key=lambda g: len(self._postings.get(g, ()))):
+            refs = self._postings.get(gram, set())
+            matching = set(refs) if matching is None else matching & refs
+            if not matching:
+                break
+        return (matching or set()) & ref_ids | (ref_ids - self._indexed)
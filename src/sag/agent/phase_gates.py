@@ -14,6 +14,7 @@ from typing import Any, Iterable, Mapping, Optional
 
 from loguru import logger
 
+from .evidence_store import stored_records
 from .invocation_receipts import RECEIPT_DIR
 from .phase_machine import PhaseClaim, PhaseOutcome
 
@@ -968,6 +969,9 @@ def _read_json_records(orchestrator, directory: str) -> list[Mapping[str, Any]]:
     """
     if orchestrator is None:
         return []
+    stored = stored_records(orchestrator, directory)
+    if stored is not None:
+        return stored
     try:
         probe = orchestrator.execute_command(
             f"cat {shlex.quote(directory)}/*.json 2>/dev/null",
@@ -28,10 +28,15 @@ from typing import Any, Dict, List, Optional
 
 from loguru import logger
 
+from sag.agent.project_files import project_files_for
+from sag.agent.survey_probe import LISTING, SOURCE_DIRS, TEST_DIRS
+
 # Enforcer version accepts range syntax ([1.8,), [11,17)); capture the lower
 # bound including a legacy "1.x" form (the old \d+ captured "1" from "1.8").
 ENFORCER_JAVA_PATTERN = r"<requireJavaVersion>.*?<version>\s*\[?\s*(\d+(?:\.\d+)?)"
 WORKSPACE_ROOT = "/workspace"
+# The README prefix the documentation analysis reads, cached or not.
+README_MAX_CHARS = 10000
 
 
 def normalize_java_version(raw) -> Optional[str]:
@@ -53,10 +58,47 @@ def normalize_java_version(raw) -> Optional[str]:
 
 
 def path_exists(orch, path: str) -> bool:
+    files = project_files_for(orch)
+    if files is not None:
+        return files.exists(path)
     result = orch.execute_command(f"test -e {shlex.quote(path)} && echo yes || echo no")
     return "yes" in (result.get("output") or "")
 
 
+def _probe(orch, path: str, command: str, *, directory: bool = False) -> bool:
+    """A ``test -f``/``test -d`` ``command`` echoing 'exists', answered from
+    the run's project-file cache when the orchestrator has one."""
+    files = project_files_for(orch)
+    if files is not None:
+        return files.is_dir(path) if directory else files.is_file(path)
+    result = orch.execute_command(command)
+    return bool(result.get("success") and "exists" in (result.get("output") or ""))
+
+
+def _read_text(orch, path: str, command: str, **kwargs: Any) -> Optional[str]:
+    """What a ``cat`` ``command`` of ``path`` printed, None when it failed.
+
+    Served from the run's project-file cache (full text) when the
+    orchestrator has one; otherwise ``command`` runs as it always did.
+    """
+    files = project_files_for(orch)
+    if files is not None:
+        return files.read(path)
+    result = orch.execute_command(command, **kwargs)
+    return result.get("output", "") if result.get("success") else None
+
+
+def _scan_lines(orch, kind: str, path: str, command: str) -> List[str]:
+    """The lines ``command`` prints, served from the survey probe's ``kind``
+    scan of ``path`` when the run's project-file cache holds one."""
+    files = project_files_for(orch)
+    lines = files.scan(kind, path) if files is not None else None
+    if lines is None:
+        found = orch.execute_command(command)
+        lines = (found.get("output") or "").splitlines()
+    return lines
+
+
 def _is_workspace_owned_path(
     orch,
     path: str,
@@ -241,10 +283,11 @@ def analyze_project_structure(orch, project_path: str) -> Dict[str, Any]:
 
     existing_files = []
     for file in files_to_check:
-        result = orch.execute_command(
-            f"test -f {project_path}/{file} && echo 'exists' || echo 'missing'"
-        )
-        if result.get("success") and "exists" in result.get("output", ""):
+        if _probe(
+            orch,
+            f"{project_path}/{file}",
+            f"test -f {project_path}/{file} && echo 'exists' || echo 'missing'",
+        ):
             existing_files.append(file)
 
     gradle_markers = (
@@ -301,9 +344,14 @@ def analyze_project_structure(orch, project_path: str) -> Dict[str, Any]:
     # receiving a bare authoritative "unknown".
     if project_type == "unknown":
         structure["detection_checked"] = [f for f in files_to_check if not f.startswith("README")]
-        listing = orch.execute_command(f"ls -1 {project_path} 2>/dev/null | head -30")
-        if listing.get("success"):
-            structure["root_listing"] = (listing.get("output") or "").strip()
+        files = project_files_for(orch)
+        names = files.scan(LISTING, project_path) if files is not None else None
+        if names is not None:
+            structure["root_listing"] = "\n".join(names[:30]).strip()
+        else:
+            listing = orch.execute_command(f"ls -1 {project_path} 2>/dev/null | head -30")
+            if listing.get("success"):
+                structure["root_listing"] = (listing.get("output") or "").strip()
 
     return structure
 
@@ -328,9 +376,11 @@ def analyze_documentation(orch, project_path: str) -> Dict[str, Any]:
     readme_content = ""
 
     for readme_file in readme_files:
-        result = orch.execute_command(f"cat {project_path}/{readme_file}")
-        if result.get("success"):
-            readme_content = result.get("output", "")
+        path = f"{project_path}/{readme_file}"
+        text = _read_text(orch, path, f"head -c {README_MAX_CHARS} {path}")
+        if text is not None:
+            # A cached README is the whole file: read the same prefix.
+            readme_content = text[:README_MAX_CHARS]
             documentation["source_path"] = readme_file
             logger.info(f"Successfully read {readme_file}")
             break
@@ -409,20 +459,19 @@ def analyze_build_configuration(orch, project_path: str, project_type: str) -> D
 
     if project_type == "Java":
         # 首先检查是Maven还是Gradle项目
-        maven_exists = orch.execute_command(f"test -f {project_path}/pom.xml && echo 'exists'")
-        gradle_exists = orch.execute_command(
-            f"test -f {project_path}/build.gradle && echo 'exists'"
-        )
-        gradle_kts_exists = orch.execute_command(
-            f"test -f {project_path}/build.gradle.kts && echo 'exists'"
+        maven_exists, gradle_exists, gradle_kts_exists = (
+            _probe(orch, path, f"test -f {path} && echo 'exists'")
+            for path in (
+                f"{project_path}/pom.xml",
+                f"{project_path}/build.gradle",
+                f"{project_path}/build.gradle.kts",
+            )
         )
 
-        if maven_exists.get("success") and "exists" in maven_exists.get("output", ""):
+        if maven_exists:
             config["build_system"] = "Maven"
             analyze_maven_configuration(orch, project_path, config)
-        elif (gradle_exists.get("success") and "exists" in gradle_exists.get("output", "")) or (
-            gradle_kts_exists.get("success") and "exists" in gradle_kts_exists.get("output", "")
-        ):
+        elif gradle_exists or gradle_kts_exists:
             config["build_system"] = "Gradle"
             analyze_gradle_configuration(orch, project_path, config)
     elif project_type == "Python":
@@ -529,10 +578,12 @@ def _local_python_providers(
             or not metadata_path.startswith(root + "/")
         ):
             continue
-        read = orch.execute_command(f"cat {shlex.quote(metadata_path)}", truncate_output=False)
-        if not read.get("success"):
+        text = _read_text(
+            orch, metadata_path, f"cat {shlex.quote(metadata_path)}", truncate_output=False
+        )
+        if text is None:
             continue
-        parsed = _parse_pyproject(read.get("output") or "")
+        parsed = _parse_pyproject(text or "")
         project = parsed.get("project") if isinstance(parsed.get("project"), dict) else {}
         distribution_name = str(project.get("name") or "").strip()
         normalized_name = _normalize_distribution_name(distribution_name)
@@ -674,16 +725,16 @@ def read_python_metadata(orch, project_path: str) -> Optional[Dict[str, Any]]:
         return None
 
     def list_dir(directory: str) -> set:
-        listing = orch.execute_command(f"ls -1 {directory} 2>/dev/null")
-        return {line.strip() for line in (listing.get("output") or "").splitlines() if line.strip()}
+        lines = _scan_lines(orch, LISTING, directory, f"ls -1 {directory} 2>/dev/null")
+        return {line.strip() for line in lines if line.strip()}
 
     def read_from(directory: str, name: str, present: set) -> str:
         if name not in present:
             return ""
         # Untruncated like the pom reads: this content is parsed
         # internally by regex and never reaches the model's context.
-        result = orch.execute_command(f"cat {directory}/{name}", truncate_output=False)
-        return result.get("output", "") if result.get("success") else ""
+        path = f"{directory}/{name}"
+        return _read_text(orch, path, f"cat {path}", truncate_output=False) or ""
 
     # Native-core detection (live TVM regression): when the repo ROOT is a
     # build shell (root CMakeLists.txt, or a pyproject with no [project]
@@ -874,12 +925,12 @@ def analyze_maven_configuration(orch, project_path: str, config: Dict[str, Any])
     # internally by regex (java version, <modules>, <packaging>, dependencies) and
     # never reaches the model. Truncation drops <modules>/enforcer blocks on large
     # poms (httpcomponents-client: <modules> at line 260), which mis-scoped builds.
-    result = orch.execute_command(f"cat {project_path}/pom.xml", truncate_output=False)
-    if not result.get("success"):
+    main_pom_content = _read_text(
+        orch, f"{project_path}/pom.xml", f"cat {project_path}/pom.xml", truncate_output=False
+    )
+    if main_pom_content is None:
         return
 
-    main_pom_content = result.get("output", "")
-
     # Check if this is a multi-module project and look for parent POMs
     all_pom_contents = [main_pom_content]
     pom_locations = [f"{project_path}/pom.xml"]
@@ -897,19 +948,22 @@ def analyze_maven_configuration(orch, project_path: str, config: Dict[str, Any])
             f"{project_path}/parent/pom.xml",
         ]
 
+        files = project_files_for(orch)
         for parent_path in potential_parent_paths:
             # First check if parent POM exists
-            check_result = orch.execute_command(
-                f"test -f {parent_path} && echo 'exists' 2>/dev/null"
-            )
-            if check_result.get("success") and "exists" in check_result.get("output", ""):
+            if _probe(orch, parent_path, f"test -f {parent_path} && echo 'exists' 2>/dev/null"):
                 # Extract just the properties section to avoid truncation
-                props_result = orch.execute_command(
-                    f"sed -n '/<properties>/,/<\\/properties>/p' {parent_path} 2>/dev/null | head -200"
-                )
-                if props_result.get("success") and props_result.get("output"):
+                if files is not None:
+                    properties = _properties_section(files.read(parent_path) or "")
+                else:
+                    props_result = orch.execute_command(
+                        f"sed -n '/<properties>/,/<\\/properties>/p' {parent_path} 2>/dev/null"
+                        " | head -200"
+                    )
+                    properties = props_result.get("output") if props_result.get("success") else ""
+                if properties:
                     # Get a minimal version of parent POM with just properties
-                    minimal_parent = f"<project>{props_result.get('output', '')}</project>"
+                    minimal_parent = f"<project>{properties}</project>"
                     all_pom_contents.append(minimal_parent)
                     pom_locations.append(parent_path)
                     logger.info(f"Found parent POM at: {parent_path}")
@@ -997,22 +1051,33 @@ def analyze_maven_configuration(orch, project_path: str, config: Dict[str, Any])
     ]  # 限制输出
 
 
+def _properties_section(pom_text: str) -> str:
+    """``sed -n '/<properties>/,/<\\/properties>/p' | head -200`` over ``pom_text``."""
+    lines: List[str] = []
+    inside = False
+    for line in pom_text.splitlines():
+        if inside:
+            lines.append(line)
+            inside = "</properties>" not in line
+        elif "<properties>" in line:
+            lines.append(line)
+            inside = True
+    return "".join(f"{line}\n" for line in lines[:200])
+
+
 def analyze_gradle_configuration(orch, project_path: str, config: Dict[str, Any]) -> None:
     """分析Gradle配置（build.gradle 或 build.gradle.kts）"""
     # 首先尝试读取 build.gradle
     gradle_content = ""
     gradle_file = ""
 
-    result = orch.execute_command(f"cat {project_path}/build.gradle")
-    if result.get("success"):
-        gradle_content = result.get("output", "")
-        gradle_file = "build.gradle"
-    else:
-        # 尝试读取 build.gradle.kts
-        result = orch.execute_command(f"cat {project_path}/build.gradle.kts")
-        if result.get("success"):
-            gradle_content = result.get("output", "")
-            gradle_file = "build.gradle.kts"
+    for name in ("build.gradle", "build.gradle.kts"):
+        # 先 build.gradle，再 build.gradle.kts
+        text = _read_text(orch, f"{project_path}/{name}", f"cat {project_path}/{name}")
+        if text is not None:
+            gradle_content = text
+            gradle_file = name
+            break
 
     if gradle_content:
         logger.info(f"Analyzing Gradle configuration from {gradle_file}")
@@ -1042,27 +1107,30 @@ def analyze_test_configuration(orch, project_path: str, project_type: str) -> Di
     # 检查测试目录
     test_dirs = ["src/test", "test", "tests", "__tests__"]
     for test_dir in test_dirs:
-        result = orch.execute_command(f"test -d {project_path}/{test_dir} && echo 'exists'")
-        if result.get("success") and "exists" in result.get("output", ""):
+        if _probe(
+            orch,
+            f"{project_path}/{test_dir}",
+            f"test -d {project_path}/{test_dir} && echo 'exists'",
+            directory=True,
+        ):
             test_config["test_directories"].append(test_dir)
 
     # 根据项目类型检测测试框架
     if project_type == "Java":
         # 检查是Maven还是Gradle项目
-        maven_exists = orch.execute_command(f"test -f {project_path}/pom.xml && echo 'exists'")
-        gradle_exists = orch.execute_command(
-            f"test -f {project_path}/build.gradle && echo 'exists'"
-        )
-        gradle_kts_exists = orch.execute_command(
-            f"test -f {project_path}/build.gradle.kts && echo 'exists'"
+        maven_exists, gradle_exists, gradle_kts_exists = (
+            _probe(orch, path, f"test -f {path} && echo 'exists'")
+            for path in (
+                f"{project_path}/pom.xml",
+                f"{project_path}/build.gradle",
+                f"{project_path}/build.gradle.kts",
+            )
         )
 
-        if maven_exists.get("success") and "exists" in maven_exists.get("output", ""):
+        if maven_exists:
             test_config["build_system"] = "Maven"
             detect_maven_test_framework(orch, project_path, test_config)
-        elif (gradle_exists.get("success") and "exists" in gradle_exists.get("output", "")) or (
-            gradle_kts_exists.get("success") and "exists" in gradle_kts_exists.get("output", "")
-        ):
+        elif gradle_exists or gradle_kts_exists:
             test_config["build_system"] = "Gradle"
             detect_gradle_test_framework(orch, project_path, test_config)
 
@@ -1071,6 +1139,14 @@ def analyze_test_configuration(orch, project_path: str, project_type: str) -> Di
 
 def detect_maven_test_framework(orch, project_path: str, test_config: Dict[str, Any]) -> None:
     """检测Maven项目的测试框架"""
+    files = project_files_for(orch)
+    if files is not None:
+        pom = files.read(f"{project_path}/pom.xml") or ""
+        for marker, framework in (("junit", "JUnit"), ("testng", "TestNG")):
+            if marker in pom:
+                test_config["test_framework"] = framework
+        return
+
     # 检查是否使用 JUnit
     result = orch.execute_command(f"grep -r 'junit' {project_path}/pom.xml")
     if result.get("success") and result.get("output"):
@@ -1086,14 +1162,12 @@ def detect_gradle_test_framework(orch, project_path: str, test_config: Dict[str,
     """检测Gradle项目的测试框架"""
     # 尝试读取build.gradle文件
     gradle_content = ""
-    result = orch.execute_command(f"cat {project_path}/build.gradle")
-    if result.get("success"):
-        gradle_content = result.get("output", "")
-    else:
-        # 尝试读取build.gradle.kts文件
-        result = orch.execute_command(f"cat {project_path}/build.gradle.kts")
-        if result.get("success"):
-            gradle_content = result.get("output", "")
+    for name in ("build.gradle", "build.gradle.kts"):
+        # 先 build.gradle，再 build.gradle.kts
+        text = _read_text(orch, f"{project_path}/{name}", f"cat {project_path}/{name}")
+        if text is not None:
+            gradle_content = text
+            break
 
     if gradle_content:
         # 检测测试框架
@@ -1106,10 +1180,11 @@ def detect_gradle_test_framework(orch, project_path: str, test_config: Dict[str,
 def get_java_test_annotation_counts(
     orch, project_path: str, cache: Optional[Dict[str, Dict[str, int]]] = None
 ) -> Optional[Dict[str, int]]:
-    """Collect counts for key JUnit annotations inside src/test/* Java sources."""
-    import json
+    """Collect counts for key JUnit annotations inside src/test/* Java sources.
 
-    from sag.testcases.catalog import STATIC_SCAN_EXCLUSION_HELPER
+    Served by the same scan (and per-file cache) as the Java test catalog.
+    """
+    from sag.testcases.catalog import scan_java_test_sources
 
     if not orch:
         return None
@@ -1117,74 +1192,9 @@ def get_java_test_annotation_counts(
     if cache is not None and project_path in cache:
         return cache[project_path]
 
-    command = f"""cd {project_path} && python3 - <<'PY'
-import json
-import re
-from collections import Counter
-from pathlib import Path
-
-{STATIC_SCAN_EXCLUSION_HELPER}
-
-ANNOTATION_PATTERN = re.compile(r'@([A-Za-z_][A-Za-z0-9_]*)')
-
-
-def strip_comments(source: str) -> str:
-    source = re.sub(r'/\\*.*?\\*/', '', source, flags=re.S)
-    source = re.sub(r'//.*', '', source)
-    return source
-
-
-counts = Counter()
-project_root = Path('.')
-
-test_dirs = []
-for candidate in project_root.rglob('src'):
-    if candidate.name != 'src':
-        continue
-    test_dir = candidate / 'test'
-    if not test_dir.is_dir():
-        continue
-    if is_excluded(test_dir):
-        continue
-    test_dirs.append(test_dir)
-
-for test_dir in test_dirs:
-    for java_file in test_dir.rglob('*.java'):
-        if is_excluded(java_file.parent):
-            continue
-        try:
-            text = java_file.read_text(encoding='utf-8')
-        except Exception:
-            try:
-                text = java_file.read_text(encoding='latin-1')
-            except Exception:
-                continue
-        cleaned = strip_comments(text)
-        counts.update(ANNOTATION_PATTERN.findall(cleaned))
-
-result = {{
-    'Test': counts.get('Test', 0),
-    'ParameterizedTest': counts.get('ParameterizedTest', 0),
-    'RepeatedTest': counts.get('RepeatedTest', 0),
-    'TestFactory': counts.get('TestFactory', 0),
-    'TestTemplate': counts.get('TestTemplate', 0),
-    'DynamicTest': counts.get('DynamicTest', 0),
-    'Disabled': counts.get('Disabled', 0),
-}}
-print(json.dumps(result))
-PY"""
-
-    response = orch.execute_command(command)
-    if not response.get("success"):
-        return None
-
-    output = (response.get("output") or "").strip()
-    if not output:
-        return None
-
-    try:
-        counts = json.loads(output.splitlines()[-1])
-    except json.JSONDecodeError:
+    document = scan_java_test_sources(project_path, orch)
+    counts = document.get("annotations") if document else None
+    if not isinstance(counts, dict):
         logger.debug("Unable to parse Java test annotation counts from output")
         return None
 
@@ -1392,6 +1402,12 @@ def island_applies_maven_publish(orch, root: str) -> bool:
     if not orch:
         return False
     root = root.rstrip("/")
+    files = project_files_for(orch)
+    if files is not None:
+        return any(
+            "maven-publish" in (files.read(f"{root}/{name}") or "")
+            for name in ("build.gradle", "build.gradle.kts")
+        )
     cmd = f"grep -lE 'maven-publish' {root}/build.gradle {root}/build.gradle.kts " f"2>/dev/null"
     found = orch.execute_command(cmd)
     return bool((found.get("output") or "").strip())
@@ -1498,10 +1514,8 @@ def _read_config_text(orch, path: str) -> str:
     """
     if not orch:
         return ""
-    result = orch.execute_command(f"cat {shlex.quote(path)} 2>/dev/null", truncate_output=False)
-    if not result.get("success"):
-        return ""
-    return result.get("output") or ""
+    command = f"cat {shlex.quote(path)} 2>/dev/null"
+    return _read_text(orch, path, command, truncate_output=False) or ""
 
 
 # Everything from the first of these ends the pom's own coordinate header: a
@@ -2216,8 +2230,16 @@ def scan_root_build_markers(orch, project_path: str) -> Dict[str, Any]:
 
     packaging = None
     if has_pom:
-        pkg = orch.execute_command(f"grep -m1 '<packaging>' {project_path}/pom.xml 2>/dev/null")
-        match = re.search(r"<packaging>\s*([^<\s]+)\s*</packaging>", pkg.get("output") or "")
+        files = project_files_for(orch)
+        if files is not None:
+            pom = files.read(f"{project_path}/pom.xml") or ""
+            declared = next((line for line in pom.splitlines() if "<packaging>" in line), "")
+        else:
+            pkg = orch.execute_command(
+                f"grep -m1 '<packaging>' {project_path}/pom.xml 2>/dev/null"
+            )
+            declared = pkg.get("output") or ""
+        match = re.search(r"<packaging>\s*([^<\s]+)\s*</packaging>", declared)
         packaging = match.group(1).strip().lower() if match else "jar"
 
     return {
@@ -2249,9 +2271,8 @@ def scan_source_modules(orch, project_path: str) -> List[Dict[str, Any]]:
         f"-o -path '*/src/main/scala' -o -path '*/src/main/kotlin' \\) "
         f"-not -path '*/target/*' -not -path '*/build/*' 2>/dev/null"
     )
-    found = orch.execute_command(find_cmd)
     seen_dirs = set()
-    for line in (found.get("output") or "").splitlines():
+    for line in _scan_lines(orch, SOURCE_DIRS, project_path, find_cmd):
         line = line.strip()
         if not line or "/src/main/" not in line:
             continue
@@ -2283,9 +2304,8 @@ def scan_test_module_dirs(orch, project_path: str) -> List[str]:
         f"-o -path '*/src/test/scala' -o -path '*/src/test/kotlin' \\) "
         f"-not -path '*/target/*' -not -path '*/build/*' 2>/dev/null"
     )
-    found = orch.execute_command(find_cmd)
     test_module_dirs: List[str] = []
-    for line in (found.get("output") or "").splitlines():
+    for line in _scan_lines(orch, TEST_DIRS, project_path, find_cmd):
         line = line.strip()
         if "/src/test/" not in line:
             continue
@@ -2348,9 +2368,15 @@ def is_valid_project_directory(orch, path: str) -> bool:
         logger.debug(f"Rejected project path outside resolved workspace: {path}")
         return False
 
+    files = project_files_for(orch)
+
+    def probe(path: str, flag: str) -> bool:
+        if files is not None:
+            return files.is_dir(path) if flag == "-d" else files.is_file(path)
+        return orch.execute_command(f"test {flag} {shlex.quote(path)}").get("exit_code") == 0
+
     # Check if directory exists
-    result = orch.execute_command(f"test -d {shlex.quote(normalized)}")
-    if result.get("exit_code") != 0:
+    if not probe(normalized, "-d"):
         logger.debug(f"Directory does not exist: {normalized}")
         return False
 
@@ -2372,8 +2398,7 @@ def is_valid_project_directory(orch, path: str) -> bool:
 
     for indicator in project_indicators:
         indicator_path = posixpath.join(normalized, indicator)
-        result = orch.execute_command(f"test -f {shlex.quote(indicator_path)}")
-        if result.get("exit_code") == 0:
+        if probe(indicator_path, "-f"):
             logger.debug(f"Found project indicator {indicator} in {normalized}")
             return True
 
@@ -2381,8 +2406,7 @@ def is_valid_project_directory(orch, path: str) -> bool:
     source_dirs = ["src", "lib", "app", "source"]
     for src_dir in source_dirs:
         source_path = posixpath.join(normalized, src_dir)
-        result = orch.execute_command(f"test -d {shlex.quote(source_path)}")
-        if result.get("exit_code") == 0:
+        if probe(source_path, "-d"):
             # Check if it contains actual source files
             result = orch.execute_command(
                 f"find {shlex.quote(source_path)} "
@@ -2547,14 +2571,12 @@ def _surveyed_python_root(orch, project_path: str) -> str:
     """The python root the survey's package fact is scanned from — the same
     ``detect_python_package_root`` chain ``read_python_metadata`` walks
     (plain repo: the root itself; native-core: the python/ subdir)."""
-    listing = orch.execute_command(f"ls -1 {project_path} 2>/dev/null")
-    root_files = {
-        line.strip() for line in (listing.get("output") or "").splitlines() if line.strip()
-    }
+    lines = _scan_lines(orch, LISTING, project_path, f"ls -1 {project_path} 2>/dev/null")
+    root_files = {line.strip() for line in lines if line.strip()}
     root_pyproject = ""
     if "pyproject.toml" in root_files:
-        result = orch.execute_command(f"cat {project_path}/pyproject.toml", truncate_output=False)
-        root_pyproject = result.get("output", "") if result.get("success") else ""
+        path = f"{project_path}/pyproject.toml"
+        root_pyproject = _read_text(orch, path, f"cat {path}", truncate_output=False) or ""
     return detect_python_package_root(orch, project_path, root_files, root_pyproject)["python_root"]
 
 
@@ -2574,13 +2596,15 @@ def redetect_build_files(orch, project_path: str) -> List[str]:
     found: List[str] = []
     for marker in FALLBACK_BUILD_MARKERS:
         try:
-            result = orch.execute_command(
-                f"test -f {project_path}/{marker} && echo 'exists' || echo 'missing'"
+            exists = _probe(
+                orch,
+                f"{project_path}/{marker}",
+                f"test -f {project_path}/{marker} && echo 'exists' || echo 'missing'",
             )
         except Exception as exc:  # never let detection crash the fallback
             logger.debug(f"Build-file re-detection failed for {marker}: {exc}")
             continue
-        if result.get("success") and "exists" in result.get("output", ""):
+        if exists:
             found.append(marker)
     return found
 
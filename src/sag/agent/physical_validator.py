@@ -24,6 +24,8 @@ Example Usage:
         print("Project built and tested successfully!")
 """
 
+import hashlib
+import io
 import json
 import os
 import posixpath
@@ -37,6 +39,12 @@ from urllib.parse import quote, unquote, urlparse
 
 from loguru import logger
 
+from sag.agent.artifact_index import (
+    ARTIFACT_INDEX_DIRNAME,
+    ArtifactSnapshot,
+    artifact_index_command,
+    parse_artifact_index,
+)
 from sag.agent.receipt_structure import dispatch_terminated as _dispatch_terminated
 from sag.agent.receipt_structure import module_key as _receipt_module_key
 from sag.config.settings import (
@@ -46,7 +54,9 @@ from sag.config.settings import (
 )
 from sag.runtime.container_io import (
     ContainerFileReadError,
+    archive_orchestrator,
     command_did_not_run as _command_did_not_run,
+    execute_commands,
     read_container_text,
 )
 from sag.testcases.catalog import (
@@ -61,6 +71,7 @@ from sag.testcases.compileall_metrics import (
     compileall_metrics_command,
     parse_compileall_metrics,
 )
+from sag.testcases.report_harvest import ReportHarvester
 from sag.testcases.results import (
     CanonicalTestIdentity,
     TestResultObservation,
@@ -210,6 +221,11 @@ def _dist_record_matches(record_dir: str, project_name: str) -> bool:
 # which the in-container parser derives from this one.
 INVOCATION_RECEIPTS_DIRNAME = ".setup_agent/invocation_receipts"
 
+# Container directory holding the compact parser's per-report parse cache. It
+# stays out of /workspace/.setup_agent, which is copied into every session
+# mirror, and is disposable: a missing or unreadable cache only costs a re-parse.
+REPORT_PARSE_CACHE_DIR = "/tmp/sag-report-cache"
+
 
 class _ExpectationScope(NamedTuple):
     """What scoping coverage to the attempted modules produced (Plan 8 §3.5).
@@ -281,9 +297,10 @@ _RECEIPTS_ABSENT = "absent"
 _RECEIPTS_UNREADABLE = "unreadable"
 
 
-# In-container test-report parser (executed via `python3 - <<'PY'`). The four
+# In-container test-report parser (executed via `python3 - <<'PY'`). The five
 # header assignments (project_dir, pytest_reports_dir, receipts_dir,
-# primary_root) are prepended by _parse_test_reports_compact_in_container.
+# primary_root, report_cache_path) are prepended by
+# _parse_test_reports_compact_in_container.
 # Kept as a plain module string so the embedded script needs no f-string brace
 # escaping.
 #
@@ -303,6 +320,7 @@ _RECEIPTS_UNREADABLE = "unreadable"
 _COMPACT_REPORT_PARSER_BODY = '''
 import hashlib
 import json
+import os
 import re
 import xml.etree.ElementTree as ET
 from pathlib import Path
@@ -695,26 +713,72 @@ parsing_errors = []
 metrics_conflicts = set()
 
 
-def parse_report(report_file):
-    """Return canonical cases, suite-only counts, and explicit attempt metadata."""
+def parse_report_stream(report_file):
+    """Return canonical cases, suite-only counts, and explicit attempt metadata.
+
+    iterparse keeps one testcase subtree in memory at a time: each testcase is
+    classified when it closes and then cleared, so multi-megabyte failure
+    bodies never accumulate. Cases carry their simple class name so the Groovy
+    filter can be applied after the cache.
+    """
+    attempt_values = set()
+    attempt_error = None
+    cases = []
+    saw_testcase = False
+    collection_errors = 0
+    collection_errors_skipped = 0
+    collection_messages = {}
+    counts = {"total": 0, "failed": 0, "error": 0, "skipped": 0}
+    root_is_suite = None
+    depth = 0
     try:
-        tree = ET.parse(report_file)
-        xml_root = tree.getroot()
+        for event, element in ET.iterparse(report_file, events=("start", "end")):
+            tag = local_name(element)
+            if event == "start":
+                if root_is_suite is None:
+                    root_is_suite = tag == "testsuite"
+                if tag == "testsuite" and (depth == 0 or not root_is_suite):
+                    counts["total"] += int_attr(element, "tests")
+                    counts["failed"] += int_attr(element, "failures")
+                    counts["error"] += int_attr(element, "errors")
+                    counts["skipped"] += int_attr(element, "skipped")
+                depth += 1
+                continue
+            depth -= 1
+            if tag == "property" and element.get("name") == "sag.attempt_id":
+                try:
+                    value = int(element.get("value") or "")
+                    if value < 1:
+                        raise ValueError
+                    attempt_values.add(value)
+                except (TypeError, ValueError):
+                    attempt_error = "invalid"
+                continue
+            if tag != "testcase":
+                continue
+            saw_testcase = True
+            classname = (element.get("classname") or "").strip()
+            collection_kind = collection_node_kind(element)
+            if collection_kind == "error":
+                collection_errors += 1
+                message = structured_error_line(element)
+                if message:
+                    collection_messages[message] = collection_messages.get(message, 0) + 1
+            elif collection_kind == "skipped":
+                collection_errors_skipped += 1
+            else:
+                identity = canonical_identity(
+                    classname,
+                    element.get("name"),
+                    element.get("file"),
+                )
+                if identity:
+                    simple_classname = classname.split(".")[-1] if classname else ""
+                    cases.append((identity, testcase_status(element), simple_classname))
+            element.clear()
     except Exception as exc:
         parsing_errors.append(f"Error parsing {report_file}: {exc}")
         return None
-    attempt_values = set()
-    attempt_error = None
-    for element in xml_root.iter():
-        if local_name(element) != "property" or element.get("name") != "sag.attempt_id":
-            continue
-        try:
-            value = int(element.get("value") or "")
-            if value < 1:
-                raise ValueError
-            attempt_values.add(value)
-        except (TypeError, ValueError):
-            attempt_error = "invalid"
     if len(attempt_values) > 1:
         attempt_error = "conflicting"
     attempt_id = (
@@ -724,70 +788,65 @@ def parse_report(report_file):
     )
     if attempt_id is None and attempt_error is None:
         attempt_error = "missing"
-
-    testcases = [
-        element for element in xml_root.iter() if local_name(element) == "testcase"
-    ]
-    if testcases:
-        cases = []
-        collection_errors = 0
-        collection_errors_skipped = 0
-        collection_messages = {}
-        for testcase in testcases:
-            classname = (testcase.get("classname") or "").strip()
-            collection_kind = collection_node_kind(testcase)
-            if collection_kind == "error":
-                collection_errors += 1
-                message = structured_error_line(testcase)
-                if message:
-                    collection_messages[message] = collection_messages.get(message, 0) + 1
-                continue
-            if collection_kind == "skipped":
-                collection_errors_skipped += 1
-                continue
-            simple_classname = classname.split(".")[-1] if classname else ""
-            if simple_classname in groovy_classes:
-                continue
-            identity = canonical_identity(
-                classname,
-                testcase.get("name"),
-                testcase.get("file"),
-            )
-            if identity:
-                cases.append((identity, testcase_status(testcase)))
-        return {
-            "cases": cases,
-            "suite_counts": None,
-            "attempt_id": attempt_id,
-            "attempt_error": attempt_error,
-            "collection_errors": collection_errors,
-            "collection_errors_skipped": collection_errors_skipped,
-            "collection_messages": collection_messages,
-        }
-    counts = {"total": 0, "failed": 0, "error": 0, "skipped": 0}
-    suites = (
-        [xml_root]
-        if local_name(xml_root) == "testsuite"
-        else [
-            element for element in xml_root.iter() if local_name(element) == "testsuite"
-        ]
-    )
-    for suite in suites:
-        counts["total"] += int_attr(suite, "tests")
-        counts["failed"] += int_attr(suite, "failures")
-        counts["error"] += int_attr(suite, "errors")
-        counts["skipped"] += int_attr(suite, "skipped")
     return {
-        "cases": None,
-        "suite_counts": counts,
+        "cases": cases if saw_testcase else None,
+        "suite_counts": None if saw_testcase else counts,
         "attempt_id": attempt_id,
         "attempt_error": attempt_error,
-        "collection_errors": 0,
-        "collection_errors_skipped": 0,
-        "collection_messages": {},
+        "collection_errors": collection_errors,
+        "collection_errors_skipped": collection_errors_skipped,
+        "collection_messages": collection_messages,
     }
 
 
+# Parsed reports persist between validator passes keyed by (path, mtime_ns,
+# size): a pass re-reads only the reports that changed since the last one.
+REPORT_CACHE_VERSION = 1
+report_cache = {}
+if report_cache_path:
+    try:
+        loaded = json.loads(Path(report_cache_path).read_text())
+        if loaded.get("version") == REPORT_CACHE_VERSION:
+            report_cache = loaded.get("entries") or {}
+    except Exception:
+        report_cache = {}
+fresh_cache = {path: report_cache[path] for path in scanned_files if path in report_cache}
+cache_dirty = len(fresh_cache) != len(report_cache)
+
+
+def parse_report(report_file):
+    """parse_report_stream through the (path, mtime_ns, size) cache, Groovy-filtered."""
+    global cache_dirty
+    try:
+        stat = os.stat(report_file)
+        key = [stat.st_mtime_ns, stat.st_size]
+    except OSError:
+        key = None
+    entry = fresh_cache.get(report_file)
+    if key is not None and entry and entry.get("key") == key:
+        parsed = dict(entry["parsed"])
+        if parsed["cases"] is not None:
+            parsed["cases"] = [
+                (tuple(identity), status, simple_classname)
+                for identity, status, simple_classname in parsed["cases"]
+            ]
+    else:
+        parsed = parse_report_stream(report_file)
+        if parsed is None:
+            return None
+        if key is not None:
+            fresh_cache[report_file] = {"key": key, "parsed": parsed}
+            cache_dirty = True
+    if parsed["cases"] is not None:
+        parsed = dict(parsed)
+        parsed["cases"] = [
+            (identity, status)
+            for identity, status, simple_classname in parsed["cases"]
+            if simple_classname not in groovy_classes
+        ]
+    return parsed
+
+
 def bump(counts, status):
     counts["total"] += 1
     if status == "error":
@@ -967,6 +1026,16 @@ if corrupt_receipts:
         "receipt_error": "; ".join(corrupt_receipts[:5]),
         "receipt_error_files": corrupt_receipts[:20],
     }
+if report_cache_path and cache_dirty:
+    try:
+        cache_file = Path(report_cache_path)
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        staged = cache_file.with_name(cache_file.name + ".tmp")
+        payload = {"version": REPORT_CACHE_VERSION, "entries": fresh_cache}
+        staged.write_text(json.dumps(payload, separators=(",", ":")))
+        os.replace(staged, cache_file)
+    except Exception:
+        pass
 print(json.dumps(result, separators=(",", ":")))
 '''
 
@@ -1061,6 +1130,21 @@ def _partition_collection_nodes(
     }
 
 
+def _report_stats(all_testcases: List[Dict[str, any]]) -> Dict[str, any]:
+    """Per-file report statistics over every runtime testcase (spec §3.4-4)."""
+    testcase_entries, collection = _partition_collection_nodes(all_testcases)
+    statuses = [tc.get("status") for tc in testcase_entries]
+    return {
+        "total": len(testcase_entries),
+        "passed": statuses.count("passed"),
+        "failed": statuses.count("failed"),
+        "errors": statuses.count("error"),
+        "skipped": statuses.count("skipped"),
+        "testcases": testcase_entries,
+        **collection,
+    }
+
+
 def _is_pytest_report_path(path: str, pytest_reports_dir: str) -> bool:
     """True for python_tool's per-invocation pytest XMLs.
 
@@ -1080,19 +1164,29 @@ def _test_report_attempt_id(xml_content: str) -> Tuple[Optional[int], Optional[s
     except ET.ParseError:
         return None, "malformed"
 
-    values = set()
+    values: set = set()
     invalid = False
     for element in root.iter():
-        if element.tag.rsplit("}", 1)[-1] != "property" or element.get("name") != "sag.attempt_id":
-            continue
-        try:
-            value = int(element.get("value") or "")
-            if value < 1:
-                raise ValueError
-            values.add(value)
-        except (TypeError, ValueError):
-            invalid = True
+        invalid = _collect_attempt_id(element, values) or invalid
+    return _attempt_id_outcome(values, invalid)
+
 
+def _collect_attempt_id(element: ET.Element, values: set) -> bool:
+    """Add a ``sag.attempt_id`` property's value to ``values``; True when invalid."""
+    if element.tag.rsplit("}", 1)[-1] != "property" or element.get("name") != "sag.attempt_id":
+        return False
+    try:
+        value = int(element.get("value") or "")
+        if value < 1:
+            raise ValueError
+        values.add(value)
+    except (TypeError, ValueError):
+        return True
+    return False
+
+
+def _attempt_id_outcome(values: set, invalid: bool) -> Tuple[Optional[int], Optional[str]]:
+    """Fold the collected attempt ids into ``(attempt_id, error)``."""
     if invalid:
         return None, "invalid"
     if len(values) > 1:
@@ -1102,6 +1196,48 @@ def _test_report_attempt_id(xml_content: str) -> Tuple[Optional[int], Optional[s
     return next(iter(values)), None
 
 
+# (totals key, <testsuite> attribute) pairs summed by parse_module_test_reports.
+_MODULE_SUITE_ATTRS = (
+    ("tests_total", "tests"),
+    ("tests_failed", "failures"),
+    ("tests_errors", "errors"),
+    ("tests_skipped", "skipped"),
+)
+
+
+def _module_report_counts(content: str) -> Tuple[Dict[str, int], List[str]]:
+    """Suite-attribute totals and failing testcase names from one report's text."""
+    totals = {"tests_total": 0, "tests_failed": 0, "tests_errors": 0, "tests_skipped": 0}
+    failing: List[str] = []
+    # Parse each <testsuite ...> open tag, reading attributes
+    # independently. Surefire and Gradle emit them in different orders
+    # (Gradle: name, tests, skipped, failures, errors), so a single
+    # positional regex would silently miss one writer's reports.
+    for open_tag in re.finditer(r"<testsuite\b[^>]*>", content):
+        tag = open_tag.group(0)
+        for key, attr in _MODULE_SUITE_ATTRS:
+            m = re.search(rf'\b{attr}="(\d+)"', tag)
+            if m:
+                totals[key] += int(m.group(1))
+    # Failing testcases: match a testcase WITH a body (self-closing
+    # passing cases are skipped), then read name/classname from the
+    # open tag INDEPENDENTLY. Surefire emits name-before-classname,
+    # Gradle classname-before-name -- a positional regex misses one
+    # writer (live commons-vfs: failures counted but no names).
+    # The `[^/]` before `>` excludes self-closing <testcase .../>
+    # (passing cases); otherwise a self-closing tag would be read as
+    # an open tag and swallow the next sibling's <failure> body.
+    for case in re.finditer(r"<testcase\b([^>]*[^/])>(.*?)</testcase>", content, re.DOTALL):
+        attrs, body = case.group(1), case.group(2)
+        if "<failure" in body or "<error" in body:
+            name_m = re.search(r'\bname="([^"]*)"', attrs)
+            cls_m = re.search(r'\bclassname="([^"]*)"', attrs)
+            nm = name_m.group(1) if name_m else "(unknown)"
+            cls = cls_m.group(1) if cls_m else ""
+            failing.append(f"{cls}.{nm}" if cls else nm)
+    return totals, failing
+
+
 def _carries_unresolved_property(value: str) -> bool:
     """Whether a coordinate still holds an unexpanded `${...}` placeholder."""
     return "${" in str(value or "")
@@ -1319,6 +1455,56 @@ class PhysicalValidator:
                 "command": command[:100] + "..." if len(command) > 100 else command,
             }
 
+    def _execute_batch_with_logging(
+        self, commands: List[str], operation: str = "batch"
+    ) -> List[Dict[str, any]]:
+        """
+        Execute independent probes in one batched round trip.
+
+        Args:
+            commands: Commands to execute; none may depend on another's effects
+            operation: Description of operation for logging
+
+        Returns:
+            One standardized result dictionary per command, in input order
+        """
+        if not commands:
+            return []
+        if not self.docker_orchestrator:
+            return [
+                {
+                    "success": False,
+                    "output": "",
+                    "exit_code": -1,
+                    "error": "No docker orchestrator available",
+                }
+                for _ in commands
+            ]
+        try:
+            raw_results = execute_commands(self.docker_orchestrator, commands)
+        except Exception as e:
+            logger.error(f"❌ {operation} execution failed: {e}")
+            return [
+                {"success": False, "output": "", "exit_code": -1, "error": str(e)}
+                for _ in commands
+            ]
+
+        results = []
+        failures = 0
+        for command, result in zip(commands, raw_results):
+            exit_code = result.get("exit_code", 1)
+            failures += 0 if exit_code == 0 else 1
+            results.append(
+                {
+                    "success": exit_code == 0,
+                    "output": result.get("output", ""),
+                    "exit_code": exit_code,
+                    "command": command[:100] + "..." if len(command) > 100 else command,
+                }
+            )
+        logger.debug(f"{operation}: {len(commands)} probes, {failures} non-zero")
+        return results
+
     def validate_build_artifacts(self, project_name: str = None) -> Dict[str, any]:
         """
         Check three levels of build evidence:
@@ -1415,8 +1601,54 @@ class PhysicalValidator:
         two consecutive checks within the TTL during the run still hit the cache.
         """
         self.clear_cache()
+        # The report pass re-walks the whole tree rather than trusting the
+        # incremental index: it is the one place a missed change would ship.
+        project_dir = f"{self.project_path}/{project_name}" if project_name else self.project_path
+        self._artifact_snapshot(project_dir, full=True)
         return self.validate_build_artifacts(project_name=project_name)
 
+    def _artifact_index_path(self, project_dir: str) -> str:
+        digest = hashlib.sha1(project_dir.rstrip("/").encode("utf-8")).hexdigest()[:16]
+        return f"{(self.project_path or '').rstrip('/')}/{ARTIFACT_INDEX_DIRNAME}/{digest}.json"
+
+    def _artifact_snapshot(
+        self, project_dir: str, full: bool = False
+    ) -> Optional[ArtifactSnapshot]:
+        """Class/JAR facts for ``project_dir`` from the incremental artifact index.
+
+        One in-container walk answers the class count, JAR list, newest class
+        mtime and per-module counts; later passes re-stat only what changed.
+        ``None`` for test doubles, containers without python3/GNU find, or any
+        failure: callers then run their own ``find`` scans.
+        """
+        orchestrator = archive_orchestrator(self.docker_orchestrator)
+        if orchestrator is None or not self.project_path:
+            return None
+        cache_key = self._get_cache_key("artifact_index", project_dir)
+        if not full:
+            cached = self._get_cached_result(cache_key)
+            if cached is not None:
+                return cached
+        command = artifact_index_command(
+            project_dir, self._artifact_index_path(project_dir), full=full
+        )
+        try:
+            result = orchestrator.execute_command(command, truncate_output=False)
+        except Exception as e:
+            logger.debug(f"Artifact index unavailable, using find scans: {e}")
+            return None
+        if _command_did_not_run(result) or result.get("exit_code") != 0:
+            return None
+        snapshot = parse_artifact_index(str(result.get("output") or ""))
+        if snapshot is None:
+            return None
+        logger.debug(
+            f"Artifact index for {project_dir}: {snapshot.indexed} entries, "
+            f"{snapshot.changed} changed{' (rebuilt)' if snapshot.rebuilt else ''}"
+        )
+        self._cache_result(cache_key, snapshot)
+        return snapshot
+
     def _check_class_files(self, project_dir: str) -> Dict[str, any]:
         """Check for .class files in the project with caching."""
         cache_key = self._get_cache_key("class_files", project_dir)
@@ -1426,6 +1658,12 @@ class PhysicalValidator:
         if cached_result is not None:
             return cached_result
 
+        snapshot = self._artifact_snapshot(project_dir)
+        if snapshot is not None:
+            result = {"count": snapshot.class_count, "paths": list(snapshot.class_sample)}
+            self._cache_result(cache_key, result)
+            return result
+
         try:
             # Count .class files
             count_cmd = f"find {project_dir} -name '*.class' -type f 2>/dev/null | wc -l"
@@ -1467,6 +1705,15 @@ class PhysicalValidator:
         if cached_result is not None:
             return cached_result
 
+        snapshot = self._artifact_snapshot(project_dir)
+        if snapshot is not None:
+            # Same match as the find below: `-path '*/target/*.jar'` spans
+            # directories, so any JAR with a target/ or build/ ancestor counts.
+            paths = [p for p in snapshot.jars if "/target/" in p or "/build/" in p]
+            result_dict = {"count": len(paths), "paths": paths}
+            self._cache_result(cache_key, result_dict)
+            return result_dict
+
         try:
             # Check Maven target and Gradle build directories (including build/libs)
             cmd = f"find {project_dir} \\( -path '*/target/*.jar' -o -path '*/build/*.jar' -o -path '*/build/libs/*.jar' \\) -type f 2>/dev/null"
@@ -1491,6 +1738,16 @@ class PhysicalValidator:
 
     def _check_compilation_recency(self, project_dir: str) -> Dict[str, any]:
         """Check if compilation is recent (within last hour)."""
+        snapshot = self._artifact_snapshot(project_dir)
+        if snapshot is not None and snapshot.newest_class_mtime is not None:
+            newest_timestamp = int(snapshot.newest_class_mtime)
+            age_seconds = int(datetime.now().timestamp()) - newest_timestamp
+            return {
+                "recent": age_seconds < (self.compilation_recency_hours * 3600),
+                "newest_class_time": datetime.fromtimestamp(newest_timestamp).isoformat(),
+                "age_seconds": age_seconds,
+            }
+
         try:
             # Try GNU stat first (Linux/container environments) - get newest file
             cmd = f"find {project_dir} -name '*.class' -type f -exec stat -c '%Y' {{}} \\; 2>/dev/null | sort -rn | head -1"
@@ -1966,27 +2223,35 @@ class PhysicalValidator:
             if "EXISTS" in (pytest_probe.get("output") or ""):
                 report_dirs.append(PYTEST_REPORT_DIR)
 
-            # Step 2: For each directory, list XML files in small batches to avoid truncation
-            report_files: List[str] = []
-            for report_dir in report_dirs:
-                # Limit depth to keep per-command output small; Gradle may have nested per-class dirs
-                list_cmd = f"find '{report_dir}' -maxdepth 2 -type f -name '*.xml' 2>/dev/null"
-                list_result = self.docker_orchestrator.execute_command(list_cmd)
-                if list_result.get("exit_code") == 0 and list_result.get("output"):
-                    files = [
-                        f.strip() for f in list_result.get("output", "").split("\n") if f.strip()
-                    ]
-                    # Filter obviously irrelevant XMLs if any (keep flexible)
-                    report_files.extend(files)
-
-            # Fallback: If directory discovery failed to find anything, do a global file search (may be heavy)
-            if not report_files:
-                fallback_cmd = f"find {project_dir} -type f \\( -path '*/surefire-reports/*.xml' -o -path '*/failsafe-reports/*.xml' -o -path '*/test-results/*.xml' \\) 2>/dev/null"
-                fallback_res = self.docker_orchestrator.execute_command(fallback_cmd)
-                if fallback_res.get("exit_code") == 0 and fallback_res.get("output"):
-                    report_files = [
-                        f.strip() for f in fallback_res.get("output", "").split("\n") if f.strip()
-                    ]
+            # Step 2: Production streams every report out in one harvest (one
+            # stat listing, one archive of the files changed since last pass).
+            harvested = self._harvest_test_reports(project_dir, report_dirs)
+            report_files: List[str] = list(harvested or ())
+            if harvested is None:
+                # For each directory, list XML files in small batches to avoid truncation
+                for report_dir in report_dirs:
+                    # Limit depth to keep per-command output small; Gradle may have nested per-class dirs
+                    list_cmd = f"find '{report_dir}' -maxdepth 2 -type f -name '*.xml' 2>/dev/null"
+                    list_result = self.docker_orchestrator.execute_command(list_cmd)
+                    if list_result.get("exit_code") == 0 and list_result.get("output"):
+                        files = [
+                            f.strip()
+                            for f in list_result.get("output", "").split("\n")
+                            if f.strip()
+                        ]
+                        # Filter obviously irrelevant XMLs if any (keep flexible)
+                        report_files.extend(files)
+
+                # Fallback: If directory discovery failed to find anything, do a global file search (may be heavy)
+                if not report_files:
+                    fallback_cmd = f"find {project_dir} -type f \\( -path '*/surefire-reports/*.xml' -o -path '*/failsafe-reports/*.xml' -o -path '*/test-results/*.xml' \\) 2>/dev/null"
+                    fallback_res = self.docker_orchestrator.execute_command(fallback_cmd)
+                    if fallback_res.get("exit_code") == 0 and fallback_res.get("output"):
+                        report_files = [
+                            f.strip()
+                            for f in fallback_res.get("output", "").split("\n")
+                            if f.strip()
+                        ]
 
             test_result["report_files"] = report_files
 
@@ -2029,15 +2294,21 @@ class PhysicalValidator:
 
             for report_file in report_files:
                 try:
-                    xml_result = self.docker_orchestrator.execute_command(f"cat '{report_file}'")
-                    if xml_result.get("exit_code") != 0:
-                        test_result["parsing_errors"].append(f"Failed to read {report_file}")
-                        continue
-
-                    xml_content = xml_result.get("output", "")
-                    if not xml_content.strip():
+                    if harvested is not None:
+                        report = harvested[report_file]
+                    else:
+                        xml_result = self.docker_orchestrator.execute_command(
+                            f"cat '{report_file}'"
+                        )
+                        if xml_result.get("exit_code") != 0:
+                            test_result["parsing_errors"].append(f"Failed to read {report_file}")
+                            continue
+                        report = self._parse_test_report_text(
+                            xml_result.get("output", ""), report_file
+                        )
+                    if report is None:
                         continue
-                    stats = self._parse_single_test_xml(xml_content, report_file)
+                    stats, attempt_id, attempt_error = report
                     if not stats:
                         test_result["parsing_errors"].append(
                             f"Failed to parse XML structure in {report_file}"
@@ -2051,7 +2322,6 @@ class PhysicalValidator:
                             collection_error_counts.get(message, 0) + count
                         )
 
-                    attempt_id, attempt_error = _test_report_attempt_id(xml_content)
                     is_pytest = _is_pytest_report_path(report_file, PYTEST_REPORT_DIR)
                     if (is_pytest and attempt_error) or (attempt_error not in (None, "missing")):
                         metrics_conflicts.add("test_attempt_id_invalid")
@@ -2553,6 +2823,7 @@ class PhysicalValidator:
             f"pytest_reports_dir = {json.dumps(PYTEST_REPORT_DIR)}\n"
             f"receipts_dir = {json.dumps(self._invocation_receipts_dir())}\n"
             f"primary_root = {json.dumps(primary_root) if primary_root else 'None'}\n"
+            f"report_cache_path = {json.dumps(self._report_parse_cache_path(project_dir))}\n"
             f"{_COMPACT_REPORT_PARSER_BODY}\n"
             "PY"
         )
@@ -2594,6 +2865,12 @@ class PhysicalValidator:
         )
         return parsed
 
+    @staticmethod
+    def _report_parse_cache_path(project_dir: str) -> str:
+        """The compact parser's (path, mtime, size) cache file for ``project_dir``."""
+        digest = hashlib.sha1(project_dir.rstrip("/").encode("utf-8")).hexdigest()[:16]
+        return f"{REPORT_PARSE_CACHE_DIR}/{digest}.json"
+
     def _parse_single_test_xml(self, xml_content: str, file_path: str) -> Optional[Dict[str, int]]:
         """
         Parse a single test XML file and extract statistics.
@@ -2601,92 +2878,35 @@ class PhysicalValidator:
         """
         try:
             root = ET.fromstring(xml_content)
-            testcase_entries: List[Dict[str, str]] = []
 
             # Maven Surefire format: <testsuite tests="X" failures="Y" errors="Z" skipped="W">
             if root.tag == "testsuite":
-                # Collect all testcases first
-                all_testcases = self._collect_testcases_from_suite(root, file_path)
-
                 # Collection nodes never executed -> they leave the runtime set
                 # entirely (Plan 4 Task 2).
-                testcase_entries, collection = _partition_collection_nodes(all_testcases)
-
-                # Recalculate statistics over every runtime testcase (spec §3.4-4)
-                total = len(testcase_entries)
-                failures = sum(1 for tc in testcase_entries if tc.get("status") == "failed")
-                errors = sum(1 for tc in testcase_entries if tc.get("status") == "error")
-                skipped = sum(1 for tc in testcase_entries if tc.get("status") == "skipped")
-                passed = sum(1 for tc in testcase_entries if tc.get("status") == "passed")
-
-                return {
-                    "total": total,
-                    "passed": max(0, passed),  # Ensure non-negative
-                    "failed": failures,
-                    "errors": errors,
-                    "skipped": skipped,
-                    "testcases": testcase_entries,
-                    **collection,
-                }
+                return _report_stats(self._collect_testcases_from_suite(root, file_path))
 
             # Gradle format: <testsuites> containing multiple <testsuite>
             elif root.tag == "testsuites":
-                # Collect all testcases from all suites
                 all_testcases = []
                 for testsuite in root.findall("testsuite"):
                     all_testcases.extend(self._collect_testcases_from_suite(testsuite, file_path))
-
-                testcase_entries, collection = _partition_collection_nodes(all_testcases)
-
-                # Calculate statistics over every runtime testcase (spec §3.4-4)
-                total = len(testcase_entries)
-                failures = sum(1 for tc in testcase_entries if tc.get("status") == "failed")
-                errors = sum(1 for tc in testcase_entries if tc.get("status") == "error")
-                skipped = sum(1 for tc in testcase_entries if tc.get("status") == "skipped")
-                passed = sum(1 for tc in testcase_entries if tc.get("status") == "passed")
-
-                return {
-                    "total": total,
-                    "passed": max(0, passed),
-                    "failed": failures,
-                    "errors": errors,
-                    "skipped": skipped,
-                    "testcases": testcase_entries,
-                    **collection,
-                }
+                return _report_stats(all_testcases)
 
             # Try to find testsuite elements even if root is different
             testsuites = root.findall(".//testsuite")
             if testsuites:
-                # Collect all testcases from all suites
                 all_testcases = []
                 for testsuite in testsuites:
                     all_testcases.extend(self._collect_testcases_from_suite(testsuite, file_path))
-
-                testcase_entries, collection = _partition_collection_nodes(all_testcases)
-
+                stats = _report_stats(all_testcases)
                 # An all-collection-nodes file still parsed successfully: it
                 # reports zero executed tests, not a parse failure.
-                saw_collection_nodes = (
-                    collection["collection_errors"] or collection["collection_errors_skipped"]
-                )
-                if testcase_entries or saw_collection_nodes:
-                    # Calculate statistics over every runtime testcase (spec §3.4-4)
-                    total = len(testcase_entries)
-                    failures = sum(1 for tc in testcase_entries if tc.get("status") == "failed")
-                    errors = sum(1 for tc in testcase_entries if tc.get("status") == "error")
-                    skipped = sum(1 for tc in testcase_entries if tc.get("status") == "skipped")
-                    passed = sum(1 for tc in testcase_entries if tc.get("status") == "passed")
-
-                    return {
-                        "total": total,
-                        "passed": max(0, passed),
-                        "failed": failures,
-                        "errors": errors,
-                        "skipped": skipped,
-                        "testcases": testcase_entries,
-                        **collection,
-                    }
+                if (
+                    stats["testcases"]
+                    or stats["collection_errors"]
+                    or stats["collection_errors_skipped"]
+                ):
+                    return stats
                 return None
 
             logger.warning(f"Unrecognized XML format in {file_path}, root tag: {root.tag}")
@@ -2705,6 +2925,117 @@ class PhysicalValidator:
             # Always try fallback rather than losing data
             return self._extract_test_stats_fallback(xml_content, file_path)
 
+    def _parse_single_test_stream(
+        self, data: bytes, file_path: str
+    ) -> Tuple[Optional[Dict[str, any]], Optional[int], Optional[str]]:
+        """Stream one report with ``iterparse``: (stats, attempt_id, attempt_error).
+
+        The same facts as :meth:`_parse_single_test_xml` plus
+        :func:`_test_report_attempt_id`, read in one pass that drops every
+        testcase subtree (and its failure body) as soon as it is consumed.
+        Anything the stream cannot parse takes the same regex fallback.
+        """
+        attempt_values: set = set()
+        attempt_invalid = False
+        all_testcases: List[Dict[str, any]] = []
+        open_elements: List[ET.Element] = []
+        root_tag: Optional[str] = None
+        saw_testsuite = False
+        try:
+            for event, element in ET.iterparse(io.BytesIO(data), events=("start", "end")):
+                if event == "start":
+                    if root_tag is None:
+                        root_tag = element.tag
+                    elif element.tag == "testsuite":
+                        saw_testsuite = True
+                    open_elements.append(element)
+                    continue
+                open_elements.pop()
+                if _collect_attempt_id(element, attempt_values):
+                    attempt_invalid = True
+                if element.tag != "testcase" or not open_elements:
+                    continue
+                # Mirror _parse_single_test_xml: a <testsuite> root owns its
+                # direct testcases, a <testsuites> root its direct suites'
+                # testcases, any other root every nested suite's testcases.
+                suite = open_elements[-1]
+                depth = {"testsuite": 1, "testsuites": 2}.get(root_tag)
+                if suite.tag != "testsuite" or (depth and len(open_elements) != depth):
+                    continue
+                all_testcases.append(self._testcase_entry(element, suite, file_path))
+                element.clear()
+        except Exception as e:
+            logger.warning(f"XML parsing error in {file_path}: {e}")
+            content = data.decode("utf-8", errors="replace")
+            return (
+                self._extract_test_stats_fallback(content, file_path),
+                *_test_report_attempt_id(content),
+            )
+
+        attempt = _attempt_id_outcome(attempt_values, attempt_invalid)
+        if root_tag in ("testsuite", "testsuites"):
+            return _report_stats(all_testcases), *attempt
+        if saw_testsuite:
+            stats = _report_stats(all_testcases)
+            if (
+                stats["testcases"]
+                or stats["collection_errors"]
+                or stats["collection_errors_skipped"]
+            ):
+                return stats, *attempt
+            return None, *attempt
+        logger.warning(f"Unrecognized XML format in {file_path}, root tag: {root_tag}")
+        return None, *attempt
+
+    def _parse_test_report_text(
+        self, xml_content: str, file_path: str
+    ) -> Optional[Tuple[Optional[Dict[str, any]], Optional[int], Optional[str]]]:
+        """Shell-path counterpart of :meth:`_parse_single_test_stream`; None when empty."""
+        if not xml_content.strip():
+            return None
+        stats = self._parse_single_test_xml(xml_content, file_path)
+        return (stats, *_test_report_attempt_id(xml_content)) if stats else (None, None, None)
+
+    def _parse_test_report_bytes(
+        self, file_path: str, data: bytes
+    ) -> Optional[Tuple[Optional[Dict[str, any]], Optional[int], Optional[str]]]:
+        """Harvester parser for :meth:`parse_test_reports`; None when empty."""
+        if not data.strip():
+            return None
+        return self._parse_single_test_stream(data, file_path)
+
+    def _report_harvester(self) -> ReportHarvester:
+        """The run's report harvester; its parse cache outlives validation passes."""
+        harvester = getattr(self, "_harvester", None)
+        if harvester is None or harvester.orchestrator is not self.docker_orchestrator:
+            harvester = self._harvester = ReportHarvester(self.docker_orchestrator)
+        return harvester
+
+    def _harvest_test_reports(
+        self, project_dir: str, report_dirs: List[str]
+    ) -> Optional[Dict[str, any]]:
+        """Every report XML under ``report_dirs`` parsed in one harvest.
+
+        Same discovery as the shell path (two levels below each report dir,
+        then a project-wide pattern search when that finds nothing). ``None``
+        when the orchestrator cannot harvest.
+        """
+        harvester = self._report_harvester()
+        harvested = harvester.harvest(
+            report_dirs, self._parse_test_report_bytes, kind="test_reports", maxdepth=2
+        )
+        if harvested is None or harvested:
+            return harvested
+        return harvester.harvest(
+            [project_dir],
+            self._parse_test_report_bytes,
+            kind="test_reports",
+            find_filter=(
+                "-path '*/surefire-reports/*.xml' -o -path '*/failsafe-reports/*.xml' "
+                "-o -path '*/test-results/*.xml'"
+            ),
+        )
+
     def _check_modules_without_tests(self, project_dir: str, report_dirs: List[str]) -> List[str]:
         """
         Check if this is a multi-module project and identify modules without test reports.
@@ -2715,21 +3046,17 @@ class PhysicalValidator:
         modules_without_tests = []
 
         try:
-            # Check if root pom.xml has <modules> section
+            # Check if root pom.xml has <modules> section; the module extraction
+            # tolerates a missing POM, so both probes share one round trip.
             pom_check_cmd = f"test -f {project_dir}/pom.xml && echo 'EXISTS' || echo 'MISSING'"
-            pom_result = self._execute_command_with_logging(
-                pom_check_cmd, "checking for root pom.xml"
+            modules_cmd = f"grep -A 100 '<modules>' {project_dir}/pom.xml 2>/dev/null | grep -B 100 '</modules>' | grep '<module>' | sed 's/<module>//g' | sed 's/<\\/module>//g' | tr -d ' \\t'"
+            pom_result, modules_result = self._execute_batch_with_logging(
+                [pom_check_cmd, modules_cmd], "extracting Maven modules"
             )
 
             if not pom_result["success"] or "MISSING" in pom_result.get("output", ""):
                 return []  # Not a Maven project or no root POM
 
-            # Extract modules from pom.xml
-            modules_cmd = f"grep -A 100 '<modules>' {project_dir}/pom.xml 2>/dev/null | grep -B 100 '</modules>' | grep '<module>' | sed 's/<module>//g' | sed 's/<\\/module>//g' | tr -d ' \\t'"
-            modules_result = self._execute_command_with_logging(
-                modules_cmd, "extracting Maven modules"
-            )
-
             if not modules_result["success"] or not modules_result.get("output"):
                 return []  # No modules found
 
@@ -2744,6 +3071,7 @@ class PhysicalValidator:
             report_dir_set = set(report_dirs)
 
             # Check each module for test reports
+            unreported = []
             for module in modules:
                 module_dir = f"{project_dir}/{module}"
 
@@ -2759,15 +3087,20 @@ class PhysicalValidator:
                         break
 
                 if not has_reports:
-                    # Double-check by looking for any XML test reports
-                    check_cmd = f"find {module_dir} -path '*/target/surefire-reports/*.xml' -o -path '*/target/failsafe-reports/*.xml' 2>/dev/null | head -1"
-                    check_result = self._execute_command_with_logging(
-                        check_cmd, f"checking for test reports in {module}"
-                    )
+                    unreported.append(module)
 
-                    if not check_result["success"] or not check_result.get("output", "").strip():
-                        modules_without_tests.append(module)
-                        logger.debug(f"Module {module} has no test reports")
+            # Double-check by looking for any XML test reports, one batch for all
+            check_results = self._execute_batch_with_logging(
+                [
+                    f"find {project_dir}/{module} -path '*/target/surefire-reports/*.xml' -o -path '*/target/failsafe-reports/*.xml' 2>/dev/null | head -1"
+                    for module in unreported
+                ],
+                "checking modules for test reports",
+            )
+            for module, check_result in zip(unreported, check_results):
+                if not check_result["success"] or not check_result.get("output", "").strip():
+                    modules_without_tests.append(module)
+                    logger.debug(f"Module {module} has no test reports")
 
             return modules_without_tests
 
@@ -2779,36 +3112,39 @@ class PhysicalValidator:
         self, testsuite: ET.Element, file_path: str
     ) -> List[Dict[str, any]]:
         """Collect individual testcase entries from a testsuite element."""
-        cases: List[Dict[str, any]] = []
-        for testcase in testsuite.findall("testcase"):
-            name = (testcase.get("name") or "").strip()
-            classname = (testcase.get("classname") or "").strip()
-            identity_file = testcase.get("file") or testsuite.get("file")
-            file_attr = identity_file or file_path
-            time_attr = testcase.get("time")
-            status = self._determine_testcase_status(testcase)
-            collection_kind = _collection_node_kind(testcase)
-            entry = {
-                "name": name,
-                "classname": classname,
-                "file": file_attr,
-                "identity_file": identity_file,
-                "status": status,
-                "time": float(time_attr) if time_attr else 0.0,
-                "collection_node": collection_kind,
-            }
-            if collection_kind == "error":
-                error = testcase.find("error")
-                entry["collection_message"] = _structured_error_line(
-                    error.text if error is not None else "",
-                    (error.get("message") if error is not None else "") or "",
-                )
-            cases.append(entry)
+        cases = [
+            self._testcase_entry(testcase, testsuite, file_path)
+            for testcase in testsuite.findall("testcase")
+        ]
         # Debug logging
         if len(cases) > 0:
             logger.debug(f"Collected {len(cases)} testcases from {file_path}")
         return cases
 
+    def _testcase_entry(
+        self, testcase: ET.Element, testsuite: ET.Element, file_path: str
+    ) -> Dict[str, any]:
+        """One testcase entry, as the report parsers hand it to aggregation."""
+        identity_file = testcase.get("file") or testsuite.get("file")
+        time_attr = testcase.get("time")
+        collection_kind = _collection_node_kind(testcase)
+        entry = {
+            "name": (testcase.get("name") or "").strip(),
+            "classname": (testcase.get("classname") or "").strip(),
+            "file": identity_file or file_path,
+            "identity_file": identity_file,
+            "status": self._determine_testcase_status(testcase),
+            "time": float(time_attr) if time_attr else 0.0,
+            "collection_node": collection_kind,
+        }
+        if collection_kind == "error":
+            error = testcase.find("error")
+            entry["collection_message"] = _structured_error_line(
+                error.text if error is not None else "",
+                (error.get("message") if error is not None else "") or "",
+            )
+        return entry
+
     @staticmethod
     def _determine_testcase_status(testcase: ET.Element) -> str:
         """Determine the status of a testcase element."""
@@ -5307,22 +5643,28 @@ class PhysicalValidator:
 
         result = {"exist": False, "count": 0, "jar_count": 0, "class_count": 0, "details": {}}
 
-        # Count JAR files (complete scan, no head limit). Exclude the Gradle
-        # wrapper/tooling jar: it ships with the repo and is NOT a build output,
-        # so it must never count as evidence that the project compiled.
-        jar_cmd = (
-            f"find {project_dir} -name '*.jar' -type f "
-            f"-not -path '*/gradle/wrapper/*' 2>/dev/null | wc -l"
-        )
-        jar_result = self._execute_command_with_logging(jar_cmd, "counting JAR files")
-        if jar_result["success"]:
-            result["jar_count"] = int(jar_result["output"].strip() or 0)
+        # Exclude the Gradle wrapper/tooling jar from the JAR count: it ships
+        # with the repo and is NOT a build output, so it must never count as
+        # evidence that the project compiled.
+        snapshot = self._artifact_snapshot(project_dir)
+        if snapshot is not None:
+            result["jar_count"] = sum(1 for p in snapshot.jars if "/gradle/wrapper/" not in p)
+            result["class_count"] = snapshot.class_count
+        else:
+            # Count JAR files (complete scan, no head limit).
+            jar_cmd = (
+                f"find {project_dir} -name '*.jar' -type f "
+                f"-not -path '*/gradle/wrapper/*' 2>/dev/null | wc -l"
+            )
+            jar_result = self._execute_command_with_logging(jar_cmd, "counting JAR files")
+            if jar_result["success"]:
+                result["jar_count"] = int(jar_result["output"].strip() or 0)
 
-        # Count class files (complete scan)
-        class_cmd = f"find {project_dir} -name '*.class' -type f 2>/dev/null | wc -l"
-        class_result = self._execute_command_with_logging(class_cmd, "counting class files")
-        if class_result["success"]:
-            result["class_count"] = int(class_result["output"].strip() or 0)
+            # Count class files (complete scan)
+            class_cmd = f"find {project_dir} -name '*.class' -type f 2>/dev/null | wc -l"
+            class_result = self._execute_command_with_logging(class_cmd, "counting class files")
+            if class_result["success"]:
+                result["class_count"] = int(class_result["output"].strip() or 0)
 
         # Check for Node modules only if a Node.js project is detected
         package_json_cmd = (
@@ -5386,44 +5728,63 @@ class PhysicalValidator:
         if project_dir not in module_dirs:
             module_dirs = [project_dir] + module_dirs
 
+        # Every per-module probe is independent, so all modules are measured
+        # in one batched round trip instead of 4-5 execs per module. Class and
+        # JAR counts come from the artifact index when it is available.
+        snapshot = self._artifact_snapshot(project_dir)
+        probes: List[str] = []
+        for module_dir in module_dirs:
+            if snapshot is None:
+                probes.append(
+                    f"find '{module_dir}/{classes_glob}' -name '*.class' -type f 2>/dev/null "
+                    "| wc -l"
+                )
+                probes.append(
+                    f"find '{module_dir}/{jars_glob}' -name '*.jar' -type f "
+                    f"-not -path '*/gradle/wrapper/*' 2>/dev/null | wc -l"
+                )
+            for sub in report_subdirs:
+                probes.append(f"test -d {module_dir}/{sub} && echo EXISTS")
+            probes.append(f"test -d {module_dir}/src/test && echo EXISTS")
+        probe_results = iter(self._execute_batch_with_logging(probes, "scanning modules"))
+
         modules: List[Dict[str, any]] = []
         for module_dir in module_dirs:
             rel = module_dir[len(project_dir) :].strip("/") or "."
             name = "." if rel == "." else rel.replace("/", sep)
 
-            class_cmd = (
-                f"find '{module_dir}/{classes_glob}' -name '*.class' -type f 2>/dev/null | wc -l"
-            )
-            cc = self._execute_command_with_logging(class_cmd, f"counting classes in {rel}")
-            # None (not 0) when the count command fails: "couldn't measure" must
-            # not masquerade as "zero classes" (which would also wrongly suppress
-            # the artifact-based build inference downstream).
-            class_count = int((cc.get("output") or "0").strip() or 0) if cc.get("success") else None
+            if snapshot is not None:
+                class_count = snapshot.class_count_under(f"{module_dir}/{classes_glob}")
+                jar_count = sum(
+                    1
+                    for path in snapshot.jars_under(f"{module_dir}/{jars_glob}")
+                    if "/gradle/wrapper/" not in path
+                )
+            else:
+                cc = next(probe_results)
+                # None (not 0) when the count command fails: "couldn't measure"
+                # must not masquerade as "zero classes" (which would also wrongly
+                # suppress the artifact-based build inference downstream).
+                class_count = (
+                    int((cc.get("output") or "0").strip() or 0) if cc.get("success") else None
+                )
 
-            jar_cmd = (
-                f"find '{module_dir}/{jars_glob}' -name '*.jar' -type f "
-                f"-not -path '*/gradle/wrapper/*' 2>/dev/null | wc -l"
-            )
-            jc = self._execute_command_with_logging(jar_cmd, f"counting jars in {rel}")
-            jar_count = int((jc.get("output") or "0").strip() or 0) if jc.get("success") else None
+                jc = next(probe_results)
+                jar_count = (
+                    int((jc.get("output") or "0").strip() or 0) if jc.get("success") else None
+                )
 
             report_dirs: List[str] = []
             for sub in report_subdirs:
-                rd = f"{module_dir}/{sub}"
-                chk = self._execute_command_with_logging(
-                    f"test -d {rd} && echo EXISTS", f"checking reports {rel}"
-                )
+                chk = next(probe_results)
                 if "EXISTS" in (chk.get("output") or ""):
-                    report_dirs.append(rd)
+                    report_dirs.append(f"{module_dir}/{sub}")
 
             # Test-bearing probe: does this module declare test sources? Feeds
             # modules_test_bearing so the report can tell "tests ran in a strict
             # subset of the test-bearing modules" (reactor_scope_narrowed) apart
             # from "these modules simply have no tests" (spec §4).
-            tst = self._execute_command_with_logging(
-                f"test -d {module_dir}/src/test && echo EXISTS",
-                f"checking test sources {rel}",
-            )
+            tst = next(probe_results)
             has_test_sources = "EXISTS" in (tst.get("output") or "")
 
             record = {
@@ -5502,69 +5863,28 @@ class PhysicalValidator:
         if not self.docker_orchestrator or not report_dirs:
             return {}
 
-        import re as _re
-
         totals = {"tests_total": 0, "tests_failed": 0, "tests_errors": 0, "tests_skipped": 0}
         failing: List[str] = []
 
-        # Collect XML file paths from ALL report dirs, then dedupe by absolute
-        # path BEFORE parsing. Gradle's modern layout nests report dirs
-        # (build/test-results/test lives inside build/test-results), and
-        # scan_modules lists both because older layouts drop XMLs directly in
-        # the parent. A recursive `find` on the parent re-lists every file the
-        # child find already returned, so parsing per-dir would count each XML
-        # twice (live bigtop: 72=2x36, 2=2x1, 26=2x13). File-level dedupe is the
-        # robust guarantee: nested (ancestor+descendant) dirs can never
-        # double-count, while genuinely distinct files across sibling dirs
-        # (Maven surefire + failsafe) are still each counted once.
-        seen_files: set = set()
-        ordered_files: List[str] = []
-        for rd in report_dirs:
-            find_cmd = f"find {rd} -name 'TEST-*.xml' -o -name '*.xml' -path '*{rd}*' 2>/dev/null"
-            listing = self._execute_command_with_logging(find_cmd, f"listing reports {rd}")
-            for f in (listing.get("output") or "").splitlines():
-                f = f.strip()
-                if not f.endswith(".xml") or f in seen_files:
-                    continue
-                seen_files.add(f)
-                ordered_files.append(f)
-
-        for xml_file in ordered_files:
-            cat = self._execute_command_with_logging(f"cat '{xml_file}'", f"reading {xml_file}")
-            content = cat.get("output") or ""
-            # Parse each <testsuite ...> open tag, reading attributes
-            # independently. Surefire and Gradle emit them in different orders
-            # (Gradle: name, tests, skipped, failures, errors), so a single
-            # positional regex would silently miss one writer's reports.
-            for open_tag in _re.finditer(r"<testsuite\b[^>]*>", content):
-                tag = open_tag.group(0)
-                for key, attr in (
-                    ("tests_total", "tests"),
-                    ("tests_failed", "failures"),
-                    ("tests_errors", "errors"),
-                    ("tests_skipped", "skipped"),
-                ):
-                    m = _re.search(rf'\b{attr}="(\d+)"', tag)
-                    if m:
-                        totals[key] += int(m.group(1))
-            # Failing testcases: match a testcase WITH a body (self-closing
-            # passing cases are skipped), then read name/classname from the
-            # open tag INDEPENDENTLY. Surefire emits name-before-classname,
-            # Gradle classname-before-name -- a positional regex misses one
-            # writer (live commons-vfs: failures counted but no names).
-            # The `[^/]` before `>` excludes self-closing <testcase .../>
-            # (passing cases); otherwise a self-closing tag would be read as
-            # an open tag and swallow the next sibling's <failure> body.
-            for case in _re.finditer(
-                r"<testcase\b([^>]*[^/])>(.*?)</testcase>", content, _re.DOTALL
-            ):
-                attrs, body = case.group(1), case.group(2)
-                if "<failure" in body or "<error" in body:
-                    name_m = _re.search(r'\bname="([^"]*)"', attrs)
-                    cls_m = _re.search(r'\bclassname="([^"]*)"', attrs)
-                    nm = name_m.group(1) if name_m else "(unknown)"
-                    cls = cls_m.group(1) if cls_m else ""
-                    failing.append(f"{cls}.{nm}" if cls else nm)
+        # Production harvests every XML under the module's report dirs in one
+        # pass, re-reading only files changed since the previous pass.
+        harvested = self._report_harvester().harvest(
+            report_dirs, self._module_report_counts_bytes, kind="module_report_counts"
+        )
+        if harvested is None:
+            harvested = {
+                xml_file: _module_report_counts(
+                    self._execute_command_with_logging(
+                        f"cat '{xml_file}'", f"reading {xml_file}"
+                    ).get("output")
+                    or ""
+                )
+                for xml_file in self._list_module_report_files(report_dirs)
+            }
+        for file_totals, file_failing in harvested.values():
+            for key, count in file_totals.items():
+                totals[key] += count
+            failing.extend(file_failing)
 
         passed = max(
             totals["tests_total"]
@@ -5588,6 +5908,67 @@ class PhysicalValidator:
             "evidence_refs": list(report_dirs),
         }
 
+    def _list_module_report_files(self, report_dirs: List[str]) -> List[str]:
+        """Every XML under ``report_dirs`` via the shell, deduplicated by path.
+
+        Collect XML file paths from ALL report dirs, then dedupe by absolute
+        path BEFORE parsing. Gradle's modern layout nests report dirs
+        (build/test-results/test lives inside build/test-results), and
+        scan_modules lists both because older layouts drop XMLs directly in
+        the parent. A recursive `find` on the parent re-lists every file the
+        child find already returned, so parsing per-dir would count each XML
+        twice (live bigtop: 72=2x36, 2=2x1, 26=2x13). File-level dedupe is the
+        robust guarantee: nested (ancestor+descendant) dirs can never
+        double-count, while genuinely distinct files across sibling dirs
+        (Maven surefire + failsafe) are still each counted once.
+        """
+        seen_files: set = set()
+        ordered_files: List[str] = []
+        for rd in report_dirs:
+            find_cmd = f"find {rd} -name 'TEST-*.xml' -o -name '*.xml' -path '*{rd}*' 2>/dev/null"
+            listing = self._execute_command_with_logging(find_cmd, f"listing reports {rd}")
+            for f in (listing.get("output") or "").splitlines():
+                f = f.strip()
+                if not f.endswith(".xml") or f in seen_files:
+                    continue
+                seen_files.add(f)
+                ordered_files.append(f)
+        return ordered_files
+
+    @staticmethod
+    def _module_report_counts_bytes(
+        file_path: str, data: bytes
+    ) -> Tuple[Dict[str, int], List[str]]:
+        """Harvester parser for :meth:`parse_module_test_reports`.
+
+        Streams the report with ``iterparse``: suite attributes are summed as
+        each ``<testsuite>`` opens and each testcase is dropped once its
+        failure/error children have been checked. Malformed XML gets the
+        regex reader, which tolerates truncated files.
+        """
+        totals = {"tests_total": 0, "tests_failed": 0, "tests_errors": 0, "tests_skipped": 0}
+        failing: List[str] = []
+        try:
+            for event, element in ET.iterparse(io.BytesIO(data), events=("start", "end")):
+                tag = element.tag.rsplit("}", 1)[-1]
+                if event == "start":
+                    if tag == "testsuite":
+                        for key, attr in _MODULE_SUITE_ATTRS:
+                            value = (element.get(attr) or "").strip()
+                            if value.isdigit():
+                                totals[key] += int(value)
+                    continue
+                if tag != "testcase":
+                    continue
+                if any(child.tag.rsplit("}", 1)[-1] in ("failure", "error") for child in element):
+                    nm = element.get("name") or "(unknown)"
+                    cls = element.get("classname") or ""
+                    failing.append(f"{cls}.{nm}" if cls else nm)
+                element.clear()
+        except ET.ParseError:
+            return _module_report_counts(data.decode("utf-8", errors="replace"))
+        return totals, failing
+
     def _validate_maven_fingerprints(self, project_dir: str) -> Dict[str, any]:
         """
         Validate Maven build fingerprints without executing mvn commands.
@@ -5606,33 +5987,36 @@ class PhysicalValidator:
             f"{project_dir}/target/classes",
         ]
 
+        # Root fingerprints and the module listing go out in one batch.
+        modules_cmd = (
+            f"find {project_dir} -mindepth 2 -maxdepth 2 -name 'pom.xml' -type f 2>/dev/null"
+        )
+        *check_results, modules_result = self._execute_batch_with_logging(
+            [f"test -e {path}" for path in fingerprint_checks] + [modules_cmd],
+            "checking Maven fingerprints",
+        )
+
         fingerprints_found = 0
-        for fingerprint_path in fingerprint_checks:
-            cmd = f"test -e {fingerprint_path}"
-            check_result = self._execute_command_with_logging(cmd, f"checking {fingerprint_path}")
+        for fingerprint_path, check_result in zip(fingerprint_checks, check_results):
             if check_result["success"]:
                 fingerprints_found += 1
                 result["details"][fingerprint_path.split("/")[-1]] = True
 
         # Check for multi-module projects
-        modules_cmd = (
-            f"find {project_dir} -mindepth 2 -maxdepth 2 -name 'pom.xml' -type f 2>/dev/null"
-        )
-        modules_result = self._execute_command_with_logging(modules_cmd, "finding Maven modules")
         if modules_result["success"] and modules_result["output"]:
-            modules = modules_result["output"].strip().split("\n")
-            for module_pom in modules:
-                if module_pom:
-                    module_dir = "/".join(module_pom.split("/")[:-1])
-                    module_name = module_dir.split("/")[-1]
-
-                    # Check module fingerprints
-                    module_target = f"{module_dir}/target/maven-status"
-                    cmd = f"test -d {module_target}"
-                    if self._execute_command_with_logging(cmd, f"checking module {module_name}")[
-                        "success"
-                    ]:
-                        result["modules"].append(module_name)
+            module_dirs = [
+                "/".join(module_pom.split("/")[:-1])
+                for module_pom in modules_result["output"].strip().split("\n")
+                if module_pom
+            ]
+            # Check module fingerprints, all modules in one batch
+            module_checks = self._execute_batch_with_logging(
+                [f"test -d {module_dir}/target/maven-status" for module_dir in module_dirs],
+                "checking Maven module fingerprints",
+            )
+            for module_dir, check_result in zip(module_dirs, module_checks):
+                if check_result["success"]:
+                    result["modules"].append(module_dir.split("/")[-1])
 
         # Determine validity
         result["valid"] = fingerprints_found > 0 or len(result["modules"]) > 0
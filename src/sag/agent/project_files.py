@@ -0,0 +1,278 @@
+"""Run-scoped cache of the project's build files for the survey and analyzers.
+
+One ``project analyze`` used to read the same few files many times over:
+``pom.xml`` was ``cat``-ed by ``analyze_maven_configuration`` and grepped twice
+by ``detect_maven_test_framework``, ``build.gradle`` was read by both Gradle
+passes, every ``test -f pom.xml`` ran once per scanner, and the Python
+metadata readers re-read ``pyproject.toml``/``setup.py`` on top — one container
+exec each.
+
+A ``ProjectFileCache`` is attached to ONE workspace's orchestrator for the
+run. Each entry is a path, its ``stat`` stamp (type, size, mtime, inode) and, for a
+regular file, its text:
+
+* ``prefetch`` fills many paths with one exec, and any path read before it was
+  prefetched costs one exec the first time and none after;
+* ``invalidate`` is called after every tool execution (any tool may write the
+  tree). The next read then re-stats every cached path in one exec and re-reads
+  only those whose stamp moved;
+* text is read untruncated, because these files are parsed here and never
+  reach the model. A file over ``MAX_CACHED_BYTES`` keeps its stamp but is read
+  directly each time;
+* ``seed`` takes entries and scans (directory listings, ``find`` results) that
+  the one-exec survey probe (``sag.agent.survey_probe``) collected. A scan has
+  no stamp to re-check, so ``invalidate`` drops the scans outright and the next
+  reader runs its own command.
+
+Only the production ``DockerOrchestrator`` gets a cache implicitly, like the
+evidence store. Test doubles keep the readers' own commands unless a test
+attaches one, so a scripted double answers exactly what it always answered.
+"""
+
+import secrets
+import shlex
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from loguru import logger
+
+from sag.runtime.container_io import archive_orchestrator
+
+MAX_CACHED_BYTES = 4 * 1024 * 1024
+MISSING = "missing"
+
+# The files and directories a survey of ``project_path`` always asks about,
+# prefetched in one exec before the scanners run.
+SURVEY_PATHS = (
+    "pom.xml",
+    "build.gradle",
+    "build.gradle.kts",
+    "settings.gradle",
+    "settings.gradle.kts",
+    "gradle.properties",
+    "gradlew",
+    "pyproject.toml",
+    "setup.py",
+    "setup.cfg",
+    "package.json",
+    "requirements.txt",
+    "Cargo.toml",
+    "go.mod",
+    "CMakeLists.txt",
+    "Makefile",
+    "README.md",
+    "README.txt",
+    "README",
+    "docs/README.md",
+    "src/main/java",
+    "src/main/groovy",
+    "src/main/scala",
+    "src/main/kotlin",
+    "src/test",
+    "test",
+    "tests",
+    "__tests__",
+)
+
+
+@dataclass(frozen=True)
+class ProjectFile:
+    """One path as ``stat -L`` saw it, with its text when it is a regular file.
+
+    The stamp is type, size, mtime (to the nanosecond where the filesystem
+    keeps it) and inode, so a same-size rewrite within one second still moves it.
+    """
+
+    stamp: str
+    text: Optional[str] = None
+
+    @property
+    def kind(self) -> str:
+        return self.stamp.split("|", 1)[0]
+
+    @property
+    def exists(self) -> bool:
+        return self.stamp != MISSING
+
+    @property
+    def is_file(self) -> bool:
+        return self.kind in ("regular file", "regular empty file")
+
+    @property
+    def is_dir(self) -> bool:
+        return self.kind == "directory"
+
+
+class ProjectFileCache:
+    """The project files one workspace's survey has read, valid until a tool runs."""
+
+    def __init__(self, orchestrator: Any):
+        self.orchestrator = orchestrator
+        self._lock = threading.Lock()
+        self._entries: Dict[str, ProjectFile] = {}
+        self._scans: Dict[Tuple[str, str], List[str]] = {}
+        self._stale = False
+
+    def prefetch(self, paths: Iterable[str]) -> None:
+        """Load every path not cached yet, in one exec."""
+        with self._lock:
+            self._revalidate()
+            wanted = [path for path in dict.fromkeys(paths) if path not in self._entries]
+            self._load([(path, "") for path in wanted])
+
+    def entry(self, path: str) -> Optional[ProjectFile]:
+        """``path``'s current entry, or None when the container could not be read."""
+        with self._lock:
+            self._revalidate()
+            if path not in self._entries:
+                self._load([(path, "")])
+            return self._entries.get(path)
+
+    def exists(self, path: str) -> bool:
+        entry = self.entry(path)
+        return entry is not None and entry.exists
+
+    def is_file(self, path: str) -> bool:
+        entry = self.entry(path)
+        return entry is not None and entry.is_file
+
+    def is_dir(self, path: str) -> bool:
+        entry = self.entry(path)
+        return entry is not None and entry.is_dir
+
+    def read(self, path: str) -> Optional[str]:
+        """The full text of the regular file at ``path``, or None when there is none."""
+        entry = self.entry(path)
+        if entry is None or not entry.is_file:
+            return None
+        if entry.text is not None:
+            return entry.text
+        # Over MAX_CACHED_BYTES: read it whole, every time.
+        result = self.orchestrator.execute_command(
+            f"cat {shlex.quote(path)}", truncate_output=False
+        )
+        return (result.get("output") or "") if result.get("success") else None
+
+    def scan(self, kind: str, path: str) -> Optional[List[str]]:
+        """The lines a ``kind`` scan of ``path`` printed, None when not seeded."""
+        with self._lock:
+            lines = self._scans.get((kind, path))
+            return list(lines) if lines is not None else None
+
+    def seed(
+        self,
+        entries: Mapping[str, ProjectFile],
+        scans: Optional[Mapping[Tuple[str, str], List[str]]] = None,
+    ) -> None:
+        """Take what one survey exec saw: entries by path, scan lines by (kind, path)."""
+        with self._lock:
+            self._entries.update(entries)
+            self._scans.update({key: list(lines) for key, lines in (scans or {}).items()})
+
+    def invalidate(self) -> None:
+        """Something may have written the tree: re-stat before the next read."""
+        with self._lock:
+            self._stale = bool(self._entries)
+            self._scans.clear()
+
+    def _revalidate(self) -> None:
+        if not self._stale:
+            return
+        self._stale = False
+        self._load([(path, entry.stamp) for path, entry in self._entries.items()])
+
+    def _load(self, requests: List[Tuple[str, str]]) -> None:
+        """Stat every path and read the regular files whose stamp is not ``known``."""
+        if not requests:
+            return
+        marker = f"@@sag-file-{secrets.token_hex(8)}"
+        script = [f"m={marker}"]
+        for path, known in requests:
+            quoted = shlex.quote(path)
+            script.append(
+                f"s=$(stat -L -c '%F|%s|%y|%i' -- {quoted} 2>/dev/null || echo {MISSING}); "
+                f'printf \'%s %s\\n\' "$m" "$s"; '
+                f'if [ "$s" != {shlex.quote(known)} ] && [ -f {quoted} ]; then '
+                f"head -c {MAX_CACHED_BYTES + 1} -- {quoted} 2>/dev/null; fi; printf '\\n'"
+            )
+        script.append('printf \'%s end\\n\' "$m"')
+        try:
+            result = self.orchestrator.execute_command(
+                "\n".join(script), truncate_output=False
+            )
+        except Exception as exc:
+            logger.debug(f"project files not read: {exc}")
+            result = None
+        output = str((result or {}).get("output") or "")
+        sections = output.split(f"\n{marker} ")
+        head = sections[0]
+        if head.startswith(f"{marker} "):
+            sections[0] = head[len(marker) + 1 :]
+        else:
+            sections = sections[1:]
+        if len(sections) != len(requests) + 1 or not sections[-1].startswith("end"):
+            # Transport failure or a torn answer: keep nothing, so every reader
+            # asks again instead of trusting half an answer.
+            for path, _known in requests:
+                self._entries.pop(path, None)
+            return
+        for (path, known), section in zip(requests, sections):
+            stamp, _, text = section.partition("\n")
+            previous = self._entries.get(path)
+            if stamp == known and previous is not None:
+                continue
+            if not stamp.startswith(("regular file", "regular empty file")):
+                self._entries[path] = ProjectFile(stamp)
+            elif len(text.encode("utf-8", errors="replace")) > MAX_CACHED_BYTES:
+                self._entries[path] = ProjectFile(stamp)
+            else:
+                self._entries[path] = ProjectFile(stamp, text)
+
+
+def attach_project_files(orchestrator: Any) -> ProjectFileCache:
+    """The cache attached to ``orchestrator``, creating it on first use."""
+    cache = getattr(orchestrator, "_project_files", None)
+    if not isinstance(cache, ProjectFileCache):
+        cache = ProjectFileCache(orchestrator)
+        orchestrator._project_files = cache
+    return cache
+
+
+def project_files_for(orchestrator: Any) -> Optional[ProjectFileCache]:
+    """The cache behind ``orchestrator``, if it has (or implicitly gets) one."""
+    if orchestrator is None:
+        return None
+    cache = getattr(orchestrator, "_project_files", None)
+    if isinstance(cache, ProjectFileCache):
+        return cache
+    if archive_orchestrator(orchestrator) is None:
+        return None
+    return attach_project_files(orchestrator)
+
+
+def invalidate_project_files(orchestrator: Any) -> None:
+    """Mark ``orchestrator``'s cache stale; a no-op when it has none."""
+    cache = getattr(orchestrator, "_project_files", None)
+    if isinstance(cache, ProjectFileCache):
+        cache.invalidate()
+
+
+def prefetch_survey_files(orchestrator: Any, project_path: str) -> None:
+    """Load ``SURVEY_PATHS`` under ``project_path`` in one exec, when cached."""
+    cache = project_files_for(orchestrator)
+    if cache is not None:
+        root = project_path.rstrip("/")
+        cache.prefetch(f"{root}/{name}" for name in SURVEY_PATHS)
+
+
+__all__ = [
+    "MAX_CACHED_BYTES",
+    "SURVEY_PATHS",
+    "ProjectFile",
+    "ProjectFileCache",
+    "attach_project_files",
+    "invalidate_project_files",
+    "prefetch_survey_files",
+    "project_files_for",
+]
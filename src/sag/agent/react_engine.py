@@ -15,6 +15,7 @@ from sag.config.prompt_loader import load_react_engine_prompts
 from sag.config.settings import effective_phase_floor
 from sag.evidence import OperationOutcome
 from sag.project_fact_sheet import project_fact_sheet_identity
+from sag.runtime.container_io import archive_orchestrator
 from sag.tools.base import (
     BaseTool,
     OutputPersistenceError,
@@ -47,6 +48,7 @@ from .control_events import (
     compact_control_value,
     forced_action_sha256,
 )
+from .early_dispatch import EarlyDispatch
 from .evidence_assessments import ASSESSMENT_DIR, ensure_receipt_assessed
 from .job_obligations import (
     OBLIGATION_DIR,
@@ -111,6 +113,7 @@ from .retry_authority import (
 from .token_tracker import TokenTracker
 from .tool_orchestration import (
     ActualToolExecution,
+    PrefetchedResults,
     ToolCall,
     ToolExecution,
     ToolExecutionRecord,
@@ -1094,6 +1097,8 @@ class ReActEngine(UIEventEmitter):
             raise RuntimeError("setup evidence finalization is not configured")
         was_sealed = state.sealed
         if not was_sealed:
+            # Sealing closes the run's record: buffered journal lines land first.
+            self._flush_context_journal(wait=True)
             # Plan 8 §3.2 trigger 3, in two steps: WAIT for a still-running
             # job while allocated budget remains, then the closing sweep. A
             # job that terminated while the run was finishing still owes a
@@ -1115,6 +1120,8 @@ class ReActEngine(UIEventEmitter):
         return ReportDeliveryStatus.SKIPPED
 
     def _close_flow(self, termination: RunTerminationStatus) -> RunTermination:
+        # Every termination (completed, aborted, cancelled) passes here.
+        self._close_context_journal()
         state = getattr(self, "run_evidence_state", None)
         if state is None:
             raise RuntimeError("setup flow closure requires run evidence state")
@@ -1724,6 +1731,18 @@ class ReActEngine(UIEventEmitter):
                 gate.evidence_refs,
             )
 
+    def _snapshot_provisioned_toolchain(self) -> None:
+        """Commit the freshly provisioned container for later runs (best effort)."""
+        if not getattr(self.config, "docker_toolchain_snapshots", False):
+            return
+        orchestrator = archive_orchestrator(self.orchestrator)
+        if orchestrator is None:
+            return
+        try:
+            orchestrator.snapshot_provisioned_toolchain(getattr(self, "repository_url", None))
+        except Exception as exc:
+            logger.warning(f"Toolchain snapshot skipped: {exc}")
+
     @staticmethod
     def _phase_record_status(record) -> str:
         if (
@@ -1751,6 +1770,11 @@ class ReActEngine(UIEventEmitter):
                 self._phase_record_status(applied),
                 f"[{applied.outcome.value}] {text}",
             )
+        # Phase boundary: the finished phase's journal goes out in the background.
+        self._flush_context_journal()
+
+        if record.phase == "provision" and decision.route.kind == "advance":
+            self._snapshot_provisioned_toolchain()
 
         if decision.route.kind == "evidence_close":
             reason = (
@@ -1993,6 +2017,17 @@ class ReActEngine(UIEventEmitter):
             step_span=len(self.steps),
         )
 
+    def _flush_context_journal(self, wait: bool = False) -> None:
+        flush = getattr(getattr(self, "context_journal", None), "flush", None)
+        if flush is not None:
+            flush(wait=wait)
+
+    def _close_context_journal(self) -> None:
+        # Later records (there should be none) are written through, one exec each.
+        close = getattr(getattr(self, "context_journal", None), "close", None)
+        if close is not None:
+            close()
+
     def _evidence_is_sealed(self) -> bool:
         """Whether this run has closed its evidence and accepts no more of it.
 
@@ -2451,18 +2486,34 @@ class ReActEngine(UIEventEmitter):
                 self.token_tracker.set_iteration(self.current_iteration)
 
                 messages = render_messages(system_prompt, self.steps)
+                steps_before = len(self.steps)
+                early_dispatch = self._start_early_dispatch()
                 try:
-                    turn = self.llm_client.get_native_turn(messages)
+                    if early_dispatch is None:
+                        turn = self.llm_client.get_native_turn(messages)
+                    else:
+                        turn = self.llm_client.get_native_turn(
+                            messages, on_tool_call=early_dispatch.submit
+                        )
                 except Exception as exc:
                     # `get_native_turn` propagates provider errors instead of
                     # swallowing them the way `get_response` did.
                     logger.error(f"Native executor request failed: {exc}")
+                    if early_dispatch is not None:
+                        # Calls already handed over settle with their observations;
+                        # a failure there must not replace the provider error.
+                        try:
+                            early_dispatch.finish()
+                        except Exception as dispatch_exc:
+                            logger.error(
+                                f"Early-dispatched tool calls failed to settle: {dispatch_exc}"
+                            )
                     self._export_token_usage_csv()
                     if phase_mode:
                         return self.abort(reason=f"LLM response unavailable: {exc}")
                     return False
-
-                steps_before = len(self.steps)
+                if early_dispatch is not None:
+                    executed_steps = early_dispatch.finish(turn)
 
                 if not turn.tool_calls:
                     if turn.text.strip():
@@ -2497,7 +2548,8 @@ class ReActEngine(UIEventEmitter):
                         )
                     continue
 
-                executed_steps = self._execute_native_calls(turn)
+                if early_dispatch is None:
+                    executed_steps = self._execute_native_calls(turn)
                 added = max(len(self.steps) - steps_before, 0)
 
                 if phase_mode:
@@ -2900,6 +2952,7 @@ class ReActEngine(UIEventEmitter):
                 params,
             ),
             output_storage=self.output_storage,
+            prefetched=getattr(self, "_prefetched_results", None),
             logger=logger,
         )
 
@@ -4243,9 +4296,8 @@ class ReActEngine(UIEventEmitter):
         try:
             triggers = [
                 record
-                for record in read_records(orchestrator, ASSESSMENT_DIR)
-                if str(record.get("receipt_id") or "").strip() == receipt_id
-                and is_failure_class(record.get("typed_code"))
+                for record in read_records(orchestrator, ASSESSMENT_DIR, receipt_id=receipt_id)
+                if is_failure_class(record.get("typed_code"))
                 and str(record.get("assessment_id") or "").strip() not in attempted
             ]
             if not triggers:
@@ -4395,9 +4447,7 @@ class ReActEngine(UIEventEmitter):
             claim_ids = [value for value in claim_ids if value]
             if not claim_ids:
                 return
-            for record in read_records(orchestrator, ASSESSMENT_DIR):
-                if str(record.get("receipt_id") or "").strip() != receipt_id:
-                    continue
+            for record in read_records(orchestrator, ASSESSMENT_DIR, receipt_id=receipt_id):
                 assessment_id = str(record.get("assessment_id") or "").strip()
                 if not assessment_id or assessment_id in committed:
                     continue
@@ -4643,6 +4693,86 @@ class ReActEngine(UIEventEmitter):
             step.tool_call_id = tool_call_id
         return step
 
+    # Read-only tools whose calls may run side by side. Everything else —
+    # harness tools included — keeps strictly serial execution.
+    _CONCURRENT_READONLY_TOOLS = frozenset({"file_io", "search", "bash"})
+    _READONLY_CONCURRENCY = 8
+    # Bash commands that may share the prefetch pool. Narrower than the advisor's
+    # `_READONLY_BASH_PREFIXES`: `env` runs whatever program follows it.
+    _CONCURRENT_BASH_COMMANDS = frozenset(_READONLY_BASH_PREFIXES) - {"env"}
+    # A read-only first token says nothing once the command chains, pipes,
+    # redirects, substitutes or hands paths to `find -exec`/`-delete`/`-fls`.
+    _SHELL_SIDE_EFFECT_RE = re.compile(
+        r"[;&|<>`$\n]|\s-(?:exec|execdir|ok|okdir|delete|fprint|fls)"
+    )
+
+    def _is_concurrency_safe(self, call) -> bool:
+        """Whether this native call may run alongside the turn's other reads."""
+        name = str(call.name or "").strip().lower()
+        params = dict(call.arguments or {})
+        if name not in self._CONCURRENT_READONLY_TOOLS or self._is_state_changing(name, params):
+            return False
+        if name == "search":
+            # Polling a background job reaps it and settles job obligations.
+            return not str(params.get("target") or "").strip().startswith("job:")
+        if name == "bash":
+            command = str(params.get("command") or "")
+            if self._first_command_token(command) not in self._CONCURRENT_BASH_COMMANDS:
+                return False
+            return not self._SHELL_SIDE_EFFECT_RE.search(command)
+        return True
+
+    def _prefetch_read_only_run(self, calls, start: int) -> int:
+        """Start the run of concurrency-safe calls beginning at ``start`` together.
+
+        Returns the index of the run's last call. The serial pass still walks
+        every call in order — gates, refusals and observations are unchanged —
+        but takes each tool result from the pool instead of running it."""
+        end = start
+        while end < len(calls) and self._is_concurrency_safe(calls[end]):
+            end += 1
+        if end - start < 2:
+            return start
+        self._close_prefetched_results()
+        results = PrefetchedResults(max_workers=min(end - start, self._READONLY_CONCURRENCY))
+        orchestrator = self._get_tool_orchestrator()
+        for call in calls[start:end]:
+            orchestrator.prefetch(
+                ToolCall(name=call.name or "", raw_params=dict(call.arguments or {})), results
+            )
+        self._prefetched_results = results
+        return end - 1
+
+    def _close_prefetched_results(self) -> None:
+        results = getattr(self, "_prefetched_results", None)
+        self._prefetched_results = None
+        if results is not None:
+            results.close()
+
+    def _start_early_dispatch(self) -> Optional[EarlyDispatch]:
+        """A worker for this turn's calls when executor turns are streamed."""
+        if not getattr(self.config, "stream_native_turns", False):
+            return None
+        return EarlyDispatch(
+            self._execute_native_calls,
+            lambda: self.steps,
+            model=self.llm_client.capabilities_for(ReactModelMode.ACTION).model,
+        )
+
+    @staticmethod
+    def _arriving_calls(tool_calls, calls: List[Any]):
+        """Yield ``(index, call)`` while ``calls`` holds every call known so far.
+
+        A buffered turn's calls are all known up front; a streamed turn
+        (`EarlyDispatch`) hands them over one at a time as they complete."""
+        if isinstance(tool_calls, tuple):
+            calls.extend(tool_calls)
+            yield from enumerate(tool_calls)
+            return
+        for call in tool_calls:
+            calls.append(call)
+            yield len(calls) - 1, call
+
     def _execute_native_calls(self, turn) -> List[ReActStep]:
         """Execute every tool call of one assistant turn, in order.
 
@@ -4650,31 +4780,40 @@ class ReActEngine(UIEventEmitter):
         refusal, or a cancellation — because Anthropic rejects an assistant
         tool_use that no tool_result answers (anatomy map risk 5). A phase
         signal or a loop force-break stops execution but never stops the
-        answering."""
+        answering. Consecutive read-only calls run concurrently
+        (`_prefetch_read_only_run`); their observations still land in call
+        order."""
         executed: List[ReActStep] = []
         cancelled_reason: Optional[str] = None
+        calls: List[Any] = []
+        prefetched_through = -1
 
-        for call in turn.tool_calls:
-            step = ReActStep(
-                step_type=StepType.ACTION,
-                content=call.name or "(tool call without a name)",
-                tool_name=call.name,
-                tool_params=dict(call.arguments),
-                timestamp=self._get_timestamp(),
-                model_used=turn.model_used,
-                tool_call_id=call.id,
-                native_text=turn.text,
-            )
-            self.steps.append(step)
+        try:
+            for index, call in self._arriving_calls(turn.tool_calls, calls):
+                step = ReActStep(
+                    step_type=StepType.ACTION,
+                    content=call.name or "(tool call without a name)",
+                    tool_name=call.name,
+                    tool_params=dict(call.arguments),
+                    timestamp=self._get_timestamp(),
+                    model_used=turn.model_used,
+                    tool_call_id=call.id,
+                    native_text=turn.text,
+                )
+                self.steps.append(step)
 
-            if cancelled_reason is not None:
-                self._append_native_observation(call.id, f"[not executed: {cancelled_reason}]")
-                continue
+                if cancelled_reason is not None:
+                    self._append_native_observation(call.id, f"[not executed: {cancelled_reason}]")
+                    continue
 
-            batch_break_reason = self._execute_action_step(step)
-            executed.append(step)
-            if batch_break_reason is not None:
-                cancelled_reason = batch_break_reason
+                if index > prefetched_through:
+                    prefetched_through = self._prefetch_read_only_run(calls, index)
+                batch_break_reason = self._execute_action_step(step)
+                executed.append(step)
+                if batch_break_reason is not None:
+                    cancelled_reason = batch_break_reason
+        finally:
+            self._close_prefetched_results()
 
         # Plan 8 §3.2 trigger 1: after each executed action batch, whatever
         # tools it used. A model that spends its turns polling a log is
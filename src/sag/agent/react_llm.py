@@ -10,7 +10,9 @@ scheduler in Plan 2 Task 8.
 from __future__ import annotations
 
 import json
+import time
 from dataclasses import dataclass
+from types import SimpleNamespace
 from typing import Any, Callable, Optional
 
 import litellm
@@ -19,6 +21,7 @@ from loguru import logger
 from sag.config import create_verbose_logger
 from sag.tools.base import BaseTool
 
+from .native_messages import add_cache_breakpoints
 from .react_types import ReactModelCapabilities, ReactModelMode
 
 
@@ -46,6 +49,17 @@ class NativeTurn:
     model_used: str
 
 
+def _arguments_complete(arguments: str) -> bool:
+    """Whether streamed argument text already forms a whole JSON object."""
+    text = arguments.strip()
+    if not text.endswith("}"):
+        return False
+    try:
+        return isinstance(json.loads(text), dict)
+    except ValueError:
+        return False
+
+
 class ReactLLMClient:
     """Own model capabilities, LiteLLM request construction, and response normalization."""
 
@@ -161,6 +175,7 @@ class ReactLLMClient:
         messages: list[dict[str, Any]],
         *,
         include_tools: bool = True,
+        on_tool_call: Optional[Callable[[NativeToolCall], None]] = None,
     ) -> NativeTurn:
         """One native multi-turn executor call: full message history in,
         structured (text, tool_calls) out.
@@ -168,11 +183,19 @@ class ReactLLMClient:
         Nothing is flattened into text and no tool-call id is discarded, so each
         `{"role": "tool", "tool_call_id": ...}` reply can be correlated back to
         the call that produced it (spec §3.1).
+
+        With `stream_native_turns` configured the response is streamed, and
+        `on_tool_call` receives every call of the turn, in order, as soon as
+        its arguments are complete — while the model may still be writing.
         """
         capabilities = self.capabilities_for(ReactModelMode.ACTION)
         params = self._build_native_request_params(messages, capabilities, include_tools)
+        streaming = bool(getattr(self.config, "stream_native_turns", False))
         try:
-            response = litellm.completion(**params)
+            if streaming:
+                turn, response = self._stream_native_turn(params, capabilities, on_tool_call)
+            else:
+                response = litellm.completion(**params)
         except Exception as exc:
             # Logged, never swallowed: the loop turns a provider failure into a
             # typed abort, which a None return could not express.
@@ -180,8 +203,9 @@ class ReactLLMClient:
             if self.config.verbose:
                 self._log_llm_error(exc)
             raise
-        self._track_native_usage(response, capabilities.model)
-        turn = self._native_turn_from_response(response, capabilities)
+        if not streaming:
+            self._track_native_usage(response, capabilities.model)
+            turn = self._native_turn_from_response(response, capabilities)
         if self.config.verbose:
             self._log_llm_response(capabilities.model, turn.text, response)
         self._log_agent_response_length(capabilities.model, turn.text)
@@ -236,6 +260,11 @@ class ReactLLMClient:
             "model": capabilities.model,
             "messages": list(messages),
         }
+        caching = bool(getattr(self.config, "native_prompt_caching", False))
+        if caching and capabilities.tool_call_format == "anthropic":
+            # OpenAI-style providers cache the stable prefix on their own;
+            # Anthropic only caches up to explicit breakpoints.
+            params["messages"] = add_cache_breakpoints(params["messages"])
 
         tools_schema: list[dict[str, Any]] = []
         if include_tools and capabilities.supports_function_calling:
@@ -272,6 +301,133 @@ class ReactLLMClient:
         except Exception as exc:  # pragma: no cover - defensive accounting path
             self.logger.debug(f"Could not track executor token usage: {exc}")
 
+    def _stream_native_turn(
+        self,
+        params: dict[str, Any],
+        capabilities: ReactModelCapabilities,
+        on_tool_call: Optional[Callable[[NativeToolCall], None]],
+    ) -> tuple[NativeTurn, Any]:
+        """Assemble a streamed turn, releasing each tool call once it is complete.
+
+        A call is complete when its arguments parse as a JSON object (nothing
+        may follow the closing brace), when the provider starts the next call,
+        or when the stream ends. Calls are released strictly in index order
+        with the same ids and parsing as `_native_tool_call`. Returns the turn
+        plus a response-shaped object carrying the final usage.
+        """
+        params = {**params, "stream": True}
+        if capabilities.tool_call_format == "openai":
+            params["stream_options"] = {"include_usage": True}
+        record = self._start_streamed_record(capabilities.model)
+        started = time.monotonic()
+        first_token: Optional[float] = None
+        first_tool_call: Optional[float] = None
+        text_parts: list[str] = []
+        parts: dict[int, dict[str, Any]] = {}
+        released: list[NativeToolCall] = []
+        usage = None
+        model_used = None
+
+        def release(final: bool) -> None:
+            nonlocal first_tool_call
+            while len(released) in parts:
+                index = len(released)
+                part = parts[index]
+                if not (final or index + 1 in parts or _arguments_complete(part["arguments"])):
+                    return
+                call = self._native_tool_call(
+                    {
+                        "id": part["id"],
+                        "function": {"name": part["name"], "arguments": part["arguments"]},
+                    },
+                    index,
+                )
+                released.append(call)
+                if first_tool_call is None:
+                    first_tool_call = time.monotonic() - started
+                if on_tool_call is not None:
+                    on_tool_call(call)
+
+        for chunk in litellm.completion(**params):
+            model_used = getattr(chunk, "model", None) or model_used
+            usage = getattr(chunk, "usage", None) or usage
+            choices = getattr(chunk, "choices", None) or ()
+            delta = getattr(choices[0], "delta", None) if choices else None
+            if delta is None:
+                continue
+            content = getattr(delta, "content", None)
+            tool_deltas = getattr(delta, "tool_calls", None) or ()
+            if first_token is None and (
+                content or tool_deltas or getattr(delta, "reasoning_content", None)
+            ):
+                first_token = time.monotonic() - started
+            if content:
+                text_parts.append(content)
+            for tool_delta in tool_deltas:
+                self._merge_tool_call_delta(parts, tool_delta)
+            release(final=False)
+        release(final=True)
+
+        response = SimpleNamespace(usage=usage, model=model_used)
+        self._track_streamed_usage(response, capabilities.model, record)
+        if record is not None:
+            try:
+                self.token_tracker.track_stream_latency(
+                    record, first_token=first_token, first_tool_call=first_tool_call
+                )
+            except Exception as exc:  # pragma: no cover - defensive accounting path
+                self.logger.debug(f"Could not track executor stream latency: {exc}")
+        turn = NativeTurn(
+            text="".join(text_parts),
+            tool_calls=tuple(released),
+            model_used=model_used or capabilities.model,
+        )
+        return turn, response
+
+    def _merge_tool_call_delta(self, parts: dict[int, dict[str, Any]], tool_delta: Any) -> None:
+        call_id = self._get_tool_call_value(tool_delta, "id")
+        index = self._get_tool_call_value(tool_delta, "index")
+        if not isinstance(index, int):
+            # Index-less deltas continue the open call unless they open a new one.
+            index = len(parts) - 1 if parts and not call_id else len(parts)
+        part = parts.setdefault(index, {"id": None, "name": "", "arguments": ""})
+        part["id"] = part["id"] or call_id
+        function = self._get_tool_call_value(tool_delta, "function")
+        if function is None:
+            return
+        name = self._get_tool_call_value(function, "name")
+        if isinstance(name, str) and not part["name"]:
+            part["name"] = name
+        arguments = self._get_tool_call_value(function, "arguments")
+        if isinstance(arguments, dict):
+            part["arguments"] += json.dumps(arguments)
+        elif isinstance(arguments, str):
+            part["arguments"] += arguments
+
+    def _start_streamed_record(self, model: str) -> Optional[dict[str, Any]]:
+        if self.token_tracker is None:
+            return None
+
+        try:
+            return self.token_tracker.start_streamed_record(model, "executor")
+        except Exception as exc:  # pragma: no cover - defensive accounting path
+            self.logger.debug(f"Could not open streamed executor token record: {exc}")
+            return None
+
+    def _track_streamed_usage(
+        self, response: Any, model: str, record: Optional[dict[str, Any]]
+    ) -> None:
+        if record is None:
+            self._track_native_usage(response, model)
+            return
+
+        try:
+            self.token_tracker.track_token_usage(
+                response, model, "executor", streamed_record=record
+            )
+        except Exception as exc:  # pragma: no cover - defensive accounting path
+            self.logger.debug(f"Could not track executor token usage: {exc}")
+
     def _native_turn_from_response(
         self,
         response: Any,
@@ -59,6 +59,7 @@ from sag.agent.claim_records import (
 )
 from sag.agent.control_events import canonical_json
 from sag.agent.evidence_assessments import ASSESSMENT_DIR
+from sag.agent.evidence_store import lookup_evidence, note_evidence_written, stored_records
 from sag.agent.invocation_contracts import (
     DEFAULT_INTENT_SOURCE,
     contract_hash,
@@ -700,8 +701,11 @@ def write_repair(execute: Callable[..., Any], repair: Optional[Mapping[str, Any]
         result = execute(command) or {}
     except Exception as exc:
         logger.debug(f"repair contract {identifier} not persisted: {exc}")
+        note_evidence_written(execute, final, body, False)
         return False
-    return _succeeded(result)
+    written = _succeeded(result)
+    note_evidence_written(execute, final, body, written)
+    return written
 
 
 # ---------------------------------------------------------------------------
@@ -1024,7 +1028,9 @@ def _lifecycle_action(typed_value: Mapping[str, Any]) -> Optional[str]:
     return ARGV_ACTIONS.get(runner)
 
 
-def read_records(orchestrator: Any, directory: str) -> List[Dict[str, Any]]:
+def read_records(
+    orchestrator: Any, directory: str, *, receipt_id: Optional[str] = None
+) -> List[Dict[str, Any]]:
     """Every readable single-line JSON record in one evidence directory.
 
     Same bounded read the phase gate uses: one glob `cat`, and a line that does
@@ -1034,10 +1040,16 @@ def read_records(orchestrator: Any, directory: str) -> List[Dict[str, Any]]:
     Public because the build facade's Stage E provenance gate needs the same
     read over `claims/` and `evidence_assessments/`: two readers of the same
     directories must not disagree about what a stored record is.
+
+    `receipt_id` keeps only the records stating that receipt; the workspace's
+    evidence store answers it from its index.
     """
     execute = getattr(orchestrator, "execute_command", None)
     if not callable(execute):
         return []
+    stored = stored_records(orchestrator, directory, receipt_id=receipt_id)
+    if stored is not None:
+        return stored
     try:
         probe = execute(
             f"cat {shlex.quote(directory)}/*.json 2>/dev/null", workdir=None, timeout=30
@@ -1056,6 +1068,8 @@ def read_records(orchestrator: Any, directory: str) -> List[Dict[str, Any]]:
             continue
         if isinstance(payload, Mapping):
             records.append(dict(payload))
+    if receipt_id is not None:
+        return [record for record in records if _text(record.get("receipt_id")) == receipt_id]
     return records
 
 
@@ -1065,6 +1079,9 @@ def _read_existing(execute: Callable[..., Any], path: str) -> Optional[Dict[str,
     An unparseable file is reported as a body that matches nothing, so the
     caller refuses instead of overwriting bytes it cannot account for.
     """
+    cached = lookup_evidence(execute, path)
+    if cached is not None:
+        return cached
     try:
         result = execute(f"cat {shlex.quote(path)}") or {}
     except Exception as exc:
@@ -37,9 +37,10 @@ a row the walk forgot to check. The counts are reported as
 from __future__ import annotations
 
 import json
+from contextlib import nullcontext
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Callable, Literal, Mapping
+from typing import Any, Callable, ContextManager, Literal, Mapping
 
 from pydantic import BaseModel, ConfigDict, Field, ValidationError
 
@@ -278,14 +279,28 @@ class ControlReplayRunner:
         llm_factory: Callable[[], Any] | None = None,
         orchestrator_factory: Callable[[], Any] | None = None,
         verify_expected: bool = True,
+        measure: Callable[[str], ContextManager[Any]] | None = None,
+        wrap_verdict_orchestrator: Callable[[Any], Any] | None = None,
     ) -> None:
         # Factories are deliberate tripwires. Replays never invoke either one.
         self.llm_factory = llm_factory
         self.orchestrator_factory = orchestrator_factory
         self.verify_expected = verify_expected
+        # Benchmark seams (`sag bench`): `measure(component)` brackets each call
+        # into a production component, and the wrapper may stand between the
+        # finalizer and the in-memory persistence seam (simulated exec latency,
+        # round-trip counting). Neither changes what the walk verifies.
+        self.measure = measure
+        self.wrap_verdict_orchestrator = wrap_verdict_orchestrator
 
     @classmethod
-    def offline(cls, *, verify_expected: bool = True) -> "ControlReplayRunner":
+    def offline(
+        cls,
+        *,
+        verify_expected: bool = True,
+        measure: Callable[[str], ContextManager[Any]] | None = None,
+        wrap_verdict_orchestrator: Callable[[Any], Any] | None = None,
+    ) -> "ControlReplayRunner":
         def _forbidden() -> Any:
             raise AssertionError("offline replay attempted an external call")
 
@@ -293,10 +308,14 @@ class ControlReplayRunner:
             llm_factory=_forbidden,
             orchestrator_factory=_forbidden,
             verify_expected=verify_expected,
+            measure=measure,
+            wrap_verdict_orchestrator=wrap_verdict_orchestrator,
         )
 
     def run(self, path: str | Path) -> ReplayResult:
-        transcript = ReplayTranscript.read(path)
+        measure = self.measure or (lambda component: nullcontext())
+        with measure("transcript"):
+            transcript = ReplayTranscript.read(path)
         header = transcript.header
         initial = header.initial_state
         machine = PhaseMachine(start_phase=initial.start_phase)
@@ -317,7 +336,9 @@ class ControlReplayRunner:
             phase_remaining=dict(initial.repair_phase_remaining),
         )
         output_storage = _ReplayOutputStorage()
-        verdict_orchestrator = _ReplayVerdictOrchestrator()
+        verdict_orchestrator: Any = _ReplayVerdictOrchestrator()
+        if self.wrap_verdict_orchestrator is not None:
+            verdict_orchestrator = self.wrap_verdict_orchestrator(verdict_orchestrator)
         finalizer = VerdictFinalizer(verdict_orchestrator)
 
         active_envelope: dict[str, Any] | None = None
@@ -653,13 +674,14 @@ class ControlReplayRunner:
                         reason=payload["reason"],
                         evidence_refs=tuple(payload["evidence_refs"]),
                     )
-                    gate = validate_phase_claim(
-                        claim,
-                        ValidatorState(payload["validator_state"]),
-                        reason=payload["reason"],
-                        evidence_refs=tuple(payload["evidence_refs"]),
-                        validated_facts=payload["validated_facts"],
-                    )
+                    with measure("phase_gate"):
+                        gate = validate_phase_claim(
+                            claim,
+                            ValidatorState(payload["validator_state"]),
+                            reason=payload["reason"],
+                            evidence_refs=tuple(payload["evidence_refs"]),
+                            validated_facts=payload["validated_facts"],
+                        )
                     if gate.accepted is not payload["expected_accepted"]:
                         raise ReplayMismatchError("gate acceptance differs from transcript")
                     if gate.validated_outcome.value != payload["expected_outcome"]:
@@ -694,12 +716,13 @@ class ControlReplayRunner:
                     repair_payload = payload.get("repair_request")
                     if repair_payload is not None:
                         request = RepairRequest.from_metadata(repair_payload)
-                        decision = transition_policy.request_repair(
-                            request,
-                            state=state,
-                            budgets=budgets,
-                            source_record=pending_record,
-                        )
+                        with measure("transition_policy"):
+                            decision = transition_policy.request_repair(
+                                request,
+                                state=state,
+                                budgets=budgets,
+                                source_record=pending_record,
+                            )
                         accepted = decision.route.kind == "repair"
                         repairs.append(
                             RepairRouteResult(
@@ -719,11 +742,12 @@ class ControlReplayRunner:
                                 },
                             )
                     else:
-                        decision = transition_policy.decide(
-                            pending_record,
-                            state=state,
-                            budgets=budgets,
-                        )
+                        with measure("transition_policy"):
+                            decision = transition_policy.decide(
+                                pending_record,
+                                state=state,
+                                budgets=budgets,
+                            )
                     if (
                         decision.route.kind != payload["expected_kind"]
                         or decision.route.target != payload["expected_target"]
@@ -737,7 +761,8 @@ class ControlReplayRunner:
                 elif event.kind == "loop_decision":
                     event_payload = dict(payload["event"])
                     recorded_recurrence_count = event_payload.pop("recurrence_count", None)
-                    decision = loop_memory.observe(LoopEvent(**event_payload))
+                    with measure("loop_memory"):
+                        decision = loop_memory.observe(LoopEvent(**event_payload))
                     if (
                         recorded_recurrence_count is not None
                         and int(recorded_recurrence_count) != decision.recurrence_count
@@ -760,10 +785,11 @@ class ControlReplayRunner:
                         finalized_at=header.finalized_at,
                         close_reason=payload["reason"],
                     )
-                    snapshot = finalizer.finalize(
-                        state,
-                        EvidenceCloseReason(payload["reason"]),
-                    )
+                    with measure("verdict_finalizer"):
+                        snapshot = finalizer.finalize(
+                            state,
+                            EvidenceCloseReason(payload["reason"]),
+                        )
                 elif event.kind == "claim_transition":
                     # Plan 6 Stage C: claim-graph transitions are replayed by
                     # claim_graph.load(), not by this walker — pass through so
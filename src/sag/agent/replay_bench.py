@@ -0,0 +1,383 @@
+"""Offline control-layer benchmark over replay transcripts (``sag bench``).
+
+A replay transcript (``tests/fixtures/control_layer/*.jsonl``) drives the
+production phase gate, ``PhaseTransitionPolicy``, ``LoopMemory`` and
+``VerdictFinalizer`` exactly as the recorded run did, with no LLM and no
+container. That makes it a benchmark corpus as well as a regression fixture.
+``run_bench`` replays every transcript ``iterations`` times through
+``ControlReplayRunner`` and reports, per transcript and per component:
+
+* **wall time**: ``perf_counter_ns`` around each call into the component,
+  the median over the measured iterations;
+* **allocated blocks**: the change in ``sys.getallocatedblocks()`` across the
+  calls, i.e. blocks the component left alive (net, not gross: CPython has no
+  cheap gross allocation counter, and ``tracemalloc`` would distort the wall
+  times it sits next to);
+* **round trips**: ``execute_command`` calls the component made. The
+  finalizer's in-memory persistence seam is wrapped in a
+  ``SimulatedOrchestrator`` that counts each call and can sleep a configurable
+  exec latency, so a change that adds a container exec shows up both as a
+  round trip and, at a realistic latency, as wall time.
+
+Round trips are deterministic, so any increase over a stored baseline is a
+regression. Wall time and allocations are noisy and are compared with a
+relative tolerance plus a small absolute floor.
+
+A replay transcript starts with a ``ReplayHeader`` row. The
+``control_events.jsonl`` a ``--record`` session writes holds the raw events
+without one (no initial state, no expected snapshot or digest), so it cannot be
+replayed: such files are listed as skipped, never silently dropped.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import statistics
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from sag.agent.replay import ControlReplayRunner, ReplayValidationError
+
+BENCH_SCHEMA = 1
+DEFAULT_TOLERANCE = 0.25
+# Absolute slack on top of the relative tolerance, so a component that takes
+# a few microseconds or keeps a handful of blocks does not flap.
+WALL_FLOOR_MS = 0.5
+ALLOC_FLOOR_BLOCKS = 100
+
+# The components ``ControlReplayRunner.run`` brackets, in walk order.
+COMPONENTS = (
+    "transcript",
+    "phase_gate",
+    "transition_policy",
+    "loop_memory",
+    "verdict_finalizer",
+)
+UNATTRIBUTED = "unattributed"
+
+
+@dataclass
+class _Sample:
+    wall_ns: int = 0
+    alloc_blocks: int = 0
+    round_trips: int = 0
+    calls: int = 0
+
+
+class BenchMeter:
+    """Per-component wall time, retained blocks and round trips for one replay."""
+
+    def __init__(self) -> None:
+        self.samples: Dict[str, _Sample] = {component: _Sample() for component in COMPONENTS}
+        self._active: List[str] = []
+
+    @contextmanager
+    def measure(self, component: str) -> Iterator[None]:
+        sample = self.samples.setdefault(component, _Sample())
+        self._active.append(component)
+        blocks = sys.getallocatedblocks()
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            sample.wall_ns += time.perf_counter_ns() - start
+            sample.alloc_blocks += sys.getallocatedblocks() - blocks
+            sample.calls += 1
+            self._active.pop()
+
+    def round_trip(self) -> None:
+        """Charge one exec to the component currently being measured."""
+        component = self._active[-1] if self._active else UNATTRIBUTED
+        self.samples.setdefault(component, _Sample()).round_trips += 1
+
+
+class SimulatedOrchestrator:
+    """Stands in front of an orchestrator, counting execs and adding latency."""
+
+    def __init__(
+        self,
+        inner: Any,
+        *,
+        latency_s: float = 0.0,
+        on_round_trip: Optional[Callable[[], None]] = None,
+    ) -> None:
+        self.inner = inner
+        self.latency_s = latency_s
+        self.on_round_trip = on_round_trip
+        self.round_trips = 0
+
+    def execute_command(self, command: str, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        self.round_trips += 1
+        if self.on_round_trip is not None:
+            self.on_round_trip()
+        if self.latency_s > 0:
+            time.sleep(self.latency_s)
+        return self.inner.execute_command(command, *args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.inner, name)
+
+
+@dataclass(frozen=True)
+class ComponentStats:
+    wall_ms: float
+    alloc_blocks: int
+    round_trips: int
+    calls: int
+
+
+@dataclass(frozen=True)
+class TranscriptBench:
+    run_id: str
+    path: str
+    iterations: int
+    total_wall_ms: float
+    components: Mapping[str, ComponentStats]
+
+    @property
+    def round_trips(self) -> int:
+        return sum(stats.round_trips for stats in self.components.values())
+
+
+@dataclass
+class BenchReport:
+    latency_ms: float
+    iterations: int
+    results: List[TranscriptBench] = field(default_factory=list)
+    #: (path, reason) for files that are not replay transcripts
+    skipped: List[Tuple[str, str]] = field(default_factory=list)
+    #: (path, error) for transcripts that no longer replay
+    failures: List[Tuple[str, str]] = field(default_factory=list)
+
+
+def _first_row(path: Path) -> Any:
+    with path.open(encoding="utf-8") as handle:
+        for line in handle:
+            if line.strip():
+                return json.loads(line)
+    return None
+
+
+def discover_transcripts(paths: Iterable[str | Path]) -> Tuple[List[Path], List[Tuple[str, str]]]:
+    """Replay transcripts under ``paths`` and (path, reason) for every other file.
+
+    A directory contributes every ``*.jsonl`` below it, in path order.
+    """
+    candidates: List[Path] = []
+    skipped: List[Tuple[str, str]] = []
+    for raw in paths:
+        path = Path(raw)
+        if path.is_dir():
+            candidates.extend(sorted(path.rglob("*.jsonl")))
+        elif path.is_file():
+            candidates.append(path)
+        else:
+            skipped.append((str(path), "no such file or directory"))
+    transcripts: List[Path] = []
+    for path in dict.fromkeys(candidates):
+        try:
+            header = _first_row(path)
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError) as exc:
+            skipped.append((str(path), f"not JSON lines: {exc}"))
+            continue
+        if not isinstance(header, dict) or not {
+            "initial_state",
+            "expected_event_digest",
+        } <= header.keys():
+            skipped.append((str(path), "first row is not a replay header"))
+            continue
+        transcripts.append(path)
+    return transcripts, skipped
+
+
+def _replay_once(path: Path, latency_s: float) -> Tuple[str, int, BenchMeter]:
+    meter = BenchMeter()
+    runner = ControlReplayRunner.offline(
+        measure=meter.measure,
+        wrap_verdict_orchestrator=lambda inner: SimulatedOrchestrator(
+            inner, latency_s=latency_s, on_round_trip=meter.round_trip
+        ),
+    )
+    gc.collect()
+    start = time.perf_counter_ns()
+    result = runner.run(path)
+    return result.header.run_id, time.perf_counter_ns() - start, meter
+
+
+def bench_transcript(
+    path: str | Path, *, iterations: int = 5, warmup: int = 1, latency_ms: float = 0.0
+) -> TranscriptBench:
+    """Replay ``path`` ``warmup + iterations`` times and keep the measured medians."""
+    if iterations < 1:
+        raise ValueError("iterations must be at least 1")
+    latency_s = max(latency_ms, 0.0) / 1000.0
+    for _ in range(max(warmup, 0)):
+        _replay_once(Path(path), latency_s)
+    run_id = ""
+    totals: List[int] = []
+    meters: List[BenchMeter] = []
+    for _ in range(iterations):
+        run_id, total_ns, meter = _replay_once(Path(path), latency_s)
+        totals.append(total_ns)
+        meters.append(meter)
+    components: Dict[str, ComponentStats] = {}
+    for component in dict.fromkeys(name for meter in meters for name in meter.samples):
+        samples = [meter.samples.get(component, _Sample()) for meter in meters]
+        components[component] = ComponentStats(
+            wall_ms=statistics.median(sample.wall_ns for sample in samples) / 1e6,
+            alloc_blocks=int(statistics.median(sample.alloc_blocks for sample in samples)),
+            round_trips=max(sample.round_trips for sample in samples),
+            calls=max(sample.calls for sample in samples),
+        )
+    return TranscriptBench(
+        run_id=run_id,
+        path=str(path),
+        iterations=iterations,
+        total_wall_ms=statistics.median(totals) / 1e6,
+        components=components,
+    )
+
+
+def run_bench(
+    paths: Iterable[str | Path],
+    *,
+    iterations: int = 5,
+    warmup: int = 1,
+    latency_ms: float = 0.0,
+) -> BenchReport:
+    """Benchmark every replay transcript under ``paths``."""
+    transcripts, skipped = discover_transcripts(paths)
+    report = BenchReport(latency_ms=latency_ms, iterations=iterations, skipped=skipped)
+    seen: Dict[str, str] = {}
+    for path in transcripts:
+        try:
+            result = bench_transcript(
+                path, iterations=iterations, warmup=warmup, latency_ms=latency_ms
+            )
+        except ReplayValidationError as exc:
+            report.failures.append((str(path), str(exc)))
+            continue
+        if result.run_id in seen:
+            report.skipped.append((str(path), f"duplicate run_id of {seen[result.run_id]}"))
+            continue
+        seen[result.run_id] = str(path)
+        report.results.append(result)
+    return report
+
+
+def report_to_baseline(report: BenchReport) -> Dict[str, Any]:
+    """The JSON document ``--save-baseline`` writes, keyed by run_id."""
+    return {
+        "schema": BENCH_SCHEMA,
+        "latency_ms": report.latency_ms,
+        "iterations": report.iterations,
+        "transcripts": {
+            result.run_id: {
+                "path": result.path,
+                "total_wall_ms": round(result.total_wall_ms, 4),
+                "components": {
+                    component: {
+                        "wall_ms": round(stats.wall_ms, 4),
+                        "alloc_blocks": stats.alloc_blocks,
+                        "round_trips": stats.round_trips,
+                        "calls": stats.calls,
+                    }
+                    for component, stats in result.components.items()
+                },
+            }
+            for result in report.results
+        },
+    }
+
+
+def save_baseline(report: BenchReport, path: str | Path) -> None:
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(
+        json.dumps(report_to_baseline(report), indent=2, sort_keys=True) + "\n", encoding="utf-8"
+    )
+
+
+def load_baseline(path: str | Path) -> Dict[str, Any]:
+    """A baseline written by ``save_baseline``; ValueError when it is not one."""
+    try:
+        document = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as exc:
+        raise ValueError(f"cannot read bench baseline {path}: {exc}") from exc
+    if not isinstance(document, dict) or document.get("schema") != BENCH_SCHEMA:
+        raise ValueError(f"{path} is not a schema-{BENCH_SCHEMA} bench baseline")
+    if not isinstance(document.get("transcripts"), dict):
+        raise ValueError(f"{path} has no transcripts")
+    return document
+
+
+def compare_to_baseline(
+    report: BenchReport,
+    baseline: Mapping[str, Any],
+    *,
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> List[str]:
+    """Human-readable regressions of ``report`` against ``baseline``.
+
+    Round trips regress on any increase. Wall time and retained blocks regress
+    when they exceed the baseline by more than ``tolerance`` (relative) plus
+    the absolute floor. Wall times are only compared at the same latency.
+    """
+    regressions: List[str] = []
+    same_latency = float(baseline.get("latency_ms", 0.0)) == float(report.latency_ms)
+    recorded = baseline["transcripts"]
+    for result in report.results:
+        before = recorded.get(result.run_id)
+        if not isinstance(before, dict):
+            continue
+        if same_latency:
+            limit = before["total_wall_ms"] * (1 + tolerance) + WALL_FLOOR_MS
+            if result.total_wall_ms > limit:
+                regressions.append(
+                    f"{result.run_id}: total wall {result.total_wall_ms:.3f}ms "
+                    f"> baseline {before['total_wall_ms']:.3f}ms"
+                )
+        for component, stats in result.components.items():
+            was = before.get("components", {}).get(component)
+            if not isinstance(was, dict):
+                continue
+            label = f"{result.run_id}/{component}"
+            if stats.round_trips > was["round_trips"]:
+                regressions.append(
+                    f"{label}: {stats.round_trips} round trips > baseline {was['round_trips']}"
+                )
+            if same_latency and stats.wall_ms > was["wall_ms"] * (1 + tolerance) + WALL_FLOOR_MS:
+                regressions.append(
+                    f"{label}: wall {stats.wall_ms:.3f}ms > baseline {was['wall_ms']:.3f}ms"
+                )
+            alloc_limit = max(was["alloc_blocks"], 0) * (1 + tolerance) + ALLOC_FLOOR_BLOCKS
+            if stats.alloc_blocks > alloc_limit:
+                regressions.append(
+                    f"{label}: {stats.alloc_blocks} retained blocks "
+                    f"> baseline {was['alloc_blocks']}"
+                )
+    return regressions
+
+
+__all__ = [
+    "BENCH_SCHEMA",
+    "COMPONENTS",
+    "DEFAULT_TOLERANCE",
+    "BenchMeter",
+    "BenchReport",
+    "ComponentStats",
+    "SimulatedOrchestrator",
+    "TranscriptBench",
+    "bench_transcript",
+    "compare_to_baseline",
+    "discover_transcripts",
+    "load_baseline",
+    "report_to_baseline",
+    "run_bench",
+    "save_baseline",
+]
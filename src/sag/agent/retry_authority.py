@@ -54,6 +54,12 @@ from loguru import logger
 
 from sag.agent.control_events import canonical_sha256
 from sag.agent.evidence_assessments import ASSESSMENT_DIR
+from sag.agent.evidence_store import (
+    lookup_evidence,
+    note_evidence_written,
+    remember_evidence,
+    stored_records,
+)
 from sag.agent.invocation_receipts import target_sha as probe_target_sha
 from sag.agent.repair_contracts import intent_source_for_dispatch
 
@@ -254,20 +260,24 @@ def read_ledger(
     file is truncated — would let one corrupt byte end a run, so a corrupt
     ledger is logged loudly and then treated as no ledger at all.
     """
-    try:
-        result = execute(f"cat {shlex.quote(RETRY_LEDGER_PATH)}") or {}
-    except Exception as exc:
-        logger.debug(f"retry ledger unreadable: {exc}")
-        return {}
-    if not _succeeded(result):
-        return {}
-    content = str(result.get("output") or "").strip()
-    if not content:
-        return {}
-    try:
-        payload = json.loads(content)
-    except (TypeError, ValueError):
-        payload = None
+    payload = lookup_evidence(execute, RETRY_LEDGER_PATH)
+    if payload is None:
+        try:
+            result = execute(f"cat {shlex.quote(RETRY_LEDGER_PATH)}") or {}
+        except Exception as exc:
+            logger.debug(f"retry ledger unreadable: {exc}")
+            return {}
+        if not _succeeded(result):
+            return {}
+        content = str(result.get("output") or "").strip()
+        if not content:
+            return {}
+        try:
+            payload = json.loads(content)
+        except (TypeError, ValueError):
+            payload = None
+        if isinstance(payload, Mapping):
+            remember_evidence(execute, RETRY_LEDGER_PATH, payload)
     if not isinstance(payload, Mapping):
         logger.warning(
             f"retry ledger at {RETRY_LEDGER_PATH} is not a readable key map; it is read "
@@ -313,8 +323,11 @@ def write_ledger(
         result = execute(command) or {}
     except Exception as exc:
         logger.debug(f"retry ledger not persisted: {exc}")
+        note_evidence_written(execute, RETRY_LEDGER_PATH, body, False)
         return False
-    return _succeeded(result)
+    written = _succeeded(result)
+    note_evidence_written(execute, RETRY_LEDGER_PATH, body, written)
+    return written
 
 
 def record_failure(
@@ -473,7 +486,13 @@ def read_frozen_contract(
     # module scope would tie this module's import order to the facade's.
     from sag.agent.invocation_contracts import CONTRACT_DIR
 
-    payload = _read_json(execute, f"{CONTRACT_DIR}/{identifier}.json")
+    path = f"{CONTRACT_DIR}/{identifier}.json"
+    payload = lookup_evidence(execute, path)
+    if payload is None:
+        payload = _read_json(execute, path)
+        if isinstance(payload, dict):
+            # Frozen means never rewritten: the next read can skip the `cat`.
+            remember_evidence(execute, path, payload)
     return payload if isinstance(payload, dict) else None
 
 
@@ -554,6 +573,9 @@ def _read_records(
     directory: str,
 ) -> List[Dict[str, Any]]:
     """Every readable single-line JSON record in one evidence directory."""
+    stored = stored_records(execute, directory)
+    if stored is not None:
+        return stored
     try:
         probe = execute(f"cat {shlex.quote(directory)}/*.json 2>/dev/null") or {}
     except Exception as exc:
@@ -0,0 +1,271 @@
+"""One-exec structural survey of a project, run inside the container.
+
+``ProjectAnalyzer._perform_comprehensive_analysis`` asks the tree dozens of
+small questions: ``test -f``/``test -d`` per marker, a ``cat`` per build file
+and README, an ``ls`` of the root, the source- and test-module ``find``s, and
+a ``test -e`` for every build marker of every ancestor of every module when it
+groups them into islands. Each one was a container exec.
+
+``survey_project`` ships a self-contained scanner (``python3 - <<'PY'``, the
+way ``testcases/catalog.py`` ships its test scanner) that collects all of
+those raw facts in ONE pass and prints one JSON document:
+
+* ``files``: every ``SURVEY_PATHS`` entry plus the build markers of every
+  module ancestor, as the ``stat`` stamp ``ProjectFileCache`` keeps and, for
+  a regular file, its text;
+* ``listing``: what ``ls -1`` prints for the project root;
+* ``source_dirs``/``test_dirs``: what the module ``find``s in
+  ``physical_survey`` print, walked in the same order with the same depth
+  limits and exclusions.
+
+The document seeds the orchestrator's ``ProjectFileCache``, and the
+host-side parsers in ``physical_survey`` read it through the cache exactly as
+they read the shell answers before. Without ``python3`` in the image, or on an
+answer that does not parse, the survey falls back to the one-exec shell
+prefetch and every scan runs its own command.
+"""
+
+import json
+import secrets
+import shlex
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from loguru import logger
+
+from sag.agent.project_files import (
+    MAX_CACHED_BYTES,
+    SURVEY_PATHS,
+    ProjectFile,
+    prefetch_survey_files,
+    project_files_for,
+)
+
+# Scan kinds the probe seeds, keyed by the project path the caller passed.
+LISTING = "ls"
+SOURCE_DIRS = "source_dirs"
+TEST_DIRS = "test_dirs"
+
+# The build markers ``island_root_for`` probes at each ancestor of a module.
+ANCESTOR_MARKERS = (
+    "settings.gradle",
+    "settings.gradle.kts",
+    "pom.xml",
+    "build.gradle",
+    "build.gradle.kts",
+)
+
+# Runs with the project root as cwd; PARAMS is prepended by `survey_command`.
+# The stamp reproduces `stat -L -c '%F|%s|%y|%i'` so a later revalidation by
+# the shell compares equal, and the walk reproduces GNU find's pre-order,
+# readdir-order traversal (no symlinked dirs, `-maxdepth`, `-path` globs
+# matched against the whole path).
+SURVEY_SCRIPT = """
+import fnmatch
+import json
+import os
+import stat
+import sys
+import time
+
+ROOT = PARAMS["root"]
+BASE = ROOT.rstrip("/")
+MAX_BYTES = PARAMS["max_bytes"]
+SOURCE_PATTERNS = tuple("*/src/main/" + lang for lang in ("java", "groovy", "scala", "kotlin"))
+TEST_PATTERNS = tuple("*/src/test/" + lang for lang in ("java", "groovy", "scala", "kotlin"))
+EXCLUDED_PATTERNS = ("*/target/*", "*/build/*")
+SOURCE_DEPTH = 5
+TEST_DEPTH = 6
+
+
+def stamp(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return "missing"
+    mode = st.st_mode
+    if stat.S_ISREG(mode):
+        kind = "regular file" if st.st_size else "regular empty file"
+    elif stat.S_ISDIR(mode):
+        kind = "directory"
+    elif stat.S_ISFIFO(mode):
+        kind = "fifo"
+    elif stat.S_ISSOCK(mode):
+        kind = "socket"
+    elif stat.S_ISCHR(mode):
+        kind = "character special file"
+    elif stat.S_ISBLK(mode):
+        kind = "block special file"
+    else:
+        kind = "weird file"
+    seconds, nanos = divmod(st.st_mtime_ns, 10 ** 9)
+    local = time.localtime(seconds)
+    mtime = "%s.%09d %s" % (
+        time.strftime("%Y-%m-%d %H:%M:%S", local), nanos, time.strftime("%z", local)
+    )
+    return "%s|%d|%s|%d" % (kind, st.st_size, mtime, st.st_ino)
+
+
+def entry(path):
+    found = stamp(path)
+    text = None
+    if found.startswith("regular"):
+        try:
+            with open(path, "rb") as handle:
+                data = handle.read(MAX_BYTES + 1)
+            if len(data) <= MAX_BYTES:
+                text = data.decode("utf-8", "replace")
+        except OSError:
+            pass
+    return [found, text]
+
+
+def matches(path, patterns):
+    if not any(fnmatch.fnmatchcase(path, pattern) for pattern in patterns):
+        return False
+    return not any(fnmatch.fnmatchcase(path, pattern) for pattern in EXCLUDED_PATTERNS)
+
+
+source_dirs = []
+test_dirs = []
+
+
+def visit(path, depth):
+    if depth <= SOURCE_DEPTH and matches(path, SOURCE_PATTERNS):
+        source_dirs.append(path)
+    if depth <= TEST_DEPTH and matches(path, TEST_PATTERNS):
+        test_dirs.append(path)
+    if depth >= TEST_DEPTH:
+        return
+    try:
+        children = list(os.scandir(path))
+    except OSError:
+        return
+    prefix = path if path.endswith("/") else path + "/"
+    for child in children:
+        try:
+            is_dir = child.is_dir(follow_symlinks=False)
+        except OSError:
+            continue
+        if is_dir:
+            visit(prefix + child.name, depth + 1)
+
+
+visit(ROOT, 0)
+
+files = {}
+for name in PARAMS["paths"]:
+    files[BASE + "/" + name] = entry(BASE + "/" + name)
+modules = [found.rsplit("/src/main/", 1)[0] for found in source_dirs]
+modules += [found.rsplit("/src/test/", 1)[0] for found in test_dirs]
+for module in modules:
+    current = module.rstrip("/")
+    while current.startswith(BASE + "/"):
+        for marker in PARAMS["markers"]:
+            path = current + "/" + marker
+            if path not in files:
+                files[path] = entry(path)
+        current = current.rsplit("/", 1)[0]
+
+try:
+    listing = sorted(name for name in os.listdir(ROOT) if not name.startswith("."))
+except OSError:
+    listing = None
+
+document = {
+    "files": files,
+    "listing": listing,
+    "source_dirs": source_dirs,
+    "test_dirs": test_dirs,
+}
+sys.stdout.write(PARAMS["marker"] + json.dumps(document) + "\\n")
+"""
+
+
+def survey_command(project_path: str, marker: str) -> str:
+    """The shell command that runs ``SURVEY_SCRIPT`` over ``project_path``."""
+    params = {
+        "root": project_path,
+        "max_bytes": MAX_CACHED_BYTES,
+        "paths": list(SURVEY_PATHS),
+        "markers": list(ANCESTOR_MARKERS),
+        "marker": marker,
+    }
+    return (
+        f"cd {shlex.quote(project_path)} && python3 - <<'PY'\n"
+        f"import json\nPARAMS = json.loads({json.dumps(params)!r})\n"
+        f"{SURVEY_SCRIPT}PY"
+    )
+
+
+def _parse_document(output: str, marker: str) -> Optional[Dict[str, Any]]:
+    """The probe's JSON document from ``output``, None when it is not all there."""
+    for line in reversed(output.splitlines()):
+        if not line.startswith(marker):
+            continue
+        try:
+            document = json.loads(line[len(marker) :])
+        except ValueError:
+            return None
+        if not isinstance(document, dict) or not isinstance(document.get("files"), dict):
+            return None
+        for key in ("source_dirs", "test_dirs"):
+            value = document.get(key)
+            if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+                return None
+        return document
+    return None
+
+
+def _seed_from(
+    document: Mapping[str, Any], project_path: str
+) -> Tuple[Dict[str, ProjectFile], Dict[Tuple[str, str], List[str]]]:
+    """The cache entries and scans ``document`` holds for ``project_path``."""
+    entries = {
+        path: ProjectFile(stamp, text)
+        for path, (stamp, text) in document["files"].items()
+        if isinstance(stamp, str) and (text is None or isinstance(text, str))
+    }
+    scans = {
+        (SOURCE_DIRS, project_path): list(document["source_dirs"]),
+        (TEST_DIRS, project_path): list(document["test_dirs"]),
+    }
+    listing = document.get("listing")
+    if isinstance(listing, list):
+        scans[(LISTING, project_path)] = [str(name) for name in listing]
+    return entries, scans
+
+
+def survey_project(orchestrator: Any, project_path: str) -> bool:
+    """Seed ``orchestrator``'s project-file cache with one in-container survey.
+
+    True when the probe's document was taken. False when the orchestrator has
+    no cache (its readers run their own commands) or the probe could not run,
+    in which case the survey files are still prefetched in one shell exec.
+    """
+    files = project_files_for(orchestrator)
+    if files is None:
+        return False
+    marker = f"@@sag-survey-{secrets.token_hex(8)}@@"
+    try:
+        result = orchestrator.execute_command(
+            survey_command(project_path, marker), truncate_output=False
+        )
+        document = _parse_document(str((result or {}).get("output") or ""), marker)
+        if document is not None:
+            files.seed(*_seed_from(document, project_path))
+            return True
+    except Exception as exc:
+        logger.debug(f"survey probe did not run: {exc}")
+    prefetch_survey_files(orchestrator, project_path)
+    return False
+
+
+__all__ = [
+    "ANCESTOR_MARKERS",
+    "LISTING",
+    "SOURCE_DIRS",
+    "SURVEY_SCRIPT",
+    "TEST_DIRS",
+    "survey_command",
+    "survey_project",
+]
@@ -4,7 +4,7 @@ import csv
 import json
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from loguru import logger
 
@@ -27,6 +27,7 @@ class TokenTracker:
         step_type: str,
         tool_name: Optional[str] = None,
         iteration: Optional[int] = None,
+        streamed_record: Optional[Dict[str, Any]] = None,
     ) -> None:
         """
         Extract and record token usage from LLM response.
@@ -37,6 +38,8 @@ class TokenTracker:
             step_type: 'thought' or 'action'
             tool_name: Tool name for actions, 'Think' for thoughts
             iteration: Iteration number (uses current_iteration if not provided)
+            streamed_record: Record opened by start_streamed_record; filled in
+                place (keeping its tool name) instead of appending a new one
         """
         try:
             # Use provided iteration or current iteration
@@ -64,6 +67,8 @@ class TokenTracker:
             # Calculate actual output tokens
             actual_output_tokens = completion_tokens - reasoning_tokens
 
+            cache_read_tokens, cache_write_tokens = self._extract_cache_tokens(response)
+
             # Create token record
             record = {
                 "iteration": iter_num,
@@ -76,20 +81,81 @@ class TokenTracker:
                 "completion_tokens": completion_tokens,
                 "reasoning_tokens": reasoning_tokens,
                 "actual_output_tokens": actual_output_tokens,
+                "cache_read_tokens": cache_read_tokens,
+                "cache_write_tokens": cache_write_tokens,
             }
 
-            self.token_records.append(record)
+            if streamed_record is not None:
+                record["tool_name"] = streamed_record.get("tool_name", tool_name)
+                streamed_record.update(record)
+            else:
+                self.token_records.append(record)
 
             # Log token usage in debug mode
             logger.debug(
                 f"Token usage tracked - {step_type}:{tool_name} "
                 f"Total:{total_tokens} Prompt:{prompt_tokens} "
-                f"Reasoning:{reasoning_tokens} Output:{actual_output_tokens}"
+                f"Reasoning:{reasoning_tokens} Output:{actual_output_tokens} "
+                f"CacheRead:{cache_read_tokens} CacheWrite:{cache_write_tokens}"
             )
 
         except Exception as e:
             logger.warning(f"Failed to track token usage: {e}")
 
+    def start_streamed_record(self, model: str, step_type: str) -> Dict[str, Any]:
+        """
+        Open the record of a response that is still streaming.
+
+        The record is appended before its usage is known, so a tool name
+        resolved mid-stream (update_last_tool_name) lands on it; the usage is
+        filled in later via track_token_usage(..., streamed_record=record).
+
+        Args:
+            model: Model name used for the request
+            step_type: 'thought' or 'action'
+
+        Returns:
+            The appended record
+        """
+        record = {
+            "iteration": self.current_iteration,
+            "timestamp": datetime.now().isoformat(),
+            "type": step_type,
+            "tool_name": "Think" if step_type == "thought" else "Unknown",
+            "model": model,
+            "total_tokens": 0,
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+            "reasoning_tokens": 0,
+            "actual_output_tokens": 0,
+            "cache_read_tokens": 0,
+            "cache_write_tokens": 0,
+            "time_to_first_token": None,
+            "time_to_first_tool_call": None,
+        }
+        self.token_records.append(record)
+        return record
+
+    def track_stream_latency(
+        self,
+        record: Dict[str, Any],
+        *,
+        first_token: Optional[float] = None,
+        first_tool_call: Optional[float] = None,
+    ) -> None:
+        """
+        Record streaming latencies (seconds since the request was sent).
+
+        Args:
+            record: Record opened by start_streamed_record
+            first_token: Time to the first streamed token
+            first_tool_call: Time until the first complete tool call was dispatched
+        """
+        if first_token is not None:
+            record["time_to_first_token"] = round(first_token, 3)
+        if first_tool_call is not None:
+            record["time_to_first_tool_call"] = round(first_tool_call, 3)
+
     def is_reasoning_model(self, model: str) -> bool:
         """
         Check if model supports reasoning tokens.
@@ -143,6 +209,34 @@ class TokenTracker:
 
         return 0
 
+    def _extract_cache_tokens(self, response: Any) -> Tuple[int, int]:
+        """
+        Extract prompt-cache token counts from response usage.
+
+        Anthropic reports cache_read_input_tokens / cache_creation_input_tokens;
+        OpenAI-style providers report only reads, as
+        prompt_tokens_details.cached_tokens.
+
+        Args:
+            response: LiteLLM response object
+
+        Returns:
+            (cache read tokens, cache write tokens), 0 where not reported
+        """
+        usage = getattr(response, "usage", None)
+        if not usage:
+            return 0, 0
+
+        def count(value: Any) -> int:
+            return value if isinstance(value, int) else 0
+
+        cache_read = count(getattr(usage, "cache_read_input_tokens", None))
+        if not cache_read:
+            details = getattr(usage, "prompt_tokens_details", None)
+            cache_read = count(getattr(details, "cached_tokens", None))
+        cache_write = count(getattr(usage, "cache_creation_input_tokens", None))
+        return cache_read, cache_write
+
     def update_last_tool_name(self, tool_name: str):
         """
         Update the tool name of the last token record.
@@ -186,6 +280,10 @@ class TokenTracker:
                 "completion_tokens",
                 "reasoning_tokens",
                 "actual_output_tokens",
+                "cache_read_tokens",
+                "cache_write_tokens",
+                "time_to_first_token",
+                "time_to_first_tool_call",
             ]
 
             # Write CSV file
@@ -217,6 +315,8 @@ class TokenTracker:
                 "total_prompt_tokens": 0,
                 "total_reasoning_tokens": 0,
                 "total_output_tokens": 0,
+                "total_cache_read_tokens": 0,
+                "total_cache_write_tokens": 0,
             }
 
         # Calculate totals
@@ -230,6 +330,13 @@ class TokenTracker:
             record.get("actual_output_tokens", 0) for record in self.token_records
         )
 
+        total_cache_read_tokens = sum(
+            record.get("cache_read_tokens", 0) for record in self.token_records
+        )
+        total_cache_write_tokens = sum(
+            record.get("cache_write_tokens", 0) for record in self.token_records
+        )
+
         # Count by type
         thoughts = sum(1 for record in self.token_records if record.get("type") == "thought")
         actions = sum(1 for record in self.token_records if record.get("type") == "action")
@@ -240,6 +347,18 @@ class TokenTracker:
             model = record.get("model", "unknown")
             models[model] = models.get(model, 0) + record.get("total_tokens", 0)
 
+        # Streaming latencies (only streamed responses carry them)
+        first_tokens = [
+            record["time_to_first_token"]
+            for record in self.token_records
+            if record.get("time_to_first_token") is not None
+        ]
+        first_tool_calls = [
+            record["time_to_first_tool_call"]
+            for record in self.token_records
+            if record.get("time_to_first_tool_call") is not None
+        ]
+
         # Count reasoning model usage
         reasoning_model_records = sum(
             1 for record in self.token_records if self.is_reasoning_model(record.get("model", ""))
@@ -251,11 +370,19 @@ class TokenTracker:
             "total_prompt_tokens": total_prompt_tokens,
             "total_reasoning_tokens": total_reasoning_tokens,
             "total_output_tokens": total_output_tokens,
+            "total_cache_read_tokens": total_cache_read_tokens,
+            "total_cache_write_tokens": total_cache_write_tokens,
             "thoughts_count": thoughts,
             "actions_count": actions,
             "reasoning_model_records": reasoning_model_records,
             "tokens_by_model": models,
             "average_tokens_per_call": total_tokens / total_records if total_records > 0 else 0,
+            "average_time_to_first_token": (
+                sum(first_tokens) / len(first_tokens) if first_tokens else None
+            ),
+            "average_time_to_first_tool_call": (
+                sum(first_tool_calls) / len(first_tool_calls) if first_tool_calls else None
+            ),
         }
 
     def log_summary(self):
@@ -268,9 +395,19 @@ class TokenTracker:
         logger.info(f"  Prompt tokens: {stats['total_prompt_tokens']:,}")
         logger.info(f"  Reasoning tokens: {stats['total_reasoning_tokens']:,}")
         logger.info(f"  Output tokens: {stats['total_output_tokens']:,}")
+        logger.info(
+            f"  Prompt cache: {stats['total_cache_read_tokens']:,} read, "
+            f"{stats['total_cache_write_tokens']:,} written"
+        )
         logger.info(f"  Thoughts: {stats['thoughts_count']}, Actions: {stats['actions_count']}")
         logger.info(f"  Reasoning model calls: {stats['reasoning_model_records']}")
         logger.info(f"  Average tokens per call: {stats['average_tokens_per_call']:.1f}")
+        first_token = stats.get("average_time_to_first_token")
+        if first_token is not None:
+            logger.info(f"  Average time to first token: {first_token:.2f}s")
+        first_tool_call = stats.get("average_time_to_first_tool_call")
+        if first_tool_call is not None:
+            logger.info(f"  Average time to first tool call: {first_tool_call:.2f}s")
 
         if stats["tokens_by_model"]:
             logger.info("  Tokens by model:")
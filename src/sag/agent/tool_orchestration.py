@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import re
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import nullcontext
 from dataclasses import dataclass, field
 from difflib import get_close_matches
 from typing import Any, Callable, Dict, Literal, MutableSequence, Optional
@@ -121,6 +123,37 @@ class ToolLifecycleEvent:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+class PrefetchedResults:
+    """Tool results of one turn's read-only calls, started together on a pool.
+
+    Keyed by execution signature. The serial pass takes each result at most
+    once, when it reaches the call that would otherwise have run the tool
+    itself; a call the pass refuses or cancels leaves its read-only result
+    unused.
+    """
+
+    def __init__(self, max_workers: int):
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, max_workers), thread_name_prefix="sag-readonly"
+        )
+        self._futures: Dict[str, list[Future]] = {}
+
+    def submit(self, signature: str, run: Callable[[], ToolResult]) -> None:
+        self._futures.setdefault(signature, []).append(self._executor.submit(run))
+
+    def take(self, signature: str) -> Optional[Future]:
+        pending = self._futures.get(signature)
+        return pending.pop(0) if pending else None
+
+    def close(self) -> None:
+        """Drop results nobody took; wait for calls already running."""
+        for pending in self._futures.values():
+            for future in pending:
+                future.cancel()
+        self._futures.clear()
+        self._executor.shutdown(wait=True)
+
+
 def _format_maven_version_contract(result: ToolResult) -> str:
     metadata = result.metadata or {}
     requirement = metadata.get("maven_version_requirement")
@@ -308,6 +341,7 @@ class ToolOrchestrator:
         event_sink: Optional[Callable[[ToolLifecycleEvent], None]] = None,
         before_tool_execute: Optional[Callable[[ToolCall, Dict[str, Any]], Any]] = None,
         output_storage: Any = None,
+        prefetched: Optional[PrefetchedResults] = None,
         logger: Any = None,
     ):
         from sag.agent.tool_parameters import ToolParameterNormalizer
@@ -326,6 +360,7 @@ class ToolOrchestrator:
         self.event_sink = event_sink
         self.before_tool_execute = before_tool_execute
         self.output_storage = output_storage
+        self.prefetched = prefetched
         self.logger = logger or default_logger
         self.parameter_normalizer = ToolParameterNormalizer(
             tools=self.tools,
@@ -404,17 +439,49 @@ class ToolOrchestrator:
         root = rec.get("test_root") if action == "test" else rec.get("build_root")
         return root or None
 
-    def execute(self, call: ToolCall) -> ToolExecution:
+    def _bind_output_storage(self, tool_name: str):
         if self.output_storage is None:
-            return self._execute(call)
-        task_id = str(getattr(self.context_manager, "current_task_id", None) or call.name)
-        with bind_tool_result_output_storage(
+            return nullcontext()
+        task_id = str(getattr(self.context_manager, "current_task_id", None) or tool_name)
+        return bind_tool_result_output_storage(
             self.output_storage,
             task_id=task_id,
-            tool_name=call.name,
-        ):
+            tool_name=tool_name,
+        )
+
+    def execute(self, call: ToolCall) -> ToolExecution:
+        with self._bind_output_storage(call.name):
             return self._execute(call)
 
+    def prefetch(self, call: ToolCall, results: PrefetchedResults) -> None:
+        """Start ``call``'s tool on ``results``' pool, resolved as ``_execute`` would.
+
+        Works on copies: ``call`` itself is executed (and taken from
+        ``results``) later by ``execute``. Calls that would not reach the tool
+        unchanged are simply not started.
+        """
+        name = call.name
+        params = dict(call.raw_params or {})
+        if name not in self.tools:
+            name, params = self.parameter_normalizer.resolve_legacy_alias(
+                name, params, parameter_fixes=[]
+            )
+        if name not in self.tools or name == "build":
+            return
+        try:
+            validated_params = self.parameter_normalizer.validate_and_fix(name, params, [])
+        except Exception:
+            return
+        tool = self.tools[name]
+        binding_name = call.name
+
+        def run() -> ToolResult:
+            # Pool threads start with an empty context: bind storage here.
+            with self._bind_output_storage(binding_name):
+                return tool.safe_execute(**validated_params)
+
+        results.submit(self._execution_signature(name, validated_params), run)
+
     def _execute(self, call: ToolCall) -> ToolExecution:
         started_at = time.perf_counter()
         raw_params = call.raw_params or {}
@@ -593,8 +660,12 @@ class ToolOrchestrator:
                 self.logger.warning(f"Before-execute hook failed for {call.name}: {exc}")
 
         escaped_exception_result: Optional[ToolResult] = None
+        prefetched = self.prefetched.take(signature) if self.prefetched is not None else None
         try:
-            result = self.tools[call.name].safe_execute(**validated_params)
+            if prefetched is not None:
+                result = prefetched.result()
+            else:
+                result = self.tools[call.name].safe_execute(**validated_params)
         except OutputPersistenceError:
             raise
         except Exception as exc:
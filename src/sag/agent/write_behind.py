@@ -0,0 +1,198 @@
+"""Write-behind queue for small in-container append-only records.
+
+The context journal used to cost one ``docker exec`` per ReAct iteration,
+synchronously, before the next model call could start. Records that only need
+to be durable by the end of a phase now go through a ``WriteBehindQueue``:
+``append`` buffers the line and returns at once, and a background thread
+writes everything pending in ONE exec (one heredoc per file; a batch larger
+than ``max_cmd_chars`` is split across execs, like ``write_container_text``,
+to stay under the kernel's per-argument limit) when
+
+* the buffer passes ``max_bytes``,
+* the oldest pending line is ``max_age`` seconds old, or
+* the owner asks (``flush()`` at a phase boundary; ``flush(wait=True)`` before
+  the evidence is sealed and when the flow closes — abort and cancellation
+  included — so nothing is left behind when the run ends).
+
+Flushes are serialized, so lines reach each file in append order. Like the
+journal itself this is best-effort: a failed flush is logged and dropped, and
+nothing here ever raises into the agent loop. ``flushes`` counts the execs
+that succeeded.
+"""
+
+import shlex
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from loguru import logger
+
+from sag.utils.container_io import DEFAULT_MAX_CMD_CHARS
+
+WRITE_BEHIND_HEREDOC = "SAG_WRITE_BEHIND_EOF"
+DEFAULT_MAX_BYTES = 64 * 1024
+DEFAULT_MAX_AGE_SECONDS = 5.0
+
+
+class WriteBehindQueue:
+    def __init__(
+        self,
+        orchestrator,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_age: float = DEFAULT_MAX_AGE_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+        max_cmd_chars: int = DEFAULT_MAX_CMD_CHARS,
+    ):
+        self.orchestrator = orchestrator
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.max_cmd_chars = max_cmd_chars
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending: Dict[str, List[str]] = {}
+        self._pending_bytes = 0
+        self._oldest: Optional[float] = None
+        self._ready_dirs: set = set()
+        self._wake = threading.Event()
+        self._closed = False
+        self._flush_requested = False
+        self._thread: Optional[threading.Thread] = None
+        self.flushes = 0
+
+    def append(self, path: str, line: str) -> None:
+        """Buffer one line for ``path``; never blocks on the container."""
+        with self._lock:
+            closed = self._closed
+            if not closed:
+                self._pending.setdefault(path, []).append(line)
+                self._pending_bytes += len(line) + 1
+                # The first pending line starts the age clock: wake the
+                # flusher so it waits for that deadline instead of forever.
+                first = self._oldest is None
+                if first:
+                    self._oldest = self._clock()
+                full = self._pending_bytes >= self.max_bytes
+        if closed:
+            # After close there is no flusher left; write through.
+            self._write({path: [line]})
+            return
+        self._ensure_thread()
+        if first or full:
+            self._wake.set()
+
+    def flush(self, wait: bool = False) -> None:
+        """Write everything pending: in the background, or now when ``wait``."""
+        if wait:
+            self._flush_pending()
+        else:
+            with self._lock:
+                self._flush_requested = True
+            self._ensure_thread()
+            self._wake.set()
+
+    def close(self) -> None:
+        """Flush synchronously and stop the background thread."""
+        with self._lock:
+            self._closed = True
+        self._wake.set()
+        self._flush_pending()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=5)
+
+    @property
+    def pending_lines(self) -> int:
+        with self._lock:
+            return sum(len(lines) for lines in self._pending.values())
+
+    def _ensure_thread(self) -> None:
+        with self._lock:
+            if self._thread is not None or self._closed:
+                return
+            self._thread = threading.Thread(
+                target=self._run, daemon=True, name="sag-write-behind"
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(self._next_deadline())
+            self._wake.clear()
+            with self._lock:
+                if self._closed:
+                    return
+                due = self._oldest is not None and (
+                    self._flush_requested
+                    or self._pending_bytes >= self.max_bytes
+                    or self._clock() - self._oldest >= self.max_age
+                )
+                self._flush_requested = False
+            if due:
+                self._flush_pending()
+
+    def _next_deadline(self) -> Optional[float]:
+        with self._lock:
+            if self._oldest is None:
+                return None
+            return max(0.0, self.max_age - (self._clock() - self._oldest))
+
+    def _flush_pending(self) -> None:
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+                self._pending_bytes = 0
+                self._oldest = None
+            if batch:
+                self._write(batch)
+
+    def _write(self, batch: Dict[str, List[str]]) -> None:
+        dirs = sorted({path.rsplit("/", 1)[0] for path in batch} - self._ready_dirs)
+        commands = [f"mkdir -p {' '.join(shlex.quote(d) for d in dirs)}"] if dirs else [""]
+        counts = [0]
+        for path, lines in batch.items():
+            for part, count in self._append_parts(path, lines):
+                if commands[-1] and len(commands[-1]) + len(part) + 1 > self.max_cmd_chars:
+                    commands.append("")
+                    counts.append(0)
+                commands[-1] = f"{commands[-1]}\n{part}" if commands[-1] else part
+                counts[-1] += count
+        for command, count in zip(commands, counts):
+            try:
+                result = self.orchestrator.execute_command(command, workdir=None, timeout=60)
+            except Exception as exc:
+                logger.debug(f"write-behind flush of {count} line(s) skipped: {exc}")
+                continue
+            exit_code = (result or {}).get("exit_code", 0)
+            if exit_code != 0:
+                output = str((result or {}).get("output", ""))[:200]
+                logger.warning(
+                    f"write-behind flush of {count} line(s) failed (exit {exit_code}): {output}"
+                )
+                continue
+            self._ready_dirs.update(dirs)
+            self.flushes += 1
+
+    def _append_parts(self, path: str, lines: List[str]):
+        """Shell appends of ``lines`` to ``path``, each under ``max_cmd_chars``."""
+        target = shlex.quote(path)
+        plain = not any(line == WRITE_BEHIND_HEREDOC or "\n" in line for line in lines)
+        render = (lambda line: line) if plain else shlex.quote
+        chunk: List[str] = []
+        size = 0
+        for line in lines:
+            rendered = render(line)
+            if chunk and size + len(rendered) + 1 > self.max_cmd_chars - len(target) - 64:
+                yield self._append_part(target, chunk, plain), len(chunk)
+                chunk, size = [], 0
+            chunk.append(rendered)
+            size += len(rendered) + 1
+        if chunk:
+            yield self._append_part(target, chunk, plain), len(chunk)
+
+    @staticmethod
+    def _append_part(target: str, rendered: List[str], plain: bool) -> str:
+        if not plain:
+            return f"printf '%s\\n' {' '.join(rendered)} >> {target}"
+        body = "\n".join(rendered)
+        return f"cat >> {target} <<'{WRITE_BEHIND_HEREDOC}'\n{body}\n{WRITE_BEHIND_HEREDOC}"
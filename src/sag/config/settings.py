@@ -53,6 +53,13 @@ class Config(BaseModel):
     action_provider: str = Field(default="openai")
     action_temperature: float = Field(default=0.0)
     action_max_tokens: int = Field(default=2000)
+    # Stream executor turns and start each tool call as soon as its arguments
+    # are complete, instead of waiting for the model's trailing prose.
+    stream_native_turns: bool = Field(default=False)
+    # Mark the stable prefix of every executor request (system prompt, phase
+    # intro/ledger, prior turns) with prompt-cache breakpoints for providers
+    # that need them (Anthropic). OpenAI-style providers cache it unmarked.
+    native_prompt_caching: bool = Field(default=True)
 
     # API Keys (will be loaded from environment)
     openai_api_key: Optional[str] = Field(default=None)
@@ -77,6 +84,24 @@ class Config(BaseModel):
     # Docker configuration
     docker_base_image: str = Field(default="ubuntu:24.04")
     workspace_path: str = Field(default="/workspace")
+    # Route execute_command through one long-lived in-container helper process
+    # instead of a fresh docker exec per call. Falls back to docker exec
+    # whenever the helper cannot start (e.g. no python3 in the image yet).
+    exec_agent_enabled: bool = Field(default=False)
+    # Start new containers from a locally built image with the essential
+    # toolchain baked in (tagged by the package list) instead of apt-get
+    # installing it in every container.
+    docker_prebaked_images: bool = Field(default=True)
+    # `docker commit` the container once the provision phase advances, keyed by
+    # the resolved toolchain, and start later runs of the same repository from
+    # it.
+    docker_toolchain_snapshots: bool = Field(default=False)
+    # Mount one named volume shared by every workspace container as a
+    # content-addressed Maven/Gradle/pip dependency cache (seeded into each new
+    # container, published back when a run ends, LRU-evicted above the budget).
+    shared_dependency_cache: bool = Field(default=False)
+    shared_dependency_cache_volume: str = Field(default="sag-shared-deps")
+    shared_dependency_cache_max_gb: float = Field(default=20.0, ge=0)
 
     # Agent configuration
     max_iterations: int = Field(default=50)
@@ -152,6 +177,10 @@ class Config(BaseModel):
             action_provider=os.getenv("SAG_ACTION_PROVIDER", "openai"),
             action_temperature=float(os.getenv("SAG_ACTION_TEMPERATURE", "0.0")),
             action_max_tokens=int(os.getenv("SAG_MAX_ACTION_TOKENS", "10000")),
+            stream_native_turns=os.getenv("SAG_STREAM_NATIVE_TURNS", "false").lower()
+            in ("true", "1", "yes"),
+            native_prompt_caching=os.getenv("SAG_PROMPT_CACHING", "true").lower()
+            in ("true", "1", "yes"),
             # API Keys
             openai_api_key=os.getenv("OPENAI_API_KEY"),
             anthropic_api_key=os.getenv("ANTHROPIC_API_KEY"),
@@ -171,6 +200,18 @@ class Config(BaseModel):
             log_retention=os.getenv("SAG_LOG_RETENTION", "30 days"),
             docker_base_image=os.getenv("SAG_DOCKER_BASE_IMAGE", "ubuntu:24.04"),
             workspace_path=os.getenv("SAG_WORKSPACE_PATH", "/workspace"),
+            exec_agent_enabled=os.getenv("SAG_EXEC_AGENT", "false").lower()
+            in ("true", "1", "yes"),
+            docker_prebaked_images=os.getenv("SAG_DOCKER_PREBAKED_IMAGES", "true").lower()
+            in ("true", "1", "yes"),
+            docker_toolchain_snapshots=os.getenv("SAG_DOCKER_TOOLCHAIN_SNAPSHOTS", "false").lower()
+            in ("true", "1", "yes"),
+            shared_dependency_cache=os.getenv("SAG_SHARED_DEP_CACHE", "false").lower()
+            in ("true", "1", "yes"),
+            shared_dependency_cache_volume=os.getenv(
+                "SAG_SHARED_DEP_CACHE_VOLUME", "sag-shared-deps"
+            ),
+            shared_dependency_cache_max_gb=float(os.getenv("SAG_SHARED_DEP_CACHE_MAX_GB", "20")),
             max_iterations=int(os.getenv("SAG_MAX_ITERATIONS", "50")),
             context_switch_threshold=int(os.getenv("SAG_CONTEXT_SWITCH_THRESHOLD", "20")),
             reasoning_heartbeat_actions=int(os.getenv("SAG_REASONING_HEARTBEAT_ACTIONS", "5")),
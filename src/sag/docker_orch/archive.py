@@ -0,0 +1,90 @@
+"""Tar helpers for Docker's archive endpoints (``get_archive``/``put_archive``).
+
+One archive call moves a whole file or directory tree with no exec, no shell
+quoting, no base64 inflation and no per-argument size limit. These helpers only
+deal with the tar stream; ``DockerOrchestrator`` owns the Docker calls.
+"""
+
+from __future__ import annotations
+
+import io
+import tarfile
+import time
+from typing import IO, Any, Callable, Iterator, Mapping, Optional, Tuple
+
+# Go ``os.FileMode`` type bits as reported in the X-Docker-Container-Path-Stat
+# header that accompanies every get_archive response.
+GO_MODE_DIR = 1 << 31
+GO_MODE_SYMLINK = 1 << 27
+GO_MODE_TYPE_MASK = GO_MODE_DIR | GO_MODE_SYMLINK | (1 << 26) | (1 << 25) | (1 << 24) | (1 << 21)
+
+
+class ChunkReader(io.RawIOBase):
+    """File-like over get_archive's chunk generator, so tarfile streams the archive
+    instead of us materializing the whole thing in RAM (a session's
+    full_outputs.jsonl can be large, times every container on a dashboard load)."""
+
+    def __init__(self, chunks: Any):
+        self._chunks = iter(chunks)
+        self._buf = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b: bytearray) -> int:
+        while not self._buf:
+            try:
+                self._buf = next(self._chunks)
+            except StopIteration:
+                return 0
+        n = min(len(b), len(self._buf))
+        b[:n] = self._buf[:n]
+        self._buf = self._buf[n:]
+        return n
+
+
+def is_regular_stat(stat: Optional[Mapping[str, Any]]) -> bool:
+    """True when a get_archive path-stat header describes a regular file."""
+    if not isinstance(stat, Mapping):
+        return False
+    try:
+        mode = int(stat.get("mode", 0))
+    except (TypeError, ValueError):
+        return False
+    return not mode & GO_MODE_TYPE_MASK
+
+
+def iter_archive_members(
+    chunks: Any,
+    include: Optional[Callable[[str], bool]] = None,
+) -> Iterator[Tuple[tarfile.TarInfo, IO[bytes]]]:
+    """Stream (member, file object) for every regular file in a tar stream.
+
+    Member file objects are only valid until the next iteration step: the
+    archive is read strictly forward, so callers consume each file in turn
+    (``read()`` it or hand it to an incremental parser) without the whole
+    archive ever being buffered.
+    """
+    with tarfile.open(fileobj=io.BufferedReader(ChunkReader(chunks)), mode="r|") as tar:
+        for member in tar:
+            if not member.isreg():
+                continue
+            if include is not None and not include(member.name):
+                continue
+            handle = tar.extractfile(member)
+            if handle is not None:
+                yield member, handle
+
+
+def build_archive(files: Mapping[str, bytes], mode: int = 0o644) -> bytes:
+    """Build an uncompressed tar holding ``files`` (member name -> bytes)."""
+    buffer = io.BytesIO()
+    mtime = time.time()
+    with tarfile.open(fileobj=buffer, mode="w", format=tarfile.PAX_FORMAT) as tar:
+        for name, data in files.items():
+            info = tarfile.TarInfo(name=name.lstrip("/"))
+            info.size = len(data)
+            info.mode = mode
+            info.mtime = mtime
+            tar.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
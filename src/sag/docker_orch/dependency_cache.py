@@ -0,0 +1,393 @@
+"""Shared, content-addressed dependency cache across workspace containers.
+
+Every workspace container downloaded its own Maven repository, Gradle module
+cache and pip wheels, so a batch of thirty Java projects fetched the same
+artifacts dozens of times. With ``shared_dependency_cache`` enabled each new
+container mounts one named volume at ``SHARED_CACHE_MOUNT``:
+
+    blobs/sha256/<2>/<digest>   every artifact once, by content
+    maven/repository/...        release artifacts in Maven layout  (hard links)
+    gradle/files-2.1/...        Gradle's immutable module files    (hard links)
+    pip/                        PIP_CACHE_DIR, pip's own cache
+    .lock                       flock: shared to seed/publish, exclusive to evict
+    usage.json                  size accounting from the last publish
+
+Build tools never write into the volume directly (except pip, whose cache is
+built for concurrent use), so no tool's own locking has to work across
+containers. A new container is SEEDED without copying artifact bytes:
+
+* Maven reads the shared tree in place as a read-only tail of ``~/.m2``
+  (``maven.repo.local.tail``, Maven 3.9+, set in ``~/.mavenrc``). Anything it
+  downloads still lands in the private repository; older Mavens ignore the tail
+  and download as before.
+* Gradle's read-only dependency cache needs module metadata the volume does
+  not share, so each shared module file is linked into the private
+  ``files-2.1``: a hard link when both are on one filesystem, otherwise a
+  symlink. Existing private files are never clobbered.
+
+When the run ends the container PUBLISHES its private caches back: new
+artifacts go into the blob store (written to a unique temp name, then renamed,
+so racing publishers converge on one complete file) and are linked into the
+trees the same way. Snapshots, resolver bookkeeping and partial downloads are
+never published.
+
+Size accounting counts the blob store plus pip's cache. Above the configured
+budget, publishing evicts least-recently-used tree entries down to 90% of it.
+A tree entry's mtime is its last use: it is refreshed when a publishing
+container downloaded the file, and when the file was read since its last
+refresh (atime past mtime, which the refresh sets equal). A blob no tree links
+to any more is deleted. An entry evicted while another container reads it
+through the tail or a link is simply downloaded again by that build.
+"""
+
+from __future__ import annotations
+
+import json
+import shlex
+from dataclasses import dataclass
+from typing import Optional
+
+SHARED_CACHE_MOUNT = "/sag-cache"
+
+# Runs with the container's python3:
+#   argv = mode ("seed" | "publish"), cache_root, home, max_bytes
+# Prints one JSON summary line.
+DEPENDENCY_CACHE_SCRIPT = r"""
+import fcntl
+import hashlib
+import json
+import os
+import shutil
+import sys
+import time
+import uuid
+
+mode, root, max_bytes = sys.argv[1], sys.argv[2], int(sys.argv[4])
+# "~" (or any ~-path) resolves against the user the exec runs as.
+home = os.path.expanduser(sys.argv[3])
+TREES = {
+    "maven": (os.path.join(home, ".m2", "repository"), os.path.join(root, "maven", "repository")),
+    "gradle": (
+        os.path.join(home, ".gradle", "caches", "modules-2", "files-2.1"),
+        os.path.join(root, "gradle", "files-2.1"),
+    ),
+}
+BLOBS = os.path.join(root, "blobs", "sha256")
+STAMP = os.path.join(home, ".sag-shared-cache-seeded")
+MAVENRC = os.path.join(home, ".mavenrc")
+MAVENRC_MARKER = "# sag shared dependency cache"
+SKIP_NAMES = ("_remote.repositories", "resolver-status.properties")
+SKIP_SUFFIXES = (".lastUpdated", ".part", ".lock", ".tmp")
+
+
+def emit(payload):
+    print(json.dumps(payload, separators=(",", ":")))
+    sys.exit(0)
+
+
+if not os.path.isdir(root) or not os.access(root, os.W_OK):
+    emit({"error": "shared cache is not mounted"})
+
+
+def lock(kind):
+    handle = open(os.path.join(root, ".lock"), "a")
+    fcntl.flock(handle, kind)
+    return handle
+
+
+def publishable(tree, relative):
+    name = os.path.basename(relative)
+    if name in SKIP_NAMES or name.endswith(SKIP_SUFFIXES) or name.startswith("maven-metadata"):
+        return False
+    # Snapshots are mutable under a fixed path; only releases are shared.
+    return tree != "maven" or "-SNAPSHOT" not in relative
+
+
+def walk(directory):
+    for parent, _dirs, names in os.walk(directory):
+        for name in names:
+            path = os.path.join(parent, name)
+            yield path, os.path.relpath(path, directory)
+
+
+def sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def staged_name(target):
+    # PIDs repeat across containers sharing the volume; a uuid does not.
+    return "%s.%s.tmp" % (target, uuid.uuid4().hex)
+
+
+def place(source, target, link):
+    # Write beside the target, then rename: a reader never sees a partial file
+    # and two racing writers both end with the same complete one.
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    staged = staged_name(target)
+    try:
+        if link:
+            os.link(source, staged)
+        else:
+            shutil.copy2(source, staged)
+        os.replace(staged, target)
+    except OSError:
+        try:
+            os.unlink(staged)
+        except OSError:
+            pass
+        raise
+
+
+def device(path):
+    # The device of ``path`` or of its nearest existing ancestor.
+    while True:
+        try:
+            return os.stat(path).st_dev
+        except OSError:
+            parent = os.path.dirname(path)
+            if parent == path:
+                return None
+            path = parent
+
+
+def add_maven_tail():
+    tail = TREES["maven"][1]
+    try:
+        with open(MAVENRC) as handle:
+            if MAVENRC_MARKER in handle.read():
+                return
+    except OSError:
+        pass
+    with open(MAVENRC, "a") as handle:
+        handle.write(
+            '\n%s\nMAVEN_OPTS="${MAVEN_OPTS:-} -Dmaven.repo.local.tail=%s'
+            ' -Dmaven.repo.local.tail.ignoreAvailability=true"\n' % (MAVENRC_MARKER, tail)
+        )
+
+
+def link_gradle_tree():
+    private, shared = TREES["gradle"]
+    hard = device(private) == device(shared)
+    linked = 0
+    for path, relative in walk(shared):
+        target = os.path.join(private, relative)
+        if relative.endswith(".tmp") or os.path.lexists(target):
+            continue
+        try:
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            if hard:
+                os.link(path, target)
+            else:
+                os.symlink(path, target)
+            linked += 1
+        except OSError:
+            continue
+    return linked
+
+
+def refresh_reads(now):
+    # Entries read in place (Maven tail, Gradle links) since their last refresh.
+    refreshed = 0
+    for tree in TREES:
+        for path, _relative in walk(TREES[tree][1]):
+            try:
+                stat = os.lstat(path)
+                if stat.st_atime > stat.st_mtime:
+                    os.utime(path, (now, now))
+                    refreshed += 1
+            except OSError:
+                continue
+    return refreshed
+
+
+def usage():
+    total = blobs = 0
+    for path, _relative in walk(BLOBS):
+        try:
+            total += os.lstat(path).st_size
+            blobs += 1
+        except OSError:
+            pass
+    for path, _relative in walk(os.path.join(root, "pip")):
+        try:
+            total += os.lstat(path).st_size
+        except OSError:
+            pass
+    return total, blobs
+
+
+def evict(total):
+    # Oldest last-use first; a blob goes once no tree links to it.
+    low_water = int(max_bytes * 0.9)
+    entries = []
+    for tree in TREES:
+        for path, _relative in walk(TREES[tree][1]):
+            try:
+                stat = os.lstat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, path))
+    for path, _relative in walk(os.path.join(root, "pip")):
+        try:
+            entries.append((os.lstat(path).st_mtime, path))
+        except OSError:
+            continue
+    entries.sort()
+    evicted = 0
+    pip_root = os.path.join(root, "pip") + os.sep
+    for _mtime, path in entries:
+        if total <= low_water:
+            break
+        try:
+            stat = os.lstat(path)
+            os.unlink(path)
+        except OSError:
+            continue
+        evicted += 1
+        # A pip file frees its bytes; a tree entry only when the blob is its
+        # last other link.
+        if path.startswith(pip_root) or stat.st_nlink <= 2:
+            total -= stat.st_size
+    for path, _relative in list(walk(BLOBS)):
+        try:
+            if os.lstat(path).st_nlink == 1:
+                os.unlink(path)
+        except OSError:
+            pass
+    return evicted
+
+
+if mode == "seed":
+    with lock(fcntl.LOCK_SH):
+        seeded = link_gradle_tree()
+        try:
+            add_maven_tail()
+        except OSError:
+            pass
+        os.makedirs(os.path.join(root, "pip"), exist_ok=True)
+    with open(STAMP, "w") as handle:
+        handle.write(str(time.time()))
+    emit({"seeded": seeded})
+
+try:
+    with open(STAMP) as handle:
+        seeded_at = float(handle.read().strip())
+except (OSError, ValueError):
+    seeded_at = 0.0
+published = refreshed = added_bytes = 0
+now = time.time()
+with lock(fcntl.LOCK_SH):
+    for tree, (private, shared) in TREES.items():
+        for path, relative in walk(private):
+            if not publishable(tree, relative):
+                continue
+            try:
+                stat = os.lstat(path)
+            except OSError:
+                continue
+            if (stat.st_mode & 0o170000) != 0o100000:
+                continue
+            target = os.path.join(shared, relative)
+            try:
+                shared_stat = os.lstat(target)
+            except OSError:
+                shared_stat = None
+            if shared_stat is not None and (shared_stat.st_dev, shared_stat.st_ino) == (
+                stat.st_dev,
+                stat.st_ino,
+            ):
+                continue  # a link to the shared entry; refresh_reads sees its reads
+            if shared_stat is not None and shared_stat.st_size == stat.st_size:
+                # Already shared; a read since the seed counts as a use.
+                if stat.st_atime > seeded_at or stat.st_mtime > seeded_at:
+                    try:
+                        os.utime(target, (now, now))
+                        refreshed += 1
+                    except OSError:
+                        pass
+                continue
+            try:
+                digest = sha256(path)
+                blob = os.path.join(BLOBS, digest[:2], digest)
+                if not os.path.exists(blob):
+                    place(path, blob, link=False)
+                    added_bytes += stat.st_size
+                place(blob, target, link=True)
+                os.utime(target, (now, now))
+                published += 1
+            except OSError:
+                continue
+    refreshed += refresh_reads(now)
+# The next publish from this container counts only uses after this one.
+try:
+    with open(STAMP, "w") as handle:
+        handle.write(str(time.time()))
+except OSError:
+    pass
+total, blobs = usage()
+evicted = 0
+if max_bytes > 0 and total > max_bytes:
+    with lock(fcntl.LOCK_EX):
+        evicted = evict(total)
+    total, blobs = usage()
+summary = {
+    "published": published,
+    "refreshed": refreshed,
+    "added_bytes": added_bytes,
+    "total_bytes": total,
+    "blobs": blobs,
+    "evicted": evicted,
+    "max_bytes": max_bytes,
+    "updated_at": now,
+}
+try:
+    staged = staged_name(os.path.join(root, "usage.json"))
+    with open(staged, "w") as handle:
+        json.dump(summary, handle)
+    os.replace(staged, os.path.join(root, "usage.json"))
+except OSError:
+    pass
+emit(summary)
+"""
+
+
+@dataclass(frozen=True)
+class CacheSummary:
+    """What one seed or publish pass reported."""
+
+    seeded: int = 0
+    published: int = 0
+    refreshed: int = 0
+    added_bytes: int = 0
+    total_bytes: int = 0
+    blobs: int = 0
+    evicted: int = 0
+
+
+def cache_command(
+    mode: str, home: str = "~", max_bytes: int = 0, root: str = SHARED_CACHE_MOUNT
+) -> str:
+    """The exec that runs one pass; ``home`` defaults to the exec user's own."""
+    script = shlex.quote(DEPENDENCY_CACHE_SCRIPT)
+    arguments = " ".join(shlex.quote(str(value)) for value in (mode, root, home, max_bytes))
+    return f"python3 -c {script} {arguments}"
+
+
+def parse_cache_summary(output: str) -> Optional[CacheSummary]:
+    """The script's summary line, or None when it did not run or reported an error."""
+    lines = (output or "").strip().splitlines()
+    try:
+        payload = json.loads(lines[-1]) if lines else None
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(payload, dict) or payload.get("error"):
+        return None
+    fields = CacheSummary.__dataclass_fields__
+    try:
+        return CacheSummary(**{key: int(payload[key]) for key in fields if key in payload})
+    except (TypeError, ValueError):
+        return None
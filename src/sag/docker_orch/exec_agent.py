@@ -0,0 +1,432 @@
+"""Long-lived in-container exec agent.
+
+Every ``DockerOrchestrator.execute_command`` used to cost a full Docker exec
+round trip: ``exec_create`` + ``exec_start`` + ``exec_inspect`` and a fresh
+process tree inside the container. Validator passes and context saves issue
+dozens of tiny probes (``test -f``, ``cat``, ``stat``), so that fixed cost
+dominated their wall time.
+
+The agent is ONE helper process (``python3 -u -c AGENT_SCRIPT``) started with
+a single exec whose stdin/stdout stay attached. Requests are JSON lines tagged
+with an id; the helper answers each on its own thread, so several callers can
+share the stream concurrently and responses are matched back by id. Commands
+still run under ``/bin/bash -c`` with the exact wrapped command the orchestrator
+builds, so the result dict is unchanged — only the Docker round trip is gone.
+
+The helper only needs the container's ``python3`` (installed by the base
+environment setup). When it cannot start, the orchestrator keeps using
+``exec_run``; the agent is an optimization, never a requirement.
+"""
+
+from __future__ import annotations
+
+import base64
+import itertools
+import json
+import threading
+import time
+from typing import Any, Dict, Optional, Protocol
+
+from loguru import logger
+
+# Executed by the container's python3. Stdlib only; it must run on whatever
+# python3 the distro ships. stdout is the response channel, so every spawned
+# command gets its own pipes.
+AGENT_SCRIPT = r"""
+import base64, json, os, subprocess, sys, threading
+
+_LOCK = threading.Lock()
+
+
+def _emit(message):
+    data = (json.dumps(message) + "\n").encode("utf-8")
+    with _LOCK:
+        sys.stdout.buffer.write(data)
+        sys.stdout.buffer.flush()
+
+
+def _b64(data):
+    return base64.b64encode(data).decode("ascii")
+
+
+def _stat(path):
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return {"exists": False}
+    import stat as _st
+    return {
+        "exists": True,
+        "size": st.st_size,
+        "mtime": st.st_mtime,
+        "mtime_ns": st.st_mtime_ns,
+        "mode": st.st_mode & 0o7777,
+        "is_dir": _st.S_ISDIR(st.st_mode),
+        "is_file": _st.S_ISREG(st.st_mode),
+    }
+
+
+def _handle(request):
+    rid = request.get("id")
+    op = request.get("op")
+    try:
+        if op == "ping":
+            _emit({"id": rid, "ok": True, "pid": os.getpid()})
+        elif op == "exec":
+            env = dict(os.environ)
+            env.update(request.get("env") or {})
+            merge = bool(request.get("merge_stderr"))
+            proc = subprocess.run(
+                ["/bin/bash", "-c", request["cmd"]],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT if merge else subprocess.PIPE,
+                env=env,
+            )
+            _emit({
+                "id": rid,
+                "ok": True,
+                "exit_code": proc.returncode,
+                "stdout": _b64(proc.stdout or b""),
+                "stderr": _b64(proc.stderr or b""),
+            })
+        elif op == "read":
+            path = request["path"]
+            if not os.path.isfile(path):
+                _emit({"id": rid, "ok": True, "exists": False})
+                return
+            with open(path, "rb") as handle:
+                _emit({"id": rid, "ok": True, "exists": True, "data": _b64(handle.read())})
+        elif op == "write":
+            path = request["path"]
+            data = base64.b64decode(request.get("data") or "")
+            parent = os.path.dirname(path)
+            if parent:
+                os.makedirs(parent, exist_ok=True)
+            if request.get("append"):
+                with open(path, "ab") as handle:
+                    handle.write(data)
+            else:
+                tmp = "%s.sag-agent.%d.%s.tmp" % (path, os.getpid(), rid)
+                with open(tmp, "wb") as handle:
+                    handle.write(data)
+                if request.get("mode") is not None:
+                    os.chmod(tmp, int(request["mode"]))
+                os.replace(tmp, path)
+            _emit({"id": rid, "ok": True, "size": len(data)})
+        elif op == "stat":
+            _emit(dict(_stat(request["path"]), id=rid, ok=True))
+        else:
+            _emit({"id": rid, "ok": False, "error": "unknown op: %r" % (op,)})
+    except Exception as exc:
+        _emit({"id": rid, "ok": False, "error": "%s: %s" % (type(exc).__name__, exc)})
+
+
+for _line in sys.stdin:
+    _line = _line.strip()
+    if not _line:
+        continue
+    try:
+        _request = json.loads(_line)
+    except ValueError as exc:
+        _emit({"id": None, "ok": False, "error": "bad request: %s" % exc})
+        continue
+    threading.Thread(target=_handle, args=(_request,), daemon=True).start()
+"""
+
+AGENT_COMMAND = ["python3", "-u", "-c", AGENT_SCRIPT]
+
+
+class ExecAgentError(RuntimeError):
+    """The agent transport failed.
+
+    ``dispatched`` is False when the request never reached the helper (safe to
+    retry through ``exec_run``) and True when it was written but its answer was
+    lost — the command may have run, so it must not be silently re-executed.
+    """
+
+    def __init__(self, message: str, *, dispatched: bool = False):
+        super().__init__(message)
+        self.dispatched = dispatched
+
+
+class AgentStream(Protocol):
+    """Byte stream to the helper: raw stdin writes, demultiplexed stdout reads."""
+
+    def write(self, data: bytes) -> None: ...
+
+    def read_chunk(self) -> Optional[bytes]: ...
+
+    def close(self) -> None: ...
+
+
+class DockerExecStream:
+    """Adapter over a Docker ``exec_start(socket=True)`` attach socket.
+
+    Without a TTY Docker multiplexes stdout/stderr into 8-byte framed chunks.
+    stdout frames carry responses; stderr frames are helper diagnostics.
+    """
+
+    def __init__(self, sock: Any):
+        self._sock = sock
+
+    def write(self, data: bytes) -> None:
+        raw = getattr(self._sock, "_sock", self._sock)
+        raw.sendall(data)
+
+    def read_chunk(self) -> Optional[bytes]:
+        from docker.utils.socket import STDERR, STDOUT, next_frame_header, read_exactly
+
+        while True:
+            stream, size = next_frame_header(self._sock)
+            if stream < 0:
+                return None
+            payload = read_exactly(self._sock, size) if size else b""
+            if stream == STDOUT:
+                return payload
+            if stream == STDERR and payload:
+                logger.debug(f"exec agent stderr: {payload.decode('utf-8', errors='replace')}")
+
+    def close(self) -> None:
+        try:
+            self._sock.close()
+        except Exception:
+            pass
+
+
+class ExecStats:
+    """Per-transport request latency and throughput counters.
+
+    Both the agent and the ``exec_run`` path record here so one snapshot
+    compares them on the same run.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._transports: Dict[str, Dict[str, Any]] = {}
+        self._started = time.monotonic()
+
+    def record(
+        self,
+        transport: str,
+        op: str,
+        seconds: float,
+        *,
+        bytes_out: int = 0,
+        bytes_in: int = 0,
+        ok: bool = True,
+    ) -> None:
+        with self._lock:
+            bucket = self._transports.setdefault(
+                transport,
+                {
+                    "requests": 0,
+                    "failures": 0,
+                    "total_seconds": 0.0,
+                    "max_seconds": 0.0,
+                    "bytes_out": 0,
+                    "bytes_in": 0,
+                    "ops": {},
+                },
+            )
+            bucket["requests"] += 1
+            bucket["failures"] += 0 if ok else 1
+            bucket["total_seconds"] += seconds
+            bucket["max_seconds"] = max(bucket["max_seconds"], seconds)
+            bucket["bytes_out"] += bytes_out
+            bucket["bytes_in"] += bytes_in
+            bucket["ops"][op] = bucket["ops"].get(op, 0) + 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return a JSON-safe summary: counts, mean/max latency, throughput."""
+        with self._lock:
+            transports = {}
+            for name, bucket in self._transports.items():
+                requests = bucket["requests"]
+                total = bucket["total_seconds"]
+                transports[name] = {
+                    "requests": requests,
+                    "failures": bucket["failures"],
+                    "total_seconds": round(total, 6),
+                    "mean_ms": round(total / requests * 1000, 3) if requests else 0.0,
+                    "max_ms": round(bucket["max_seconds"] * 1000, 3),
+                    "requests_per_second": round(requests / total, 3) if total > 0 else 0.0,
+                    "bytes_out": bucket["bytes_out"],
+                    "bytes_in": bucket["bytes_in"],
+                    "ops": dict(bucket["ops"]),
+                }
+            return {
+                "uptime_seconds": round(time.monotonic() - self._started, 3),
+                "transports": transports,
+            }
+
+
+class ContainerExecAgent:
+    """Client side of the helper protocol.
+
+    A reader thread demultiplexes responses by id, so ``request`` is safe to
+    call from several threads at once. Once the stream breaks the agent is
+    permanently closed; the owner decides whether to start a new one.
+    """
+
+    TRANSPORT = "agent"
+
+    def __init__(self, stream: AgentStream, *, stats: Optional[ExecStats] = None):
+        self._stream = stream
+        self.stats = stats or ExecStats()
+        self._ids = itertools.count(1)
+        self._write_lock = threading.Lock()
+        self._pending_lock = threading.Lock()
+        self._pending: Dict[int, Dict[str, Any]] = {}
+        self._closed = False
+        self._close_reason = ""
+        self._reader = threading.Thread(
+            target=self._read_loop, name="sag-exec-agent-reader", daemon=True
+        )
+        self._reader.start()
+
+    @property
+    def alive(self) -> bool:
+        return not self._closed
+
+    def handshake(self, timeout: float = 15.0) -> Dict[str, Any]:
+        """Ping the helper; raise ``ExecAgentError`` if it does not answer."""
+        return self.request("ping", timeout=timeout)
+
+    def request(
+        self, op: str, *, timeout: Optional[float] = None, **payload: Any
+    ) -> Dict[str, Any]:
+        """Send one request and wait for its response."""
+        if self._closed:
+            raise ExecAgentError(f"exec agent closed: {self._close_reason}")
+        request_id = next(self._ids)
+        slot: Dict[str, Any] = {"event": threading.Event(), "response": None}
+        with self._pending_lock:
+            self._pending[request_id] = slot
+        line = (json.dumps(dict(payload, id=request_id, op=op)) + "\n").encode("utf-8")
+        started = time.monotonic()
+        try:
+            with self._write_lock:
+                self._stream.write(line)
+        except Exception as exc:
+            with self._pending_lock:
+                self._pending.pop(request_id, None)
+            self._shutdown(f"write failed: {exc}")
+            raise ExecAgentError(f"exec agent write failed: {exc}", dispatched=False) from exc
+
+        if not slot["event"].wait(timeout):
+            with self._pending_lock:
+                self._pending.pop(request_id, None)
+            self.stats.record(
+                self.TRANSPORT, op, time.monotonic() - started, bytes_out=len(line), ok=False
+            )
+            raise ExecAgentError(f"exec agent timed out after {timeout}s on {op}", dispatched=True)
+
+        response = slot["response"]
+        if response is None:
+            raise ExecAgentError(
+                f"exec agent stream closed before answering {op}: {self._close_reason}",
+                dispatched=True,
+            )
+        self.stats.record(
+            self.TRANSPORT,
+            op,
+            time.monotonic() - started,
+            bytes_out=len(line),
+            bytes_in=int(response.pop("_bytes", 0)),
+            ok=bool(response.get("ok")),
+        )
+        if not response.get("ok"):
+            raise ExecAgentError(
+                f"exec agent {op} failed: {response.get('error')}", dispatched=True
+            )
+        return response
+
+    def run(
+        self,
+        command: str,
+        *,
+        environment: Optional[Dict[str, str]] = None,
+        merge_stderr: bool = False,
+    ) -> tuple[int, bytes, bytes]:
+        """Run ``/bin/bash -c command``; return (exit_code, stdout, stderr)."""
+        response = self.request(
+            "exec", cmd=command, env=dict(environment or {}), merge_stderr=merge_stderr
+        )
+        return (
+            int(response.get("exit_code", -1)),
+            base64.b64decode(response.get("stdout") or ""),
+            base64.b64decode(response.get("stderr") or ""),
+        )
+
+    def read_file(self, path: str) -> Optional[bytes]:
+        """Return the file's bytes, or None when it is not a regular file."""
+        response = self.request("read", path=path)
+        if not response.get("exists"):
+            return None
+        return base64.b64decode(response.get("data") or "")
+
+    def write_file(
+        self, path: str, data: bytes, *, append: bool = False, mode: Optional[int] = None
+    ) -> None:
+        """Write ``data`` (atomic rename unless ``append``), creating parents."""
+        self.request(
+            "write",
+            path=path,
+            data=base64.b64encode(data).decode("ascii"),
+            append=append,
+            mode=mode,
+        )
+
+    def stat(self, path: str) -> Dict[str, Any]:
+        """Return ``{"exists": False}`` or size/mtime/mode/is_dir/is_file."""
+        response = self.request("stat", path=path)
+        return {key: value for key, value in response.items() if key not in {"id", "ok"}}
+
+    def close(self) -> None:
+        self._shutdown("closed by owner")
+        self._stream.close()
+
+    def _shutdown(self, reason: str) -> None:
+        with self._pending_lock:
+            if not self._closed:
+                self._closed = True
+                self._close_reason = reason
+            pending = list(self._pending.values())
+            self._pending.clear()
+        for slot in pending:
+            slot["event"].set()
+
+    def _read_loop(self) -> None:
+        # Only the trailing partial line is carried between chunks, so a large
+        # response costs one copy per chunk rather than one per line.
+        partial = b""
+        try:
+            while True:
+                chunk = self._stream.read_chunk()
+                if not chunk:
+                    break
+                *lines, partial = (partial + chunk).split(b"\n")
+                for line in lines:
+                    if line.strip():
+                        self._dispatch(line)
+            self._shutdown("helper exited")
+        except Exception as exc:
+            self._shutdown(f"read failed: {exc}")
+
+    def _dispatch(self, line: bytes) -> None:
+        try:
+            response = json.loads(line)
+        except ValueError:
+            logger.debug(f"exec agent emitted a non-JSON line: {line[:200]!r}")
+            return
+        if not isinstance(response, dict):
+            return
+        response["_bytes"] = len(line) + 1
+        with self._pending_lock:
+            slot = self._pending.pop(response.get("id"), None)
+        if slot is None:
+            logger.debug(f"exec agent response without a waiter: {response.get('error')}")
+            return
+        slot["response"] = response
+        slot["event"].set()
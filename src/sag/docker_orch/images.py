@@ -0,0 +1,194 @@
+"""Pre-baked toolchain base images and post-provision container snapshots.
+
+Every new container used to start from the bare distro image and spend minutes
+in ``apt-get update`` plus an install of the essential toolchain before the
+agent did any work, and the provision phase then installed a JDK and build
+tool on top. Two caches remove that repeated cost:
+
+* A locally built base image with ``ESSENTIAL_PACKAGES`` baked in. Its tag is
+  content-addressed by the distro image, the package list and the recipe
+  version, so changing any of them builds a new image instead of reusing a
+  stale one.
+* An optional ``docker commit`` of the container once the provision phase has
+  advanced. It is tagged by the resolved toolchain fingerprint (the versions
+  the container actually reports), and an alias tag per repository points at
+  it, so a later run of that repository starts from the warm image. A
+  snapshot carries the toolchain and the build caches, never the previous
+  run's workspace: the orchestrator clears ``/workspace`` when it starts from
+  one.
+
+Both are best effort. Any Docker failure falls back to the distro image and the
+ordinary in-container setup.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+from typing import Any, Optional, Sequence
+
+from docker.errors import NotFound
+from loguru import logger
+
+# Installed into every container (baked into the base image when enabled).
+ESSENTIAL_PACKAGES = (
+    "curl",
+    "wget",
+    "git",
+    "nano",
+    "vim",
+    "python3",
+    "python3-pip",
+    "nodejs",
+    "npm",
+    "build-essential",
+    "grep",
+    "findutils",
+    "less",
+)
+
+BASE_IMAGE_REPOSITORY = "sag-base"
+SNAPSHOT_REPOSITORY = "sag-snapshot"
+# Bump when the Dockerfile below changes meaning; it is part of the tag.
+BASE_RECIPE_VERSION = 1
+
+LABEL_PREBAKED = "setup-agent.prebaked"
+LABEL_BASE_PACKAGES = "setup-agent.base-packages"
+LABEL_SNAPSHOT = "setup-agent.snapshot"
+LABEL_TOOLCHAIN = "setup-agent.toolchain"
+LABEL_REPOSITORY = "setup-agent.repository"
+
+# One exec, one `name=<first line>` per tool (the shell's own error when a tool
+# is absent). The fingerprint is what the container resolves, not what the
+# model asked for.
+TOOLCHAIN_PROBE = " ; ".join(
+    f"echo {name}=$({command} 2>&1 | head -1 || true)"
+    for name, command in (
+        ("java", "java -version"),
+        ("javac", "javac -version"),
+        ("maven", "mvn -v"),
+        ("gradle", "gradle -v 2>/dev/null | grep -m1 Gradle"),
+        ("python", "python3 -V"),
+        ("node", "node -v"),
+        ("os", "grep -m1 PRETTY_NAME /etc/os-release"),
+    )
+)
+
+
+def base_image_tag(base_image: str, packages: Sequence[str] = ESSENTIAL_PACKAGES) -> str:
+    """``sag-base:<digest>`` for this distro image and package list."""
+    key = json.dumps(
+        {"base": base_image, "packages": sorted(packages), "recipe": BASE_RECIPE_VERSION},
+        sort_keys=True,
+    )
+    return f"{BASE_IMAGE_REPOSITORY}:{hashlib.sha256(key.encode()).hexdigest()[:16]}"
+
+
+def base_dockerfile(base_image: str, packages: Sequence[str] = ESSENTIAL_PACKAGES) -> str:
+    return (
+        f"FROM {base_image}\n"
+        "ENV DEBIAN_FRONTEND=noninteractive\n"
+        "RUN apt-get update -qq"
+        f" && apt-get install -y -qq {' '.join(sorted(packages))}"
+        " && rm -rf /var/lib/apt/lists/*\n"
+        f"LABEL {LABEL_PREBAKED}=\"1\" {LABEL_BASE_PACKAGES}={json.dumps(' '.join(packages))}\n"
+    )
+
+
+def ensure_base_image(
+    client: Any, base_image: str, packages: Sequence[str] = ESSENTIAL_PACKAGES
+) -> Optional[str]:
+    """The pre-baked image's tag, building it once; None when it cannot be built."""
+    tag = base_image_tag(base_image, packages)
+    try:
+        client.images.get(tag)
+        logger.info(f"Using pre-baked base image {tag}")
+        return tag
+    except NotFound:
+        pass
+    except Exception as exc:
+        logger.warning(f"Could not look up pre-baked image {tag}: {exc}")
+        return None
+    logger.info(f"Building pre-baked base image {tag} from {base_image} (one-time)...")
+    try:
+        dockerfile = io.BytesIO(base_dockerfile(base_image, packages).encode())
+        client.images.build(fileobj=dockerfile, tag=tag, rm=True, pull=False)
+    except Exception as exc:
+        logger.warning(f"Pre-baked image build failed, using {base_image}: {exc}")
+        return None
+    logger.info(f"✅ Built pre-baked base image {tag}")
+    return tag
+
+
+def toolchain_fingerprint(probe_output: str) -> Optional[str]:
+    """Digest of the tool versions ``TOOLCHAIN_PROBE`` printed; None when unusable."""
+    lines = sorted(
+        line.strip()
+        for line in (probe_output or "").splitlines()
+        if "=" in line and line.split("=", 1)[0].isidentifier()
+    )
+    if not lines:
+        return None
+    return hashlib.sha256("\n".join(lines).encode()).hexdigest()[:16]
+
+
+def snapshot_tag(fingerprint: str) -> str:
+    return f"{SNAPSHOT_REPOSITORY}:{fingerprint}"
+
+
+def repository_alias(repository: str) -> str:
+    """The ``sag-snapshot`` tag that points a repository at its latest snapshot."""
+    return f"repo-{hashlib.sha256(repository.encode()).hexdigest()[:16]}"
+
+
+def find_snapshot(client: Any, repository: str) -> Optional[str]:
+    """The snapshot last provisioned for ``repository``, or None."""
+    if not repository:
+        return None
+    tag = f"{SNAPSHOT_REPOSITORY}:{repository_alias(repository)}"
+    try:
+        client.images.get(tag)
+    except NotFound:
+        return None
+    except Exception as exc:
+        logger.debug(f"snapshot lookup failed: {exc}")
+        return None
+    return tag
+
+
+def commit_snapshot(
+    client: Any, container: Any, fingerprint: str, *, toolchain: str, repository: str
+) -> Optional[str]:
+    """``docker commit`` ``container`` as the snapshot for ``fingerprint``.
+
+    An existing snapshot for the same fingerprint is kept, not recommitted: the
+    toolchain it carries is by definition the same one. Either way the
+    repository's alias tag is moved onto it.
+    """
+    tag = snapshot_tag(fingerprint)
+    try:
+        image = client.images.get(tag)
+        logger.info(f"Toolchain snapshot {tag} already exists")
+    except NotFound:
+        image = None
+    except Exception as exc:
+        logger.debug(f"snapshot lookup failed: {exc}")
+        return None
+    if image is None:
+        labels = {LABEL_SNAPSHOT: "1", LABEL_TOOLCHAIN: toolchain, LABEL_REPOSITORY: repository}
+        changes = [f"LABEL {key}={json.dumps(value)}" for key, value in labels.items()]
+        try:
+            image = container.commit(
+                repository=SNAPSHOT_REPOSITORY, tag=fingerprint, changes=changes
+            )
+        except Exception as exc:
+            logger.warning(f"Toolchain snapshot {tag} failed: {exc}")
+            return None
+        logger.info(f"✅ Committed toolchain snapshot {tag}")
+    if repository:
+        try:
+            image.tag(SNAPSHOT_REPOSITORY, repository_alias(repository))
+        except Exception as exc:
+            logger.debug(f"snapshot alias for {repository} not tagged: {exc}")
+    return tag
@@ -1,6 +1,7 @@
 """Docker Orchestrator for managing containers and volumes."""
 
 import os
+import posixpath
 import re
 import shlex
 import subprocess
@@ -8,13 +9,22 @@ import threading
 import time
 import uuid
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import IO, Any, Callable, Dict, Iterator, List, Mapping, Optional, Tuple
 
 import docker
 from docker.errors import APIError, DockerException, NotFound
 from loguru import logger
 
 from sag.config import get_config
+from sag.docker_orch import dependency_cache, images
+from sag.docker_orch.archive import build_archive, is_regular_stat, iter_archive_members
+from sag.docker_orch.exec_agent import (
+    AGENT_COMMAND,
+    ContainerExecAgent,
+    DockerExecStream,
+    ExecAgentError,
+    ExecStats,
+)
 from sag.runtime.exec_env import DEFAULT_UTF8_ENVIRONMENT, default_utf8_environment
 
 ENV_OVERLAY_SCRIPT_PATH = "/workspace/.setup_agent/env_overlay.sh"
@@ -32,6 +42,13 @@ MAVEN_ENFORCER_VERSION_RANGE_MARKERS = (
     "Detected Maven Version:",
     "is not in the allowed range",
 )
+# First agent restart back-off after a failed start (doubles per failure).
+EXEC_AGENT_RETRY_SECONDS = 30.0
+EXEC_AGENT_MAX_START_FAILURES = 5
+# execute_batch keeps each generated script well under MAX_ARG_STRLEN (~128 KB),
+# since the whole script travels as one ``bash -c`` argument.
+BATCH_MAX_SCRIPT_CHARS = 60000
+BATCH_FRAME_OVERHEAD_CHARS = 200
 
 
 def _has_unknown_exit_failure_marker(output: str) -> bool:
@@ -45,6 +62,21 @@ def _has_unknown_exit_failure_marker(output: str) -> bool:
     )
 
 
+def _exec_output_size(output: Any) -> int:
+    """Byte size of an ``exec_run`` output (plain bytes or a demuxed pair)."""
+    if isinstance(output, tuple):
+        return sum(len(part) for part in output if part)
+    return len(output) if output else 0
+
+
+class _AgentExecResult:
+    """``exec_run``-shaped result for a command the exec agent ran."""
+
+    def __init__(self, exit_code: int, output: Any):
+        self.exit_code = exit_code
+        self.output = output
+
+
 class DockerOrchestrator:
     """Orchestrates Docker containers for project setup."""
 
@@ -52,6 +84,12 @@ class DockerOrchestrator:
         self.config = get_config()
         self.base_image = base_image or self.config.docker_base_image
         self.project_name = project_name
+        # Which image the container started from ("base", "snapshot" or
+        # "prebaked"); set by _resolve_start_image.
+        self._start_image_kind = "base"
+        # Serializes this orchestrator's exec-agent starts; other sessions'
+        # orchestrators start their helpers independently.
+        self._exec_agent_start_lock = threading.Lock()
 
         # Docker client
         try:
@@ -72,8 +110,12 @@ class DockerOrchestrator:
 
         logger.info(f"Docker Orchestrator initialized for project: {project_name}")
 
-    def create_and_start_container(self) -> bool:
-        """Create and start a new container for the project."""
+    def create_and_start_container(self, repository_url: Optional[str] = None) -> bool:
+        """Create and start a new container for the project.
+
+        ``repository_url`` lets a new container start from the toolchain
+        snapshot an earlier run of the same repository committed.
+        """
 
         if not self.project_name:
             raise ValueError("Project name is required to create container")
@@ -96,15 +138,16 @@ class DockerOrchestrator:
             if not self._ensure_image_available():
                 logger.error(f"Failed to ensure image {self.base_image} is available")
                 return False
+            image = self._resolve_start_image(repository_url)
 
             # Prepare container configuration
             container_config = self._get_container_config()
 
-            logger.info(f"Creating container {self.container_name} with image {self.base_image}")
+            logger.info(f"Creating container {self.container_name} with image {image}")
 
             # Create container
             container = self.client.containers.create(
-                image=self.base_image, name=self.container_name, **container_config
+                image=image, name=self.container_name, **container_config
             )
 
             # Start container
@@ -163,6 +206,7 @@ class DockerOrchestrator:
                 logger.info(f"Container {self.container_name} is not running")
                 return True
 
+            self.close_exec_agent()
             logger.info(f"Stopping container {self.container_name}")
             container.stop(timeout=30)
 
@@ -183,6 +227,11 @@ class DockerOrchestrator:
             success = True
 
             # Stop and remove container
+            self.close_exec_agent()
+            evidence = getattr(self, "_evidence_store", None)
+            if evidence is not None:
+                # The evidence directories go with the project.
+                evidence.reset()
             if self.container_exists():
                 container = self.client.containers.get(self.container_name)
 
@@ -288,6 +337,100 @@ class DockerOrchestrator:
         """Merge caller-provided env with SAG's safe UTF-8 execution defaults."""
         return default_utf8_environment(environment)
 
+    def _exec_stats(self) -> ExecStats:
+        stats = getattr(self, "_exec_stats_counters", None)
+        if stats is None:
+            stats = ExecStats()
+            self._exec_stats_counters = stats
+        return stats
+
+    def exec_stats(self) -> Dict[str, Any]:
+        """Per-transport latency/throughput counters for container requests."""
+        return self._exec_stats().snapshot()
+
+    def _exec_agent_enabled(self) -> bool:
+        return bool(getattr(getattr(self, "config", None), "exec_agent_enabled", False))
+
+    def get_exec_agent(self) -> Optional[ContainerExecAgent]:
+        """Return the live in-container exec agent, starting it on demand.
+
+        ``None`` means "use exec_run": the agent is disabled, the container is
+        not running, or a recent start failed (e.g. python3 not installed yet
+        during environment setup) and the back-off has not expired.
+        """
+        if not self._exec_agent_enabled():
+            return None
+        agent = getattr(self, "_exec_agent", None)
+        if agent is not None and agent.alive:
+            return agent
+        with self._exec_agent_start_lock:
+            agent = getattr(self, "_exec_agent", None)
+            if agent is not None and agent.alive:
+                return agent
+            failures = getattr(self, "_exec_agent_start_failures", 0)
+            if failures >= EXEC_AGENT_MAX_START_FAILURES:
+                return None
+            if time.monotonic() < getattr(self, "_exec_agent_retry_at", 0.0):
+                return None
+            try:
+                agent = self._start_exec_agent()
+            except Exception as e:
+                self._exec_agent_start_failures = failures + 1
+                self._exec_agent_retry_at = time.monotonic() + EXEC_AGENT_RETRY_SECONDS * (
+                    2**failures
+                )
+                logger.warning(f"Exec agent could not start, using docker exec per command: {e}")
+                return None
+            self._exec_agent = agent
+            self._exec_agent_start_failures = 0
+            return agent
+
+    def _start_exec_agent(self) -> Optional[ContainerExecAgent]:
+        container = self.client.containers.get(self.container_name)
+        if container.status != "running":
+            raise RuntimeError(f"container {self.container_name} is not running")
+        api = self.client.api
+        exec_id = api.exec_create(
+            container.id,
+            AGENT_COMMAND,
+            stdin=True,
+            stdout=True,
+            stderr=True,
+            tty=False,
+            environment=self._default_exec_environment(),
+        )["Id"]
+        sock = api.exec_start(exec_id, socket=True)
+        agent = ContainerExecAgent(DockerExecStream(sock), stats=self._exec_stats())
+        try:
+            agent.handshake()
+        except Exception:
+            agent.close()
+            raise
+        logger.info(f"Exec agent started in {self.container_name}")
+        return agent
+
+    def close_exec_agent(self) -> Dict[str, Any]:
+        """Stop the exec agent (if any) and return the final request counters."""
+        agent = getattr(self, "_exec_agent", None)
+        if agent is not None:
+            agent.close()
+            self._exec_agent = None
+        return self.exec_stats()
+
+    def _exec_via_agent(
+        self,
+        agent: ContainerExecAgent,
+        wrapped_command: str,
+        exec_env: Dict[str, str],
+        capture_stderr: bool,
+    ) -> _AgentExecResult:
+        exit_code, stdout, stderr = agent.run(
+            wrapped_command, environment=exec_env, merge_stderr=not capture_stderr
+        )
+        if capture_stderr:
+            return _AgentExecResult(exit_code, (stdout or None, stderr or None))
+        return _AgentExecResult(exit_code, stdout)
+
     def _is_json_content(self, output: str, command: str) -> bool:
         """
         检测是否为JSON内容，避免对JSON文件进行破坏性截断
@@ -513,17 +656,22 @@ class DockerOrchestrator:
         Returns:
             A dictionary with the result of the command execution.
         """
-        # Ensure container is running and get container object
-        if not self.is_container_running():
-            if not self.container_exists():
-                raise RuntimeError(
-                    f"Container {self.container_name} does not exist. Create it first."
-                )
-            if not self.start_container():
-                raise RuntimeError(f"Failed to start container {self.container_name}")
+        # A live exec agent proves the container is running (its stream dies
+        # with the container), so the two inspect round trips are skipped.
+        agent = self.get_exec_agent()
+        container = None
+        if agent is None:
+            # Ensure container is running and get container object
+            if not self.is_container_running():
+                if not self.container_exists():
+                    raise RuntimeError(
+                        f"Container {self.container_name} does not exist. Create it first."
+                    )
+                if not self.start_container():
+                    raise RuntimeError(f"Failed to start container {self.container_name}")
 
-        # Get the container object
-        container = self.client.containers.get(self.container_name)
+            # Get the container object
+            container = self.client.containers.get(self.container_name)
 
         # Build the command to be executed in the container with proper environment loading
         # Source profile to ensure all environment variables (JAVA_HOME, M2_HOME, PATH) are loaded
@@ -554,18 +702,42 @@ class DockerOrchestrator:
             # Prepare environment
             exec_env = self._default_exec_environment(environment)
 
-            # Execute the command with stderr capture
-            # Use demux to separate stdout and stderr when requested
-            # NOTE: We don't use Docker's workdir parameter here because we handle it
-            # explicitly with cd in the bash command for better reliability
-            result = container.exec_run(
-                exec_command,
-                workdir=None,  # Handled by cd command in bash
-                stderr=True,  # Explicitly capture stderr
-                stdout=True,  # Explicitly capture stdout
-                demux=capture_stderr,  # Separate stdout/stderr when True
-                environment=exec_env,
-            )
+            result = None
+            started = time.monotonic()
+            if agent is not None:
+                try:
+                    result = self._exec_via_agent(
+                        agent, wrapped_command, exec_env, capture_stderr
+                    )
+                except ExecAgentError as exc:
+                    if exc.dispatched:
+                        # The command may already have run; re-executing it
+                        # through exec_run could repeat its side effects.
+                        runner_dispatched = True
+                        raise
+                    logger.warning(f"Exec agent unavailable, falling back to docker exec: {exc}")
+                    container = self.client.containers.get(self.container_name)
+            if result is None:
+                # Execute the command with stderr capture
+                # Use demux to separate stdout and stderr when requested
+                # NOTE: We don't use Docker's workdir parameter here because we handle it
+                # explicitly with cd in the bash command for better reliability
+                result = container.exec_run(
+                    exec_command,
+                    workdir=None,  # Handled by cd command in bash
+                    stderr=True,  # Explicitly capture stderr
+                    stdout=True,  # Explicitly capture stdout
+                    demux=capture_stderr,  # Separate stdout/stderr when True
+                    environment=exec_env,
+                )
+                self._exec_stats().record(
+                    "exec_run",
+                    "exec",
+                    time.monotonic() - started,
+                    bytes_out=len(wrapped_command),
+                    bytes_in=_exec_output_size(result.output),
+                    ok=True,
+                )
             runner_dispatched = True
 
             # Handle output based on whether demux was used
@@ -586,104 +758,15 @@ class DockerOrchestrator:
                 stderr_str = ""
                 exit_code = result.exit_code
 
-            logger.debug(f"Command finished with exit code: {exit_code}")
-
-            # IMPROVED: Content-aware truncation logic
-            original_length = len(output)
-            if truncate_output and original_length > 10000:  # ~100 lines threshold
-                lines = output.split("\n")
-                if len(lines) > 100:
-                    # Check if this is JSON content that needs protection
-                    if self._is_json_content(output, command):
-                        # For JSON files, apply smart truncation that preserves validity
-                        output = self._smart_json_truncate(output, max_entries=10)
-                        logger.info(f"🔧 Applied JSON-aware truncation to preserve file integrity")
-                    # Check if this is XML/POM content that needs special handling
-                    elif self._is_xml_content(output, command):
-                        # For XML/POM files, apply smart truncation that preserves error-prone sections
-                        output = self._smart_xml_truncate(output, max_lines=150)
-                        logger.info(
-                            f"🔧 Applied XML-aware truncation to preserve error-prone sections"
-                        )
-                    else:
-                        # Apply normal truncation for non-JSON/XML content
-                        truncated = (
-                            "\n".join(lines[:25])
-                            + f"\n... [ORCHESTRATOR TRUNCATED: {len(lines)} lines, {original_length} chars] ...\n"
-                            + "\n".join(lines[-25:])
-                        )
-                        logger.warning(
-                            f"🚨 Orchestrator applied emergency truncation: {len(lines)} lines → 50 lines to prevent context pollution"
-                        )
-                        output = truncated
-
-            # Smart debug logging: show structure of truncated output
-            if (
-                original_length > 10000 and len(output.split("\n")) <= 60
-            ):  # If we applied truncation
-                # For truncated output, show the structure more clearly
-                output_lines = output.split("\n")
-                if len(output_lines) > 10:
-                    debug_display = (
-                        "\n".join(output_lines[:5])
-                        + f"\n... [Truncated output: showing first 5 + last 5 lines of {len(output_lines)} total] ...\n"
-                        + "\n".join(output_lines[-5:])
-                    )
-                else:
-                    debug_display = output
-                logger.debug(f"Command output (showing truncation structure):\n{debug_display}")
-            else:
-                # For normal output, use character limit
-                debug_output = output[:500] + "..." if len(output) > 500 else output
-                logger.debug(f"Command output (truncated for logs):\n{debug_output}")
-
-            # Enhanced success detection for build tools
-            # Check for explicit failure markers in addition to exit code
-            build_failed = False
-            if "mvn" in command or "maven" in command.lower():
-                # Maven-specific failure detection
-                if "BUILD FAILURE" in output or "[ERROR] BUILD FAILURE" in output:
-                    build_failed = True
-                    logger.warning("Maven BUILD FAILURE detected despite exit code")
-            elif "gradle" in command:
-                # Gradle-specific failure detection
-                if "BUILD FAILED" in output or "FAILURE: Build failed" in output:
-                    build_failed = True
-                    logger.warning("Gradle BUILD FAILED detected despite exit code")
-            elif "npm" in command:
-                # NPM-specific failure detection
-                if "npm ERR!" in output or "ERR!" in stderr_str:
-                    build_failed = True
-                    logger.warning("NPM error detected despite exit code")
-
-            timeout_exit_codes = {124, 137, 143}
-            timeout_terminated = (
-                timeout_seconds is not None
-                and timeout_seconds > 0
-                and exit_code in timeout_exit_codes
+            return self._command_result(
+                command,
+                output=output,
+                stdout_str=stdout_str,
+                stderr_str=stderr_str,
+                exit_code=exit_code,
+                timeout_seconds=timeout_seconds,
+                truncate_output=truncate_output,
             )
-            termination_reason = "absolute_timeout" if timeout_terminated else None
-            monitoring_info = {"execution_time": timeout_seconds} if timeout_terminated else None
-
-            # Determine final success status
-            success = (exit_code == 0) and not build_failed and not timeout_terminated
-
-            return {
-                "success": success,
-                "exit_code": exit_code,
-                "output": output,
-                "stdout": stdout_str,
-                "stderr": stderr_str,
-                "signal": None,  # Docker doesn't directly provide signal info
-                "build_failed": build_failed,  # Additional flag for build failures
-                "termination_reason": termination_reason,
-                "monitoring_info": monitoring_info,
-                "timeout": timeout_seconds if timeout_seconds and timeout_seconds > 0 else None,
-                # A returned command is not proof that Docker accepted it.
-                # This bit is set only after ``container.exec_run`` returned a
-                # real execution object and is propagated into runner receipts.
-                "runner_dispatched": True,
-            }
         except Exception as e:
             logger.error(f"Failed to execute command '{command}': {e}")
             return {
@@ -696,6 +779,329 @@ class DockerOrchestrator:
                 "runner_dispatched": runner_dispatched,
             }
 
+    def _command_result(
+        self,
+        command: str,
+        *,
+        output: str,
+        stdout_str: str,
+        stderr_str: str,
+        exit_code: Optional[int],
+        timeout_seconds: Optional[int],
+        truncate_output: bool,
+    ) -> Dict[str, Any]:
+        """Shape one finished command into the ``execute_command`` result dict."""
+        logger.debug(f"Command finished with exit code: {exit_code}")
+
+        # IMPROVED: Content-aware truncation logic
+        original_length = len(output)
+        if truncate_output and original_length > 10000:  # ~100 lines threshold
+            lines = output.split("\n")
+            if len(lines) > 100:
+                # Check if this is JSON content that needs protection
+                if self._is_json_content(output, command):
+                    # For JSON files, apply smart truncation that preserves validity
+                    output = self._smart_json_truncate(output, max_entries=10)
+                    logger.info(f"🔧 Applied JSON-aware truncation to preserve file integrity")
+                # Check if this is XML/POM content that needs special handling
+                elif self._is_xml_content(output, command):
+                    # For XML/POM files, apply smart truncation that preserves error-prone sections
+                    output = self._smart_xml_truncate(output, max_lines=150)
+                    logger.info(
+                        f"🔧 Applied XML-aware truncation to preserve error-prone sections"
+                    )
+                else:
+                    # Apply normal truncation for non-JSON/XML content
+                    truncated = (
+                        "\n".join(lines[:25])
+                        + f"\n... [ORCHESTRATOR TRUNCATED: {len(lines)} lines, {original_length} chars] ...\n"
+                        + "\n".join(lines[-25:])
+                    )
+                    logger.warning(
+                        f"🚨 Orchestrator applied emergency truncation: {len(lines)} lines → 50 lines to prevent context pollution"
+                    )
+                    output = truncated
+
+        # Smart debug logging: show structure of truncated output
+        if (
+            original_length > 10000 and len(output.split("\n")) <= 60
+        ):  # If we applied truncation
+            # For truncated output, show the structure more clearly
+            output_lines = output.split("\n")
+            if len(output_lines) > 10:
+                debug_display = (
+                    "\n".join(output_lines[:5])
+                    + f"\n... [Truncated output: showing first 5 + last 5 lines of {len(output_lines)} total] ...\n"
+                    + "\n".join(output_lines[-5:])
+                )
+            else:
+                debug_display = output
+            logger.debug(f"Command output (showing truncation structure):\n{debug_display}")
+        else:
+            # For normal output, use character limit
+            debug_output = output[:500] + "..." if len(output) > 500 else output
+            logger.debug(f"Command output (truncated for logs):\n{debug_output}")
+
+        # Enhanced success detection for build tools
+        # Check for explicit failure markers in addition to exit code
+        build_failed = False
+        if "mvn" in command or "maven" in command.lower():
+            # Maven-specific failure detection
+            if "BUILD FAILURE" in output or "[ERROR] BUILD FAILURE" in output:
+                build_failed = True
+                logger.warning("Maven BUILD FAILURE detected despite exit code")
+        elif "gradle" in command:
+            # Gradle-specific failure detection
+            if "BUILD FAILED" in output or "FAILURE: Build failed" in output:
+                build_failed = True
+                logger.warning("Gradle BUILD FAILED detected despite exit code")
+        elif "npm" in command:
+            # NPM-specific failure detection
+            if "npm ERR!" in output or "ERR!" in stderr_str:
+                build_failed = True
+                logger.warning("NPM error detected despite exit code")
+
+        timeout_exit_codes = {124, 137, 143}
+        timeout_terminated = (
+            timeout_seconds is not None
+            and timeout_seconds > 0
+            and exit_code in timeout_exit_codes
+        )
+        termination_reason = "absolute_timeout" if timeout_terminated else None
+        monitoring_info = {"execution_time": timeout_seconds} if timeout_terminated else None
+
+        # Determine final success status
+        success = (exit_code == 0) and not build_failed and not timeout_terminated
+
+        return {
+            "success": success,
+            "exit_code": exit_code,
+            "output": output,
+            "stdout": stdout_str,
+            "stderr": stderr_str,
+            "signal": None,  # Docker doesn't directly provide signal info
+            "build_failed": build_failed,  # Additional flag for build failures
+            "termination_reason": termination_reason,
+            "monitoring_info": monitoring_info,
+            "timeout": timeout_seconds if timeout_seconds and timeout_seconds > 0 else None,
+            # A returned command is not proof that Docker accepted it.
+            # This bit is set only after ``container.exec_run`` returned a
+            # real execution object and is propagated into runner receipts.
+            "runner_dispatched": True,
+        }
+
+    def execute_batch(
+        self,
+        commands: List[str],
+        workdir: Optional[str] = None,
+        environment: Optional[Dict[str, str]] = None,
+        timeout: Optional[int] = None,
+        truncate_output: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute many small, independent commands in as few execs as possible.
+
+        Each command runs in its own subshell (so ``cd``/``exit`` cannot leak
+        into the next one) between nonce sentinels written to BOTH stdout and
+        stderr; the sentinels keep every command's streams and exit code apart.
+        Scripts are chunked under the kernel's per-argument limit.
+
+        Returns:
+            One ``execute_command``-shaped dict per command, in input order. A
+            command whose end sentinel never arrived (the batch exec failed or
+            timed out) carries ``exit_code == -1`` and a ``dispatch_status``.
+        """
+        results: List[Dict[str, Any]] = []
+        for chunk in self._batch_chunks(list(commands)):
+            results.extend(
+                self._execute_batch_chunk(chunk, workdir, environment, timeout, truncate_output)
+            )
+        return results
+
+    @staticmethod
+    def _batch_chunks(commands: List[str]) -> List[List[str]]:
+        chunks: List[List[str]] = []
+        current: List[str] = []
+        size = 0
+        for command in commands:
+            cost = len(command) + BATCH_FRAME_OVERHEAD_CHARS
+            if current and size + cost > BATCH_MAX_SCRIPT_CHARS:
+                chunks.append(current)
+                current, size = [], 0
+            current.append(command)
+            size += cost
+        if current:
+            chunks.append(current)
+        return chunks
+
+    def _execute_batch_chunk(
+        self,
+        commands: List[str],
+        workdir: Optional[str],
+        environment: Optional[Dict[str, str]],
+        timeout: Optional[int],
+        truncate_output: bool,
+    ) -> List[Dict[str, Any]]:
+        nonce = uuid.uuid4().hex
+        lines = []
+        for index, command in enumerate(commands):
+            begin = shlex.quote(f"__SAG_BATCH_{nonce}_BEGIN_{index}__")
+            end = f"__SAG_BATCH_{nonce}_END_{index}__"
+            lines.append(
+                f"printf '%s\\n' {begin}; printf '%s\\n' {begin} >&2\n"
+                f"(\n{command}\n)\n"
+                f"printf '\\n%s %d\\n' {shlex.quote(end)} \"$?\"; "
+                f"printf '\\n%s\\n' {shlex.quote(end)} >&2"
+            )
+        batch = self.execute_command(
+            "\n".join(lines),
+            workdir=workdir,
+            environment=environment,
+            timeout=timeout,
+            truncate_output=False,
+        )
+        stdout = batch.get("stdout")
+        stderr = batch.get("stderr") or ""
+        if stdout is None:
+            stdout = batch.get("output") or ""
+
+        results = []
+        for index, command in enumerate(commands):
+            begin = f"__SAG_BATCH_{nonce}_BEGIN_{index}__"
+            end = f"__SAG_BATCH_{nonce}_END_{index}__"
+            framed = re.search(
+                re.escape(begin) + r"\n(.*?)\n" + re.escape(end) + r" (-?\d+)",
+                stdout,
+                re.DOTALL,
+            )
+            if framed is None:
+                if begin in stdout:
+                    status, dispatched = "execution_observation_failed", True
+                elif batch.get("dispatch_status"):
+                    # The batch exec itself failed; its status covers every command.
+                    status = batch["dispatch_status"]
+                    dispatched = bool(batch.get("runner_dispatched"))
+                else:
+                    # The batch ran but stopped (e.g. timed out) before this one.
+                    status, dispatched = "dispatch_failed", False
+                results.append(
+                    {
+                        "success": False,
+                        "exit_code": -1,
+                        "output": "" if dispatched else str(batch.get("output") or ""),
+                        "dispatch_status": status,
+                        "runner_dispatched": dispatched,
+                    }
+                )
+                continue
+            err = re.search(
+                re.escape(begin) + r"\n(.*?)\n" + re.escape(end), stderr, re.DOTALL
+            )
+            stdout_str = framed.group(1).strip()
+            stderr_str = err.group(1).strip() if err else ""
+            results.append(
+                self._command_result(
+                    command,
+                    output=(stdout_str + "\n" + stderr_str).strip() if stderr_str else stdout_str,
+                    stdout_str=stdout_str,
+                    stderr_str=stderr_str,
+                    exit_code=int(framed.group(2)),
+                    timeout_seconds=None,
+                    truncate_output=truncate_output,
+                )
+            )
+        return results
+
+    def iter_archive(
+        self, path: str, include: Optional[Callable[[str], bool]] = None
+    ) -> Iterator[Tuple[str, IO[bytes]]]:
+        """
+        Stream every regular file under ``path`` with ONE ``get_archive`` call.
+
+        Yields ``(absolute container path, file object)`` pairs; each file
+        object must be consumed before advancing. ``include`` filters on the
+        archive member name (relative to ``path``'s parent). Raises
+        ``FileNotFoundError`` when ``path`` does not exist.
+        """
+        try:
+            stream, _stat = self.client.api.get_archive(self.container_name, path)
+        except NotFound as e:
+            if "no such container" in str(e).lower():
+                raise
+            raise FileNotFoundError(path) from e
+        parent = posixpath.dirname(path.rstrip("/")) or "/"
+        for member, handle in iter_archive_members(stream, include):
+            yield posixpath.join(parent, member.name), handle
+
+    def read_archive(
+        self, path: str, include: Optional[Callable[[str], bool]] = None
+    ) -> Optional[Dict[str, bytes]]:
+        """Read a file or whole directory tree in one call; None when absent."""
+        try:
+            return {name: handle.read() for name, handle in self.iter_archive(path, include)}
+        except FileNotFoundError:
+            return None
+
+    def read_archive_file(self, path: str) -> Optional[bytes]:
+        """
+        Read one regular file's exact bytes in one call; None when absent.
+
+        Raises ``IsADirectoryError`` when ``path`` exists but is not a regular
+        file (directory, symlink, device) so callers fall back to a shell read
+        that follows symlinks instead of streaming a whole tree.
+        """
+        try:
+            stream, stat = self.client.api.get_archive(self.container_name, path)
+        except NotFound as e:
+            if "no such container" in str(e).lower():
+                raise
+            return None
+        if not is_regular_stat(stat):
+            close = getattr(stream, "close", None)
+            if callable(close):
+                close()
+            raise IsADirectoryError(path)
+        for _member, handle in iter_archive_members(stream):
+            return handle.read()
+        raise IsADirectoryError(path)
+
+    def write_archive(
+        self, files: Mapping[str, bytes], *, append: bool = False, mode: int = 0o644
+    ) -> bool:
+        """
+        Upload files with ONE ``put_archive`` call, then move them into place.
+
+        Every file lands under a unique temp name first; one batched exec then
+        renames each over its target (atomic per file) or, with ``append``,
+        appends it and removes the temp. Docker creates missing parent
+        directories. Raises when the upload itself fails (nothing was changed);
+        returns False when a finalize step failed.
+        """
+        if not files:
+            return True
+        nonce = uuid.uuid4().hex[:12]
+        staged = {path: f"{path}.sag-tmp-{nonce}" for path in files}
+        payload = build_archive(
+            {staged[path]: data for path, data in files.items()}, mode=mode
+        )
+        if not self.client.api.put_archive(self.container_name, "/", payload):
+            raise RuntimeError("put_archive was rejected")
+        if append:
+            finalize = [
+                f"cat {shlex.quote(tmp)} >> {shlex.quote(path)} && rm -f {shlex.quote(tmp)}"
+                for path, tmp in staged.items()
+            ]
+        else:
+            finalize = [
+                f"mv -f {shlex.quote(tmp)} {shlex.quote(path)}" for path, tmp in staged.items()
+            ]
+        results = self.execute_batch(finalize)
+        if all(result.get("exit_code") == 0 for result in results):
+            return True
+        logger.error(f"Archive write finalize failed for {len(files)} file(s)")
+        self.execute_batch([f"rm -f {shlex.quote(tmp)}" for tmp in staged.values()])
+        return False
+
     def execute_command_with_monitoring(
         self,
         command: str,
@@ -2026,9 +2432,46 @@ class DockerOrchestrator:
                 f"mkdir -p {self.config.workspace_path} && while true; do sleep 30; done",
             ],
         }
+        if self.config.shared_dependency_cache:
+            mount = dependency_cache.SHARED_CACHE_MOUNT
+            config["volumes"] = {
+                self.config.shared_dependency_cache_volume: {"bind": mount, "mode": "rw"}
+            }
+            config["environment"]["PIP_CACHE_DIR"] = f"{mount}/pip"
 
         return config
 
+    def _shared_cache_pass(self, mode: str) -> Optional[dependency_cache.CacheSummary]:
+        max_bytes = int(self.config.shared_dependency_cache_max_gb * 1024**3)
+        # The script resolves "~" as the user the exec runs as.
+        result = self.execute_command(
+            dependency_cache.cache_command(mode, max_bytes=max_bytes), workdir=None
+        )
+        summary = dependency_cache.parse_cache_summary(result.get("output") or "")
+        if summary is None:
+            logger.debug(f"shared dependency cache {mode} skipped: {result.get('output')}")
+        return summary
+
+    def seed_shared_dependencies(self) -> Optional[dependency_cache.CacheSummary]:
+        """Point this container's Maven and Gradle caches at the shared volume."""
+        summary = self._shared_cache_pass("seed")
+        if summary is not None:
+            logger.info(f"Linked {summary.seeded} shared Gradle files; Maven reads the volume")
+        return summary
+
+    def publish_shared_dependencies(self) -> Optional[dependency_cache.CacheSummary]:
+        """Publish this container's downloaded dependencies to the shared volume."""
+        if not self.config.shared_dependency_cache:
+            return None
+        summary = self._shared_cache_pass("publish")
+        if summary is not None:
+            logger.info(
+                f"Shared dependency cache: published {summary.published}, "
+                f"{summary.total_bytes / 1024**2:.1f} MiB in {summary.blobs} blobs, "
+                f"evicted {summary.evicted}"
+            )
+        return summary
+
     def _create_volume(self) -> bool:
         """Create a Docker volume for the project."""
 
@@ -2094,6 +2537,53 @@ class DockerOrchestrator:
             logger.error(f"Failed to pull image {self.base_image}: {e}")
             return False
 
+    def _resolve_start_image(self, repository_url: Optional[str]) -> str:
+        """The image a new container starts from: snapshot, pre-baked, or base.
+
+        Records which one in ``_start_image_kind`` so the environment setup can
+        skip the package installs the image already carries.
+        """
+        self._start_image_kind = "base"
+        if self.config.docker_toolchain_snapshots and repository_url:
+            snapshot = images.find_snapshot(self.client, repository_url)
+            if snapshot:
+                logger.info(f"Starting from toolchain snapshot {snapshot}")
+                self._start_image_kind = "snapshot"
+                return snapshot
+        if self.config.docker_prebaked_images:
+            prebaked = images.ensure_base_image(self.client, self.base_image)
+            if prebaked:
+                self._start_image_kind = "prebaked"
+                return prebaked
+        return self.base_image
+
+    def snapshot_provisioned_toolchain(self, repository_url: Optional[str]) -> Optional[str]:
+        """Commit the provisioned container, keyed by its resolved toolchain.
+
+        Called once the provision phase has advanced. Returns the snapshot tag,
+        or None when snapshots are disabled or the commit failed.
+        """
+        if not self.config.docker_toolchain_snapshots:
+            return None
+        probe = self.execute_command(images.TOOLCHAIN_PROBE, workdir=None)
+        toolchain = str(probe.get("output") or "").strip()
+        fingerprint = images.toolchain_fingerprint(toolchain) if probe.get("success") else None
+        if not fingerprint:
+            logger.debug("toolchain snapshot skipped: the toolchain probe failed")
+            return None
+        try:
+            container = self.client.containers.get(self.container_name)
+        except Exception as exc:
+            logger.debug(f"toolchain snapshot skipped: {exc}")
+            return None
+        return images.commit_snapshot(
+            self.client,
+            container,
+            fingerprint,
+            toolchain=toolchain,
+            repository=repository_url or "",
+        )
+
     def _wait_for_container_ready(self, timeout: int = 30) -> bool:
         """Wait for container to be ready."""
 
@@ -2120,6 +2610,41 @@ class DockerOrchestrator:
         )
         return False
 
+    def _install_essential_packages(self) -> bool:
+        """apt-get the essential toolchain; False only when Git cannot be installed."""
+        # Update package lists first
+        logger.info("📦 Updating package lists...")
+        update_result = self.execute_command("apt-get update -qq", workdir=None)
+        if not update_result["success"]:
+            logger.warning("⚠️ Package list update failed, continuing with cached lists")
+
+        # Install essential packages including Git - this prevents chain failure B
+        essential_packages = list(images.ESSENTIAL_PACKAGES)
+
+        install_command = f"apt-get install -y -qq {' '.join(essential_packages)}"
+        logger.info(f"📦 Installing essential packages: {' '.join(essential_packages)}")
+
+        install_result = self.execute_command(install_command, workdir=None)
+
+        if not install_result["success"]:
+            logger.error("❌ Essential package installation failed")
+            logger.error(f"Exit code: {install_result.get('exit_code', 'unknown')}")
+            logger.error(f"Output: {install_result.get('output', 'no output')}")
+
+            # Try to install Git separately as it's critical for the workflow
+            logger.info("🔧 Attempting to install Git separately...")
+            git_result = self.execute_command("apt-get install -y git", workdir=None)
+            if not git_result["success"]:
+                logger.error(
+                    "❌ CRITICAL: Git installation failed - this will cause chain failure B"
+                )
+                return False
+            else:
+                logger.info("✅ Git installed successfully as fallback")
+        else:
+            logger.info("✅ All essential packages installed successfully")
+        return True
+
     def _setup_container_environment(self) -> bool:
         """
         Setup the basic environment in the container.
@@ -2155,54 +2680,26 @@ class DockerOrchestrator:
                 else:
                     logger.info(f"✅ Workspace step {i+1} completed successfully")
 
-            # ★★ STEP 2: PRIORITY - Install Git and essential tools during initialization
-            logger.info("🔧 PRIORITY: Installing Git and essential tools")
-
-            # Update package lists first
-            logger.info("📦 Updating package lists...")
-            update_result = self.execute_command("apt-get update -qq", workdir=None)
-            if not update_result["success"]:
-                logger.warning("⚠️ Package list update failed, continuing with cached lists")
-
-            # Install essential packages including Git - this prevents chain failure B
-            essential_packages = [
-                "curl",
-                "wget",
-                "git",
-                "nano",
-                "vim",
-                "python3",
-                "python3-pip",
-                "nodejs",
-                "npm",
-                "build-essential",
-                "grep",
-                "findutils",
-                "less",
-            ]
-
-            install_command = f"apt-get install -y -qq {' '.join(essential_packages)}"
-            logger.info(f"📦 Installing essential packages: {' '.join(essential_packages)}")
-
-            install_result = self.execute_command(install_command, workdir=None)
-
-            if not install_result["success"]:
-                logger.error("❌ Essential package installation failed")
-                logger.error(f"Exit code: {install_result.get('exit_code', 'unknown')}")
-                logger.error(f"Output: {install_result.get('output', 'no output')}")
+            if self._start_image_kind == "snapshot":
+                # The snapshot's workspace is the previous run's; only its
+                # toolchain and build caches are meant to carry over.
+                self.execute_command(
+                    f"find {self.config.workspace_path} -mindepth 1"
+                    " ! -name .sag_workspace_marker -delete",
+                    workdir=None,
+                )
 
-                # Try to install Git separately as it's critical for the workflow
-                logger.info("🔧 Attempting to install Git separately...")
-                git_result = self.execute_command("apt-get install -y git", workdir=None)
-                if not git_result["success"]:
-                    logger.error(
-                        "❌ CRITICAL: Git installation failed - this will cause chain failure B"
-                    )
-                    return False
-                else:
-                    logger.info("✅ Git installed successfully as fallback")
+            # ★★ STEP 2: PRIORITY - Install Git and essential tools during initialization
+            if self._start_image_kind != "base":
+                logger.info(f"Essential tools are baked into the {self._start_image_kind} image")
             else:
-                logger.info("✅ All essential packages installed successfully")
+                logger.info("🔧 PRIORITY: Installing Git and essential tools")
+                if not self._install_essential_packages():
+                    return False
+
+            # The seed script runs on the python3 installed just above.
+            if self.config.shared_dependency_cache:
+                self.seed_shared_dependencies()
 
             # STEP 3: Verify critical tools are available and log versions
             verification_commands = [
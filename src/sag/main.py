@@ -17,6 +17,7 @@ from rich.text import Text
 
 from sag import __version__
 from sag.agent.agent import SetupAgent
+from sag.agent.branch_log import BRANCH_LOG_SUFFIX, merge_branch_log
 from sag.agent.context_journal import JOURNAL_DIR
 from sag.agent.history_state import HistoryActionState, decode_history_action_state
 from sag.agent.phase_machine import PHASE_NAMES
@@ -261,6 +262,14 @@ def _detect_coverage_build_system(orchestrator, project_dir: str):
         return None
 
 
+def _publish_shared_dependencies(orchestrator) -> None:
+    """Best-effort publish of the run's downloads to the shared dependency cache."""
+    try:
+        orchestrator.publish_shared_dependencies()
+    except Exception as exc:  # never propagate into the command's success/exit path
+        logger.warning(f"Shared dependency cache publish failed (ignored): {exc}")
+
+
 def _run_coverage_pass(orchestrator, project_name: str) -> bool:
     """Isolated, best-effort coverage pass AFTER the setup verdict is locked.
 
@@ -334,7 +343,11 @@ def cli(ctx, log_level, log_file, verbose, ui):
     ctx.obj["config"] = config
 
     # Display welcome message for main commands (skip in UI mode, will be shown by UIManager)
-    if ctx.invoked_subcommand not in ["list"] and not config.verbose and not config.ui_mode:
+    if (
+        ctx.invoked_subcommand not in ["list", "bench"]
+        and not config.verbose
+        and not config.ui_mode
+    ):
         console.print(
             Panel.fit(
                 "[bold blue]SAG[/bold blue] - [dim]Setup Agent[/dim]\n"
@@ -418,11 +431,18 @@ def list():
     "project_ref",
     help="Git ref to set up, such as a branch, tag, release tag, short commit, or full commit.",
 )
+@click.option(
+    "--shared-cache",
+    is_flag=True,
+    help="Mount the shared Maven/Gradle/pip dependency cache volume (see SAG_SHARED_DEP_CACHE)",
+)
 @click.pass_context
-def project(ctx, repo_url, name, goal, record, coverage, ui, project_ref):
+def project(ctx, repo_url, name, goal, record, coverage, ui, project_ref, shared_cache):
     """Initial setup for a new project from repository URL."""
 
     config = ctx.obj["config"]
+    if shared_cache:
+        config.shared_dependency_cache = True
 
     # Override ui_mode from command-line flag if provided
     if ui:
@@ -507,6 +527,7 @@ def project(ctx, repo_url, name, goal, record, coverage, ui, project_ref):
 
         if coverage:
             _run_coverage_pass(orchestrator, project_name)
+        _publish_shared_dependencies(orchestrator)
 
         # Only show completion messages in non-UI mode (UI manager handles this)
         if not config.ui_mode:
@@ -646,6 +667,7 @@ def run(ctx, docker_name, task, max_iterations, record, coverage, ui):
 
         if coverage:
             _run_coverage_pass(orchestrator, actual_project_name)
+        _publish_shared_dependencies(orchestrator)
 
         # Only show completion messages in non-UI mode (UI manager handles this)
         if not config.ui_mode:
@@ -722,6 +744,19 @@ def _coerce_entry_list(value) -> List[Any]:
         return []
 
 
+def _inspect_branch_history(snapshot_text: Optional[str], log_text: Optional[str]) -> List[Any]:
+    """Branch history entries: the phase snapshot plus its append-only event log."""
+    if not snapshot_text:
+        return []
+    try:
+        data = json.loads(snapshot_text)
+    except (json.JSONDecodeError, ValueError):
+        return []
+    if not isinstance(data, dict):
+        return []
+    return _coerce_entry_list(merge_branch_log(data, log_text)[0].get("history"))
+
+
 def _inspect_sorted_records(records) -> List[Dict[str, Any]]:
     """Journal records ordered by iteration (defensive: bad records sort last)."""
 
@@ -1120,14 +1155,9 @@ class _SessionInspectSource:
             return None
 
     def phase_history(self, phase: str) -> List[Any]:
-        text = self._read(f"phase_{phase}.json")
-        if not text:
-            return []
-        try:
-            data = json.loads(text)
-        except (json.JSONDecodeError, ValueError):
-            return []
-        return _coerce_entry_list(data.get("history") if isinstance(data, dict) else None)
+        return _inspect_branch_history(
+            self._read(f"phase_{phase}.json"), self._read(f"phase_{phase}{BRANCH_LOG_SUFFIX}")
+        )
 
     def full_output(self, ref: str) -> Optional[str]:
         if self._full_outputs is None:
@@ -1192,14 +1222,11 @@ class _ContainerInspectSource:
             return None
 
     def phase_history(self, phase: str) -> List[Any]:
-        text = self._run(f"cat {_CONTEXTS_DIR_IN_CONTAINER}/phase_{phase}.json 2>/dev/null")
-        if not text:
-            return []
-        try:
-            data = json.loads(text)
-        except (json.JSONDecodeError, ValueError):
-            return []
-        return _coerce_entry_list(data.get("history") if isinstance(data, dict) else None)
+        branch = f"{_CONTEXTS_DIR_IN_CONTAINER}/phase_{phase}"
+        return _inspect_branch_history(
+            self._run(f"cat {branch}.json 2>/dev/null"),
+            self._run(f"cat {branch}{BRANCH_LOG_SUFFIX} 2>/dev/null"),
+        )
 
     def full_output(self, ref: str) -> Optional[str]:
         if self._full_outputs is None:
@@ -1366,6 +1393,121 @@ def ui(host, port, demo):
     run_web_server(host=host, port=port, demo=demo)
 
 
+DEFAULT_BENCH_CORPUS = Path("tests") / "fixtures" / "control_layer"
+
+
+def _render_bench_report(report) -> Table:
+    table = Table(title=f"Control-layer replay ({report.latency_ms:g}ms simulated exec latency)")
+    table.add_column("transcript", overflow="fold")
+    table.add_column("component", overflow="fold")
+    table.add_column("calls", justify="right")
+    table.add_column("wall ms", justify="right")
+    table.add_column("blocks", justify="right")
+    table.add_column("round trips", justify="right")
+    for result in report.results:
+        for component, stats in result.components.items():
+            if not stats.calls and not stats.round_trips:
+                continue
+            table.add_row(
+                result.run_id,
+                component,
+                str(stats.calls),
+                f"{stats.wall_ms:.3f}",
+                str(stats.alloc_blocks),
+                str(stats.round_trips),
+            )
+        table.add_row(
+            result.run_id,
+            "[bold]total[/bold]",
+            "",
+            f"[bold]{result.total_wall_ms:.3f}[/bold]",
+            "",
+            f"[bold]{result.round_trips}[/bold]",
+            end_section=True,
+        )
+    return table
+
+
+@cli.command()
+@click.argument("paths", nargs=-1, type=click.Path(exists=True))
+@click.option("--iterations", default=5, show_default=True, type=int, help="Measured replays")
+@click.option("--warmup", default=1, show_default=True, type=int, help="Unmeasured replays first")
+@click.option(
+    "--latency-ms",
+    default=0.0,
+    show_default=True,
+    type=float,
+    help="Simulated latency of every container exec",
+)
+@click.option("--baseline", type=click.Path(exists=True), help="Fail on regressions against this")
+@click.option("--save-baseline", type=click.Path(), help="Write this run as a baseline")
+@click.option(
+    "--tolerance",
+    default=0.25,
+    show_default=True,
+    type=float,
+    help="Relative wall-time and allocation slack against the baseline",
+)
+@click.option("--json", "as_json", is_flag=True, help="Print the results as JSON")
+def bench(paths, iterations, warmup, latency_ms, baseline, save_baseline, tolerance, as_json):
+    """Benchmark the control layer offline by replaying recorded transcripts."""
+    from sag.agent.replay_bench import (
+        compare_to_baseline,
+        load_baseline,
+        report_to_baseline,
+        run_bench,
+    )
+    from sag.agent.replay_bench import save_baseline as write_baseline
+
+    if not paths:
+        if not DEFAULT_BENCH_CORPUS.is_dir():
+            console.print(
+                f"[bold red]❌ No transcripts given and no {DEFAULT_BENCH_CORPUS}[/bold red]"
+            )
+            sys.exit(1)
+        paths = (str(DEFAULT_BENCH_CORPUS),)
+    if iterations < 1:
+        console.print("[bold red]❌ --iterations must be at least 1[/bold red]")
+        sys.exit(1)
+    try:
+        recorded = load_baseline(baseline) if baseline else None
+    except ValueError as exc:
+        console.print(f"[bold red]❌ {exc}[/bold red]")
+        sys.exit(1)
+
+    report = run_bench(paths, iterations=iterations, warmup=warmup, latency_ms=latency_ms)
+    regressions = (
+        compare_to_baseline(report, recorded, tolerance=tolerance) if recorded is not None else []
+    )
+    if save_baseline:
+        write_baseline(report, save_baseline)
+
+    if as_json:
+        document = report_to_baseline(report)
+        document["skipped"] = [{"path": path, "reason": reason} for path, reason in report.skipped]
+        document["failures"] = [{"path": path, "error": error} for path, error in report.failures]
+        document["regressions"] = regressions
+        click.echo(json.dumps(document, indent=2, sort_keys=True))
+    else:
+        if report.results:
+            console.print(_render_bench_report(report))
+        for path, reason in report.skipped:
+            console.print(f"[dim]skipped {path}: {reason}[/dim]")
+        for path, error in report.failures:
+            console.print(f"[bold red]❌ {path} no longer replays: {error}[/bold red]")
+        for regression in regressions:
+            console.print(f"[bold red]❌ regression: {regression}[/bold red]")
+        if save_baseline:
+            console.print(f"[green]Baseline written to {save_baseline}[/green]")
+
+    if not report.results and not report.failures:
+        if not as_json:
+            console.print("[bold red]❌ No replay transcripts found[/bold red]")
+        sys.exit(1)
+    if report.failures or regressions:
+        sys.exit(1)
+
+
 @cli.command()
 def version():
     """Show SAG version information."""
@@ -10,7 +10,9 @@ from __future__ import annotations
 import base64
 import binascii
 import shlex
-from typing import Any, Mapping, Optional
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+from loguru import logger
 
 _PAYLOAD_MARKER = "__SAG_FILE_BASE64__"
 _MISSING_MARKER = "__SAG_FILE_MISSING__"
@@ -40,6 +42,29 @@ def command_did_not_run(result: Any) -> bool:
     )
 
 
+def execute_commands(orchestrator: Any, commands: Sequence[str]) -> List[Mapping[str, Any]]:
+    """Run independent probes through ``execute_batch`` when the orchestrator has it.
+
+    Production ``DockerOrchestrator`` answers the whole list in one exec per
+    chunk. Test doubles (and MagicMocks, whose attribute calls return mocks)
+    get the exact same command strings one ``execute_command`` at a time, so
+    substring-matching fakes keep working unchanged.
+    """
+    commands = list(commands)
+    if not commands:
+        return []
+    batch = getattr(orchestrator, "execute_batch", None)
+    if callable(batch):
+        results = batch(commands)
+        if (
+            isinstance(results, list)
+            and len(results) == len(commands)
+            and all(isinstance(result, Mapping) for result in results)
+        ):
+            return results
+    return [orchestrator.execute_command(command) for command in commands]
+
+
 def _execute_untruncated(orchestrator: Any, command: str) -> Mapping[str, Any]:
     """Use the production no-truncation API, with a narrow test-double fallback."""
     try:
@@ -56,6 +81,71 @@ def _execute_untruncated(orchestrator: Any, command: str) -> Mapping[str, Any]:
     return result
 
 
+def archive_orchestrator(orchestrator: Any) -> Any:
+    """Return ``orchestrator`` when it speaks Docker's tar transport, else None.
+
+    Only the production ``DockerOrchestrator`` moves files with
+    ``get_archive``/``put_archive``; every test double keeps the shell path.
+    """
+    from sag.docker_orch.orch import DockerOrchestrator
+
+    return orchestrator if isinstance(orchestrator, DockerOrchestrator) else None
+
+
+def _archive_read(orchestrator: Any, path: str) -> tuple[bool, Optional[bytes]]:
+    """One ``get_archive`` read: (handled, bytes-or-None-when-absent).
+
+    ``handled`` is False whenever the archive cannot answer authoritatively
+    (test double, symlink or directory, transport error); the caller then
+    keeps the shell read, whose semantics are the reference.
+    """
+    transport = archive_orchestrator(orchestrator)
+    if transport is None:
+        return False, None
+    try:
+        return True, transport.read_archive_file(path)
+    except Exception as exc:
+        logger.debug(f"archive read of {path} fell back to the shell: {exc}")
+        return False, None
+
+
+def read_container_tree(orchestrator: Any, path: str) -> Optional[Dict[str, bytes]]:
+    """Read every regular file under ``path`` (absolute path -> bytes).
+
+    Production moves the whole tree in one streamed ``get_archive``; doubles
+    get a ``find`` listing plus one exact read per file. ``None`` means the
+    path does not exist.
+    """
+    transport = archive_orchestrator(orchestrator)
+    if transport is not None:
+        try:
+            return transport.read_archive(path)
+        except Exception as exc:
+            logger.debug(f"archive tree read of {path} fell back to the shell: {exc}")
+
+    quoted = shlex.quote(path)
+    listing = _execute_untruncated(
+        orchestrator,
+        f"if test -e {quoted}; then find {quoted} -type f; else exit 44; fi",
+    )
+    if listing.get("exit_code") == 44:
+        return None
+    if not _command_succeeded(listing):
+        raise ContainerFileReadError(
+            f"container tree listing did not succeed for {path}: "
+            f"{str(listing.get('output') or '')[:120]}"
+        )
+    files: Dict[str, bytes] = {}
+    for file_path in str(listing.get("output") or "").splitlines():
+        file_path = file_path.strip()
+        if not file_path:
+            continue
+        text = read_container_text(orchestrator, file_path, exact_bytes=True)
+        if text is not None:
+            files[file_path] = text.encode("utf-8")
+    return files
+
+
 def _direct_read(
     orchestrator: Any, path: str, *, exact_bytes: bool = False
 ) -> tuple[bool, Optional[str]]:
@@ -111,11 +201,31 @@ def read_container_text(
     ``exact_bytes`` additionally preserves terminal newlines and every other
     UTF-8 byte via base64 transport.  It is required for transactional
     readback.  XML/JSON parsers normally need only the untruncated path.
+
+    Against the production orchestrator a regular file is read with one
+    ``get_archive`` call instead; symlinks, directories and transport errors
+    keep the shell path below.
     """
     handled, direct = _direct_read(orchestrator, path, exact_bytes=exact_bytes)
     if handled:
         return direct
 
+    # Production: one get_archive call instead of an exec + base64 round trip.
+    handled, raw = _archive_read(orchestrator, path)
+    if handled:
+        if raw is None:
+            return None
+        try:
+            text = raw.decode("utf-8")
+        except UnicodeDecodeError as exc:
+            if exact_bytes:
+                raise ContainerFileReadError(
+                    f"lossless container read returned invalid UTF-8 for {path}"
+                ) from exc
+            text = raw.decode("utf-8", errors="replace")
+        # The shell `cat` path is stripped by execute_command; keep that shape.
+        return text if exact_bytes else text.strip()
+
     # In-memory file maps are an explicit test-double API and preserve bytes.
     # Limit this shortcut to exact readback; parser tests still exercise the
     # production truncate_output=False call.
@@ -7,6 +7,7 @@ It ensures deduplication and enables meaningful comparison between what tests
 exist in code vs what actually ran.
 """
 
+import hashlib
 import json
 import re
 from dataclasses import dataclass, field
@@ -308,73 +309,84 @@ def merge_testcase_status(current: str, new: str) -> str:
     return new if severity.get(new, 0) > severity.get(current, 0) else current
 
 
-def build_java_test_catalog(project_path: str, docker_orchestrator) -> TestCaseCatalog:
-    """Build a catalog of Java test cases via static analysis.
+# Container directory holding the Java test scanner's per-file cache. Like the
+# compact report parser's cache it stays out of /workspace/.setup_agent (copied
+# into every session mirror) and is disposable: a missing or unreadable cache
+# only costs a rescan.
+TEST_CATALOG_CACHE_DIR = "/tmp/sag-test-catalog"
 
-    This function scans Java test files and extracts test methods with their
-    full context (package, class, method, file path). It handles:
-    - JUnit 4/5 @Test annotations
-    - TestNG @Test annotations
-    - Parameterized tests
-    - Test factories and templates
+# ProjectFileCache scan kind holding the last scan document of a project, so
+# the catalog and the annotation counters share one exec within a tool run.
+JAVA_TEST_SCAN = "java_tests"
 
-    Args:
-        project_path: Root directory of the Java project
-        docker_orchestrator: Docker orchestrator for command execution
+# In-container Java test scanner (executed via `python3 - <<'PY'`). The header
+# assignment (cache_path) and STATIC_SCAN_EXCLUSION_HELPER are prepended by
+# java_test_scan_command. Kept as a plain module string so the embedded script
+# needs no f-string brace escaping.
+#
+# One pass serves both consumers: every src/test tree is walked once, each
+# .java file yields its package, class, test methods (the catalog's scope is
+# src/test/java when it exists, else src/test) and its annotation counts (the
+# counters' scope is all of src/test). Per-file results persist between scans
+# keyed by (mtime_ns, size) and then by content sha1, so a rescan re-parses only
+# the files whose bytes changed; those are parsed by a fork pool when there are
+# enough of them.
+_JAVA_TEST_SCAN_BODY = r'''
+CACHE_VERSION = 1
+PARALLEL_MIN_FILES = 64
+COUNTED_ANNOTATIONS = (
+    'Test',
+    'ParameterizedTest',
+    'RepeatedTest',
+    'TestFactory',
+    'TestTemplate',
+    'DynamicTest',
+    'Disabled',
+)
+ANNOTATION_PATTERN = re.compile(r'@([A-Za-z_][A-Za-z0-9_]*)')
 
-    Returns:
-        TestCaseCatalog containing all discovered test cases
-    """
-    catalog = TestCaseCatalog()
 
-    if not docker_orchestrator:
-        logger.warning("No docker orchestrator available for test discovery")
-        return catalog
+def strip_comments(source):
+    source = re.sub(r'/\*.*?\*/', '', source, flags=re.S)
+    source = re.sub(r'//.*', '', source)
+    return source
 
-    try:
-        # Use the existing annotation counting script but enhance it to return full details
-        command = f"""cd {project_path} && python3 - <<'PY'
-import json
-import re
-from pathlib import Path
-
-{STATIC_SCAN_EXCLUSION_HELPER}
 
 def extract_package(content):
-    match = re.search(r'^package\\s+([a-zA-Z0-9_.]+);', content, re.MULTILINE)
+    match = re.search(r'^package\s+([a-zA-Z0-9_.]+);', content, re.MULTILINE)
     return match.group(1) if match else ''
 
+
 def extract_class_name(content, file_name):
     # Try to find public class first
-    match = re.search(r'public\\s+class\\s+([A-Za-z0-9_]+)', content)
+    match = re.search(r'public\s+class\s+([A-Za-z0-9_]+)', content)
     if match:
         return match.group(1)
     # Fall back to any class
-    match = re.search(r'class\\s+([A-Za-z0-9_]+)', content)
+    match = re.search(r'class\s+([A-Za-z0-9_]+)', content)
     if match:
         return match.group(1)
     # Use filename as last resort
     return Path(file_name).stem
 
+
 def extract_test_methods(content):
     # Find all @Test, @ParameterizedTest, @RepeatedTest, etc.
-    # Improved pattern to handle various test annotation styles and modifiers
     # Handles: @Test, @Test(...), annotations on separate lines, various method modifiers
     methods = []
 
     # Primary pattern for common test annotations
-    pattern = r'@(Test|ParameterizedTest|RepeatedTest|TestFactory|TestTemplate|DataProvider)(?:\\([^)]*\\))?\\s*(?:.*?\\s+)?(?:public\\s+)?(?:void\\s+)?([a-zA-Z0-9_]+)\\s*\\('
+    pattern = r'@(Test|ParameterizedTest|RepeatedTest|TestFactory|TestTemplate|DataProvider)(?:\([^)]*\))?\s*(?:.*?\s+)?(?:public\s+)?(?:void\s+)?([a-zA-Z0-9_]+)\s*\('
     matches = re.findall(pattern, content, re.DOTALL)
     methods.extend([method_name for _, method_name in matches])
 
     # Secondary pattern to catch tests where annotation is on a different line
-    # Look for public void methods that likely are tests (common test method pattern)
-    lines = content.split('\\n')
+    lines = content.split('\n')
     for i, line in enumerate(lines):
         if '@Test' in line or '@ParameterizedTest' in line or '@RepeatedTest' in line:
             # Look ahead for the method declaration (within next 5 lines)
             for j in range(i+1, min(i+6, len(lines))):
-                method_match = re.search(r'(?:public\\s+)?(?:void\\s+)?([a-zA-Z0-9_]+)\\s*\\(', lines[j])
+                method_match = re.search(r'(?:public\s+)?(?:void\s+)?([a-zA-Z0-9_]+)\s*\(', lines[j])
                 if method_match:
                     method_name = method_match.group(1)
                     if method_name not in methods and not method_name.startswith('set') and not method_name.startswith('get'):
@@ -382,7 +394,7 @@ def extract_test_methods(content):
                     break
 
     # Tertiary pattern for JUnit 3 style tests (methods starting with "test" and returning void)
-    junit3_pattern = r'public\\s+void\\s+(test[a-zA-Z0-9_]*)\\s*\\('
+    junit3_pattern = r'public\s+void\s+(test[a-zA-Z0-9_]*)\s*\('
     for match in re.finditer(junit3_pattern, content):
         method_name = match.group(1)
         if method_name not in methods:
@@ -398,101 +410,264 @@ def extract_test_methods(content):
 
     return unique_methods
 
+
+def scan_file(job):
+    """(path, sha1, result) for one source; result None when sha1 == known."""
+    path_text, known_digest = job
+    try:
+        data = Path(path_text).read_bytes()
+    except OSError:
+        return path_text, None, None
+    digest = hashlib.sha1(data).hexdigest()
+    if digest == known_digest:
+        return path_text, digest, None
+    try:
+        content = data.decode('utf-8')
+    except UnicodeDecodeError:
+        content = data.decode('latin-1')
+    # read_text()'s universal newlines, which the patterns were written against.
+    content = content.replace('\r\n', '\n').replace('\r', '\n')
+    counts = Counter(ANNOTATION_PATTERN.findall(strip_comments(content)))
+    return path_text, digest, {
+        'package': extract_package(content),
+        'class_name': extract_class_name(content, Path(path_text).name),
+        'methods': extract_test_methods(content),
+        'annotations': {name: counts[name] for name in COUNTED_ANNOTATIONS if counts.get(name)},
+    }
+
+
+def run_scans(jobs):
+    workers = min(8, os.cpu_count() or 1)
+    if len(jobs) >= PARALLEL_MIN_FILES and workers > 1:
+        try:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+
+            context = multiprocessing.get_context('fork')
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+                return list(pool.map(scan_file, jobs, chunksize=32))
+        except Exception:
+            pass
+    return [scan_file(job) for job in jobs]
+
+
 project_root = Path('.')
-test_cases = []
 
-# Find all test directories (env/vendor subtrees pruned at the walk level)
-test_dirs = []
+# Every src/test tree (env/vendor subtrees pruned at the walk level); the
+# catalog reads its java/ subtree when there is one.
+sources = []
 for candidate in project_root.rglob('src'):
     if candidate.name != 'src':
         continue
-    if is_excluded(candidate):
+    test_dir = candidate / 'test'
+    if not test_dir.is_dir() or is_excluded(test_dir):
         continue
-    test_dir = candidate / 'test' / 'java'
-    if not test_dir.is_dir():
-        test_dir = candidate / 'test'
-        if not test_dir.is_dir():
-            continue
-    if is_excluded(test_dir):
-        continue
-    test_dirs.append(test_dir)
-
-# Process each test file
-for test_dir in test_dirs:
+    java_dir = test_dir / 'java'
+    has_java_dir = java_dir.is_dir()
     for java_file in test_dir.rglob('*.java'):
         if is_excluded(java_file.parent):
             continue
+        in_catalog = not has_java_dir or java_dir in java_file.parents
+        sources.append((java_file, in_catalog))
 
-        # Determine module from path
-        module = None
-        parts = java_file.parts
-        if 'src' in parts:
-            src_idx = parts.index('src')
-            if src_idx > 0:
-                # Module is the directory containing src
-                module = parts[src_idx - 1]
-                if module == '.':
-                    module = None
+cache = {}
+if cache_path:
+    try:
+        loaded = json.loads(Path(cache_path).read_text())
+        if loaded.get('version') == CACHE_VERSION:
+            cache = loaded.get('entries') or {}
+    except Exception:
+        cache = {}
+
+entries = {}
+stat_keys = {}
+jobs = []
+for java_file, _ in sources:
+    path_text = str(java_file)
+    if path_text in entries or path_text in stat_keys:
+        continue
+    try:
+        stat = os.stat(path_text)
+        key = [stat.st_mtime_ns, stat.st_size]
+    except OSError:
+        key = None
+    cached = cache.get(path_text)
+    if key is not None and cached and cached.get('key') == key:
+        entries[path_text] = cached
+        continue
+    stat_keys[path_text] = key
+    jobs.append((path_text, cached.get('sha1') if cached else None))
 
+parsed_files = 0
+for path_text, digest, result in run_scans(jobs):
+    if digest is None:
+        continue
+    if result is not None:
+        parsed_files += 1
+    else:
+        result = cache[path_text]['result']
+    entries[path_text] = {'key': stat_keys[path_text], 'sha1': digest, 'result': result}
+
+test_cases = []
+annotations = Counter()
+for java_file, in_catalog in sources:
+    entry = entries.get(str(java_file))
+    if entry is None:
+        continue
+    result = entry['result']
+    annotations.update(result['annotations'])
+    if not in_catalog or not result['methods']:
+        continue
+
+    # Determine module from path
+    module = None
+    parts = java_file.parts
+    if 'src' in parts:
+        src_idx = parts.index('src')
+        if src_idx > 0:
+            # Module is the directory containing src
+            module = parts[src_idx - 1]
+            if module == '.':
+                module = None
+
+    file_path = str(java_file.relative_to(project_root))
+    for method in result['methods']:
+        test_cases.append({
+            'package': result['package'],
+            'class_name': result['class_name'],
+            'method_name': method,
+            'file_path': file_path,
+            'module': module
+        })
+
+if cache_path and (jobs or set(entries) != set(cache)):
+    try:
+        cache_file = Path(cache_path)
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        staged = cache_file.with_name(cache_file.name + '.tmp')
+        payload = {'version': CACHE_VERSION, 'entries': entries}
+        staged.write_text(json.dumps(payload, separators=(',', ':')))
+        os.replace(staged, cache_file)
+    except Exception:
+        pass
+
+print(json.dumps({
+    'test_cases': test_cases,
+    'total': len(test_cases),
+    'annotations': {name: annotations.get(name, 0) for name in COUNTED_ANNOTATIONS},
+    'parsed_files': parsed_files,
+}))
+'''
+
+
+def java_test_cache_path(project_path: str) -> str:
+    """The Java test scanner's per-file cache file for ``project_path``."""
+    digest = hashlib.sha1(project_path.rstrip("/").encode("utf-8")).hexdigest()[:16]
+    return f"{TEST_CATALOG_CACHE_DIR}/{digest}.json"
+
+
+def java_test_scan_command(project_path: str) -> str:
+    """The shell command that runs the Java test scanner over ``project_path``."""
+    return (
+        f"cd {project_path} && python3 - <<'PY'\n"
+        "import hashlib\nimport json\nimport os\nimport re\n"
+        "from collections import Counter\nfrom pathlib import Path\n"
+        f"cache_path = {json.dumps(java_test_cache_path(project_path))}\n"
+        f"{STATIC_SCAN_EXCLUSION_HELPER}\n"
+        f"{_JAVA_TEST_SCAN_BODY}PY"
+    )
+
+
+def scan_java_test_sources(project_path: str, docker_orchestrator) -> Optional[Dict[str, Any]]:
+    """Scan the project's Java test sources once; None when the scan failed.
+
+    Returns the scanner's document: ``test_cases`` (the catalog rows),
+    ``annotations`` (counts of the JUnit annotations across src/test) and
+    ``parsed_files`` (how many files were parsed rather than served from the
+    per-file cache). Within one tool run the document is kept on the
+    orchestrator's project-file cache, so the catalog and the annotation
+    counters share a single exec.
+    """
+    from sag.agent.project_files import project_files_for
+
+    files = project_files_for(docker_orchestrator)
+    if files is not None:
+        kept = files.scan(JAVA_TEST_SCAN, project_path)
+        if kept:
+            return json.loads(kept[0])
+
+    result = docker_orchestrator.execute_command(java_test_scan_command(project_path))
+    if not result.get("success"):
+        logger.warning(f"Failed to scan Java tests: {result.get('error', 'Unknown error')}")
+        return None
+
+    for line in reversed((result.get("output") or "").strip().splitlines()):
+        if not line.startswith("{"):
+            continue
         try:
-            content = java_file.read_text(encoding='utf-8')
-        except:
-            try:
-                content = java_file.read_text(encoding='latin-1')
-            except:
-                continue
-
-        package = extract_package(content)
-        class_name = extract_class_name(content, java_file.name)
-        methods = extract_test_methods(content)
-
-        if methods:
-            file_path = str(java_file.relative_to(project_root))
-            for method in methods:
-                test_cases.append({{
-                    'package': package,
-                    'class_name': class_name,
-                    'method_name': method,
-                    'file_path': file_path,
-                    'module': module
-                }})
-
-print(json.dumps({{'test_cases': test_cases, 'total': len(test_cases)}}))
-PY"""
-
-        result = docker_orchestrator.execute_command(command)
-        if not result.get("success"):
-            logger.warning(f"Failed to discover Java tests: {result.get('error', 'Unknown error')}")
+            document = json.loads(line)
+        except json.JSONDecodeError as e:
+            logger.warning(f"Failed to parse test discovery output: {e}")
+            return None
+        if not isinstance(document, dict):
+            return None
+        logger.debug(f"Java test scan parsed {document.get('parsed_files')} files")
+        if files is not None:
+            files.seed({}, {(JAVA_TEST_SCAN, project_path): [line]})
+        return document
+    logger.info("No Java test scan output")
+    return None
+
+
+def build_java_test_catalog(project_path: str, docker_orchestrator) -> TestCaseCatalog:
+    """Build a catalog of Java test cases via static analysis.
+
+    This function scans Java test files and extracts test methods with their
+    full context (package, class, method, file path). It handles:
+    - JUnit 4/5 @Test annotations
+    - TestNG @Test annotations
+    - Parameterized tests
+    - Test factories and templates
+
+    Args:
+        project_path: Root directory of the Java project
+        docker_orchestrator: Docker orchestrator for command execution
+
+    Returns:
+        TestCaseCatalog containing all discovered test cases
+    """
+    catalog = TestCaseCatalog()
+
+    if not docker_orchestrator:
+        logger.warning("No docker orchestrator available for test discovery")
+        return catalog
+
+    try:
+        document = scan_java_test_sources(project_path, docker_orchestrator)
+        if document is None:
             return catalog
 
-        output = result.get("output", "").strip()
-        if not output:
+        test_cases = document.get("test_cases") or []
+        if not test_cases:
             logger.info("No Java test cases found in project")
             return catalog
 
-        try:
-            data = json.loads(output.splitlines()[-1])
-            test_cases = data.get("test_cases", [])
-
-            for tc in test_cases:
-                descriptor = TestCaseDescriptor(
-                    package=tc.get("package", ""),
-                    class_name=tc.get("class_name", ""),
-                    method_name=tc.get("method_name", ""),
-                    file_path=tc.get("file_path", ""),
-                    module=tc.get("module"),
-                )
-                catalog.add(descriptor)
-
-            logger.info(f"📊 Built test catalog with {catalog.count()} test methods")
-
-            # Log module breakdown if multi-module
-            by_module = catalog.to_dict()["by_module"]
-            if by_module and len(by_module) > 1:
-                logger.info(f"   Multi-module breakdown: {by_module}")
-
-        except (json.JSONDecodeError, KeyError) as e:
-            logger.warning(f"Failed to parse test discovery output: {e}")
+        for tc in test_cases:
+            descriptor = TestCaseDescriptor(
+                package=tc.get("package", ""),
+                class_name=tc.get("class_name", ""),
+                method_name=tc.get("method_name", ""),
+                file_path=tc.get("file_path", ""),
+                module=tc.get("module"),
+            )
+            catalog.add(descriptor)
+
+        logger.info(f"📊 Built test catalog with {catalog.count()} test methods")
+
+        # Log module breakdown if multi-module
+        by_module = catalog.to_dict()["by_module"]
+        if by_module and len(by_module) > 1:
+            logger.info(f"   Multi-module breakdown: {by_module}")
 
     except Exception as e:
         logger.error(f"Error building Java test catalog: {e}")
@@ -0,0 +1,215 @@
+"""Single-pass harvesting of JUnit XML reports out of the managed container.
+
+The shell path reads a report set with one ``find`` per report directory and
+one ``cat`` per XML file; a Cassandra-sized reactor leaves thousands of
+surefire/failsafe/Gradle reports behind, so a single validator pass paid
+thousands of exec round trips. The harvester instead
+
+* lists every report with its mtime and size in ONE ``find -printf`` exec,
+* re-reads only the files whose ``(path, mtime, size)`` changed since the
+  previous harvest — the changed set is packed into one tar inside the
+  container and streamed out with ONE ``get_archive`` call,
+* hands each file to a caller-supplied parser, one member at a time, and keeps
+  the parsed result so later validator passes skip unchanged files entirely.
+
+Only the production ``DockerOrchestrator`` speaks the tar transport; for every
+other orchestrator :meth:`ReportHarvester.harvest` returns ``None`` and callers
+keep their shell ``find``/``cat`` path, whose semantics are the reference.
+"""
+
+from __future__ import annotations
+
+import posixpath
+import shlex
+import tarfile
+import uuid
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from loguru import logger
+
+from sag.runtime.container_io import archive_orchestrator, command_did_not_run
+
+# Where the changed-file list and the packed tar are staged inside the
+# container. Both are removed once the archive has been streamed out.
+HARVEST_STAGE_DIR = "/tmp"
+
+# `find -printf` is GNU-only (busybox lacks it); a failed capability probe
+# sends the caller back to its shell path instead of reporting "no reports".
+_PRINTF_UNSUPPORTED_EXIT = 45
+
+
+class ReportStat(NamedTuple):
+    """One listed report: absolute path plus the stat fields that key the cache."""
+
+    path: str
+    mtime: str
+    size: int
+
+
+ReportParser = Callable[[str, bytes], Any]
+
+
+class ReportHarvester:
+    """Incremental, transfer-batched reader for report files in one container.
+
+    Parsed results are cached per ``(kind, path)`` and reused while the file's
+    ``(mtime, size)`` is unchanged. ``kind`` names the parser, so two callers
+    that read the same XML for different facts never see each other's results.
+    Cached results are shared between passes: callers must not mutate them.
+    """
+
+    def __init__(self, orchestrator: Any):
+        self.orchestrator = orchestrator
+        self._cache: Dict[Tuple[str, str], Tuple[str, int, Any]] = {}
+
+    def available(self) -> bool:
+        """True when the orchestrator supports the exec + archive transport."""
+        return archive_orchestrator(self.orchestrator) is not None
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def list_reports(
+        self,
+        roots: Sequence[str],
+        *,
+        find_filter: str = "-name '*.xml'",
+        maxdepth: Optional[int] = None,
+    ) -> Optional[List[ReportStat]]:
+        """Stat every matching file under ``roots`` in one exec.
+
+        Paths are deduplicated in listing order, so nested roots (Gradle's
+        ``build/test-results`` and its ``test`` child) never list a file twice.
+        Returns ``None`` when the listing could not run.
+        """
+        if not roots:
+            return []
+        depth = f" -maxdepth {int(maxdepth)}" if maxdepth is not None else ""
+        quoted_roots = " ".join(shlex.quote(root) for root in roots)
+        command = (
+            f"find / -maxdepth 0 -printf '' 2>/dev/null || exit {_PRINTF_UNSUPPORTED_EXIT}; "
+            f"find {quoted_roots}{depth} -type f \\( {find_filter} \\) "
+            "-printf '%p\\t%T@\\t%s\\n' 2>/dev/null; true"
+        )
+        result = self.orchestrator.execute_command(command, truncate_output=False)
+        if command_did_not_run(result) or result.get("exit_code") != 0:
+            return None
+
+        seen = set()
+        stats: List[ReportStat] = []
+        for line in str(result.get("output") or "").splitlines():
+            path, _, rest = line.partition("\t")
+            mtime, _, size = rest.partition("\t")
+            if not path.startswith("/") or path in seen:
+                continue
+            try:
+                stats.append(ReportStat(path, mtime.strip(), int(size)))
+            except ValueError:
+                continue
+            seen.add(path)
+        return stats
+
+    def harvest(
+        self,
+        roots: Sequence[str],
+        parse: ReportParser,
+        *,
+        kind: str,
+        find_filter: str = "-name '*.xml'",
+        maxdepth: Optional[int] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Parse every report under ``roots``; unchanged files come from the cache.
+
+        ``parse(path, data)`` receives each changed file's bytes exactly once.
+        Returns ``{path: parsed}`` in listing order, omitting files that
+        vanished between listing and transfer, or ``None`` when this
+        orchestrator cannot harvest (the caller keeps its shell path).
+        """
+        if not self.available():
+            return None
+        try:
+            listing = self.list_reports(roots, find_filter=find_filter, maxdepth=maxdepth)
+        except Exception as exc:
+            logger.debug(f"report listing fell back to the shell: {exc}")
+            return None
+        if listing is None:
+            return None
+
+        changed = [
+            stat
+            for stat in listing
+            if self._cache.get((kind, stat.path), (None, None))[:2] != (stat.mtime, stat.size)
+        ]
+        if changed:
+            # A changed file that vanishes before the transfer must not keep
+            # answering from its previous contents.
+            for stat in changed:
+                self._cache.pop((kind, stat.path), None)
+            try:
+                fetched = self._fetch(changed, parse, kind)
+            except Exception as exc:
+                logger.debug(f"report archive transfer fell back to the shell: {exc}")
+                return None
+            if fetched is None:
+                return None
+
+        harvested: Dict[str, Any] = {}
+        for stat in listing:
+            entry = self._cache.get((kind, stat.path))
+            if entry is not None:
+                harvested[stat.path] = entry[2]
+        # Forget this parser's reports under the scanned roots that the listing
+        # no longer shows, so deleted reports do not linger for the session.
+        prefixes = tuple(root.rstrip("/") + "/" for root in roots)
+        listed = {stat.path for stat in listing}
+        for key in [
+            key
+            for key in self._cache
+            if key[0] == kind
+            and key[1] not in listed
+            and (key[1] in roots or key[1].startswith(prefixes))
+        ]:
+            del self._cache[key]
+        logger.debug(
+            f"Harvested {len(harvested)} report(s) for {kind}: "
+            f"{len(changed)} re-read, {len(listing) - len(changed)} cached"
+        )
+        return harvested
+
+    def _fetch(self, changed: List[ReportStat], parse: ReportParser, kind: str) -> Optional[int]:
+        """Pack ``changed`` into one tar in the container and parse it as it streams."""
+        transport = archive_orchestrator(self.orchestrator)
+        nonce = uuid.uuid4().hex[:12]
+        list_path = posixpath.join(HARVEST_STAGE_DIR, f"sag-harvest-{nonce}.list")
+        tar_path = posixpath.join(HARVEST_STAGE_DIR, f"sag-harvest-{nonce}.tar")
+        members = "\n".join(stat.path.lstrip("/") for stat in changed) + "\n"
+        if not transport.write_archive({list_path: members.encode("utf-8")}):
+            return None
+
+        # Files removed since the listing make tar exit nonzero; the archive
+        # still holds everything that was readable, so only its presence counts.
+        pack = transport.execute_command(
+            f"tar -cf {shlex.quote(tar_path)} -C / -T {shlex.quote(list_path)} 2>/dev/null; "
+            f"rm -f {shlex.quote(list_path)}; test -f {shlex.quote(tar_path)}"
+        )
+        try:
+            if pack.get("exit_code") != 0:
+                return None
+            expected = {stat.path: stat for stat in changed}
+            parsed_count = 0
+            for _name, packed in transport.iter_archive(tar_path):
+                with tarfile.open(fileobj=packed, mode="r|") as tar:
+                    for member in tar:
+                        if not member.isreg():
+                            continue
+                        path = "/" + member.name.lstrip("/")
+                        stat = expected.get(path)
+                        handle = tar.extractfile(member)
+                        if stat is None or handle is None:
+                            continue
+                        parsed = parse(path, handle.read())
+                        self._cache[(kind, path)] = (stat.mtime, stat.size, parsed)
+                        parsed_count += 1
+            return parsed_count
+        finally:
+            transport.execute_command(f"rm -f {shlex.quote(tar_path)}")
@@ -1324,7 +1324,14 @@ class BaseTool(ABC):
             # Validate parameters - will raise ToolError if invalid
             self._validate_parameters(kwargs)
 
-            result = self.execute(**kwargs)
+            try:
+                result = self.execute(**kwargs)
+            finally:
+                from sag.agent.project_files import invalidate_project_files
+
+                # Any tool may have written the project tree.
+                for attribute in ("docker_orchestrator", "orchestrator"):
+                    invalidate_project_files(getattr(self, attribute, None))
 
             # Apply output truncation if needed
             if result.succeeded and result.output:
@@ -304,6 +304,12 @@ class OutputSearchTool(BaseTool):
                 retryable=True,
             )
 
+        # The trigram index can rule every match out without loading the output.
+        if not self.storage_manager.may_contain(ref_id, grep_pattern):
+            return ToolResult.completed_success(
+                output=f"No matches found for pattern '{grep_pattern}' in {ref_id}"
+            )
+
         output = self.storage_manager.retrieve_output(ref_id)
         if not output:
             return ToolResult.completed_failure(
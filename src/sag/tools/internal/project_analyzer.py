@@ -21,6 +21,7 @@ from sag.agent.physical_survey import (
 from sag.agent.physical_survey import normalize_java_version as _normalize_java_version
 from sag.agent.physical_survey import path_exists as _path_exists
 from sag.agent.physical_survey import root_has_installable_package as _root_has_installable_package
+from sag.agent.survey_probe import survey_project
 from sag.project_fact_sheet import (
     project_analysis_error_metadata,
     project_fact_sheet_metadata,
@@ -356,6 +357,10 @@ class ProjectAnalyzerTool(BaseTool):
             "static_test_count": None,  # Add static test count field
         }
 
+        # Every scanner below reads the same build files, listings and module
+        # scans: collect them in one in-container pass.
+        survey_project(self.docker_orchestrator, project_path)
+
         # Step 1: 检测项目基本结构
         project_structure = self._analyze_project_structure(project_path)
         analysis.update(project_structure)
@@ -11,6 +11,8 @@ try:
 except ModuleNotFoundError:  # pragma: no cover - Python 3.10 compatibility
     import tomli as tomllib  # type: ignore[import-not-found,no-redef]
 
+from sag.agent.project_files import project_files_for
+
 SUPPORTED_PYTHONS = ["3.8", "3.9", "3.10", "3.11", "3.12", "3.13"]
 
 _PYPROJECT_RP = re.compile(r'requires-python\s*=\s*["\']([^"\']+)["\']')
@@ -501,6 +503,16 @@ def _import_normalized(name: str) -> str:
     return re.sub(r"[-.]+", "_", (name or "").strip().lower())
 
 
+def _config_text(orchestrator, path: str) -> str:
+    """One project config file's text ("" when absent), through the run's
+    project-file cache when the orchestrator has one."""
+    files = project_files_for(orchestrator)
+    if files is not None:
+        return files.read(path) or ""
+    result = orchestrator.execute_command(f"cat {path} 2>/dev/null")
+    return result.get("output") or ""
+
+
 def _declared_project_name(orchestrator, root: str) -> Optional[str]:
     """The declared project name from pyproject.toml, else setup.py."""
     readers = (
@@ -508,8 +520,7 @@ def _declared_project_name(orchestrator, root: str) -> Optional[str]:
         ("setup.py", project_name_from_setup_py),
     )
     for filename, parse in readers:
-        result = orchestrator.execute_command(f"cat {root}/{filename} 2>/dev/null")
-        name = parse(result.get("output") or "")
+        name = parse(_config_text(orchestrator, f"{root}/{filename}"))
         if name:
             return name
     return None
@@ -524,8 +535,7 @@ def _declared_package_dir(orchestrator, root: str) -> Optional[str]:
         ("pyproject.toml", package_dir_from_pyproject),
     )
     for name, parse in readers:
-        result = orchestrator.execute_command(f"cat {root}/{name} 2>/dev/null")
-        mapped = parse(result.get("output") or "")
+        mapped = parse(_config_text(orchestrator, f"{root}/{name}"))
         if mapped:
             mapped = mapped.strip().strip("/")
             if mapped and mapped != ".":
@@ -10,6 +10,7 @@ from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple
 
 from loguru import logger
 
+from sag.runtime.container_io import execute_commands
 from sag.runtime.env_overlay import EnvOverlayStore
 from sag.tools.internal.build_preflight import read_build_requirements
 
@@ -393,22 +394,25 @@ class ToolchainManager:
 
     def _registered_candidates(self, spec: ToolchainSpec) -> List[ToolExecutableCandidate]:
         registry = self._load_registry()
-        entries = registry.get(spec.name, {}).get(spec.executable, [])
-        candidates = []
-        for entry in entries:
-            path = entry.get("path")
-            if not path or not self._is_executable(path):
-                continue
-            candidates.append(
-                ToolExecutableCandidate(
-                    name=entry.get("name", spec.name),
-                    executable=entry.get("executable", spec.executable),
-                    path=path,
-                    version=entry.get("version") or self._probe_version(path),
-                    source="registered",
-                )
+        entries = [
+            entry
+            for entry in registry.get(spec.name, {}).get(spec.executable, [])
+            if entry.get("path")
+        ]
+        executable = self._are_executable([entry["path"] for entry in entries])
+        entries = [entry for entry, ok in zip(entries, executable) if ok]
+        unversioned = [entry["path"] for entry in entries if not entry.get("version")]
+        probed = dict(zip(unversioned, self._probe_versions(unversioned)))
+        return [
+            ToolExecutableCandidate(
+                name=entry.get("name", spec.name),
+                executable=entry.get("executable", spec.executable),
+                path=entry["path"],
+                version=entry.get("version") or probed.get(entry["path"]),
+                source="registered",
             )
-        return candidates
+            for entry in entries
+        ]
 
     def _env_overlay_snapshot(self) -> Optional[Dict[str, Any]]:
         if self.env_overlay is None:
@@ -516,12 +520,18 @@ class ToolchainManager:
         )
         if result.get("exit_code") != 0:
             return []
-        candidates = []
-        for path in (result.get("output") or "").splitlines():
-            path = path.strip()
-            if path and self._is_executable(path):
-                candidates.append(self._candidate_from_path(spec, path, source="standalone"))
-        return candidates
+        paths = [path.strip() for path in (result.get("output") or "").splitlines() if path.strip()]
+        paths = [path for path, ok in zip(paths, self._are_executable(paths)) if ok]
+        return [
+            ToolExecutableCandidate(
+                name=spec.name,
+                executable=spec.executable,
+                path=path,
+                version=version,
+                source="standalone",
+            )
+            for path, version in zip(paths, self._probe_versions(paths))
+        ]
 
     def _path_candidate(self, spec: ToolchainSpec) -> Optional[ToolExecutableCandidate]:
         result = self.orchestrator.execute_command(f"command -v {shlex.quote(spec.executable)}")
@@ -544,11 +554,24 @@ class ToolchainManager:
             source=source,
         )
 
+    @staticmethod
+    def _is_executable_command(path: str) -> str:
+        return f"test -x {shlex.quote(path)} && echo EXISTS || echo MISSING"
+
+    @staticmethod
+    def _exists_answer(result: Dict[str, Any]) -> bool:
+        return result.get("exit_code") == 0 and "EXISTS" in (result.get("output") or "")
+
     def _is_executable(self, path: str) -> bool:
-        result = self.orchestrator.execute_command(
-            f"test -x {shlex.quote(path)} && echo EXISTS || echo MISSING"
+        result = self.orchestrator.execute_command(self._is_executable_command(path))
+        return self._exists_answer(result)
+
+    def _are_executable(self, paths: Sequence[str]) -> List[bool]:
+        """``_is_executable`` for many paths in one batched round trip."""
+        results = execute_commands(
+            self.orchestrator, [self._is_executable_command(path) for path in paths]
         )
-        return result.get("exit_code") == 0 and "EXISTS" in (result.get("output") or "")
+        return [self._exists_answer(result) for result in results]
 
     def _is_file(self, path: str) -> bool:
         result = self.orchestrator.execute_command(
@@ -606,6 +629,16 @@ class ToolchainManager:
 
     def _probe_version(self, path: str) -> Optional[str]:
         result = self.orchestrator.execute_command(f"{shlex.quote(path)} -version")
+        return self._version_answer(result)
+
+    def _probe_versions(self, paths: Sequence[str]) -> List[Optional[str]]:
+        """``_probe_version`` for many paths in one batched round trip."""
+        results = execute_commands(
+            self.orchestrator, [f"{shlex.quote(path)} -version" for path in paths]
+        )
+        return [self._version_answer(result) for result in results]
+
+    def _version_answer(self, result: Dict[str, Any]) -> Optional[str]:
         if result.get("exit_code") != 0:
             return None
         return self._extract_version(result.get("output") or "")
@@ -7,13 +7,20 @@ accumulated branch-history JSON fail with ``exec /bin/bash: argument list too
 long``. This helper keeps the fast single-command heredoc for small content and
 streams large content as length-bounded base64 chunks. It only needs the
 orchestrator's ``execute_command`` so the same code works under the test fakes.
+
+Against the production ``DockerOrchestrator`` large content skips the chunk
+loop entirely: one ``put_archive`` upload plus one rename exec, whatever the
+size (see ``write_container_files`` for many files at once).
 """
 
 import base64
 import hashlib
+from typing import Mapping, Union
 
 from loguru import logger
 
+from sag.runtime.container_io import archive_orchestrator
+
 # Stay well under the kernel's per-arg limit (MAX_ARG_STRLEN ~= 131072).
 DEFAULT_MAX_CMD_CHARS = 60000
 
@@ -55,6 +62,15 @@ def write_container_text(
         logger.error(f"Failed to write container file {path}: {result.get('output')}")
         return False
 
+    transport = archive_orchestrator(orchestrator)
+    if transport is not None:
+        payload = (content + "\n").encode("utf-8", errors="replace")
+        try:
+            return _archive_write(transport, {path: payload}, append=append)
+        except Exception as exc:
+            # The upload never landed, so the shell path below is a clean retry.
+            logger.debug(f"Archive write of {path} fell back to chunks: {exc}")
+
     encoded = base64.b64encode(content.encode("utf-8", errors="replace")).decode("ascii")
     tmp = f"{path}.b64.{hashlib.md5(encoded.encode()).hexdigest()[:8]}.tmp"
 
@@ -77,3 +93,44 @@ def write_container_text(
     logger.error(f"Failed to finalize chunked write to {path}")
     orchestrator.execute_command(f"rm -f {tmp}")
     return False
+
+
+def _archive_write(transport, files: Mapping[str, bytes], *, append: bool) -> bool:
+    if transport.write_archive(files, append=append):
+        return True
+    logger.error(f"Failed to finalize archive write of {', '.join(files)}")
+    return False
+
+
+def write_container_files(
+    orchestrator,
+    files: Mapping[str, Union[str, bytes]],
+    *,
+    append: bool = False,
+) -> bool:
+    """Write many container files at once (trusted internal paths).
+
+    Production uploads every file in ONE ``put_archive`` call and moves each
+    into place atomically (or appends it). Bytes are written verbatim; text
+    gets the same trailing newline ``write_container_text`` adds. Test doubles
+    fall back to one ``write_container_text`` per text file.
+    """
+    payloads = {
+        path: data if isinstance(data, bytes) else (data + "\n").encode("utf-8", errors="replace")
+        for path, data in files.items()
+    }
+    transport = archive_orchestrator(orchestrator)
+    if transport is not None:
+        try:
+            return _archive_write(transport, payloads, append=append)
+        except Exception as exc:
+            logger.debug(f"Archive write of {len(payloads)} file(s) fell back to the shell: {exc}")
+
+    ok = True
+    for path, data in files.items():
+        if isinstance(data, bytes):
+            text = data.decode("utf-8", errors="replace").rstrip("\n")
+        else:
+            text = data
+        ok = write_container_text(orchestrator, path, text, append=append) and ok
+    return ok
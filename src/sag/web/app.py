@@ -5,17 +5,18 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import json
-from collections.abc import Iterator
+from collections.abc import AsyncIterator
 from pathlib import Path
 from typing import Any
 
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
 from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 
 from loguru import logger
 
 from sag import __version__
+from sag.web.dashboard_stream import KEEPALIVE_SECONDS, DashboardBroadcaster
 from sag.web.launch_queue import WorkspaceBusyError
 from sag.web.launch_service import LaunchBatchRequest, LaunchService, LaunchValidationError
 from sag.web.read_model import ReadModelBuilder
@@ -24,9 +25,36 @@ from sag.web.terminal import TerminalAdapter, close_socket, recv_socket, send_so
 from sag.web.workspace_service import WorkspaceDeletionError, WorkspaceService
 
 
-def _single_snapshot(payload: dict) -> Iterator[str]:
-    yield "event: snapshot\n"
-    yield f"data: {json.dumps(payload)}\n\n"
+# How long one wait for the next stream message lasts before the stream checks
+# whether its client is still there.
+_STREAM_POLL_SECONDS = 1.0
+
+
+def _sse(event: str, version: int, data: Any) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\nid: {version}\n\n"
+
+
+async def _dashboard_events(
+    broadcaster: DashboardBroadcaster, request: Request
+) -> AsyncIterator[str]:
+    """A snapshot, then one ``patch`` event per change, for as long as the client stays."""
+    loop = asyncio.get_running_loop()
+    subscription, snapshot = await asyncio.to_thread(broadcaster.subscribe, loop)
+    try:
+        yield _sse(*snapshot)
+        idle = 0.0
+        while not await request.is_disconnected():
+            message = await subscription.next(_STREAM_POLL_SECONDS)
+            if message is not None:
+                idle = 0.0
+                yield _sse(*message)
+                continue
+            idle += _STREAM_POLL_SECONDS
+            if idle >= KEEPALIVE_SECONDS:
+                idle = 0.0
+                yield ": keepalive\n\n"
+    finally:
+        subscription.close()
 
 
 def create_app(
@@ -36,12 +64,16 @@ def create_app(
     static_dir: Path | None = None,
     launch_service: LaunchService | None = None,
     workspace_service: WorkspaceService | None = None,
+    dashboard_stream: DashboardBroadcaster | None = None,
 ) -> FastAPI:
     builder = read_model if read_model is not None else ReadModelBuilder()
     runner = task_runner if task_runner is not None else TaskRunner()
     terminal_bridge = terminal_adapter if terminal_adapter is not None else TerminalAdapter()
     owns_terminal_bridge = terminal_adapter is None
     launches = launch_service if launch_service is not None else LaunchService()
+    broadcaster = (
+        dashboard_stream if dashboard_stream is not None else DashboardBroadcaster(builder)
+    )
     # Share the launch service's store/DB so queue cleanup and launch state stay
     # consistent; a fake launch service without a store falls back to the default.
     workspaces = (
@@ -79,12 +111,14 @@ def create_app(
 
     @app.post("/api/workspaces/{workspace_id}/tasks", status_code=202)
     def submit_task(workspace_id: str, request: TaskRequest) -> dict:
-        return runner.submit(workspace_id, request)
+        accepted = runner.submit(workspace_id, request)
+        broadcaster.mark_dirty()
+        return accepted
 
     @app.delete("/api/workspaces/{workspace_id}")
     def delete_workspace(workspace_id: str) -> dict:
         try:
-            return workspaces.delete_workspace(workspace_id)
+            deleted = workspaces.delete_workspace(workspace_id)
         except WorkspaceBusyError as exc:
             raise HTTPException(status_code=409, detail=str(exc)) from exc
         except WorkspaceDeletionError as exc:
@@ -92,6 +126,8 @@ def create_app(
             # Surface a meaningful detail (not an opaque 500) so the client can
             # keep the dialog open and tell the user what to retry.
             raise HTTPException(status_code=502, detail=str(exc)) from exc
+        broadcaster.mark_dirty()
+        return deleted
 
     @app.post("/api/project-launches/batch")
     def submit_project_batch(request: LaunchBatchRequest) -> JSONResponse:
@@ -120,11 +156,11 @@ def create_app(
         return detail.model_dump(mode="json", by_alias=True)
 
     @app.get("/api/stream/dashboard")
-    def stream_dashboard() -> StreamingResponse:
-        payload = builder.dashboard().model_dump(mode="json", by_alias=True)
+    def stream_dashboard(request: Request) -> StreamingResponse:
         return StreamingResponse(
-            _single_snapshot(payload),
+            _dashboard_events(broadcaster, request),
             media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache"},
         )
 
     @app.websocket("/api/workspaces/{workspace_id}/terminal")
@@ -7,6 +7,7 @@ import re
 from pathlib import Path
 from typing import Any
 
+from sag.agent.branch_log import BRANCH_LOG_SUFFIX, merge_branch_log
 from sag.agent.history_state import HistoryActionState, decode_history_action_state
 
 from sag.web.models import (
@@ -87,7 +88,7 @@ class ContextTraceBuilder:
         phase_id = str(item.get("id") or f"phase_{index}")
         name = phase_id.removeprefix("phase_")
         title = str(item.get("description") or item.get("title") or item.get("task") or name)
-        branch_data = self._read_json(self._phase_path(phase_id))
+        branch_data = self._branch_data(phase_id)
         journal_records = self._journal_records(name)
         history = self._history_entries(branch_data)
         task = self._task(
@@ -131,6 +132,16 @@ class ContextTraceBuilder:
     def _phase_path(self, phase_id: str) -> Path:
         return self.contexts_dir / f"{phase_id}.json"
 
+    def _branch_data(self, phase_id: str) -> dict[str, Any]:
+        """The branch snapshot with its append-only event log folded in."""
+        try:
+            log_text = (self.contexts_dir / f"{phase_id}{BRANCH_LOG_SUFFIX}").read_text(
+                encoding="utf-8"
+            )
+        except OSError:
+            log_text = None
+        return merge_branch_log(self._read_json(self._phase_path(phase_id)), log_text)[0]
+
     def _journal_path(self, phase_name: str) -> Path:
         return self.contexts_dir / "journal" / f"phase_{phase_name}.journal.jsonl"
 
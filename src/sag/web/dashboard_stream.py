@@ -0,0 +1,332 @@
+"""One shared producer for the live dashboard stream.
+
+The Workbench used to poll ``/api/workspaces`` every 5s per open tab, and each
+poll listed every container and re-read every workspace's session index, so
+dashboard cost grew with clients x poll rate x workspaces. A single
+``DashboardBroadcaster`` now rebuilds the dashboard only when something may
+have changed, diffs it against the last one, and fans the JSON-patch delta out
+to every subscriber:
+
+* Docker container events (create, start, die, destroy, rename, ...) for
+  ``sag-`` containers trigger a rebuild immediately. With the shared
+  ``CachedWorkspaceRegistry`` the producer listens to the registry, which
+  already follows the event stream, instead of opening a second one.
+* While any workspace is running its session mirror refreshes every
+  ``RUNNING_TTL_SECONDS``, so the producer rebuilds on that cadence too and a
+  changed session index reaches the UI within one mirror refresh.
+* A slow ``IDLE_REFRESH_SECONDS`` rebuild covers events the daemon dropped.
+
+Rebuilds that change nothing send nothing. The producer runs only while at
+least one client is connected. A subscription bound to an event loop (the SSE
+endpoint's) is fed on that loop with ``call_soon_threadsafe``, so a connected
+client awaits its next message without holding a worker thread.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import queue
+import threading
+from typing import Any, Callable
+
+from loguru import logger
+
+from sag.web.read_model import ReadModelBuilder
+from sag.web.session_mirror import RUNNING_TTL_SECONDS
+
+IDLE_REFRESH_SECONDS = 60.0
+KEEPALIVE_SECONDS = 15.0
+# A subscriber this far behind is resynced with a fresh snapshot instead.
+SUBSCRIBER_BACKLOG = 64
+
+
+def json_patch(old: Any, new: Any, path: str = "") -> list[dict[str, Any]]:
+    """RFC 6902 operations that turn ``old`` into ``new``.
+
+    Objects are diffed key by key and equal-length lists index by index; a list
+    that changed length is replaced whole (the dashboard's lists are short and
+    reorder rarely, so a positional diff would not be smaller).
+    """
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops: list[dict[str, Any]] = []
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+        for key, value in new.items():
+            child = f"{path}/{_escape(key)}"
+            if key not in old:
+                ops.append({"op": "add", "path": child, "value": value})
+            else:
+                ops.extend(json_patch(old[key], value, child))
+        return ops
+    if isinstance(old, list) and isinstance(new, list) and len(old) == len(new):
+        ops = []
+        for index, (before, after) in enumerate(zip(old, new)):
+            ops.extend(json_patch(before, after, f"{path}/{index}"))
+        return ops
+    if type(old) is type(new) and old == new:
+        return []
+    return [{"op": "replace", "path": path, "value": new}]
+
+
+def apply_patch(document: Any, ops: list[dict[str, Any]]) -> Any:
+    """Apply the operations ``json_patch`` emits (add/remove/replace) to a copy."""
+    document = json.loads(json.dumps(document))
+    for op in ops:
+        if op["path"] == "":
+            document = op.get("value")
+            continue
+        *parents, last = [_unescape(part) for part in op["path"].split("/")[1:]]
+        target = document
+        for part in parents:
+            target = target[int(part)] if isinstance(target, list) else target[part]
+        key: Any = int(last) if isinstance(target, list) else last
+        if op["op"] == "remove":
+            del target[key]
+        else:
+            target[key] = op["value"]
+    return document
+
+
+def _escape(key: str) -> str:
+    return str(key).replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(part: str) -> str:
+    return part.replace("~1", "/").replace("~0", "~")
+
+
+Message = tuple[str, int, Any]
+
+
+class DashboardSubscription:
+    """One connected client's queue of ``(event, version, data)`` messages.
+
+    ``snapshot`` carries the whole dashboard, ``patch`` the operations that
+    take version ``n - 1`` to ``n``. Without a loop, messages are read with
+    ``get``; bound to ``loop``, they are awaited with ``next`` on that loop.
+    """
+
+    def __init__(
+        self, broadcaster: DashboardBroadcaster, loop: asyncio.AbstractEventLoop | None = None
+    ):
+        self._broadcaster = broadcaster
+        self._loop = loop
+        self._queue: queue.Queue[Message] = queue.Queue(SUBSCRIBER_BACKLOG)
+        self._async_queue: asyncio.Queue[Message] | None = (
+            asyncio.Queue(SUBSCRIBER_BACKLOG) if loop is not None else None
+        )
+
+    def get(self, timeout: float | None = None) -> Message | None:
+        """The next message, or None when nothing arrived within ``timeout``."""
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    async def next(self, timeout: float | None = None) -> Message | None:
+        """``get`` for a loop-bound subscription, awaited on its loop."""
+        if self._async_queue is None:
+            raise RuntimeError("subscription is not bound to an event loop")
+        try:
+            return await asyncio.wait_for(self._async_queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self) -> None:
+        self._broadcaster.unsubscribe(self)
+
+    def _put(self, message: Message, snapshot: dict[str, Any]) -> None:
+        if self._loop is None:
+            _offer(self._queue, message, snapshot)
+            return
+        try:
+            self._loop.call_soon_threadsafe(_offer, self._async_queue, message, snapshot)
+        except RuntimeError:
+            pass  # the loop is closed: the client is gone and unsubscribes itself
+
+
+def _offer(target: Any, message: Message, snapshot: dict[str, Any]) -> None:
+    """Queue ``message``, or resync a subscriber too far behind with ``snapshot``."""
+    try:
+        target.put_nowait(message)
+    except (queue.Full, asyncio.QueueFull):
+        # Too far behind to catch up patch by patch: start over from the
+        # current state.
+        while True:
+            try:
+                target.get_nowait()
+            except (queue.Empty, asyncio.QueueEmpty):
+                break
+        target.put_nowait(("snapshot", message[1], snapshot))
+
+
+class DashboardBroadcaster:
+    """Rebuilds the dashboard on change and fans deltas out to subscribers."""
+
+    def __init__(
+        self,
+        builder: ReadModelBuilder,
+        events: Callable[[], Any] | None = None,
+        running_refresh: float = RUNNING_TTL_SECONDS,
+        idle_refresh: float = IDLE_REFRESH_SECONDS,
+    ):
+        self.builder = builder
+        self._events = events if events is not None else self._docker_events
+        self.running_refresh = running_refresh
+        self.idle_refresh = idle_refresh
+        self._lock = threading.Lock()
+        self._subscribers: list[DashboardSubscription] = []
+        self._snapshot: dict[str, Any] | None = None
+        self._version = 0
+        self._dirty = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.rebuilds = 0
+
+    def subscribe(
+        self, loop: asyncio.AbstractEventLoop | None = None
+    ) -> tuple[DashboardSubscription, Message]:
+        """A new subscription and the snapshot message its patches apply to.
+
+        With ``loop``, the subscription's messages are delivered on that loop.
+        """
+        subscription = DashboardSubscription(self, loop)
+        with self._lock:
+            if self._snapshot is None:
+                self._snapshot = self._build()
+            self._subscribers.append(subscription)
+            snapshot = ("snapshot", self._version, self._snapshot)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._produce, daemon=True, name="sag-dashboard-stream"
+                )
+                self._thread.start()
+        return subscription, snapshot
+
+    def unsubscribe(self, subscription: DashboardSubscription) -> None:
+        with self._lock:
+            if subscription in self._subscribers:
+                self._subscribers.remove(subscription)
+            idle = not self._subscribers
+        if idle:
+            # Wake the producer so it notices and exits.
+            self._dirty.set()
+
+    def mark_dirty(self) -> None:
+        """Rebuild now (a task was submitted, a workspace deleted, ...)."""
+        self._dirty.set()
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def refresh(self) -> bool:
+        """Rebuild once and publish the delta; True when anything changed."""
+        current = self._build()
+        with self._lock:
+            previous = self._snapshot
+            self._snapshot = current
+            ops = json_patch(previous, current) if previous is not None else []
+            if not ops:
+                return False
+            self._version += 1
+            message = ("patch", self._version, ops)
+            for subscription in list(self._subscribers):
+                subscription._put(message, current)
+        return True
+
+    def _build(self) -> dict[str, Any]:
+        self.rebuilds += 1
+        return self.builder.dashboard().model_dump(mode="json", by_alias=True)
+
+    def _interval(self) -> float:
+        snapshot = self._snapshot or {}
+        running = any(
+            str((workspace.get("docker") or {}).get("status", "")).lower() == "running"
+            for workspace in snapshot.get("workspaces") or []
+        )
+        return self.running_refresh if running else self.idle_refresh
+
+    def _produce(self) -> None:
+        stopped = threading.Event()
+        # This generation's event stream only: a producer started after this
+        # one returns owns its own, which this one must not close.
+        opened: list[Any] = []
+        registry = self.builder.workspace_registry
+        listening = self._events == self._docker_events and hasattr(registry, "add_listener")
+        if listening:
+            registry.add_listener(self.mark_dirty)
+        else:
+            threading.Thread(
+                target=self._watch_events,
+                args=(stopped, opened),
+                daemon=True,
+                name="sag-docker-events",
+            ).start()
+        try:
+            while True:
+                self._dirty.wait(self._interval())
+                self._dirty.clear()
+                with self._lock:
+                    if not self._subscribers:
+                        # Nobody is watching: drop the cached state so the next
+                        # subscriber starts from a fresh build.
+                        self._snapshot = None
+                        self._thread = None
+                        return
+                try:
+                    self.refresh()
+                except Exception:
+                    logger.exception("Dashboard stream refresh failed")
+        finally:
+            stopped.set()
+            if listening:
+                registry.remove_listener(self.mark_dirty)
+            for stream in list(opened):
+                _close(stream)
+
+    def _watch_events(self, stopped: threading.Event, opened: list[Any]) -> None:
+        try:
+            stream = self._events()
+            if stream is None:
+                return
+            opened.append(stream)
+            if stopped.is_set():
+                # The producer finished while the stream was opening.
+                _close(stream)
+                return
+            for event in stream:
+                if stopped.is_set():
+                    break
+                attributes = (event.get("Actor") or {}).get("Attributes") or {}
+                if str(attributes.get("name", "")).startswith("sag-"):
+                    self._dirty.set()
+            _close(stream)
+        except Exception as exc:
+            # The periodic refreshes still run; only the instant reaction is lost.
+            logger.debug("Docker event stream ended: {}", exc)
+
+    def _docker_events(self) -> Any:
+        registry = self.builder.workspace_registry
+        client = getattr(registry, "client", None)
+        if self.builder.demo_mode or client is None:
+            return None
+        return client.events(decode=True, filters={"type": "container"})
+
+
+def _close(stream: Any) -> None:
+    close = getattr(stream, "close", None)
+    if close is not None:
+        try:
+            close()
+        except Exception:
+            pass
+
+
+__all__ = [
+    "DashboardBroadcaster",
+    "DashboardSubscription",
+    "apply_patch",
+    "json_patch",
+]
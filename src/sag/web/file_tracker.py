@@ -1,10 +1,34 @@
-"""Workspace file change snapshots for SAG Workbench."""
+"""Workspace file change snapshots for SAG Workbench.
+
+A snapshot is columnar: sorted relative paths plus parallel arrays of kind,
+size, mtime and (in ``content`` mode) a content digest, not one Python object
+per file. The walk uses ``os.scandir`` (entry names and ``d_type`` come from
+the directory read, so ignored subtrees are pruned without a stat and without
+building ``Path`` objects), and the top-level subtrees are walked in parallel
+threads since ``scandir``/``lstat`` release the GIL.
+
+``metadata`` mode (the default) compares size, mtime and type. ``content``
+mode also hashes regular files, reporting a file as modified only when its
+bytes changed and pairing a deleted file with an added file of the same
+content as a rename; digests of files whose size and mtime did not change are
+reused from the previous snapshot instead of being re-read.
+
+With a ``store_dir`` every snapshot is also written to disk in the same
+columnar form (gzip), so a base snapshot survives a Workbench restart.
+"""
 
 from __future__ import annotations
 
+import gzip
+import hashlib
+import json
 import os
+import re
 import stat
-from dataclasses import dataclass
+from array import array
+from collections.abc import Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Literal
 
@@ -25,13 +49,26 @@ DEFAULT_IGNORE_DIRS = {
     "dist",
 }
 
+SnapshotMode = Literal["metadata", "content"]
+FileKind = Literal["file", "dir", "other"]
+
+_KIND_CODES: dict[str, int] = {"file": ord("f"), "dir": ord("d"), "other": ord("o")}
+_KIND_NAMES: dict[int, FileKind] = {ord("f"): "file", ord("d"): "dir", ord("o"): "other"}
+_SNAPSHOT_FORMAT = 1
+_HASH_CHUNK = 1024 * 1024
+_MAX_WALKERS = 8
+
+# (relative path, kind code, size, mtime_ns)
+_Row = tuple[str, int, int, int]
+
 
 @dataclass(frozen=True)
 class FileMeta:
     path: str
-    type: Literal["file", "dir", "other"]
+    type: FileKind
     size: int
     mtime_ns: int
+    digest: str | None = None
 
 
 @dataclass(frozen=True)
@@ -39,61 +76,208 @@ class FileSnapshot:
     id: str
     root: Path
     mode: str
-    files: dict[str, FileMeta]
+    paths: tuple[str, ...] = ()
+    kinds: bytes = b""
+    sizes: array = field(default_factory=lambda: array("q"))
+    mtimes: array = field(default_factory=lambda: array("q"))
+    # Content mode only: one hex digest per row, "" for non-files.
+    digests: tuple[str, ...] | None = None
+
+    @property
+    def files(self) -> Mapping[str, FileMeta]:
+        """Read-only ``path -> FileMeta`` view over the columns."""
+
+        return _SnapshotFiles(self)
+
+    def meta(self, index: int) -> FileMeta:
+        digest = self.digests[index] if self.digests is not None else None
+        return FileMeta(
+            path=self.paths[index],
+            type=_KIND_NAMES[self.kinds[index]],
+            size=self.sizes[index],
+            mtime_ns=self.mtimes[index],
+            digest=digest or None,
+        )
+
+    def save(self, path: Path) -> None:
+        """Write the snapshot to ``path`` atomically."""
+
+        names = "\0".join(self.paths).encode("utf-8", "surrogateescape")
+        header = {
+            "format": _SNAPSHOT_FORMAT,
+            "id": self.id,
+            "root": str(self.root),
+            "mode": self.mode,
+            "count": len(self.paths),
+            "names_bytes": len(names),
+            "digests": self.digests is not None,
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.tmp")
+        with gzip.open(tmp, "wb", compresslevel=1) as out:
+            out.write(json.dumps(header).encode() + b"\n")
+            out.write(names)
+            out.write(self.kinds)
+            out.write(self.sizes.tobytes())
+            out.write(self.mtimes.tobytes())
+            if self.digests is not None:
+                out.write(" ".join(digest or "-" for digest in self.digests).encode())
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Path) -> FileSnapshot | None:
+        """Read a snapshot written by ``save``; None when missing or unreadable."""
+
+        try:
+            with gzip.open(path, "rb") as source:
+                header = json.loads(source.readline())
+                count = int(header["count"])
+                if header.get("format") != _SNAPSHOT_FORMAT:
+                    return None
+                raw_names = source.read(int(header["names_bytes"]))
+                names = raw_names.decode("utf-8", "surrogateescape")
+                kinds = source.read(count)
+                sizes = array("q")
+                sizes.frombytes(source.read(count * sizes.itemsize))
+                mtimes = array("q")
+                mtimes.frombytes(source.read(count * mtimes.itemsize))
+                digests = None
+                if header.get("digests"):
+                    words = source.read().decode().split(" ") if count else []
+                    digests = tuple("" if word == "-" else word for word in words)
+        except (OSError, EOFError, ValueError, KeyError):
+            return None
+        paths = tuple(names.split("\0")) if count else ()
+        # A truncated or corrupt file shows up as a short column: every column
+        # must have one entry per row, or the snapshot counts as missing.
+        columns = (paths, kinds, sizes, mtimes) + ((digests,) if digests is not None else ())
+        if any(len(column) != count for column in columns):
+            return None
+        return cls(
+            id=str(header["id"]),
+            root=Path(header["root"]),
+            mode=str(header["mode"]),
+            paths=paths,
+            kinds=kinds,
+            sizes=sizes,
+            mtimes=mtimes,
+            digests=digests,
+        )
+
+
+class _SnapshotFiles(Mapping):
+    def __init__(self, snapshot: FileSnapshot):
+        self._snapshot = snapshot
+        self._index: dict[str, int] | None = None
+
+    def _lookup(self) -> dict[str, int]:
+        if self._index is None:
+            self._index = {path: index for index, path in enumerate(self._snapshot.paths)}
+        return self._index
+
+    def __getitem__(self, path: str) -> FileMeta:
+        return self._snapshot.meta(self._lookup()[path])
+
+    def __contains__(self, path: object) -> bool:
+        return path in self._lookup()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._snapshot.paths)
+
+    def __len__(self) -> int:
+        return len(self._snapshot.paths)
 
 
 class FileChangeTracker:
-    def __init__(self, root: Path, ignore_dirs: set[str] | None = None):
+    def __init__(
+        self,
+        root: Path,
+        ignore_dirs: set[str] | None = None,
+        mode: SnapshotMode = "metadata",
+        store_dir: Path | None = None,
+        workers: int | None = None,
+    ):
         self.root = root
         self.ignore_dirs = DEFAULT_IGNORE_DIRS if ignore_dirs is None else ignore_dirs
+        self.mode = mode
+        self.store_dir = store_dir
+        self.workers = workers or min(_MAX_WALKERS, (os.cpu_count() or 1) + 2)
+        self._previous: FileSnapshot | None = None
 
     def snapshot(self, snapshot_id: str) -> FileSnapshot:
-        files: dict[str, FileMeta] = {}
-        for dirpath, dirnames, filenames in os.walk(self.root):
-            dir_path = Path(dirpath)
-            kept_dirnames: list[str] = []
+        rows = self._walk()
+        rows.sort()
+        snapshot = FileSnapshot(
+            id=snapshot_id,
+            root=self.root,
+            mode=self.mode,
+            paths=tuple(row[0] for row in rows),
+            kinds=bytes(row[1] for row in rows),
+            sizes=array("q", (row[2] for row in rows)),
+            mtimes=array("q", (row[3] for row in rows)),
+            digests=self._digests(rows) if self.mode == "content" else None,
+        )
+        self._previous = snapshot
+        if self.store_dir is not None:
+            snapshot.save(self._stored_path(snapshot_id))
+        return snapshot
+
+    def load(self, snapshot_id: str) -> FileSnapshot | None:
+        """A snapshot persisted under ``store_dir`` by an earlier ``snapshot``."""
 
-            for dirname in sorted(dirnames):
-                path = dir_path / dirname
-                if self._ignored(path):
-                    continue
-                kept_dirnames.append(dirname)
-                self._add_path(files, path)
+        if self.store_dir is None:
+            return None
+        snapshot = FileSnapshot.load(self._stored_path(snapshot_id))
+        if snapshot is not None and self._previous is None:
+            self._previous = snapshot
+        return snapshot
 
-            dirnames[:] = kept_dirnames
+    def diff(self, base: FileSnapshot, head: FileSnapshot) -> FileChangeDigest:
+        compare_content = base.digests is not None and head.digests is not None
+        added: list[int] = []
+        deleted: list[int] = []
+        modified: list[int] = []
 
-            for filename in sorted(filenames):
-                path = dir_path / filename
-                if self._ignored(path):
-                    continue
-                self._add_path(files, path)
+        # Both path columns are sorted: one merge pass, no path sets.
+        i = j = 0
+        base_count, head_count = len(base.paths), len(head.paths)
+        while i < base_count or j < head_count:
+            if j >= head_count or (i < base_count and base.paths[i] < head.paths[j]):
+                deleted.append(i)
+                i += 1
+            elif i >= base_count or head.paths[j] < base.paths[i]:
+                added.append(j)
+                j += 1
+            else:
+                if self._changed(base, i, head, j, compare_content):
+                    modified.append(j)
+                i += 1
+                j += 1
 
-        return FileSnapshot(id=snapshot_id, root=self.root, mode="metadata", files=files)
+        renames: dict[int, int] = {}
+        if compare_content:
+            renames = self._renames(base, deleted, head, added)
 
-    def diff(self, base: FileSnapshot, head: FileSnapshot) -> FileChangeDigest:
         items: list[FileChangeItem] = []
-        base_paths = set(base.files)
-        head_paths = set(head.files)
-
-        for rel in sorted(head_paths - base_paths):
-            items.append(self._item(head.files[rel], "added"))
-        for rel in sorted(base_paths - head_paths):
-            items.append(self._item(base.files[rel], "deleted"))
-        for rel in sorted(base_paths & head_paths):
-            before = base.files[rel]
-            after = head.files[rel]
-            if (
-                before.size != after.size
-                or before.mtime_ns != after.mtime_ns
-                or before.type != after.type
-            ):
-                items.append(self._item(after, "modified"))
+        for index in added:
+            if index in renames:
+                continue
+            items.append(self._item(head.meta(index), "added"))
+        renamed_from = set(renames.values())
+        for index in deleted:
+            if index not in renamed_from:
+                items.append(self._item(base.meta(index), "deleted"))
+        for index in modified:
+            items.append(self._item(head.meta(index), "modified"))
+        for head_index, base_index in sorted(renames.items()):
+            item = self._item(head.meta(head_index), "renamed")
+            items.append(item.model_copy(update={"note": f"from {base.paths[base_index]}"}))
 
         counts = FileChangeCounts(
-            added=sum(1 for item in items if item.change == "added"),
-            modified=sum(1 for item in items if item.change == "modified"),
-            deleted=sum(1 for item in items if item.change == "deleted"),
-            renamed=0,
+            added=len(added) - len(renames),
+            modified=len(modified),
+            deleted=len(deleted) - len(renames),
+            renamed=len(renames),
         )
 
         return FileChangeDigest(
@@ -102,32 +286,112 @@ class FileChangeTracker:
             items=items,
         )
 
-    def _ignored(self, path: Path) -> bool:
-        rel_parts = path.relative_to(self.root).parts
-        return any(part in self.ignore_dirs for part in rel_parts)
-
-    def _add_path(self, files: dict[str, FileMeta], path: Path) -> None:
-        rel = path.relative_to(self.root).as_posix()
+    def _walk(self) -> list[_Row]:
+        rows: list[_Row] = []
+        subtrees: list[tuple[str, str]] = []
         try:
-            path_stat = path.lstat()
+            with os.scandir(self.root) as entries:
+                for entry in entries:
+                    if entry.name in self.ignore_dirs:
+                        continue
+                    row = _row(entry, entry.name)
+                    if row is None:
+                        continue
+                    rows.append(row)
+                    if row[1] == _KIND_CODES["dir"]:
+                        subtrees.append((entry.path, entry.name))
         except OSError:
-            return
-
-        mode = path_stat.st_mode
-        kind: Literal["file", "dir", "other"]
-        if stat.S_ISDIR(mode):
-            kind = "dir"
-        elif stat.S_ISREG(mode):
-            kind = "file"
+            return rows
+
+        if len(subtrees) > 1 and self.workers > 1:
+            with ThreadPoolExecutor(max_workers=min(self.workers, len(subtrees))) as pool:
+                for subtree_rows in pool.map(lambda tree: self._walk_subtree(*tree), subtrees):
+                    rows.extend(subtree_rows)
         else:
-            kind = "other"
+            for path, rel in subtrees:
+                rows.extend(self._walk_subtree(path, rel))
+        return rows
 
-        files[rel] = FileMeta(
-            path=rel,
-            type=kind,
-            size=path_stat.st_size,
-            mtime_ns=path_stat.st_mtime_ns,
-        )
+    def _walk_subtree(self, path: str, rel: str) -> list[_Row]:
+        rows: list[_Row] = []
+        dir_code = _KIND_CODES["dir"]
+        stack = [(path, rel)]
+        while stack:
+            dir_path, dir_rel = stack.pop()
+            try:
+                with os.scandir(dir_path) as entries:
+                    for entry in entries:
+                        if entry.name in self.ignore_dirs:
+                            continue
+                        row = _row(entry, f"{dir_rel}/{entry.name}")
+                        if row is None:
+                            continue
+                        rows.append(row)
+                        if row[1] == dir_code:
+                            stack.append((entry.path, row[0]))
+            except OSError:
+                continue
+        return rows
+
+    def _digests(self, rows: list[_Row]) -> tuple[str, ...]:
+        previous = self._previous
+        known: dict[str, int] = {}
+        if previous is not None and previous.digests is not None and previous.root == self.root:
+            known = {path: index for index, path in enumerate(previous.paths)}
+        file_code = _KIND_CODES["file"]
+
+        def digest(row: _Row) -> str:
+            rel, kind, size, mtime_ns = row
+            if kind != file_code:
+                return ""
+            index = known.get(rel)
+            if (
+                index is not None
+                and previous.sizes[index] == size
+                and previous.mtimes[index] == mtime_ns
+                and previous.digests[index]
+            ):
+                return previous.digests[index]
+            return _hash_file(self.root / rel)
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            return tuple(pool.map(digest, rows, chunksize=64))
+
+    def _changed(
+        self, base: FileSnapshot, i: int, head: FileSnapshot, j: int, compare_content: bool
+    ) -> bool:
+        kind = head.kinds[j]
+        if base.kinds[i] != kind:
+            return True
+        if compare_content and kind == _KIND_CODES["file"]:
+            return base.digests[i] != head.digests[j]
+        if compare_content and kind == _KIND_CODES["dir"]:
+            # A directory's mtime moves with every entry added or removed.
+            return False
+        return base.sizes[i] != head.sizes[j] or base.mtimes[i] != head.mtimes[j]
+
+    def _renames(
+        self, base: FileSnapshot, deleted: list[int], head: FileSnapshot, added: list[int]
+    ) -> dict[int, int]:
+        """Pair added files with deleted files of identical, non-empty content."""
+
+        file_code = _KIND_CODES["file"]
+        by_digest: dict[str, list[int]] = {}
+        for index in deleted:
+            if base.kinds[index] == file_code and base.sizes[index] and base.digests[index]:
+                by_digest.setdefault(base.digests[index], []).append(index)
+        renames: dict[int, int] = {}
+        for index in added:
+            if head.kinds[index] != file_code:
+                continue
+            candidates = by_digest.get(head.digests[index])
+            if candidates:
+                renames[index] = candidates.pop(0)
+        return renames
+
+    def _stored_path(self, snapshot_id: str) -> Path:
+        safe = re.sub(r"[^A-Za-z0-9._-]", "_", snapshot_id)
+        return self.store_dir / f"{safe}.snapshot.gz"
 
     def _item(
         self,
@@ -143,6 +407,32 @@ class FileChangeTracker:
         )
 
 
+def _row(entry: os.DirEntry, rel: str) -> _Row | None:
+    try:
+        entry_stat = entry.stat(follow_symlinks=False)
+    except OSError:
+        return None
+    mode = entry_stat.st_mode
+    if stat.S_ISDIR(mode):
+        kind = _KIND_CODES["dir"]
+    elif stat.S_ISREG(mode):
+        kind = _KIND_CODES["file"]
+    else:
+        kind = _KIND_CODES["other"]
+    return rel, kind, entry_stat.st_size, entry_stat.st_mtime_ns
+
+
+def _hash_file(path: Path) -> str:
+    hasher = hashlib.blake2b(digest_size=16)
+    try:
+        with open(path, "rb") as source:
+            for chunk in iter(lambda: source.read(_HASH_CHUNK), b""):
+                hasher.update(chunk)
+    except OSError:
+        return ""
+    return hasher.hexdigest()
+
+
 def _format_size(size: int) -> str:
     if size < 1024:
         return f"{size} B"
@@ -0,0 +1,351 @@
+"""Resource-aware admission control for queued project launches.
+
+``LaunchScheduler`` used to start queued items up to ``default_global_cap()``
+no matter what they were: a few heavy Gradle builds could push the host into
+swap while light Python setups waited behind them. ``ResourceAdmission`` picks
+the next item to start from the claimable ones, and starts one only when the
+host has headroom for its estimated footprint:
+
+* Host state comes from ``/proc/meminfo`` (``MemAvailable``) and the 1-minute
+  load average. A host where ``/proc`` is unreadable admits everything, so the
+  global cap alone applies as before.
+* Each running launch reserves the part of its estimate it has not used yet
+  (estimate minus its container's current cgroup memory). ``MemAvailable``
+  already counts what it uses now.
+* An item's estimate is its repository's recorded peak from earlier runs
+  (the ``launch_footprints`` table in the ``LaunchQueueStore`` DB) plus a
+  margin. A repository never seen before gets its ecosystem's footprint once
+  the running container shows one (the mean recorded peak for that ecosystem,
+  else a static prior), and ``DEFAULT_FOOTPRINT_BYTES`` before that.
+* With nothing running, the oldest item always starts, so an item bigger than
+  the whole host still runs (alone). A smaller item may jump a blocked one, but
+  only ``MAX_BYPASSES`` times before the blocked item is waited for.
+
+When a launch finishes, its container's cgroup peak (``memory.peak``, else the
+highest sample seen) is recorded for the repository, together with the
+ecosystem classified from the container's processes at the highest-memory
+sample. SAG's own helpers (the exec agent, inline ``python3 -c``/``python3 -``
+scripts) run in every container and are left out of the classification.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+from loguru import logger
+
+from sag.web.launch_queue import LaunchFootprint, LaunchItem, LaunchQueueStore
+
+GIB = 1024**3
+DEFAULT_FOOTPRINT_BYTES = 2 * GIB
+ECOSYSTEM_FOOTPRINT_BYTES = {
+    "gradle": 4 * GIB,
+    "maven": 3 * GIB,
+    "node": 2 * GIB,
+    "python": 1 * GIB,
+}
+# Recorded peaks are scaled up by this much before they are reserved.
+FOOTPRINT_MARGIN = 1.2
+# Share of host RAM never handed out to launches (the UI, Docker, page cache).
+HOST_RESERVE_FRACTION = 0.1
+# Hold new launches while the 1-minute load average exceeds this per CPU.
+LOAD_PER_CPU_LIMIT = 1.5
+MAX_BYPASSES = 4
+SAMPLE_TTL_SECONDS = 5.0
+
+# Checked in this order: a Gradle build also runs java, a Maven one python.
+_ECOSYSTEM_MARKERS = (
+    ("gradle", ("gradle",)),
+    ("maven", ("maven", "plexus-classworlds", "mvn ")),
+    ("node", ("node ", "/node", "npm", "yarn", "pnpm")),
+    ("python", ("python", "pip ", "pytest")),
+)
+# SAG's in-container helpers: an inline or stdin python script, run directly
+# or through the shell wrapper that fed it (whose command line holds the script).
+_SAG_HELPER_RE = re.compile(r"(?:^|[\s/])python3?(?:\s+-[a-z]+)*?\s+(?:-c|-)(?:\s|$)")
+
+
+@dataclass(frozen=True)
+class HostResources:
+    mem_total: int
+    mem_available: int
+    load1: float
+    cpus: int
+
+
+@dataclass(frozen=True)
+class ContainerUsage:
+    current: int
+    peak: int | None = None
+    ecosystem: str | None = None
+
+
+def read_host_resources(meminfo: Path = Path("/proc/meminfo")) -> HostResources | None:
+    """Host memory and load, or None where ``/proc`` is not available."""
+
+    values: dict[str, int] = {}
+    try:
+        for line in meminfo.read_text().splitlines():
+            key, _, rest = line.partition(":")
+            fields = rest.split()
+            if fields and fields[0].isdigit():
+                values[key] = int(fields[0]) * 1024
+        load1 = os.getloadavg()[0]
+    except (OSError, AttributeError):
+        return None
+    if "MemTotal" not in values or "MemAvailable" not in values:
+        return None
+    return HostResources(
+        mem_total=values["MemTotal"],
+        mem_available=values["MemAvailable"],
+        load1=load1,
+        cpus=os.cpu_count() or 1,
+    )
+
+
+def classify_ecosystem(commands: Iterable[str]) -> str | None:
+    """The build ecosystem a container's process command lines point at."""
+
+    text = "\n".join(
+        lowered
+        for lowered in (command.lower() for command in commands)
+        if not _SAG_HELPER_RE.search(lowered)
+    )
+    for ecosystem, markers in _ECOSYSTEM_MARKERS:
+        if any(marker in text for marker in markers):
+            return ecosystem
+    return None
+
+
+class CgroupStats:
+    """Reads a workspace container's memory from its cgroup.
+
+    The container id is looked up through the Docker API once per container
+    (and again when its cgroup disappears); after that the cgroup v2
+    (``memory.current``/``memory.peak``) or v1 files are read directly.
+    Without a readable cgroup (remote daemon, rootless Docker) it falls back to
+    one ``stats`` API call and reports no ecosystem.
+    """
+
+    _CGROUP_DIRS = (
+        "system.slice/docker-{id}.scope",
+        "docker/{id}",
+        "memory/docker/{id}",
+        "memory/system.slice/docker-{id}.scope",
+    )
+
+    def __init__(
+        self,
+        client_factory: Callable[[], Any] | None = None,
+        cgroup_root: Path = Path("/sys/fs/cgroup"),
+        proc_root: Path = Path("/proc"),
+    ):
+        self._client_factory = client_factory or _docker_client
+        self._client: Any = None
+        self.cgroup_root = cgroup_root
+        self.proc_root = proc_root
+        self._ids: dict[str, str] = {}
+
+    def __call__(self, container_name: str) -> ContainerUsage | None:
+        try:
+            container = None
+            container_id = self._ids.get(container_name)
+            cgroup = self._cgroup_dir(container_id) if container_id else None
+            if cgroup is None:
+                # Never looked up, or the container was recreated under the
+                # same name and the cached id's cgroup is gone: look it up again.
+                self._ids.pop(container_name, None)
+                container = self._docker().containers.get(container_name)
+                container_id = self._ids[container_name] = container.id
+                cgroup = self._cgroup_dir(container_id)
+            if cgroup is not None:
+                return self._from_cgroup(cgroup)
+            container = container or self._docker().containers.get(container_name)
+            memory = container.stats(stream=False).get("memory_stats") or {}
+            if "usage" not in memory:
+                return None
+            return ContainerUsage(current=memory["usage"], peak=memory.get("max_usage"))
+        except Exception as exc:
+            # Not created yet, already removed, or no daemon: nothing to count.
+            logger.debug("No memory stats for {}: {}", container_name, exc)
+            return None
+
+    def _docker(self) -> Any:
+        if self._client is None:
+            self._client = self._client_factory()
+        return self._client
+
+    def _cgroup_dir(self, container_id: str) -> Path | None:
+        for pattern in self._CGROUP_DIRS:
+            path = self.cgroup_root / pattern.format(id=container_id)
+            if path.is_dir():
+                return path
+        return None
+
+    def _from_cgroup(self, cgroup: Path) -> ContainerUsage:
+        current = _read_int(cgroup / "memory.current")
+        if current is None:
+            current = _read_int(cgroup / "memory.usage_in_bytes") or 0
+        peak = _read_int(cgroup / "memory.peak")
+        if peak is None:
+            peak = _read_int(cgroup / "memory.max_usage_in_bytes")
+        return ContainerUsage(current=current, peak=peak, ecosystem=self._ecosystem(cgroup))
+
+    def _ecosystem(self, cgroup: Path) -> str | None:
+        commands: list[str] = []
+        for procs in [cgroup / "cgroup.procs", *cgroup.glob("*/cgroup.procs")]:
+            try:
+                pids = procs.read_text().split()
+            except OSError:
+                continue
+            for pid in pids:
+                try:
+                    raw = (self.proc_root / pid / "cmdline").read_bytes()
+                except OSError:
+                    continue
+                commands.append(raw.replace(b"\0", b" ").decode("utf-8", errors="replace"))
+        return classify_ecosystem(commands)
+
+
+def _docker_client() -> Any:
+    import docker
+
+    return docker.from_env()
+
+
+def _read_int(path: Path) -> int | None:
+    try:
+        return int(path.read_text().strip())
+    except (OSError, ValueError):
+        return None
+
+
+class ResourceAdmission:
+    """Chooses which claimable launch item, if any, may start now."""
+
+    def __init__(
+        self,
+        store: LaunchQueueStore,
+        host: Callable[[], HostResources | None] = read_host_resources,
+        containers: Callable[[str], ContainerUsage | None] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.store = store
+        self._host = host
+        self._containers = containers if containers is not None else CgroupStats()
+        self._clock = clock
+        self._usage: dict[str, tuple[float, ContainerUsage | None]] = {}
+        self._observed_peaks: dict[str, int] = {}
+        self._ecosystems: dict[str, str] = {}
+        # The memory of the sample each ``_ecosystems`` entry was classified at.
+        self._ecosystem_at: dict[str, int] = {}
+        self._footprints: tuple[float, dict[str, LaunchFootprint]] | None = None
+        self._bypasses: dict[str, int] = {}
+
+    def choose(
+        self, candidates: list[LaunchItem], active: list[LaunchItem]
+    ) -> LaunchItem | None:
+        """The first candidate that fits the host's headroom, or None to wait."""
+
+        if not candidates:
+            return None
+        head = candidates[0]
+        host = self._host()
+        if host is None or not active:
+            return self._admit(head, head)
+        if host.load1 > host.cpus * LOAD_PER_CPU_LIMIT:
+            return None
+        reserved = 0
+        for item in active:
+            usage = self._sample(item)
+            current = usage.current if usage is not None else 0
+            reserved += max(0, self.estimate(item) - current)
+        headroom = host.mem_available - reserved - host.mem_total * HOST_RESERVE_FRACTION
+        for index, item in enumerate(candidates):
+            if index and self._bypasses.get(head.id, 0) >= MAX_BYPASSES:
+                return None
+            if self.estimate(item) <= headroom:
+                return self._admit(item, head)
+        return None
+
+    def estimate(self, item: LaunchItem) -> int:
+        """Bytes of memory ``item`` is expected to need at its peak."""
+
+        footprints = self._all_footprints()
+        footprint = footprints.get(item.repo_url)
+        if footprint is not None and footprint.peak_bytes > 0:
+            return int(footprint.peak_bytes * FOOTPRINT_MARGIN)
+        ecosystem = self._ecosystems.get(item.id) or (footprint and footprint.ecosystem)
+        if not ecosystem:
+            return DEFAULT_FOOTPRINT_BYTES
+        peaks = [
+            known.peak_bytes
+            for known in footprints.values()
+            if known.ecosystem == ecosystem and known.peak_bytes > 0
+        ]
+        if peaks:
+            return int(sum(peaks) / len(peaks) * FOOTPRINT_MARGIN)
+        return ECOSYSTEM_FOOTPRINT_BYTES.get(ecosystem, DEFAULT_FOOTPRINT_BYTES)
+
+    def record_finished(self, item: LaunchItem, now: str) -> None:
+        """Store the finished launch's peak memory for its repository."""
+
+        usage = self._containers(item.workspace_id)
+        peak = max(
+            (usage.peak or usage.current) if usage is not None else 0,
+            self._observed_peaks.pop(item.id, 0),
+        )
+        ecosystem = self._ecosystems.pop(item.id, None)
+        classified_at = self._ecosystem_at.pop(item.id, -1)
+        if usage is not None and usage.ecosystem and usage.current >= classified_at:
+            ecosystem = usage.ecosystem
+        self._usage.pop(item.id, None)
+        if peak <= 0:
+            return
+        self.store.record_footprint(item.repo_url, peak, now, ecosystem=ecosystem)
+        self._footprints = None
+
+    def _admit(self, item: LaunchItem, head: LaunchItem) -> LaunchItem:
+        if item is head:
+            self._bypasses.pop(head.id, None)
+        else:
+            self._bypasses[head.id] = self._bypasses.get(head.id, 0) + 1
+        return item
+
+    def _sample(self, item: LaunchItem) -> ContainerUsage | None:
+        now = self._clock()
+        cached = self._usage.get(item.id)
+        if cached is not None and now - cached[0] < SAMPLE_TTL_SECONDS:
+            return cached[1]
+        usage = self._containers(item.workspace_id)
+        self._usage[item.id] = (now, usage)
+        if usage is not None:
+            seen = max(usage.current, usage.peak or 0)
+            self._observed_peaks[item.id] = max(self._observed_peaks.get(item.id, 0), seen)
+            # Keep the ecosystem seen at the highest memory: between builds a
+            # container runs little but SAG's helpers and idle shells.
+            if usage.ecosystem and usage.current >= self._ecosystem_at.get(item.id, -1):
+                self._ecosystems[item.id] = usage.ecosystem
+                self._ecosystem_at[item.id] = usage.current
+        return usage
+
+    def _all_footprints(self) -> dict[str, LaunchFootprint]:
+        now = self._clock()
+        if self._footprints is None or now - self._footprints[0] >= SAMPLE_TTL_SECONDS:
+            self._footprints = (now, self.store.footprints())
+        return self._footprints[1]
+
+
+__all__ = [
+    "CgroupStats",
+    "ContainerUsage",
+    "HostResources",
+    "ResourceAdmission",
+    "classify_ecosystem",
+    "read_host_resources",
+]
@@ -52,8 +52,28 @@ CREATE TABLE IF NOT EXISTS launch_items (
 );
 CREATE INDEX IF NOT EXISTS idx_launch_items_status ON launch_items(status);
 CREATE INDEX IF NOT EXISTS idx_launch_items_batch ON launch_items(batch_id);
+CREATE TABLE IF NOT EXISTS launch_footprints (
+    repo_url TEXT PRIMARY KEY,
+    ecosystem TEXT,
+    peak_bytes INTEGER NOT NULL,
+    runs INTEGER NOT NULL,
+    updated_at TEXT NOT NULL
+);
 """
 
+# Queued items whose batch is below its concurrency, oldest first.
+_ELIGIBLE_SQL = (
+    "SELECT i.* FROM launch_items i"
+    " JOIN launch_batches b ON b.id = i.batch_id"
+    " WHERE i.status = 'queued'"
+    "   AND ("
+    "     SELECT COUNT(*) FROM launch_items a"
+    "     WHERE a.batch_id = i.batch_id"
+    "       AND a.status IN ('launching', 'running')"
+    "   ) < b.concurrency"
+)
+_ELIGIBLE_ORDER = " ORDER BY i.created_at, i.row_index, i.id"
+
 
 @dataclass(frozen=True)
 class LaunchBatch:
@@ -90,6 +110,17 @@ class LaunchItem:
     finished_at: str | None = None
 
 
+@dataclass(frozen=True)
+class LaunchFootprint:
+    """Peak memory observed for past launches of one repository."""
+
+    repo_url: str
+    peak_bytes: int
+    runs: int
+    updated_at: str
+    ecosystem: str | None = None
+
+
 class LaunchQueueStore:
     """All SQLite access for the launch queue lives here."""
 
@@ -203,26 +234,35 @@ class LaunchQueueStore:
         Returns the claimed item already marked ``launching``, or ``None``.
         """
 
+        return self._claim(global_cap, now, item_id=None)
+
+    def claimable_items(self, global_cap: int) -> list[LaunchItem]:
+        """Queued items ``claim_next`` could take right now, in claim order."""
+
+        with contextlib.closing(self._connect()) as conn:
+            if self._active_count(conn) >= global_cap:
+                return []
+            rows = conn.execute(_ELIGIBLE_SQL + _ELIGIBLE_ORDER).fetchall()
+            return [_item_from_row(row) for row in rows]
+
+    def claim_item(self, item_id: str, global_cap: int, now: str) -> LaunchItem | None:
+        """Atomically claim one specific queued item if it still has capacity."""
+
+        return self._claim(global_cap, now, item_id=item_id)
+
+    def _claim(self, global_cap: int, now: str, item_id: str | None) -> LaunchItem | None:
         with contextlib.closing(self._connect()) as conn:
             claimed: LaunchItem | None = None
             with self._transaction(conn):
-                active = conn.execute(
-                    "SELECT COUNT(*) FROM launch_items"
-                    " WHERE status IN ('launching', 'running')"
-                ).fetchone()[0]
-                if active < global_cap:
-                    row = conn.execute(
-                        "SELECT i.* FROM launch_items i"
-                        " JOIN launch_batches b ON b.id = i.batch_id"
-                        " WHERE i.status = 'queued'"
-                        "   AND ("
-                        "     SELECT COUNT(*) FROM launch_items a"
-                        "     WHERE a.batch_id = i.batch_id"
-                        "       AND a.status IN ('launching', 'running')"
-                        "   ) < b.concurrency"
-                        " ORDER BY i.created_at, i.row_index, i.id"
-                        " LIMIT 1"
-                    ).fetchone()
+                if self._active_count(conn) < global_cap:
+                    if item_id is None:
+                        row = conn.execute(
+                            _ELIGIBLE_SQL + _ELIGIBLE_ORDER + " LIMIT 1"
+                        ).fetchone()
+                    else:
+                        row = conn.execute(
+                            _ELIGIBLE_SQL + " AND i.id = ?", (item_id,)
+                        ).fetchone()
                     if row is not None:
                         conn.execute(
                             "UPDATE launch_items"
@@ -235,6 +275,53 @@ class LaunchQueueStore:
                         )
             return claimed
 
+    @staticmethod
+    def _active_count(conn: sqlite3.Connection) -> int:
+        return conn.execute(
+            "SELECT COUNT(*) FROM launch_items"
+            " WHERE status IN ('launching', 'running')"
+        ).fetchone()[0]
+
+    def record_footprint(
+        self, repo_url: str, peak_bytes: int, now: str, ecosystem: str | None = None
+    ) -> None:
+        """Fold one finished run's peak memory into the repository's footprint.
+
+        A higher peak replaces the stored one; a lower one pulls it halfway
+        down, so one unusually heavy run does not pin the estimate forever.
+        """
+
+        with contextlib.closing(self._connect()) as conn:
+            with self._transaction(conn):
+                conn.execute(
+                    "INSERT INTO launch_footprints"
+                    " (repo_url, ecosystem, peak_bytes, runs, updated_at)"
+                    " VALUES (?, ?, ?, 1, ?)"
+                    " ON CONFLICT(repo_url) DO UPDATE SET"
+                    "   ecosystem = COALESCE(excluded.ecosystem, ecosystem),"
+                    "   peak_bytes = MAX(excluded.peak_bytes,"
+                    "                    (peak_bytes + excluded.peak_bytes) / 2),"
+                    "   runs = runs + 1,"
+                    "   updated_at = excluded.updated_at",
+                    (repo_url, ecosystem, int(peak_bytes), now),
+                )
+
+    def footprints(self) -> dict[str, LaunchFootprint]:
+        """Every recorded footprint, by repository URL."""
+
+        with contextlib.closing(self._connect()) as conn:
+            rows = conn.execute("SELECT * FROM launch_footprints").fetchall()
+            return {
+                row["repo_url"]: LaunchFootprint(
+                    repo_url=row["repo_url"],
+                    ecosystem=row["ecosystem"],
+                    peak_bytes=row["peak_bytes"],
+                    runs=row["runs"],
+                    updated_at=row["updated_at"],
+                )
+                for row in rows
+            }
+
     def mark_running(self, item_id: str, pid: int, now: str) -> None:
         with contextlib.closing(self._connect()) as conn:
             with self._transaction(conn):
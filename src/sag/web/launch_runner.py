@@ -11,6 +11,7 @@ from typing import Any, Callable
 
 from loguru import logger
 
+from sag.web.launch_admission import ResourceAdmission
 from sag.web.launch_queue import LaunchItem, LaunchQueueStore
 
 
@@ -63,12 +64,14 @@ class LaunchScheduler:
         workspace_exists: Callable[[str], bool] | None = None,
         global_cap: int | None = None,
         poll_interval: float = 0.5,
+        admission: ResourceAdmission | None = None,
     ):
         self.store = store
         self.spawn = spawn
         self.workspace_exists = workspace_exists or (lambda docker_label: False)
         self.global_cap = global_cap if global_cap is not None else default_global_cap()
         self.poll_interval = poll_interval
+        self.admission = admission
         self._wake = threading.Event()
         self._stop = threading.Event()
         self._thread: threading.Thread | None = None
@@ -105,11 +108,28 @@ class LaunchScheduler:
         """Start subprocesses for every queued item that has capacity right now."""
 
         while True:
-            item = self.store.claim_next(self.global_cap, _now())
+            if self.admission is None:
+                item = self.store.claim_next(self.global_cap, _now())
+            else:
+                item = self._claim_admitted()
             if item is None:
                 return
             self._start_item(item)
 
+    def _claim_admitted(self) -> LaunchItem | None:
+        """Claim the item admission control picks; None while the host is full.
+
+        Blocked items stay queued; the poll (or a finishing launch) retries.
+        """
+
+        candidates = self.store.claimable_items(self.global_cap)
+        if not candidates:
+            return None
+        chosen = self.admission.choose(candidates, self.store.unfinished_items())
+        if chosen is None:
+            return None
+        return self.store.claim_item(chosen.id, self.global_cap, _now())
+
     def reconcile_stale(self) -> None:
         """Resolve launching/running rows left over from a previous UI run.
 
@@ -153,18 +173,24 @@ class LaunchScheduler:
         self.store.mark_running(item.id, pid=process.pid, now=_now())
         threading.Thread(
             target=self._monitor,
-            args=(item.id, process),
+            args=(item, process),
             daemon=True,
             name=f"sag-launch-monitor-{item.id}",
         ).start()
 
-    def _monitor(self, item_id: str, process: Any) -> None:
+    def _monitor(self, item: LaunchItem, process: Any) -> None:
+        item_id = item.id
         try:
             exit_code = process.wait()
         except Exception as exc:
             self.store.mark_failed(item_id, f"Lost launch process: {exc}", now=_now())
             self._wake.set()
             return
+        if self.admission is not None:
+            try:
+                self.admission.record_finished(item, now=_now())
+            except Exception:
+                logger.exception("Recording launch footprint failed")
         if exit_code == 0:
             self.store.mark_completed(item_id, exit_code=0, now=_now())
         else:
@@ -12,6 +12,7 @@ from loguru import logger
 from pydantic import BaseModel, Field, StringConstraints, field_validator
 
 from sag.utils.git_utils import extract_project_name_from_url
+from sag.web.launch_admission import ResourceAdmission
 from sag.web.launch_queue import LaunchBatch, LaunchItem, LaunchQueueStore
 from sag.web.launch_runner import LaunchScheduler
 from sag.web.project_cli import ProjectCliCommand
@@ -43,6 +44,8 @@ class LaunchProjectRow(BaseModel):
 
 class LaunchBatchRequest(BaseModel):
     concurrency: int | None = None
+    # Batch-wide: every launch of the batch mounts the shared dependency cache.
+    shared_cache: bool = False
     projects: list[LaunchProjectRow] = Field(min_length=1)
 
 
@@ -91,7 +94,11 @@ class LaunchService:
         self._scheduler = (
             scheduler
             if scheduler is not None
-            else LaunchScheduler(self._store, workspace_exists=self._workspace_exists)
+            else LaunchScheduler(
+                self._store,
+                workspace_exists=self._workspace_exists,
+                admission=ResourceAdmission(self._store),
+            )
         )
 
     def start(self) -> None:
@@ -174,6 +181,7 @@ class LaunchService:
                 goal=row.goal,
                 record=row.record,
                 coverage=row.coverage,
+                shared_cache=request.shared_cache,
             ).argv()
             process_log = PROCESS_LOG_ROOT / batch_id / f"{launch_id}.log"
             items.append(
@@ -16,6 +16,7 @@ class ProjectCliCommand:
     goal: str | None = None
     record: bool = False
     coverage: bool = False
+    shared_cache: bool = False
 
     def project_args(self) -> list[str]:
         """Arguments exactly as a user would type them after ``sag``."""
@@ -31,6 +32,8 @@ class ProjectCliCommand:
             args.append("--record")
         if self.coverage:
             args.append("--coverage")
+        if self.shared_cache:
+            args.append("--shared-cache")
         return args
 
     def argv(self) -> list[str]:
@@ -16,7 +16,7 @@ from sag.web.models import (
     WorkspaceSummary,
 )
 from sag.web.session_registry import ContainerSessionRegistry
-from sag.web.workspace_registry import WorkspaceRegistry
+from sag.web.workspace_registry import WorkspaceRegistry, shared_workspace_registry
 
 
 class ReadModelBuilder:
@@ -36,7 +36,7 @@ class ReadModelBuilder:
 
         try:
             if self.workspace_registry is None:
-                self.workspace_registry = WorkspaceRegistry()
+                self.workspace_registry = shared_workspace_registry()
 
             workspaces = [
                 self._with_session_state(workspace)
@@ -60,8 +60,13 @@ class ReadModelBuilder:
         summary = SystemSummary()
         try:
             if self.workspace_registry is None:
-                self.workspace_registry = WorkspaceRegistry()
-            df = self.workspace_registry.client.df()
+                self.workspace_registry = shared_workspace_registry()
+            # The cached registry answers from memory (refreshing in the
+            # background); a plain one asks the daemon.
+            cached_df = getattr(self.workspace_registry, "df", None)
+            df = cached_df() if cached_df is not None else self.workspace_registry.client.df()
+            if df is None:
+                raise LookupError("docker df not computed yet")
             used = int(df.get("LayersSize", 0) or 0)  # total image layer bytes
             for vol in df.get("Volumes") or []:
                 used += max(0, int((vol.get("UsageData") or {}).get("Size", 0) or 0))
@@ -6,6 +6,16 @@ sessions from disk instead of re-`docker exec`-ing into every container on every
 works on a stopped container, never revives it. `MirrorReader` then answers the
 exact `cat`/`find` shapes `session_registry`'s read helpers emit, reading from the
 mirror, so those helpers stay unchanged.
+
+A running container is mirrored whole once, then delta-synced: one `find` exec
+lists every result file with its size and mtime, and only files whose entry
+changed since the last sync are fetched. Append-only `.jsonl` files (output
+storage, journals, receipts) fetch just the bytes past the mirrored length, and
+only whole lines are appended. Each refresh moves at most `REFRESH_BUDGET_BYTES`;
+whatever does not fit is picked up by the next refresh.
+
+The dashboard endpoints (threadpool) and the dashboard stream's producer thread
+both refresh mirrors, so each container's refresh runs under its own lock.
 """
 
 from __future__ import annotations
@@ -15,19 +25,35 @@ import io
 import re
 import shlex
 import tarfile
+import threading
 import time
 from pathlib import Path
 from typing import Any, Callable
 
 from loguru import logger
 
+from sag.docker_orch.archive import ChunkReader
+
 # Result paths mirrored from the container (all under /workspace). `.setup_agent`
 # holds sessions/index.json, contexts/, report_metrics.json, module_metrics.json.
 _ARCHIVE_PATHS = ("/workspace/.setup_agent", "/workspace/.sag_last_comment.json")
 _REPORT_RE = re.compile(r"setup-report-\d{8}-\d{6}\.md")
 RUNNING_TTL_SECONDS = 10.0
+REFRESH_BUDGET_BYTES = 4 * 1024 * 1024
+# Trailing bytes of the mirrored copy an append must match; one byte would be
+# the final newline of every JSONL file.
+TAIL_OVERLAP_BYTES = 4096
+
+# `<path>\t<size>\t<mtime>` for every result file; a missing path just lists nothing.
+_MANIFEST_PROBE = (
+    "find " + " ".join(_ARCHIVE_PATHS) + " -type f -printf '%p\\t%s\\t%T@\\n' 2>/dev/null; true"
+)
 
 _last_fetch: dict[str, float] = {}
+# container -> {container path: (size, mtime)} as of the last sync.
+_manifests: dict[str, dict[str, tuple[int, float]]] = {}
+_locks: dict[str, threading.Lock] = {}
+_locks_guard = threading.Lock()
 
 
 def mirror_root(logs_root: Path) -> Path:
@@ -43,50 +69,175 @@ def ensure_mirror(
 ) -> Path | None:
     """Return the host mirror dir for a container, refreshing it when needed.
 
-    Stopped container -> mirrored once (results are immutable). Running -> refetched
-    when older than RUNNING_TTL_SECONDS. Returns None only when nothing was ever
-    mirrored and the fetch fails.
+    Stopped container -> mirrored once (results are immutable). Running -> synced
+    when older than RUNNING_TTL_SECONDS: delta-synced when a manifest from an
+    earlier sync exists, otherwise extracted whole. Returns None only when nothing
+    was ever mirrored and the fetch fails.
     """
     dest = mirror_root(logs_root) / container_name
-    fetched = _last_fetch.get(container_name)
-    if dest.exists() and fetched is not None and (not running or now() - fetched < RUNNING_TTL_SECONDS):
+    if _is_fresh(dest, container_name, running, now):
         return dest
+    with _lock_for(container_name):
+        # Whoever held the lock may have just synced it.
+        if _is_fresh(dest, container_name, running, now):
+            return dest
+        return _refresh(client, container_name, running, dest, now)
+
 
+def _lock_for(container_name: str) -> threading.Lock:
+    with _locks_guard:
+        return _locks.setdefault(container_name, threading.Lock())
+
+
+def _is_fresh(dest: Path, container_name: str, running: bool, now: Callable[[], float]) -> bool:
+    fetched = _last_fetch.get(container_name)
+    if not dest.exists() or fetched is None:
+        return False
+    return not running or now() - fetched < RUNNING_TTL_SECONDS
+
+
+def _refresh(
+    client: Any, container_name: str, running: bool, dest: Path, now: Callable[[], float]
+) -> Path | None:
     try:
         container = client.containers.get(container_name)
     except Exception:
         return dest if dest.exists() else None
 
     dest.mkdir(parents=True, exist_ok=True)
-    for path in _ARCHIVE_PATHS:
-        _extract(container, path, dest)
+    manifest = _probe_manifest(container) if running else None
+    previous = _manifests.get(container_name)
+    if manifest is not None and previous is not None and dest.exists():
+        _manifests[container_name] = _sync_delta(container, dest, previous, manifest)
+    else:
+        # Probed before the extraction: a file that changes in between is newer
+        # on disk than its manifest entry, so the next sync fetches it again.
+        for path in _ARCHIVE_PATHS:
+            _extract(container, path, dest)
+        if manifest is not None:
+            _manifests[container_name] = manifest
+        else:
+            _manifests.pop(container_name, None)
     _extract_report(container, dest)
     _last_fetch[container_name] = now()
     return dest
 
 
-class _ChunkReader(io.RawIOBase):
-    """File-like over get_archive's chunk generator, so tarfile streams the archive
-    instead of us materializing the whole thing in RAM (a session's
-    full_outputs.jsonl can be large, times every container on a dashboard load)."""
-
-    def __init__(self, chunks: Any):
-        self._chunks = iter(chunks)
-        self._buf = b""
-
-    def readable(self) -> bool:
-        return True
-
-    def readinto(self, b: bytearray) -> int:
-        while not self._buf:
-            try:
-                self._buf = next(self._chunks)
-            except StopIteration:
-                return 0
-        n = min(len(b), len(self._buf))
-        b[:n] = self._buf[:n]
-        self._buf = self._buf[n:]
-        return n
+def _probe_manifest(container: Any) -> dict[str, tuple[int, float]] | None:
+    """Every result file's (size, mtime), or None when the probe cannot run."""
+    try:
+        result = container.exec_run(["sh", "-c", _MANIFEST_PROBE])
+    except Exception:
+        return None
+    if getattr(result, "exit_code", 1) != 0:
+        return None
+    output = result.output.decode("utf-8", errors="replace") if result.output else ""
+    manifest: dict[str, tuple[int, float]] = {}
+    for line in output.splitlines():
+        parts = line.split("\t")
+        if len(parts) != 3:
+            continue
+        try:
+            manifest[parts[0]] = (int(parts[1]), float(parts[2]))
+        except ValueError:
+            continue
+    return manifest
+
+
+def _sync_delta(
+    container: Any,
+    dest: Path,
+    previous: dict[str, tuple[int, float]],
+    manifest: dict[str, tuple[int, float]],
+) -> dict[str, tuple[int, float]]:
+    """Bring ``dest`` closer to ``manifest``; returns the manifest of what it holds."""
+    synced = dict(previous)
+    for path in set(previous) - set(manifest):
+        _host_path(dest, path).unlink(missing_ok=True)
+        synced.pop(path, None)
+
+    changed = [path for path, entry in manifest.items() if previous.get(path) != entry]
+    # Small files first: the session index and contexts are what the UI reads.
+    changed.sort(key=lambda path: manifest[path][0])
+    budget = REFRESH_BUDGET_BYTES
+    moved = 0
+    for path in changed:
+        size, mtime = manifest[path]
+        local = _host_path(dest, path)
+        local_size = local.stat().st_size if local.is_file() else None
+        # The length the last sync recorded; anything past it on disk is an
+        # append that did not finish and is overwritten.
+        offset = previous[path][0] if path in previous else local_size
+        if (
+            path.endswith(".jsonl")
+            and local_size is not None
+            and offset is not None
+            and 0 < offset <= min(local_size, size)
+        ):
+            appended = _fetch_tail(container, path, local, offset, size, budget)
+            if appended is not None:
+                budget -= appended
+                moved += appended
+                # A partial append records the mirrored length, so the next
+                # refresh resumes from there.
+                synced[path] = (offset + appended, mtime)
+                continue
+        if size > budget and moved:
+            continue  # next refresh; one oversized file alone may still go through
+        _extract(container, path, local.parent)
+        budget -= size
+        moved += size
+        synced[path] = (size, mtime)
+    logger.debug("mirror delta: {} changed, {} bytes fetched", len(changed), moved)
+    return synced
+
+
+def _fetch_tail(
+    container: Any, path: str, local: Path, offset: int, size: int, budget: int
+) -> int | None:
+    """Write the whole lines of up to ``budget`` bytes past ``offset`` into ``local``.
+
+    Returns the bytes written; None means refetch the file whole. The
+    ``TAIL_OVERLAP_BYTES`` before ``offset`` come along too and must match the
+    mirror's: a file rewritten rather than appended to is fetched whole instead.
+    ``local`` is truncated to ``offset`` before the write, so a repeated append
+    never duplicates a record, and only whole lines are kept, so a reader never
+    sees a torn last line.
+    """
+    length = min(size - offset, max(budget, 0))
+    if length <= 0:
+        return 0
+    overlap = min(offset, TAIL_OVERLAP_BYTES)
+    command = (
+        f"tail -c +{offset - overlap + 1} {shlex.quote(path)} 2>/dev/null"
+        f" | head -c {overlap + length}"
+    )
+    try:
+        result = container.exec_run(["sh", "-c", command])
+    except Exception:
+        return None
+    data = result.output or b""
+    if getattr(result, "exit_code", 1) != 0 or len(data) <= overlap:
+        return None
+    with open(local, "rb") as handle:
+        handle.seek(offset - overlap)
+        if handle.read(overlap) != data[:overlap]:
+            return None
+    tail = data[overlap:]
+    end = tail.rfind(b"\n") + 1
+    if end == 0:
+        # No complete line yet: wait for it, unless the budget cut a line that
+        # is longer than the whole budget, which only a full fetch can move.
+        return None if length < size - offset else 0
+    with open(local, "r+b") as handle:
+        handle.truncate(offset)
+        handle.seek(offset)
+        handle.write(tail[:end])
+    return end
+
+
+def _host_path(dest: Path, container_path: str) -> Path:
+    return dest / container_path.removeprefix("/workspace/").lstrip("/")
 
 
 def _extract(container: Any, container_path: str, dest: Path) -> None:
@@ -95,7 +246,7 @@ def _extract(container: Any, container_path: str, dest: Path) -> None:
     except Exception:
         return  # missing path (NotFound) or unreachable container — skip
     try:
-        with tarfile.open(fileobj=io.BufferedReader(_ChunkReader(stream)), mode="r|") as tar:
+        with tarfile.open(fileobj=io.BufferedReader(ChunkReader(stream)), mode="r|") as tar:
             tar.extractall(dest, filter="data")
     except Exception as exc:
         logger.debug("mirror extract failed for {}: {}", container_path, exc)
@@ -114,7 +265,8 @@ def _extract_report(container: Any, dest: Path) -> None:
         except OSError:
             continue
     for name in names:
-        _extract(container, f"/workspace/{name}", dest)
+        if not (dest / name).is_file():  # a finished report never changes
+            _extract(container, f"/workspace/{name}", dest)
 
 
 class MirrorReader:
@@ -125,7 +277,7 @@ class MirrorReader:
     path, not a general shell. Add a branch here if a helper grows a new shape.
     """
 
-    _CONTEXT_GLOBS = ("trunk*.json", "phase_*.json", "full_outputs.jsonl")
+    _CONTEXT_GLOBS = ("trunk*.json", "phase_*.json", "phase_*.events.jsonl", "full_outputs.jsonl")
 
     def __init__(self, mirror: Path):
         self.mirror = mirror
@@ -208,9 +208,9 @@ class ContainerSessionRegistry:
         if self.workspace_registry_factory is not None:
             registry = self.workspace_registry_factory()
         else:
-            from sag.web.workspace_registry import WorkspaceRegistry
+            from sag.web.workspace_registry import shared_workspace_registry
 
-            registry = WorkspaceRegistry()
+            registry = shared_workspace_registry()
 
         return registry.list_workspaces()
 
@@ -752,7 +752,7 @@ def _read_latest_trunk(orchestrator: Any) -> tuple[str, dict[str, Any]] | None:
 def _context_filenames(orchestrator: Any) -> list[str]:
     command = (
         "find /workspace/.setup_agent/contexts -maxdepth 2 -type f "
-        "\\( -name 'trunk*.json' -o -name 'phase_*.json' "
+        "\\( -name 'trunk*.json' -o -name 'phase_*.json' -o -name 'phase_*.events.jsonl' "
         "-o -name 'full_outputs.jsonl' -o -path '*/journal/phase_*.journal.jsonl' \\) "
         "-printf '%P\\n' 2>/dev/null || true"
     )
@@ -1603,7 +1603,7 @@ def _find_session_item(raw: str, session_id: str) -> dict[str, Any] | None:
 def _read_context_trace(orchestrator: Any) -> ContextTrace | None:
     command = (
         "find /workspace/.setup_agent/contexts -maxdepth 2 -type f "
-        "\\( -name 'trunk*.json' -o -name 'phase_*.json' "
+        "\\( -name 'trunk*.json' -o -name 'phase_*.json' -o -name 'phase_*.events.jsonl' "
         "-o -name 'full_outputs.jsonl' -o -path '*/journal/phase_*.journal.jsonl' \\) "
         "-printf '%P\\n' 2>/dev/null || true"
     )
@@ -1656,6 +1656,8 @@ def _is_context_filename(filename: str) -> bool:
         return True
     if filename.startswith("journal/"):
         return bool(re.fullmatch(r"journal/phase_[A-Za-z0-9_-]+\.journal\.jsonl", filename))
+    if filename.endswith(".events.jsonl"):
+        return bool(re.fullmatch(r"phase_[A-Za-z0-9_-]+\.events\.jsonl", filename))
     if not filename.endswith(".json"):
         return False
     return filename.startswith(("trunk", "phase_"))
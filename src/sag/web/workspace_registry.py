@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
-from typing import Any
+import threading
+import time
+from typing import Any, Callable
+
+from loguru import logger
 
 from sag.web.models import BuildSummary, DockerSummary, TestSummary, WorkspaceSummary
 
@@ -18,23 +22,263 @@ class WorkspaceRegistry:
     def list_workspaces(self) -> list[WorkspaceSummary]:
         workspaces: list[WorkspaceSummary] = []
 
-        for container in self._list_containers():
+        for container in self._list_containers() or []:
             summary = _workspace_summary(container)
             if summary is not None:
                 workspaces.append(summary)
 
         return sorted(workspaces, key=lambda workspace: workspace.container)
 
-    def _list_containers(self) -> list[Any]:
+    def _list_containers(self) -> list[Any] | None:
+        """Every container, or None when the daemon could not be asked."""
         try:
             return list(self.client.containers.list(all=True, ignore_removed=True))
         except TypeError:
             try:
                 return list(self.client.containers.list(all=True))
+            except Exception as exc:
+                logger.debug("docker container list failed: {}", exc)
+                return None
+        except Exception as exc:
+            logger.debug("docker container list failed: {}", exc)
+            return None
+
+
+# Container actions that can change a workspace summary (name, status, image).
+_WORKSPACE_ACTIONS = frozenset(
+    "create start restart stop die kill pause unpause rename update oom destroy".split()
+)
+DF_REFRESH_SECONDS = 300.0
+# Full re-list as a backstop for events missed while the stream reconnected.
+RESYNC_SECONDS = 600.0
+
+
+class CachedWorkspaceRegistry(WorkspaceRegistry):
+    """``WorkspaceRegistry`` served from memory and kept current by Docker events.
+
+    The container list is fetched once; after that a background thread follows
+    the daemon's container events and re-reads only the container an event
+    names. ``df()`` (slow on hosts with many images and volumes) is served
+    stale-while-revalidate: the last result comes back at once and a refresh
+    starts in the background when it is older than ``df_interval``; the
+    periodic full re-list (``resync_interval``) runs the same way. No reader
+    ever blocks on the daemon once the first list is in. A list the daemon
+    fails to answer keeps the last good one and is retried on the next read.
+    """
+
+    def __init__(
+        self,
+        client: Any | None = None,
+        df_interval: float = DF_REFRESH_SECONDS,
+        resync_interval: float = RESYNC_SECONDS,
+        now: Callable[[], float] = time.monotonic,
+    ):
+        super().__init__(client)
+        self.df_interval = df_interval
+        self.resync_interval = resync_interval
+        self._now = now
+        self._lock = threading.Lock()
+        self._containers: dict[str, WorkspaceSummary] | None = None
+        self._synced_at = 0.0
+        self._resyncing = False
+        self._df: dict[str, Any] | None = None
+        self._df_at: float | None = None
+        self._df_refreshing = False
+        self._listeners: list[Callable[[], None]] = []
+        self._watcher: threading.Thread | None = None
+        self._subscribed: threading.Event | None = None
+        self._stopped = threading.Event()
+        self._events: Any = None
+
+    def list_workspaces(self) -> list[WorkspaceSummary]:
+        self._start_watcher()
+        with self._lock:
+            cached = self._containers
+            stale = self._now() - self._synced_at >= self.resync_interval
+            revalidate = cached is not None and stale and not self._resyncing
+            if revalidate:
+                self._resyncing = True
+        if cached is None:
+            cached = self._resync()
+        elif revalidate:
+            threading.Thread(
+                target=self._revalidate, daemon=True, name="sag-workspace-resync"
+            ).start()
+        return sorted(cached.values(), key=lambda workspace: workspace.container)
+
+    def df(self) -> dict[str, Any] | None:
+        """The last ``client.df()`` result (None before the first one lands)."""
+        with self._lock:
+            due = self._df_at is None or self._now() - self._df_at >= self.df_interval
+            if due and not self._df_refreshing:
+                self._df_refreshing = True
+                threading.Thread(target=self._refresh_df, daemon=True, name="sag-docker-df").start()
+            return self._df
+
+    def add_listener(self, listener: Callable[[], None]) -> None:
+        """Call ``listener`` (from the watcher thread) whenever a workspace changes."""
+        with self._lock:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[], None]) -> None:
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def close(self) -> None:
+        self._stopped.set()
+        close = getattr(self._events, "close", None)
+        if close is not None:
+            try:
+                close()
+            except Exception:
+                pass
+
+    def _resync(self) -> dict[str, WorkspaceSummary]:
+        listed = self._list_containers()
+        if listed is None:
+            # Not authoritative: keep what we had and leave ``_synced_at`` as
+            # it is, so the next read asks the daemon again.
+            with self._lock:
+                return dict(self._containers or {})
+        containers: dict[str, WorkspaceSummary] = {}
+        for container in listed:
+            summary = _workspace_summary(container)
+            if summary is not None:
+                containers[_container_key(container, summary)] = summary
+        with self._lock:
+            self._containers = containers
+            self._synced_at = self._now()
+        return containers
+
+    def _revalidate(self) -> None:
+        with self._lock:
+            before = dict(self._containers or {})
+        try:
+            after = self._resync()
+        finally:
+            with self._lock:
+                self._resyncing = False
+        if after != before:
+            self._notify()
+
+    def _refresh_df(self) -> None:
+        try:
+            result = self.client.df()
+        except Exception as exc:
+            logger.debug("docker df refresh failed: {}", exc)
+            result = None
+        with self._lock:
+            if result is not None:
+                self._df = result
+            self._df_at = self._now()
+            self._df_refreshing = False
+
+    def _start_watcher(self) -> None:
+        with self._lock:
+            if not hasattr(self.client, "events"):
+                return
+            subscribed = self._subscribed
+            if subscribed is None:
+                self._subscribed = threading.Event()
+        if subscribed is not None:
+            # Another reader is subscribing; its list must not run ahead of it.
+            subscribed.wait()
+            return
+        # Subscribed before the first list, so nothing happens unseen in between.
+        # Opened outside the lock: connecting to the daemon can block.
+        try:
+            try:
+                stream = self._open_events()
+            except Exception as exc:
+                logger.debug("docker event stream unavailable: {}", exc)
+                stream = None
+            watcher = threading.Thread(
+                target=self._watch, args=(stream,), daemon=True, name="sag-workspace-events"
+            )
+            with self._lock:
+                self._watcher = watcher
+            watcher.start()
+        finally:
+            self._subscribed.set()
+
+    def _open_events(self) -> Any:
+        self._events = self.client.events(decode=True, filters={"type": "container"})
+        return self._events
+
+    def _watch(self, stream: Any) -> None:
+        delay = 1.0
+        while not self._stopped.is_set():
+            try:
+                if stream is None:
+                    stream = self._open_events()
+                    # Events from before this connection are gone; re-list once.
+                    if self._containers is not None:
+                        self._resync()
+                        self._notify()
+                delay = 1.0
+                for event in stream:
+                    if self._stopped.is_set():
+                        return
+                    self._apply_event(event)
+            except Exception as exc:
+                logger.debug("docker event stream interrupted: {}", exc)
+            stream = None
+            if self._stopped.wait(delay):
+                return
+            delay = min(delay * 2, 30.0)
+
+    def _apply_event(self, event: dict[str, Any]) -> None:
+        action = str(event.get("Action") or event.get("status") or "").split(":")[0]
+        actor = event.get("Actor") or {}
+        name = str((actor.get("Attributes") or {}).get("name", ""))
+        container_id = str(actor.get("ID") or event.get("id") or "")
+        if action not in _WORKSPACE_ACTIONS or not container_id:
+            return
+        with self._lock:
+            known = self._containers is not None and container_id in self._containers
+            if self._containers is None or not (known or name.startswith("sag-")):
+                return
+        summary = None
+        if action != "destroy":
+            try:
+                summary = _workspace_summary(self.client.containers.get(container_id))
+            except Exception:
+                summary = None
+        with self._lock:
+            if self._containers is None:
+                return
+            if summary is None:
+                self._containers.pop(container_id, None)
+            else:
+                self._containers[container_id] = summary
+        self._notify()
+
+    def _notify(self) -> None:
+        with self._lock:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            try:
+                listener()
             except Exception:
-                return []
-        except Exception:
-            return []
+                logger.exception("workspace change listener failed")
+
+
+_shared_registry: CachedWorkspaceRegistry | None = None
+_shared_lock = threading.Lock()
+
+
+def shared_workspace_registry() -> CachedWorkspaceRegistry:
+    """The process-wide cached registry every web read path shares."""
+    global _shared_registry
+    with _shared_lock:
+        if _shared_registry is None:
+            _shared_registry = CachedWorkspaceRegistry()
+        return _shared_registry
+
+
+def _container_key(container: Any, summary: WorkspaceSummary) -> str:
+    return _text(_safe_getattr(container, "id")) or summary.container
 
 
 def _workspace_summary(container: Any) -> WorkspaceSummary | None:
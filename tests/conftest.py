@@ -1,3 +1,5 @@
+import subprocess
+
 import pytest
 
 from sag.agent.output_storage import OutputStorageManager
@@ -17,3 +19,42 @@ def bind_durable_tool_result_storage(durable_tool_result_storage):
         tool_name="test",
     ):
         yield
+
+
+@pytest.fixture(autouse=True)
+def isolate_report_parse_cache(tmp_path_factory, monkeypatch):
+    # The compact report parser persists its parse cache on the (local) host
+    # when tests execute it for real; keep every test's cache private.
+    monkeypatch.setattr(
+        "sag.agent.physical_validator.REPORT_PARSE_CACHE_DIR",
+        str(tmp_path_factory.mktemp("report-parse-cache")),
+    )
+    # Same for the Java test scanner's per-file cache.
+    monkeypatch.setattr(
+        "sag.testcases.catalog.TEST_CATALOG_CACHE_DIR",
+        str(tmp_path_factory.mktemp("test-catalog-cache")),
+    )
+    # And for the report snapshots' stat -> sha256 cache.
+    monkeypatch.setattr(
+        "sag.agent.invocation_receipts.REPORT_HASH_CACHE",
+        str(tmp_path_factory.mktemp("report-hash-cache") / "cache.json"),
+    )
+
+
+class LocalBashOrchestrator:
+    """Runs every orchestrator command in a local bash, counting execs."""
+
+    def __init__(self):
+        self.commands = []
+
+    def execute_command(self, command, workdir=None, **kwargs):
+        self.commands.append(command)
+        proc = subprocess.run(["bash", "-c", command], capture_output=True, text=True, timeout=120)
+        output = proc.stdout + proc.stderr
+        return {"success": proc.returncode == 0, "exit_code": proc.returncode, "output": output}
+
+
+@pytest.fixture
+def local_bash():
+    """The local-bash orchestrator class: call it for a fresh orchestrator."""
+    return LocalBashOrchestrator
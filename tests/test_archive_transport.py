@@ -0,0 +1,192 @@
+"""Tar-archive transport: whole files and trees move in one get/put_archive call.
+
+The fake Docker API below serves archives from the host filesystem (container
+paths == host paths under tmp_path) and runs finalize execs in a local bash.
+"""
+
+import io
+import os
+import stat
+import subprocess
+import tarfile
+
+import pytest
+from docker.errors import NotFound
+
+from sag.docker_orch.archive import GO_MODE_DIR, build_archive
+from sag.docker_orch.orch import DockerOrchestrator
+from sag.runtime.container_io import read_container_text, read_container_tree
+from sag.utils.container_io import write_container_files, write_container_text
+
+
+class LocalExecResult:
+    def __init__(self, exit_code, output):
+        self.exit_code = exit_code
+        self.output = output
+
+
+class LocalBashContainer:
+    def __init__(self):
+        self.exec_calls = []
+
+    def exec_run(self, exec_command, **kwargs):
+        self.exec_calls.append(exec_command)
+        proc = subprocess.run(exec_command, capture_output=True)
+        return LocalExecResult(proc.returncode, (proc.stdout or None, proc.stderr or None))
+
+
+class HostArchiveAPI:
+    def __init__(self):
+        self.get_calls = []
+        self.put_calls = []
+
+    def get_archive(self, container, path):
+        self.get_calls.append(path)
+        if not os.path.lexists(path):
+            raise NotFound(f"Could not find the file {path} in container {container}")
+        buffer = io.BytesIO()
+        with tarfile.open(fileobj=buffer, mode="w") as tar:
+            tar.add(path, arcname=os.path.basename(path.rstrip("/")))
+        st = os.lstat(path)
+        mode = stat.S_IMODE(st.st_mode) | (GO_MODE_DIR if stat.S_ISDIR(st.st_mode) else 0)
+        data = buffer.getvalue()
+        return iter([data[i : i + 1000] for i in range(0, len(data), 1000)]), {"mode": mode}
+
+    def put_archive(self, container, path, data):
+        self.put_calls.append(path)
+        with tarfile.open(fileobj=io.BytesIO(data)) as tar:
+            for member in tar.getmembers():
+                target = os.path.join(path, member.name)
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                with open(target, "wb") as handle:
+                    handle.write(tar.extractfile(member).read())
+        return True
+
+
+class FakeContainers:
+    def __init__(self, container):
+        self.container = container
+
+    def get(self, _name):
+        return self.container
+
+
+class FakeClient:
+    def __init__(self, container):
+        self.containers = FakeContainers(container)
+        self.api = HostArchiveAPI()
+
+
+@pytest.fixture
+def orchestrator():
+    orchestrator = DockerOrchestrator.__new__(DockerOrchestrator)
+    orchestrator.client = FakeClient(LocalBashContainer())
+    orchestrator.container_name = "sag-demo"
+    orchestrator.is_container_running = lambda: True
+    orchestrator._runtime_profile_prefix = lambda: "true"
+    return orchestrator
+
+
+def test_exact_read_uses_one_archive_call_and_keeps_bytes(orchestrator, tmp_path):
+    target = tmp_path / "history.json"
+    target.write_bytes("{\"k\": \"ü\"}\n\n".encode())
+
+    text = read_container_text(orchestrator, str(target), exact_bytes=True)
+
+    assert text == "{\"k\": \"ü\"}\n\n"
+    assert orchestrator.client.api.get_calls == [str(target)]
+    assert orchestrator.client.containers.container.exec_calls == []
+
+
+def test_absent_file_is_none_without_an_exec(orchestrator, tmp_path):
+    assert read_container_text(orchestrator, str(tmp_path / "missing"), exact_bytes=True) is None
+    assert orchestrator.client.containers.container.exec_calls == []
+
+
+def test_non_exact_read_keeps_the_stripped_cat_shape(orchestrator, tmp_path):
+    target = tmp_path / "report.xml"
+    target.write_text("<a/>\n")
+
+    assert read_container_text(orchestrator, str(target)) == "<a/>"
+
+
+def test_symlink_falls_back_to_the_shell_read(orchestrator, tmp_path):
+    real = tmp_path / "real.txt"
+    real.write_text("payload")
+    link = tmp_path / "link.txt"
+    link.symlink_to(real)
+    orchestrator.client.api.get_archive = lambda container, path: (
+        iter([]),
+        {"mode": 1 << 27},
+    )
+
+    assert read_container_text(orchestrator, str(link), exact_bytes=True) == "payload"
+    assert orchestrator.client.containers.container.exec_calls
+
+
+def test_tree_read_streams_every_file_in_one_call(orchestrator, tmp_path):
+    root = tmp_path / "reports"
+    (root / "nested").mkdir(parents=True)
+    (root / "TEST-a.xml").write_text("a")
+    (root / "nested" / "TEST-b.xml").write_text("b")
+
+    files = read_container_tree(orchestrator, str(root))
+
+    assert files == {
+        str(root / "TEST-a.xml"): b"a",
+        str(root / "nested" / "TEST-b.xml"): b"b",
+    }
+    assert orchestrator.client.api.get_calls == [str(root)]
+    assert read_container_tree(orchestrator, str(tmp_path / "none")) is None
+
+
+def test_large_write_is_one_upload_and_one_rename(orchestrator, tmp_path):
+    target = tmp_path / "deep" / "branch.json"
+    big = "x" * 200_000
+
+    assert write_container_text(orchestrator, str(target), big)
+
+    assert target.read_text() == big + "\n"
+    assert orchestrator.client.api.put_calls == ["/"]
+    assert len(orchestrator.client.containers.container.exec_calls) == 1
+    assert not list(target.parent.glob("*.sag-tmp-*"))
+
+
+def test_large_append_keeps_prior_content(orchestrator, tmp_path):
+    target = tmp_path / "outputs.jsonl"
+    target.write_text("first\n")
+
+    assert write_container_text(orchestrator, str(target), "y" * 70_000, append=True)
+
+    assert target.read_text() == "first\n" + "y" * 70_000 + "\n"
+
+
+def test_many_files_share_one_upload(orchestrator, tmp_path):
+    files = {str(tmp_path / f"d{i}" / "f.bin"): bytes([i]) * 3 for i in range(20)}
+
+    assert write_container_files(orchestrator, files)
+
+    assert orchestrator.client.api.put_calls == ["/"]
+    assert len(orchestrator.client.containers.container.exec_calls) == 1
+    for path, data in files.items():
+        assert open(path, "rb").read() == data
+
+
+def test_failed_upload_falls_back_to_the_chunked_shell_path(orchestrator, tmp_path):
+    def reject(container, path, data):
+        raise RuntimeError("daemon said no")
+
+    orchestrator.client.api.put_archive = reject
+    target = tmp_path / "fallback.txt"
+
+    assert write_container_text(orchestrator, str(target), "z" * 70_000, max_cmd_chars=30_000)
+    assert target.read_text() == "z" * 70_000 + "\n"
+
+
+def test_build_archive_round_trips_names_and_modes():
+    data = build_archive({"/w/a.txt": b"abc"}, mode=0o600)
+
+    with tarfile.open(fileobj=io.BytesIO(data)) as tar:
+        member = tar.getmember("w/a.txt")
+        assert member.mode == 0o600
+        assert tar.extractfile(member).read() == b"abc"
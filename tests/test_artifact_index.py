@@ -0,0 +1,180 @@
+"""Incremental artifact index: one walk answers every class/JAR question.
+
+Execs run in a local bash (container paths == host paths under tmp_path), so
+the in-container index script and its `find -newerct` refresh run for real.
+"""
+
+import os
+import shutil
+import subprocess
+
+import pytest
+
+from sag.agent.artifact_index import ARTIFACT_INDEX_SCRIPT, parse_artifact_index
+from sag.agent.physical_validator import PhysicalValidator
+from sag.docker_orch.orch import DockerOrchestrator
+
+
+class LocalExecResult:
+    def __init__(self, exit_code, output):
+        self.exit_code = exit_code
+        self.output = output
+
+
+class LocalBashContainer:
+    def __init__(self):
+        self.exec_calls = []
+
+    def exec_run(self, exec_command, **kwargs):
+        self.exec_calls.append(exec_command)
+        proc = subprocess.run(exec_command, capture_output=True)
+        return LocalExecResult(proc.returncode, (proc.stdout or None, proc.stderr or None))
+
+
+class FakeContainers:
+    def __init__(self, container):
+        self.container = container
+
+    def get(self, _name):
+        return self.container
+
+
+class FakeClient:
+    def __init__(self, container):
+        self.containers = FakeContainers(container)
+
+
+@pytest.fixture
+def orchestrator():
+    orchestrator = DockerOrchestrator.__new__(DockerOrchestrator)
+    orchestrator.client = FakeClient(LocalBashContainer())
+    orchestrator.container_name = "sag-demo"
+    orchestrator.is_container_running = lambda: True
+    orchestrator._runtime_profile_prefix = lambda: "true"
+    return orchestrator
+
+
+def _touch(path, mtime=None):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"\xca\xfe\xba\xbe")
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+
+
+def _index(project, index_path, full=False):
+    arguments = [str(project), str(index_path), "1" if full else "0"]
+    proc = subprocess.run(
+        ["python3", "-c", ARTIFACT_INDEX_SCRIPT, *arguments], capture_output=True, text=True
+    )
+    return parse_artifact_index(proc.stdout)
+
+
+def _exec_count(orchestrator):
+    return len(orchestrator.client.containers.container.exec_calls)
+
+
+def test_refresh_tracks_added_moved_and_removed_artifacts(tmp_path):
+    project = tmp_path / "proj"
+    _touch(project / "core" / "target" / "classes" / "A.class", 1_000_000)
+    _touch(project / "core" / "target" / "classes" / "B.class", 1_000_000)
+    _touch(project / "api" / "build" / "classes" / "java" / "main" / "C.class", 1_000_000)
+    _touch(project / "core" / "target" / "core.jar", 1_000_000)
+    index_path = tmp_path / "index" / "proj.json"
+
+    first = _index(project, index_path)
+    assert first.rebuilt and first.class_count == 3 and first.indexed == 4
+    assert first.newest_class_mtime == pytest.approx(1_000_000)
+    assert first.class_count_under(str(project / "core" / "target" / "classes")) == 2
+    assert first.class_count_under(str(project / "api" / "build" / "classes")) == 1
+
+    untouched = _index(project, index_path)
+    assert (untouched.rebuilt, untouched.changed, untouched.class_count) == (False, 0, 3)
+
+    _touch(project / "core" / "target" / "classes" / "D.class", 2_000_000)
+    shutil.rmtree(project / "api" / "build")
+    # Moved in with an old mtime: only the ctime says it is new.
+    _touch(tmp_path / "elsewhere" / "old.jar", 500_000)
+    os.rename(tmp_path / "elsewhere" / "old.jar", project / "core" / "target" / "old.jar")
+
+    refreshed = _index(project, index_path)
+    assert not refreshed.rebuilt
+    assert refreshed.class_count == 3
+    assert refreshed.class_count_under(str(project / "api" / "build" / "classes")) == 0
+    assert refreshed.newest_class_mtime == pytest.approx(2_000_000)
+    assert refreshed.jars == tuple(
+        sorted(str(project / "core" / "target" / name) for name in ("core.jar", "old.jar"))
+    )
+    assert _index(project, index_path, full=True).class_sample == refreshed.class_sample
+
+
+def test_a_failed_index_write_is_not_vouched_for_by_the_stamp(tmp_path):
+    project = tmp_path / "proj"
+    _touch(project / "target" / "classes" / "A.class", 1_000_000)
+    index_path = tmp_path / "index" / "proj.json"
+    assert _index(project, index_path).class_count == 1
+
+    _touch(project / "target" / "classes" / "B.class", 2_000_000)
+    (tmp_path / "index" / "proj.json.tmp").mkdir()  # the staged write fails
+    assert _index(project, index_path).class_count == 2
+    (tmp_path / "index" / "proj.json.tmp").rmdir()
+
+    recovered = _index(project, index_path)
+    assert recovered.rebuilt and recovered.class_count == 2
+
+
+def test_validator_answers_every_artifact_check_from_one_index_exec(orchestrator, tmp_path):
+    project = tmp_path / "proj"
+    _touch(project / "target" / "classes" / "Root.class")
+    _touch(project / "mod" / "target" / "classes" / "m" / "Mod.class")
+    _touch(project / "mod" / "target" / "mod.jar")
+    _touch(project / "gradle" / "wrapper" / "gradle-wrapper.jar")
+    (project / "pom.xml").write_text("<project/>")
+    (project / "mod" / "pom.xml").write_text("<project/>")
+    validator = PhysicalValidator(docker_orchestrator=orchestrator, project_path=str(tmp_path))
+
+    result = validator.validate_build_artifacts("proj")
+
+    assert result["class_files"] == 2
+    assert result["jar_files"] == 1
+    assert result["recent_compilation"] is True
+    assert result["jar_file_paths"] == [str(project / "mod" / "target" / "mod.jar")]
+    commands = [call[-1] for call in orchestrator.client.containers.container.exec_calls]
+    assert len([command for command in commands if "-newerct" in command]) == 1
+    assert not any("-name '*.class'" in command or "-exec stat" in command for command in commands)
+
+    modules = {m["path"]: m for m in validator.scan_modules(str(project), "maven")}
+    assert (modules["."]["class_count"], modules["."]["jar_count"]) == (1, 0)
+    assert (modules["mod"]["class_count"], modules["mod"]["jar_count"]) == (1, 1)
+    assert (tmp_path / ".setup_agent" / "artifact_index").is_dir()
+
+
+def test_fresh_validation_rebuilds_the_index(orchestrator, tmp_path):
+    project = tmp_path / "proj"
+    _touch(project / "target" / "classes" / "A.class")
+    validator = PhysicalValidator(docker_orchestrator=orchestrator, project_path=str(tmp_path))
+    assert validator.validate_build_artifacts("proj")["class_files"] == 1
+
+    _touch(project / "target" / "classes" / "B.class")
+    before = _exec_count(orchestrator)
+    assert validator.validate_build_artifacts("proj")["class_files"] == 1  # TTL cache
+    assert _exec_count(orchestrator) > before  # missing-class scan still runs
+
+    assert validator.validate_build_artifacts_fresh("proj")["class_files"] == 2
+    assert validator._artifact_snapshot(str(project)).rebuilt is True
+
+
+def test_test_doubles_keep_the_find_scans():
+    class Double:
+        def __init__(self):
+            self.commands = []
+
+        def execute_command(self, command, **kwargs):
+            self.commands.append(command)
+            return {"success": True, "output": "0", "exit_code": 0}
+
+    double = Double()
+    validator = PhysicalValidator(docker_orchestrator=double, project_path="/workspace")
+
+    assert validator._artifact_snapshot("/workspace/proj") is None
+    assert validator._check_class_files("/workspace/proj")["count"] == 0
+    assert any("-name '*.class'" in command for command in double.commands)
@@ -0,0 +1,97 @@
+"""Branch history: append-only event log folded into periodic snapshots."""
+
+import json
+
+from sag.agent import context_manager
+from sag.agent.context_manager import BranchContextHistory, ContextManager
+from sag.web.context_trace import ContextTraceBuilder
+
+
+def _open_branch(manager, task_id="phase_build"):
+    history = BranchContextHistory(task_id=task_id, task_description="Build the project")
+    manager._save_branch_history(history, str(manager.contexts_dir / f"{task_id}.json"))
+    return task_id
+
+
+def _snapshot(manager, task_id):
+    return json.loads((manager.contexts_dir / f"{task_id}.json").read_text())
+
+
+def test_appends_go_to_the_log_and_a_fresh_manager_reads_them_back(tmp_path):
+    manager = ContextManager(workspace_path=str(tmp_path))
+    task_id = _open_branch(manager)
+
+    for index in range(3):
+        result = manager.add_to_branch_history(task_id, {"type": "action", "n": index})
+
+    assert result["entry_count"] == 3
+    assert _snapshot(manager, task_id)["history"] == []
+    log = manager.contexts_dir / f"{task_id}.events.jsonl"
+    assert len(log.read_text().splitlines()) == 3
+
+    reloaded = ContextManager(workspace_path=str(tmp_path)).load_branch_history(task_id)
+    cached = manager.load_branch_history(task_id)
+    assert [entry["n"] for entry in reloaded.history] == [0, 1, 2]
+    assert (reloaded.entry_count, reloaded.token_count) == (3, cached.token_count)
+
+
+def test_the_log_is_folded_into_the_snapshot_periodically_and_on_completion(
+    tmp_path, monkeypatch
+):
+    monkeypatch.setattr(context_manager, "COMPACT_EVERY_EVENTS", 3)
+    manager = ContextManager(workspace_path=str(tmp_path))
+    manager.create_trunk_context(goal="Set up", project_url="https://x.test/a", project_name="a")
+    trunk = manager.load_trunk_context()
+    task_id = trunk.add_task("Build")
+    manager._save_trunk_context(trunk)
+    manager.start_new_branch(task_id)
+    log = manager.contexts_dir / f"{task_id}.events.jsonl"
+
+    for index in range(4):
+        manager.add_to_branch_history(task_id, {"n": index})
+
+    assert len(_snapshot(manager, task_id)["history"]) == 3
+    assert len(log.read_text().splitlines()) == 1
+
+    manager.complete_branch(task_id, "built")
+
+    assert [entry["n"] for entry in _snapshot(manager, task_id)["history"]] == [0, 1, 2, 3]
+    assert not log.exists()
+
+
+def test_events_from_before_a_compaction_are_never_replayed(tmp_path):
+    manager = ContextManager(workspace_path=str(tmp_path))
+    task_id = _open_branch(manager)
+    for index in range(3):
+        manager.add_to_branch_history(task_id, {"n": index})
+    log = manager.contexts_dir / f"{task_id}.events.jsonl"
+    stale = log.read_text()
+
+    manager.compact_branch_history(task_id, [{"summary": "compacted"}])
+    # A crash between the snapshot write and the log removal leaves the old
+    # log, and a crash mid-append a torn last line.
+    log.write_text(stale + '{"torn": ')
+    restarted = ContextManager(workspace_path=str(tmp_path))
+    restarted.add_to_branch_history(task_id, {"n": "after"})
+
+    reloaded = ContextManager(workspace_path=str(tmp_path)).load_branch_history(task_id)
+    assert reloaded.history[0] == {"summary": "compacted"}
+    assert [entry.get("n") for entry in reloaded.history] == [None, "after"]
+
+
+def test_an_append_in_a_container_is_one_exec_whatever_the_history_size(tmp_path, local_bash):
+    orchestrator = local_bash()
+    manager = ContextManager(workspace_path=str(tmp_path), orchestrator=orchestrator)
+    task_id = _open_branch(manager)
+    for index in range(20):
+        manager.add_to_branch_history(task_id, {"n": index, "output": "x" * 2000})
+
+    orchestrator.commands.clear()
+    manager.add_to_branch_history(task_id, {"n": 20})
+
+    (command,) = orchestrator.commands
+    assert command.startswith(f"cat >> {manager.contexts_dir}/{task_id}.events.jsonl")
+    assert len(command) < 500
+
+    trace_history = ContextTraceBuilder(manager.contexts_dir)._branch_data(task_id)["history"]
+    assert [entry["n"] for entry in trace_history] == list(range(21))
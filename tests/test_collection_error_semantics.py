@@ -148,6 +148,7 @@ def _run_compact_parser(project_dir: str, pytest_reports_dir: str) -> dict:
         "pytest_reports_dir": pytest_reports_dir,
         "receipts_dir": "/workspace/.setup_agent/invocation_receipts",
         "primary_root": None,
+        "report_cache_path": None,
     }
     buffer = io.StringIO()
     with contextlib.redirect_stdout(buffer):
@@ -0,0 +1,146 @@
+"""Shared dependency cache: seed new containers, publish back by content.
+
+The cache script runs in a local python3 against tmp_path "homes" and a
+tmp_path volume, so the blob store, hard links and eviction run for real.
+"""
+
+import os
+import subprocess
+
+from sag.docker_orch.dependency_cache import (
+    DEPENDENCY_CACHE_SCRIPT,
+    cache_command,
+    parse_cache_summary,
+)
+
+
+def _run(mode, root, home, max_bytes=0):
+    proc = subprocess.run(
+        ["python3", "-c", DEPENDENCY_CACHE_SCRIPT, mode, str(root), str(home), str(max_bytes)],
+        capture_output=True,
+        text=True,
+    )
+    assert proc.returncode == 0, proc.stderr
+    return proc.stdout
+
+
+def _artifact(home, relative, content):
+    path = home / ".m2" / "repository" / relative
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+    return path
+
+
+def _volume(tmp_path):
+    root = tmp_path / "volume"
+    root.mkdir()
+    return root
+
+
+def test_publish_stores_each_release_once_and_skips_mutable_files(tmp_path):
+    root = _volume(tmp_path)
+    home = tmp_path / "a"
+    _artifact(home, "org/acme/core/1.0/core-1.0.jar", b"jar-bytes")
+    _artifact(home, "org/acme/util/2.0/util-2.0.jar", b"jar-bytes")
+    _artifact(home, "org/acme/core/1.1-SNAPSHOT/core-1.1-SNAPSHOT.jar", b"snap")
+    _artifact(home, "org/acme/core/maven-metadata-central.xml", b"<metadata/>")
+    _artifact(home, "org/acme/core/1.0/_remote.repositories", b"x")
+
+    summary = parse_cache_summary(_run("publish", root, home))
+
+    assert (summary.published, summary.blobs, summary.added_bytes) == (2, 1, len(b"jar-bytes"))
+    shared = root / "maven" / "repository" / "org" / "acme"
+    assert (shared / "core" / "1.0" / "core-1.0.jar").stat().st_nlink == 3
+    assert not (shared / "core" / "1.1-SNAPSHOT").exists()
+    assert not (shared / "core" / "maven-metadata-central.xml").exists()
+
+    again = parse_cache_summary(_run("publish", root, home))
+    assert (again.published, again.added_bytes) == (0, 0)
+
+
+def _gradle_file(home, relative, content):
+    path = home / ".gradle" / "caches" / "modules-2" / "files-2.1" / relative
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+    return path
+
+
+def test_seed_copies_nothing_and_never_clobbers_a_new_home(tmp_path):
+    root = _volume(tmp_path)
+    _artifact(tmp_path / "a", "org/acme/core/1.0/core-1.0.jar", b"shared")
+    _gradle_file(tmp_path / "a", "org.acme/core/1.0/abc/core-1.0.jar", b"shared")
+    _gradle_file(tmp_path / "a", "org.acme/api/1.0/def/api-1.0.jar", b"shared-api")
+    _run("publish", root, tmp_path / "a")
+    home = tmp_path / "b"
+    (home / ".mavenrc").parent.mkdir(parents=True)
+    (home / ".mavenrc").write_text('JAVA_HOME="/opt/jdk"\n')
+    local = _gradle_file(home, "org.acme/api/1.0/def/api-1.0.jar", b"local")
+
+    summary = parse_cache_summary(_run("seed", root, home))
+    _run("seed", root, home)
+
+    # Maven reads the volume in place, as a read-only tail of the private repository.
+    assert not (home / ".m2" / "repository").exists()
+    mavenrc = (home / ".mavenrc").read_text()
+    assert mavenrc.startswith('JAVA_HOME="/opt/jdk"\n')
+    assert mavenrc.count(f"-Dmaven.repo.local.tail={root}/maven/repository") == 1
+    # Gradle's module files are linked (same filesystem here: hard links).
+    assert summary.seeded == 1
+    files = home / ".gradle" / "caches" / "modules-2" / "files-2.1" / "org.acme"
+    shared = root / "gradle" / "files-2.1" / "org.acme" / "core" / "1.0" / "abc" / "core-1.0.jar"
+    assert os.path.samefile(files / "core" / "1.0" / "abc" / "core-1.0.jar", shared)
+    assert local.read_bytes() == b"local"
+    assert (home / ".sag-shared-cache-seeded").exists()
+
+
+def test_publish_refreshes_entries_read_in_place_but_not_untouched_ones(tmp_path):
+    root = _volume(tmp_path)
+    home = tmp_path / "a"
+    _artifact(home, "org/acme/read/1.0/read-1.0.jar", b"r")
+    _artifact(home, "org/acme/idle/1.0/idle-1.0.jar", b"i")
+    _run("publish", root, home)
+    shared = root / "maven" / "repository" / "org" / "acme"
+    read = shared / "read" / "1.0" / "read-1.0.jar"
+    idle = shared / "idle" / "1.0" / "idle-1.0.jar"
+    os.utime(read, (2_000_000, 1_000_000))  # read through the tail since its refresh
+    os.utime(idle, (1_000_000, 1_000_000))
+
+    summary = parse_cache_summary(_run("publish", root, tmp_path / "b"))
+
+    assert summary.refreshed == 1
+    assert read.stat().st_mtime > 1_000_000
+    assert idle.stat().st_mtime == 1_000_000
+
+
+def test_publish_over_budget_evicts_least_recently_used_entries(tmp_path):
+    root = _volume(tmp_path)
+    home = tmp_path / "a"
+    _artifact(home, "org/acme/old/1.0/old-1.0.jar", b"o" * 600)
+    _run("publish", root, home)
+    old = root / "maven" / "repository" / "org" / "acme" / "old" / "1.0" / "old-1.0.jar"
+    os.utime(old, (1_000_000, 1_000_000))
+    _artifact(home, "org/acme/new/1.0/new-1.0.jar", b"n" * 600)
+
+    summary = parse_cache_summary(_run("publish", root, home, max_bytes=1000))
+
+    assert summary.evicted == 1
+    assert (summary.total_bytes, summary.blobs) == (600, 1)
+    assert not old.exists()
+    assert (root / "maven" / "repository" / "org" / "acme" / "new" / "1.0").is_dir()
+    assert (root / "usage.json").exists()
+
+
+def test_unmounted_volume_reports_an_error_and_parses_to_none(tmp_path):
+    output = _run("seed", tmp_path / "missing", tmp_path / "home")
+
+    assert "not mounted" in output
+    assert parse_cache_summary(output) is None
+    assert parse_cache_summary("") is None
+
+
+def test_cache_command_quotes_the_script_and_arguments():
+    command = cache_command("publish", "/root", 20 * 1024**3)
+
+    assert command.startswith("python3 -c '")
+    assert command.endswith(" publish /sag-cache /root 21474836480")
+    assert cache_command("seed", max_bytes=1).endswith(" seed /sag-cache '~' 1")
@@ -0,0 +1,145 @@
+"""Pre-baked base images and post-provision toolchain snapshots.
+
+The Docker client is a small in-memory image store, so the tests pin what the
+orchestrator asks Docker to build, commit and tag — not Docker itself.
+"""
+
+from types import SimpleNamespace
+
+from docker.errors import NotFound
+
+from sag.docker_orch import images
+from sag.docker_orch.orch import DockerOrchestrator
+
+
+class FakeImage:
+    def __init__(self, store, name):
+        self.store = store
+        self.name = name
+
+    def tag(self, repository, tag):
+        self.store.images[f"{repository}:{tag}"] = self
+
+
+class FakeImages:
+    def __init__(self):
+        self.images = {}
+        self.builds = []
+
+    def get(self, name):
+        if name not in self.images:
+            raise NotFound(name)
+        return self.images[name]
+
+    def build(self, fileobj, tag, **kwargs):
+        self.builds.append((fileobj.read().decode(), tag))
+        self.images[tag] = FakeImage(self, tag)
+
+
+class FakeContainer:
+    def __init__(self, store):
+        self.store = store
+        self.commits = []
+
+    def commit(self, repository, tag, changes=None):
+        self.commits.append((repository, tag, list(changes or ())))
+        image = FakeImage(self.store, f"{repository}:{tag}")
+        self.store.images[f"{repository}:{tag}"] = image
+        return image
+
+
+class FakeClient:
+    def __init__(self):
+        self.images = FakeImages()
+
+
+def _orchestrator(client, commands, **config):
+    orchestrator = DockerOrchestrator.__new__(DockerOrchestrator)
+    orchestrator.client = client
+    orchestrator.base_image = "ubuntu:24.04"
+    orchestrator.container_name = "sag-demo"
+    orchestrator._start_image_kind = "base"
+    orchestrator.config = SimpleNamespace(
+        workspace_path="/workspace",
+        docker_prebaked_images=config.get("prebaked", True),
+        docker_toolchain_snapshots=config.get("snapshots", False),
+        shared_dependency_cache=False,
+    )
+
+    def execute_command(command, workdir=None, **kwargs):
+        commands.append(command)
+        output = "java=openjdk 17.0.9\nmaven=Apache Maven 3.9.6" if "echo java=" in command else ""
+        return {"success": True, "output": output, "exit_code": 0}
+
+    orchestrator.execute_command = execute_command
+    return orchestrator
+
+
+def test_base_image_tag_is_content_addressed_by_the_package_list():
+    tag = images.base_image_tag("ubuntu:24.04")
+
+    assert tag.startswith("sag-base:")
+    assert images.base_image_tag("ubuntu:24.04", list(reversed(images.ESSENTIAL_PACKAGES))) == tag
+    assert images.base_image_tag("ubuntu:22.04") != tag
+    assert images.base_image_tag("ubuntu:24.04", images.ESSENTIAL_PACKAGES + ("jq",)) != tag
+
+
+def test_prebaked_image_is_built_once_and_skips_the_in_container_installs():
+    client = FakeClient()
+    commands = []
+    orchestrator = _orchestrator(client, commands)
+
+    image = orchestrator._resolve_start_image(None)
+    assert image == images.base_image_tag("ubuntu:24.04")
+    assert orchestrator._resolve_start_image(None) == image
+    assert len(client.images.builds) == 1
+    dockerfile = client.images.builds[0][0]
+    assert dockerfile.startswith("FROM ubuntu:24.04\n")
+    assert "apt-get install -y -qq" in dockerfile and "build-essential" in dockerfile
+
+    assert orchestrator._setup_container_environment() is True
+    assert not any("apt-get" in command for command in commands)
+
+
+def test_a_failed_build_falls_back_to_the_distro_image_and_apt_get():
+    client = FakeClient()
+    client.images.build = lambda **kwargs: (_ for _ in ()).throw(RuntimeError("no network"))
+    commands = []
+    orchestrator = _orchestrator(client, commands)
+
+    assert orchestrator._resolve_start_image(None) == "ubuntu:24.04"
+    orchestrator._setup_container_environment()
+    assert any(command.startswith("apt-get install -y -qq curl") for command in commands)
+
+
+def test_snapshot_is_keyed_by_the_resolved_toolchain_and_warms_the_next_run():
+    client = FakeClient()
+    container = FakeContainer(client.images)
+    client.containers = SimpleNamespace(get=lambda _name: container)
+    commands = []
+    orchestrator = _orchestrator(client, commands, snapshots=True)
+    repo = "https://github.com/acme/app.git"
+
+    tag = orchestrator.snapshot_provisioned_toolchain(repo)
+
+    assert tag == images.snapshot_tag(
+        images.toolchain_fingerprint("java=openjdk 17.0.9\nmaven=Apache Maven 3.9.6")
+    )
+    ((repository, version, changes),) = container.commits
+    assert f"{repository}:{version}" == tag
+    assert any(change.startswith(f"LABEL {images.LABEL_TOOLCHAIN}=") for change in changes)
+    # Same toolchain for a second repository: no second commit, just an alias.
+    assert orchestrator.snapshot_provisioned_toolchain("https://github.com/acme/lib.git") == tag
+    assert len(container.commits) == 1
+
+    commands.clear()
+    assert orchestrator._resolve_start_image(repo) == images.find_snapshot(client, repo)
+    assert orchestrator._start_image_kind == "snapshot"
+    assert orchestrator._resolve_start_image("https://github.com/acme/other.git").startswith(
+        "sag-base:"
+    )
+
+    orchestrator._start_image_kind = "snapshot"
+    orchestrator._setup_container_environment()
+    assert any(command.startswith("find /workspace -mindepth 1") for command in commands)
+    assert not any("apt-get" in command for command in commands)
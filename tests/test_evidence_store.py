@@ -0,0 +1,103 @@
+"""The per-workspace evidence store: an indexed read path over the evidence files."""
+
+import json
+
+import pytest
+
+from sag.agent import job_obligations, retry_authority
+from sag.agent.evidence_store import attach_evidence_store, evidence_store_for
+from sag.agent.invocation_contracts import write_contract
+from sag.agent.job_obligations import read_obligations, write_obligation
+from sag.agent.repair_contracts import read_records
+
+
+@pytest.fixture
+def obligations_dir(tmp_path, monkeypatch):
+    directory = tmp_path / "job_obligations"
+    monkeypatch.setattr(job_obligations, "OBLIGATION_DIR", str(directory))
+    return directory
+
+
+def _obligation(job_id, settled=None):
+    return {"job_id": job_id, "receipt_tool": "gradle", "settled_receipt_id": settled}
+
+
+def test_a_directory_is_read_once_and_kept_current_by_the_writers(obligations_dir, local_bash):
+    orchestrator = local_bash()
+    attach_evidence_store(orchestrator)
+    write_obligation(orchestrator.execute_command, _obligation("job-b"))
+
+    assert [record["job_id"] for record in read_obligations(orchestrator)] == ["job-b"]
+    orchestrator.commands.clear()
+    execute = orchestrator.execute_command
+    assert write_obligation(execute, _obligation("job-a"))
+    assert write_obligation(execute, _obligation("job-a"))  # replay: served by the index
+    assert write_obligation(execute, _obligation("job-b", settled="inv-gradle-1-0002"))
+    records = read_obligations(orchestrator)
+
+    # An id the index has never seen is still checked on disk (it may hold
+    # bytes the index could not parse); a known id and every read are not.
+    assert [command.split()[0] for command in orchestrator.commands] == ["cat", "mkdir", "mkdir"]
+    assert records == read_obligations(local_bash())  # same answer as the files
+    assert [record["settled_receipt_id"] for record in records] == [None, "inv-gradle-1-0002"]
+    assert json.loads((obligations_dir / "job-a.json").read_text()) == _obligation("job-a")
+
+
+def test_an_unparseable_file_is_still_refused_and_an_unreadable_ledger_is_none(
+    obligations_dir, local_bash
+):
+    obligations_dir.mkdir()
+    (obligations_dir / "job-x.json").write_text("{torn")
+    orchestrator = local_bash()
+    attach_evidence_store(orchestrator)
+
+    assert read_obligations(orchestrator) == []
+    assert not write_obligation(orchestrator.execute_command, _obligation("job-x"))
+
+    class Unreachable(local_bash):
+        def execute_command(self, command, workdir=None, **kwargs):
+            return {"success": False, "exit_code": -1, "output": "container not running"}
+
+    unreachable = Unreachable()
+    attach_evidence_store(unreachable)
+    assert read_obligations(unreachable) is None
+
+
+def test_receipt_queries_use_the_index_and_match_the_file_read(tmp_path, local_bash):
+    directory = tmp_path / "evidence_assessments"
+    directory.mkdir()
+    for assessment_id, receipt_id in (("a-2", "inv-1"), ("a-1", "inv-1"), ("a-3", "inv-2")):
+        body = {"assessment_id": assessment_id, "receipt_id": receipt_id, "typed_code": "x"}
+        (directory / f"{assessment_id}.json").write_text(json.dumps(body) + "\n")
+    plain = local_bash()
+    indexed = local_bash()
+    attach_evidence_store(indexed)
+
+    expected = read_records(plain, str(directory), receipt_id="inv-1")
+    assert [record["assessment_id"] for record in expected] == ["a-1", "a-2"]
+    assert read_records(indexed, str(directory)) == read_records(plain, str(directory))
+    indexed.commands.clear()
+    assert read_records(indexed, str(directory), receipt_id="inv-1") == expected
+    assert indexed.commands == []
+    assert evidence_store_for(plain) is None
+
+
+def test_frozen_contracts_and_the_retry_ledger_are_read_once(tmp_path, monkeypatch, local_bash):
+    from sag.agent import invocation_contracts
+
+    monkeypatch.setattr(invocation_contracts, "CONTRACT_DIR", str(tmp_path / "contracts"))
+    monkeypatch.setattr(retry_authority, "RETRY_LEDGER_PATH", str(tmp_path / "retry.json"))
+    orchestrator = local_bash()
+    attach_evidence_store(orchestrator)
+    execute = orchestrator.execute_command
+    (tmp_path / "retry.json").write_text('{"k": {"count": 1}}')
+
+    assert write_contract(execute, {"contract_id": "c-1", "argv": "gradle test"})
+    orchestrator.commands.clear()
+    assert retry_authority.read_frozen_contract(execute, "c-1")["argv"] == "gradle test"
+    assert retry_authority.read_ledger(execute) == {"k": {"count": 1}}
+    assert retry_authority.read_ledger(execute) == {"k": {"count": 1}}
+    assert len(orchestrator.commands) == 1  # the ledger's first read
+
+    assert retry_authority.write_ledger(execute, {"k": {"count": 2}})
+    assert retry_authority.read_ledger(execute) == {"k": {"count": 2}}
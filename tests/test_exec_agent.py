@@ -0,0 +1,259 @@
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from sag.docker_orch.exec_agent import AGENT_SCRIPT, ContainerExecAgent, ExecAgentError, ExecStats
+from sag.docker_orch.orch import DockerOrchestrator
+
+
+class PipeStream:
+    """Runs the real helper script on the host over plain pipes."""
+
+    def __init__(self):
+        self.proc = subprocess.Popen(
+            [sys.executable, "-u", "-c", AGENT_SCRIPT],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+
+    def write(self, data):
+        self.proc.stdin.write(data)
+        self.proc.stdin.flush()
+
+    def read_chunk(self):
+        return self.proc.stdout.readline() or None
+
+    def close(self):
+        try:
+            self.proc.stdin.close()
+        except Exception:
+            pass
+        self.proc.wait(timeout=5)
+
+
+@pytest.fixture
+def agent():
+    agent = ContainerExecAgent(PipeStream())
+    agent.handshake()
+    yield agent
+    agent.close()
+
+
+def test_agent_runs_commands_and_keeps_streams_apart(agent):
+    exit_code, stdout, stderr = agent.run("echo out; echo err >&2; exit 3")
+
+    assert exit_code == 3
+    assert stdout == b"out\n"
+    assert stderr == b"err\n"
+
+
+def test_agent_merges_stderr_and_applies_environment(agent):
+    exit_code, stdout, _ = agent.run(
+        'echo "$SAG_PROBE"; echo err >&2', environment={"SAG_PROBE": "v1"}, merge_stderr=True
+    )
+
+    assert exit_code == 0
+    assert stdout == b"v1\nerr\n"
+
+
+def test_agent_reads_writes_and_stats_files(agent, tmp_path):
+    target = tmp_path / "nested" / "file.bin"
+
+    assert agent.stat(str(target)) == {"exists": False}
+    assert agent.read_file(str(target)) is None
+
+    agent.write_file(str(target), b"\x00payload\n")
+    agent.write_file(str(target), b"more", append=True)
+
+    assert agent.read_file(str(target)) == b"\x00payload\nmore"
+    info = agent.stat(str(target))
+    assert info["exists"] is True
+    assert info["is_file"] is True
+    assert info["size"] == 13
+    assert not list(target.parent.glob("*.tmp"))
+
+
+def test_agent_answers_concurrent_requests_by_id(agent):
+    results = {}
+
+    def worker(index):
+        results[index] = agent.run(f"sleep 0.{3 - index % 3}; echo {index}")[1]
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(6)]
+    started = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == {i: f"{i}\n".encode() for i in range(6)}
+    # Six sleeps of up to 0.3s overlap instead of summing to ~1.2s.
+    assert time.monotonic() - started < 1.0
+
+
+def test_agent_failure_surfaces_as_dispatched_error(agent, tmp_path):
+    with pytest.raises(ExecAgentError) as excinfo:
+        agent.write_file(str(tmp_path), b"cannot replace a directory")
+
+    assert excinfo.value.dispatched is True
+    assert agent.alive
+
+
+def test_agent_closed_stream_fails_pending_and_new_requests():
+    stream = PipeStream()
+    agent = ContainerExecAgent(stream)
+    agent.handshake()
+
+    with pytest.raises(ExecAgentError) as excinfo:
+        agent.run("kill $PPID; sleep 5")
+    assert excinfo.value.dispatched is True
+
+    with pytest.raises(ExecAgentError) as excinfo:
+        agent.run("true")
+    assert excinfo.value.dispatched is False
+    assert not agent.alive
+    stream.proc.wait(timeout=5)
+
+
+def test_agent_reassembles_lines_split_across_chunks():
+    class SmallChunkStream(PipeStream):
+        def read_chunk(self):
+            return self.proc.stdout.read1(7) or None
+
+    agent = ContainerExecAgent(SmallChunkStream())
+    agent.handshake()
+    try:
+        exit_code, stdout, _ = agent.run("seq 1 2000")
+    finally:
+        agent.close()
+
+    assert exit_code == 0
+    assert stdout.split() == [str(n).encode() for n in range(1, 2001)]
+
+
+def test_agent_records_latency_and_throughput(agent):
+    agent.run("true")
+    agent.stat("/")
+
+    snapshot = agent.stats.snapshot()["transports"]["agent"]
+    assert snapshot["requests"] == 3  # handshake + exec + stat
+    assert snapshot["ops"] == {"ping": 1, "exec": 1, "stat": 1}
+    assert snapshot["bytes_in"] > 0
+    assert snapshot["mean_ms"] >= 0
+
+
+class FakeExecResult:
+    def __init__(self, exit_code=0, output=(b"ok", b"")):
+        self.exit_code = exit_code
+        self.output = output
+
+
+class FakeContainer:
+    status = "running"
+
+    def __init__(self):
+        self.exec_calls = []
+
+    def exec_run(self, exec_command, **kwargs):
+        self.exec_calls.append(exec_command)
+        return FakeExecResult()
+
+
+class FakeContainers:
+    def __init__(self, container):
+        self.container = container
+
+    def get(self, _name):
+        return self.container
+
+
+class FakeClient:
+    def __init__(self, container):
+        self.containers = FakeContainers(container)
+
+
+class FakeConfig:
+    exec_agent_enabled = True
+
+
+def build_orchestrator(container, agent=None):
+    orchestrator = DockerOrchestrator.__new__(DockerOrchestrator)
+    orchestrator.client = FakeClient(container)
+    orchestrator.container_name = "sag-demo"
+    orchestrator.config = FakeConfig()
+    orchestrator.is_container_running = lambda: True
+    orchestrator._exec_agent_start_lock = threading.Lock()
+    if agent is not None:
+        orchestrator._exec_agent = agent
+    return orchestrator
+
+
+def test_execute_command_routes_through_live_agent_with_same_result_shape(agent):
+    container = FakeContainer()
+    orchestrator = build_orchestrator(container, agent)
+    orchestrator.is_container_running = lambda: pytest.fail("agent path must skip inspect")
+
+    result = orchestrator.execute_command("echo hi; echo warn >&2; exit 1", workdir="/")
+
+    assert container.exec_calls == []
+    assert result["exit_code"] == 1
+    assert result["success"] is False
+    assert result["stdout"] == "hi"
+    assert result["stderr"] == "warn"
+    assert result["output"] == "hi\nwarn"
+    assert result["runner_dispatched"] is True
+
+
+def test_execute_command_falls_back_to_exec_run_when_agent_cannot_start(monkeypatch):
+    container = FakeContainer()
+    orchestrator = build_orchestrator(container)
+
+    def fail_start(self):
+        raise RuntimeError("python3: not found")
+
+    monkeypatch.setattr(DockerOrchestrator, "_start_exec_agent", fail_start)
+
+    first = orchestrator.execute_command("true")
+    second = orchestrator.execute_command("true")
+
+    assert first["success"] is True and second["success"] is True
+    assert len(container.exec_calls) == 2
+    # The back-off keeps a failed start from being retried on every command.
+    assert orchestrator._exec_agent_start_failures == 1
+    stats = orchestrator.exec_stats()["transports"]
+    assert stats["exec_run"]["requests"] == 2
+
+
+def test_execute_command_does_not_rerun_a_dispatched_agent_command():
+    class LostAnswerAgent:
+        alive = True
+
+        def run(self, *args, **kwargs):
+            raise ExecAgentError("stream closed", dispatched=True)
+
+    container = FakeContainer()
+    orchestrator = build_orchestrator(container, LostAnswerAgent())
+
+    result = orchestrator.execute_command("mvn deploy")
+
+    assert container.exec_calls == []
+    assert result["success"] is False
+    assert result["runner_dispatched"] is True
+    assert result["dispatch_status"] == "execution_observation_failed"
+
+
+def test_agent_disabled_by_default_keeps_exec_run_path():
+    container = FakeContainer()
+    orchestrator = build_orchestrator(container)
+    orchestrator.config = None
+
+    assert orchestrator.get_exec_agent() is None
+    assert orchestrator.execute_command("true")["success"] is True
+    assert len(container.exec_calls) == 1
+
+
+def test_exec_stats_snapshot_is_empty_without_traffic():
+    assert ExecStats().snapshot()["transports"] == {}
@@ -0,0 +1,188 @@
+import subprocess
+from unittest.mock import MagicMock
+
+from sag.agent.physical_validator import PhysicalValidator
+from sag.docker_orch import orch
+from sag.docker_orch.orch import DockerOrchestrator
+from sag.runtime.container_io import execute_commands
+
+
+class LocalExecResult:
+    def __init__(self, exit_code, output):
+        self.exit_code = exit_code
+        self.output = output
+
+
+class LocalBashContainer:
+    """Runs the exec'd command in a local bash, demuxed like docker exec_run."""
+
+    def __init__(self):
+        self.exec_calls = []
+
+    def exec_run(self, exec_command, **kwargs):
+        self.exec_calls.append(exec_command)
+        proc = subprocess.run(exec_command, capture_output=True)
+        if kwargs.get("demux"):
+            return LocalExecResult(proc.returncode, (proc.stdout or None, proc.stderr or None))
+        return LocalExecResult(proc.returncode, proc.stdout + proc.stderr)
+
+
+class FakeContainers:
+    def __init__(self, container):
+        self.container = container
+
+    def get(self, _name):
+        return self.container
+
+
+class FakeClient:
+    def __init__(self, container):
+        self.containers = FakeContainers(container)
+
+
+def build_orchestrator(container):
+    orchestrator = DockerOrchestrator.__new__(DockerOrchestrator)
+    orchestrator.client = FakeClient(container)
+    orchestrator.container_name = "sag-demo"
+    orchestrator.is_container_running = lambda: True
+    orchestrator._runtime_profile_prefix = lambda: "true"
+    return orchestrator
+
+
+def test_execute_batch_keeps_exit_codes_and_streams_apart_in_one_exec():
+    container = LocalBashContainer()
+    orchestrator = build_orchestrator(container)
+
+    results = orchestrator.execute_batch(
+        [
+            "echo first",
+            "echo oops >&2; exit 3",
+            "printf 'no newline'",
+            "cd / && pwd",
+            "true",
+        ]
+    )
+
+    assert len(container.exec_calls) == 1
+    assert [r["exit_code"] for r in results] == [0, 3, 0, 0, 0]
+    assert results[0]["stdout"] == "first" and results[0]["success"] is True
+    assert results[1]["stderr"] == "oops" and results[1]["output"] == "oops"
+    assert results[1]["success"] is False
+    assert results[2]["output"] == "no newline"
+    assert results[3]["output"] == "/"
+    assert results[4]["output"] == ""
+    assert all(r["runner_dispatched"] is True for r in results)
+
+
+def test_execute_batch_isolates_working_directory_between_commands(tmp_path):
+    orchestrator = build_orchestrator(LocalBashContainer())
+
+    results = orchestrator.execute_batch(["cd /", "pwd"], workdir=str(tmp_path))
+
+    assert results[1]["output"] == str(tmp_path)
+
+
+def test_execute_batch_chunks_large_batches_under_the_argument_limit(monkeypatch):
+    monkeypatch.setattr(orch, "BATCH_MAX_SCRIPT_CHARS", 1000)
+    container = LocalBashContainer()
+    orchestrator = build_orchestrator(container)
+
+    results = orchestrator.execute_batch([f"echo {i}" for i in range(30)])
+
+    assert [r["output"] for r in results] == [str(i) for i in range(30)]
+    assert 1 < len(container.exec_calls) < 30
+
+
+def test_execute_batch_reports_commands_the_batch_never_reached():
+    orchestrator = build_orchestrator(LocalBashContainer())
+
+    results = orchestrator.execute_batch(["echo ok", "kill -9 $$", "echo never"])
+
+    assert results[0]["output"] == "ok"
+    assert results[1]["dispatch_status"] == "execution_observation_failed"
+    assert results[2]["exit_code"] == -1
+    assert results[2]["runner_dispatched"] is False
+
+
+class NeedleOrch:
+    def __init__(self):
+        self.commands = []
+
+    def execute_command(self, command, **kwargs):
+        self.commands.append(command)
+        return {"success": True, "exit_code": 0, "output": command.upper()}
+
+
+def test_execute_commands_falls_back_per_command_for_doubles():
+    fake = NeedleOrch()
+
+    results = execute_commands(fake, ["a", "b"])
+
+    assert fake.commands == ["a", "b"]
+    assert [r["output"] for r in results] == ["A", "B"]
+
+
+def test_execute_commands_ignores_mock_batch_results():
+    mock = MagicMock()
+    mock.execute_command.return_value = {"exit_code": 0, "output": "x"}
+
+    results = execute_commands(mock, ["probe"])
+
+    assert results == [{"exit_code": 0, "output": "x"}]
+
+
+class BatchCountingOrch(NeedleOrch):
+    def __init__(self, responses):
+        super().__init__()
+        self.responses = responses
+        self.batches = []
+
+    def execute_command(self, command, **kwargs):
+        self.commands.append(command)
+        for needle, output in self.responses.items():
+            if needle in command:
+                return {"success": True, "exit_code": 0, "output": output}
+        return {"success": True, "exit_code": 0, "output": ""}
+
+    def execute_batch(self, commands):
+        self.batches.append(list(commands))
+        return [self.execute_command(command) for command in commands]
+
+
+def test_scan_modules_probes_every_module_in_one_batch():
+    modules = [f"/w/p/m{i}/pom.xml" for i in range(100)]
+    fake = BatchCountingOrch(
+        {
+            "-name 'pom.xml'": "\n".join(modules),
+            "/m7/target/classes": "12",
+            "/m7/target/surefire-reports": "EXISTS",
+        }
+    )
+
+    records = PhysicalValidator(docker_orchestrator=fake).scan_modules("/w/p", "maven")
+
+    assert len(fake.batches) == 1
+    assert len(fake.batches[0]) == 101 * 5
+    by_path = {r["path"]: r for r in records}
+    assert by_path["m7"]["class_count"] == 12
+    assert by_path["m7"]["report_dirs"] == ["/w/p/m7/target/surefire-reports"]
+    assert by_path["m8"]["report_dirs"] == []
+
+
+def test_check_modules_without_tests_batches_the_per_module_double_check():
+    fake = BatchCountingOrch(
+        {
+            "test -f /w/p/pom.xml": "EXISTS",
+            "grep -A 100 '<modules>'": "a\nb\nc",
+            "find /w/p/b ": "/w/p/b/target/surefire-reports/TEST-x.xml",
+        }
+    )
+    validator = PhysicalValidator(docker_orchestrator=fake)
+
+    missing = validator._check_modules_without_tests(
+        "/w/p", ["/w/p/a/target/surefire-reports"]
+    )
+
+    assert missing == ["c"]
+    assert len(fake.batches) == 2
+    assert len(fake.batches[1]) == 2
@@ -17,19 +17,26 @@ Scripted-orchestrator style (house pattern, shared with
 tests/test_python_tool.py and tests/test_maven_gradle_tool_contracts.py).
 """
 
+import hashlib
 import json
+import os
+import subprocess
 
+import pytest
 from test_maven_gradle_tool_contracts import FakeBuildToolOrchestrator
 from test_python_tool import MANIFEST, Orch, ok
 
+import sag.agent.invocation_receipts as invocation_receipts
 from sag.agent.invocation_receipts import (
     RECEIPT_DIR,
     RECEIPT_HEREDOC,
     RECEIPT_SCHEMA_VERSION,
+    build_receipt,
     report_delta,
     snapshot_reports,
     write_receipt,
 )
+from sag.docker_orch.orch import DockerOrchestrator
 from sag.tools.internal.gradle_tool import GradleTool
 from sag.tools.internal.maven_tool import MavenTool
 from sag.tools.internal.python_tool import PYTEST_REPORT_DIR, PythonTool
@@ -141,6 +148,136 @@ def test_snapshot_reports_without_scan_roots_does_not_touch_the_container():
     assert execute.commands == []
 
 
+# ---------------------------------------------------------------------------
+# snapshot_reports — stat-keyed hash cache (execs run in a local bash, so the
+# in-container script runs for real against tmp_path)
+# ---------------------------------------------------------------------------
+
+
+class LocalExecResult:
+    def __init__(self, exit_code, output):
+        self.exit_code = exit_code
+        self.output = output
+
+
+class LocalBashContainer:
+    def exec_run(self, exec_command, **kwargs):
+        proc = subprocess.run(exec_command, capture_output=True)
+        return LocalExecResult(proc.returncode, (proc.stdout or None, proc.stderr or None))
+
+
+class FakeContainers:
+    def __init__(self, container):
+        self.container = container
+
+    def get(self, _name):
+        return self.container
+
+
+class FakeClient:
+    def __init__(self, container):
+        self.containers = FakeContainers(container)
+
+
+@pytest.fixture
+def local_orchestrator(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        invocation_receipts, "REPORT_HASH_CACHE", str(tmp_path / "cache" / "hashes.json")
+    )
+    orchestrator = DockerOrchestrator.__new__(DockerOrchestrator)
+    orchestrator.client = FakeClient(LocalBashContainer())
+    orchestrator.container_name = "sag-demo"
+    orchestrator.is_container_running = lambda: True
+    orchestrator._runtime_profile_prefix = lambda: "true"
+    return orchestrator
+
+
+def _report(path, text, mtime=1_000_000):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    os.utime(path, (mtime, mtime))
+    return str(path)
+
+
+def _plain_scan(root):
+    predicates = []
+    for marker in invocation_receipts.REPORT_PATH_MARKERS:
+        predicates += ["-path", f"*{marker}*.xml", "-o"]
+    command = ["find", str(root), "-type", "f", "(", *predicates[:-1], ")"]
+    proc = subprocess.run(
+        command + ["-exec", "sha256sum", "{}", "+"], capture_output=True, text=True
+    )
+    return invocation_receipts._parse_sha256sum(proc.stdout)
+
+
+def test_cached_snapshot_only_rehashes_reports_whose_stat_changed(local_orchestrator, tmp_path):
+    project = tmp_path / "proj"
+    unit = _report(project / "target" / "surefire-reports" / "TEST-a.xml", "<a/>")
+    gradle = _report(project / "m" / "build" / "test-results" / "test" / "TEST-b.xml", "<b/>")
+    _report(project / "target" / "surefire-reports" / "a.txt", "not a report")
+    _report(project / "src" / "test" / "resources" / "fixture.xml", "<fixture/>")
+    execute = local_orchestrator.execute_command
+
+    first = snapshot_reports(execute, [str(project)])
+    assert first == _plain_scan(project)
+    assert first.hashing == {"hashed": 2, "reused": 0}
+
+    second = snapshot_reports(execute, [str(project)])
+    assert second == first
+    assert second.hashing == {"hashed": 0, "reused": 2}
+
+    # Same size and the same old mtime: only the ctime and inode say it moved.
+    os.remove(unit)
+    _report(project / "target" / "surefire-reports" / "TEST-a.xml", "<z/>")
+    os.remove(gradle)
+    third = snapshot_reports(execute, [str(project)])
+    assert third == {unit: hashlib.sha256(b"<z/>").hexdigest()}
+    assert third == _plain_scan(project)
+    assert report_delta(second, third) == {
+        "new": [],
+        "changed": [{"path": unit, "sha256": hashlib.sha256(b"<z/>").hexdigest()}],
+    }
+    cached = json.loads((tmp_path / "cache" / "hashes.json").read_text())["entries"]
+    assert gradle not in cached
+
+
+def test_recently_written_reports_are_hashed_every_time(local_orchestrator, tmp_path):
+    project = tmp_path / "proj"
+    report = project / "target" / "surefire-reports" / "TEST-a.xml"
+    report.parent.mkdir(parents=True)
+    report.write_text("<a/>")
+    execute = local_orchestrator.execute_command
+
+    assert snapshot_reports(execute, [str(project)]).hashing == {"hashed": 1, "reused": 0}
+    # Rewritten within the timestamp granularity: the stat may not move at all.
+    report.write_text("<b/>")
+    again = snapshot_reports(execute, [str(project)])
+    assert again == {str(report): hashlib.sha256(b"<b/>").hexdigest()}
+    assert again.hashing == {"hashed": 1, "reused": 0}
+
+
+def test_receipt_records_how_much_hashing_the_cache_skipped():
+    before = invocation_receipts.ReportSnapshot({SUREFIRE: HASH_A})
+    before.hashing = {"hashed": 1, "reused": 0}
+    after = invocation_receipts.ReportSnapshot({SUREFIRE: HASH_A, FAILSAFE: HASH_B})
+    after.hashing = {"hashed": 1, "reused": 1}
+    common = dict(
+        receipt_id="inv-maven-1-0001",
+        tool="maven",
+        requested_action="test",
+        effective_action="test",
+        argv="mvn test",
+        working_directory="/workspace/proj",
+        exit_code=0,
+    )
+
+    receipt = build_receipt(before=before, after=after, **common)
+
+    assert receipt["report_hashing"] == {"hashed": 2, "reused": 1}
+    assert receipt["report_delta"] == {"new": [{"path": FAILSAFE, "sha256": HASH_B}], "changed": []}
+    assert "report_hashing" not in build_receipt(before={}, after=dict(after), **common)
+
+
 # ---------------------------------------------------------------------------
 # report_delta
 # ---------------------------------------------------------------------------
@@ -0,0 +1,63 @@
+"""The Java test scanner's per-file cache, shared by the catalog and the counters."""
+
+from sag.agent.physical_survey import count_java_test_with_expansions
+from sag.agent.project_files import attach_project_files
+from sag.testcases.catalog import build_java_test_catalog, scan_java_test_sources
+
+
+def _test_class(index, newline="\n"):
+    return newline.join(
+        [
+            "package com.example;",
+            "/* @Test commented out */",
+            f"public class T{index}Test {{",
+            "    @Test",
+            f"    public void testOne{index}() {{ }}",
+            "    @ParameterizedTest",
+            f"    void param{index}(int value) {{ }}",
+            "}",
+        ]
+    )
+
+
+def _project(tmp_path, files):
+    sources = tmp_path / "core" / "src" / "test" / "java" / "com" / "example"
+    sources.mkdir(parents=True)
+    for index in range(files):
+        (sources / f"T{index}Test.java").write_text(
+            _test_class(index, "\r\n" if index % 2 else "\n"), newline=""
+        )
+    return str(tmp_path), sources
+
+
+def test_a_rescan_parses_only_the_files_whose_bytes_changed(tmp_path, local_bash):
+    root, sources = _project(tmp_path, 80)  # enough for the process pool
+
+    first = scan_java_test_sources(root, local_bash())
+    assert first["parsed_files"] == 80
+    assert len(first["test_cases"]) == 160
+    assert first["annotations"]["Test"] == 80
+
+    (sources / "T3Test.java").write_text(_test_class(3) + "\n// @Test\n")  # comment only
+    (sources / "T4Test.java").write_text(_test_class(4).replace("testOne4", "renamed4"))
+    (sources / "T5Test.java").touch()
+    second = scan_java_test_sources(root, local_bash())
+
+    assert second["parsed_files"] == 2  # T5 was touched, but its sha1 still matches
+    assert second["annotations"] == first["annotations"]
+    methods = {case["method_name"] for case in second["test_cases"]}
+    assert "renamed4" in methods and "testOne4" not in methods
+
+
+def test_the_catalog_and_the_counters_share_one_scan_per_tool_run(tmp_path, local_bash):
+    root, _ = _project(tmp_path, 3)
+    orchestrator = local_bash()
+    attach_project_files(orchestrator)
+
+    catalog = build_java_test_catalog(root, orchestrator)
+    counts = count_java_test_with_expansions(orchestrator, root)
+
+    assert len(orchestrator.commands) == 1
+    assert catalog.count() == 6
+    assert counts["parameterized_info"]["parameterized_methods"] == 3
+    assert {d.module for d in catalog.get_all().values()} == {"core"}
@@ -4,6 +4,7 @@
 refusal, or a loop force-break interrupts the batch (Plan 2 Task 4; anatomy
 map risk 5 — Anthropic hard-400s on an unanswered tool_use)."""
 
+import time
 from types import SimpleNamespace
 
 import pytest
@@ -12,6 +13,8 @@ from sag.agent.native_messages import render_messages
 from sag.agent.react_engine import ReActEngine
 from sag.agent.react_llm import NativeToolCall, NativeTurn
 from sag.agent.react_types import ReActStep, StepType
+from sag.agent.tool_orchestration import ToolOrchestrator
+from sag.tools.base import BaseTool, ToolResult
 
 
 def _turn(*calls, text="working"):
@@ -199,3 +202,97 @@ def test_executed_batch_renders_as_paired_native_messages(native_engine):
         "call_2",
         "call_3",
     ]
+
+
+class _SlowFileTool(BaseTool):
+    """`file_io` whose every call takes a while and logs when it ran."""
+
+    def __init__(self, log, delay=0.3):
+        super().__init__("file_io", "Slow file tool")
+        self.log = log
+        self.delay = delay
+
+    def execute(self, action: str, path: str, content: str = "") -> ToolResult:
+        started = time.monotonic()
+        time.sleep(self.delay)
+        self.log.append((action, path, started, time.monotonic()))
+        return ToolResult.completed_success(output=f"{action} {path}")
+
+
+def _with_tool_orchestrator(engine, tool):
+    """Route the scripted engine's calls through a real `ToolOrchestrator`."""
+
+    def orchestrator():
+        return ToolOrchestrator(
+            tools={tool.name: tool},
+            context_manager=None,
+            recent_tool_executions=[],
+            successful_states={},
+            repository_url=None,
+            track_tool_execution=lambda signature, result: None,
+            update_successful_states=lambda tool_name, params, result: None,
+            add_system_guidance=lambda message, priority=5: None,
+            get_timestamp=lambda: "ts",
+            prefetched=getattr(engine, "_prefetched_results", None),
+        )
+
+    engine._get_tool_orchestrator = orchestrator
+    engine._execute_tool_call = lambda call: orchestrator().execute(call)
+    return engine
+
+
+def _read(index, path=None):
+    return _call(index, "file_io", {"action": "read", "path": path or f"/workspace/f{index}"})
+
+
+def test_read_only_fan_out_runs_concurrently_and_answers_in_order(native_engine):
+    log = []
+    engine = _with_tool_orchestrator(native_engine(), _SlowFileTool(log))
+
+    started = time.monotonic()
+    engine._execute_native_calls(_turn(*(_read(i) for i in range(1, 6))))
+    elapsed = time.monotonic() - started
+
+    assert len(log) == 5
+    assert elapsed < 0.3 * 3
+    observations = _observations(engine)
+    assert [o.tool_call_id for o in observations] == [f"call_{i}" for i in range(1, 6)]
+    assert all(f"read /workspace/f{i}" in o.content for i, o in enumerate(observations, 1))
+    assert engine._prefetched_results is None
+
+
+def test_state_changing_call_splits_the_concurrent_runs(native_engine):
+    log = []
+    engine = _with_tool_orchestrator(native_engine(), _SlowFileTool(log, delay=0.1))
+    write = _call(3, "file_io", {"action": "write", "path": "/workspace/f1", "content": "x"})
+
+    engine._execute_native_calls(_turn(_read(1), _read(2), write, _read(4), _read(5)))
+
+    by_call = {(action, path): (start, end) for action, path, start, end in log}
+    write_start, write_end = by_call[("write", "/workspace/f1")]
+    assert max(by_call[("read", f"/workspace/f{i}")][1] for i in (1, 2)) <= write_start
+    assert min(by_call[("read", f"/workspace/f{i}")][0] for i in (4, 5)) >= write_end
+    assert [o.tool_call_id for o in _observations(engine)] == [f"call_{i}" for i in range(1, 6)]
+
+
+@pytest.mark.parametrize(
+    ("name", "args", "safe"),
+    [
+        ("file_io", {"action": "read", "path": "/a"}, True),
+        ("file_io", {"action": "write", "path": "/a"}, False),
+        ("bash", {"command": "ls -la /workspace"}, True),
+        ("bash", {"command": "cat a | tee b"}, False),
+        ("bash", {"command": "find . -name '*.tmp' -delete"}, False),
+        ("bash", {"command": "find . -fls listing.txt"}, False),
+        ("bash", {"command": "env FOO=1 mvn install"}, False),
+        ("bash", {"command": "env"}, False),
+        ("search", {"target": "output_1", "pattern": "x"}, True),
+        ("search", {"target": "job:abc"}, False),
+        ("project", {"action": "analyze"}, False),
+        ("phase", {"action": "done"}, False),
+    ],
+)
+def test_only_plain_reads_are_concurrency_safe(name, args, safe):
+    engine = ReActEngine.__new__(ReActEngine)
+
+    assert engine._is_concurrency_safe(_call(1, name, args)) is safe
@@ -8,6 +8,7 @@ from types import SimpleNamespace
 import pytest
 
 from sag.agent.react_llm import NativeToolCall, NativeTurn, ReactLLMClient
+from sag.agent.token_tracker import TokenTracker
 from sag.config.models import LogLevel
 from sag.config.settings import Config
 from sag.tools.base import BaseTool, ToolResult
@@ -266,3 +267,144 @@ def test_ollama_targets_carry_the_configured_api_base(monkeypatch):
     client.get_native_turn([{"role": "user", "content": "go"}])
 
     assert captured["api_base"] == "http://localhost:11434"
+
+
+def _chunk(content=None, tool_calls=None, usage=None):
+    delta = SimpleNamespace(content=content, tool_calls=tool_calls)
+    return SimpleNamespace(
+        choices=[SimpleNamespace(delta=delta)] if usage is None else [],
+        usage=usage,
+        model="gpt-4o-mini",
+    )
+
+
+def _tool_delta(index, arguments, call_id=None, name=None):
+    return SimpleNamespace(
+        index=index,
+        id=call_id,
+        function=SimpleNamespace(name=name, arguments=arguments),
+    )
+
+
+def test_streamed_turn_releases_each_call_once_its_arguments_are_complete(monkeypatch):
+    consumed = []
+    chunks = [
+        _chunk(content="Cloning, then listing. "),
+        _chunk(tool_calls=[_tool_delta(0, '{"action": "cl', "call_a", "project")]),
+        _chunk(tool_calls=[_tool_delta(0, 'one", "repo_url": "https://x"}')]),
+        _chunk(tool_calls=[_tool_delta(1, "", "call_b", "project")]),
+        _chunk(tool_calls=[_tool_delta(1, '{"action": "analyze"}')]),
+        _chunk(content="Both are on their way."),
+        _chunk(usage=SimpleNamespace(prompt_tokens=10, completion_tokens=5, total_tokens=15)),
+    ]
+    captured = {}
+
+    def _completion(**params):
+        captured.update(params)
+        for index, chunk in enumerate(chunks):
+            consumed.append(index)
+            yield chunk
+
+    monkeypatch.setattr("litellm.completion", _completion)
+    tracker = TokenTracker()
+    client = make_client(config=make_config(stream_native_turns=True), token_tracker=tracker)
+    released = []
+
+    turn = client.get_native_turn(
+        [{"role": "user", "content": "go"}],
+        on_tool_call=lambda call: released.append((call, len(consumed))),
+    )
+
+    assert captured["stream"] is True
+    assert captured["stream_options"] == {"include_usage": True}
+    # Each call went out with the chunk that completed it, not at the end.
+    assert [(call.id, seen) for call, seen in released] == [("call_a", 3), ("call_b", 5)]
+    assert turn.tool_calls == tuple(call for call, _ in released)
+    assert turn.tool_calls[0].arguments == {"action": "clone", "repo_url": "https://x"}
+    assert turn.text == "Cloning, then listing. Both are on their way."
+    (record,) = tracker.token_records
+    assert (record["type"], record["total_tokens"]) == ("executor", 15)
+    assert record["time_to_first_token"] is not None
+    assert record["time_to_first_tool_call"] >= record["time_to_first_token"]
+
+
+def test_streamed_call_without_complete_json_is_released_when_the_next_begins(monkeypatch):
+    chunks = [
+        _chunk(tool_calls=[_tool_delta(0, "", "call_a", "project")]),
+        _chunk(tool_calls=[_tool_delta(1, '{"action": "analyze"', "call_b", "project")]),
+    ]
+    monkeypatch.setattr("litellm.completion", lambda **params: iter(chunks))
+    released = []
+
+    turn = make_client(config=make_config(stream_native_turns=True)).get_native_turn(
+        [{"role": "user", "content": "go"}], on_tool_call=released.append
+    )
+
+    assert [call.id for call in released] == ["call_a", "call_b"]
+    assert released[0].arguments == {}
+    # Truncated JSON still round-trips its raw text, exactly as a buffered turn would.
+    assert (released[1].arguments, released[1].raw_arguments) == ({}, '{"action": "analyze"')
+    assert turn.tool_calls == tuple(released)
+
+
+def test_anthropic_requests_carry_prompt_cache_breakpoints(monkeypatch):
+    captured = fake_completion(monkeypatch, SimpleNamespace(content="ok", tool_calls=None))
+    config = make_config(action_model="claude-sonnet-4-6", action_provider="anthropic")
+    messages = [
+        {"role": "system", "content": "sys"},
+        {"role": "user", "content": "=== PHASE: BUILD ==="},
+        {"role": "user", "content": "go"},
+    ]
+
+    make_client(config).get_native_turn(messages)
+
+    sent = captured["messages"]
+    assert [m["content"][0]["cache_control"] for m in sent] == [{"type": "ephemeral"}] * 3
+    assert messages[0]["content"] == "sys"
+
+    config.native_prompt_caching = False
+    make_client(config).get_native_turn(messages)
+    assert captured["messages"] == messages
+
+
+def test_openai_requests_are_not_marked_and_cache_reads_are_tracked(monkeypatch):
+    captured = {}
+
+    def _completion(**params):
+        captured.update(params)
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content="ok", tool_calls=None))],
+            usage=SimpleNamespace(
+                prompt_tokens=1200,
+                completion_tokens=5,
+                total_tokens=1205,
+                prompt_tokens_details=SimpleNamespace(cached_tokens=1024),
+            ),
+            model="gpt-4o-mini",
+        )
+
+    monkeypatch.setattr("litellm.completion", _completion)
+    tracker = TokenTracker()
+
+    make_client(token_tracker=tracker).get_native_turn([{"role": "system", "content": "sys"}])
+
+    assert captured["messages"] == [{"role": "system", "content": "sys"}]
+    (record,) = tracker.token_records
+    assert (record["cache_read_tokens"], record["cache_write_tokens"]) == (1024, 0)
+    assert tracker.get_summary_stats()["total_cache_read_tokens"] == 1024
+
+
+def test_anthropic_cache_writes_and_reads_are_tracked():
+    tracker = TokenTracker()
+    usage = SimpleNamespace(
+        prompt_tokens=3000,
+        completion_tokens=10,
+        total_tokens=3010,
+        cache_read_input_tokens=2500,
+        cache_creation_input_tokens=400,
+    )
+
+    tracker.track_token_usage(SimpleNamespace(usage=usage), "claude-sonnet-4-6", "executor")
+
+    record = tracker.token_records[0]
+    assert (record["cache_read_tokens"], record["cache_write_tokens"]) == (2500, 400)
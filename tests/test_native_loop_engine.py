@@ -8,6 +8,7 @@ report to COMPLETED while the pairing invariant holds on EVERY rendered
 request — an unanswered assistant tool_use is a provider 400 (anatomy map
 risk 5), so the renderer's repair pass must never have anything to do."""
 
+import threading
 from types import SimpleNamespace
 
 import pytest
@@ -313,3 +314,47 @@ def test_toolless_turn_injects_the_continuation_cue_and_the_loop_proceeds():
     assert "I should think about this some more." in assistant_texts
     cues = [m["content"] for m in second_request if m["role"] == "user"]
     assert any("No tool was called." in cue for cue in cues)
+
+
+class _StreamingNativeClient(_ScriptedNativeClient):
+    """Hands each call over before the turn ends, then finishes the prose only
+    once the call has actually run — the way a slow model's trailing text
+    arrives after its tool call is complete."""
+
+    def __init__(self, turns):
+        super().__init__(turns)
+        self.ran = threading.Event()
+
+    def get_native_turn(self, messages, *, include_tools=True, on_tool_call=None):
+        turn = super().get_native_turn(messages, include_tools=include_tools)
+        for call in turn.tool_calls:
+            on_tool_call(call)
+        assert self.ran.wait(timeout=5), "the call must run while the turn still streams"
+        self.ran.clear()
+        return turn
+
+
+def test_streamed_turns_execute_calls_before_the_turn_completes(pairing_spy):
+    engine = _engine([])
+    engine.config.stream_native_turns = True
+    client = _StreamingNativeClient([_phase_turn(index) for index in range(1, 6)])
+    engine.llm_client = client
+    phase_tool = engine.tools["phase"]
+    execute = phase_tool.execute
+
+    def execute_and_signal(**kwargs):
+        result = execute(**kwargs)
+        client.ran.set()
+        return result
+
+    phase_tool.execute = execute_and_signal
+
+    termination = engine.run_setup_loop("set up the project", max_iterations=12)
+
+    assert termination.termination is RunTerminationStatus.COMPLETED
+    assert engine.current_iteration == 5
+    assert all(before == after for before, after in pairing_spy)
+    # The prose only known once the stream ended is stamped onto the call.
+    messages = render_messages("SYSTEM PROMPT", engine.steps)
+    assert messages[2]["content"] == "Closing phase 5."
+    assert messages[2]["tool_calls"][0]["id"] == "call_5"
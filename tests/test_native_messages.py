@@ -9,7 +9,7 @@ whose parameter field is ``tool_params`` (not ``tool_parameters``) and whose
 
 import json
 
-from sag.agent.native_messages import render_messages
+from sag.agent.native_messages import add_cache_breakpoints, render_messages
 from sag.agent.react_types import ReActStep, StepType
 
 
@@ -200,3 +200,52 @@ def test_every_emitted_call_id_has_exactly_one_reply():
     ]
     answered = [m["tool_call_id"] for m in messages if m["role"] == "tool"]
     assert sorted(opened) == sorted(answered) == ["call_1", "call_2", "call_3"]
+
+
+def _breakpoints(messages):
+    return [
+        index
+        for index, message in enumerate(messages)
+        if isinstance(message["content"], list) and message["content"][0].get("cache_control")
+    ]
+
+
+def test_consecutive_requests_share_a_byte_identical_prefix():
+    window = [
+        _guidance("=== PHASE: BUILD ==="),
+        _action("bash", {"command": "mvn -q compile"}, "call_1", "Compiling."),
+        _observation("x" * 9000, "call_1"),
+    ]
+    first = render_messages("SYS", window)
+    window += [_action("bash", {"command": "ls"}, "call_2"), _observation("pom.xml", "call_2")]
+    second = render_messages("SYS", window)
+
+    assert json.dumps(second[: len(first)]) == json.dumps(first)
+
+
+def test_cache_breakpoints_mark_system_window_head_and_tail():
+    window = [
+        _guidance("=== PHASE: BUILD ==="),
+        _guidance("ATTEMPT LEDGER (older work, compacted)\n✗ mvn install"),
+        _action("bash", {"command": "ls"}, "call_1"),
+        _observation("pom.xml", "call_1"),
+    ]
+    messages = render_messages("SYS", window)
+
+    marked = add_cache_breakpoints(messages)
+
+    # The ledger, not the intro, ends the stable head once compaction ran.
+    assert _breakpoints(marked) == [0, 2, 4]
+    assert marked[2]["content"][0]["text"].startswith("ATTEMPT LEDGER")
+    assert _breakpoints(messages) == [], "the rendered messages are not modified"
+    assert [m["role"] for m in marked] == [m["role"] for m in messages]
+
+
+def test_cache_breakpoint_skips_messages_without_text():
+    messages = render_messages("SYS", [_guidance("=== PHASE: TEST ==="), _action("a", {}, "c1")])
+    # The window ends with the call's (cancellation) reply; drop it to end on
+    # a prose-less assistant turn.
+    marked = add_cache_breakpoints(messages[:-1])
+
+    assert _breakpoints(marked) == [0, 1]
+    assert marked[2]["content"] is None
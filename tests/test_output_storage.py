@@ -1,16 +1,20 @@
 import base64
+import json
 import re
 from pathlib import Path
 
 import pytest
 
 from sag.agent.output_storage import OutputStorageManager, attach_durable_output_ref
+from sag.agent.output_trigrams import TrigramPostings, required_trigrams, text_trigrams
 from sag.evidence import OperationOutcome
 from sag.project_fact_sheet import with_project_fact_sheet_identity
 from sag.tools.base import ToolResult
+from sag.tools.internal.output_search_tool import OutputSearchTool
 from sag.utils.container_io import DEFAULT_MAX_CMD_CHARS
 
-INDEX_PATH = "/workspace/.setup_agent/contexts/output_index.json"
+INDEX_PATH = "/workspace/.setup_agent/contexts/output_index.jsonl"
+LEGACY_INDEX_PATH = "/workspace/.setup_agent/contexts/output_index.json"
 STORAGE_PATH = "/workspace/.setup_agent/contexts/full_outputs.jsonl"
 
 
@@ -39,6 +43,18 @@ class FakeOutputStorageOrchestrator:
             output = self.files.get(STORAGE_PATH, "")
             return {"success": True, "output": str(len(output.splitlines())), "exit_code": 0}
 
+        if "wc -c <" in command:
+            output = self.files.get(STORAGE_PATH, "")
+            return {"success": True, "output": str(len(output.encode())), "exit_code": 0}
+
+        # `tail -c +<offset+1> <storage> | head -c <length>` — one ranged read.
+        m = re.match(r"tail -c \+(\d+) (\S+) \| head -c (\d+)$", command)
+        if m:
+            data = self.files.get(m.group(2), "").encode()
+            start = int(m.group(1)) - 1
+            chunk = data[start : start + int(m.group(3))].decode("utf-8", "replace")
+            return {"success": True, "output": chunk, "exit_code": 0}
+
         # `sed -n '<n>p' <storage>` — return the nth line of the JSONL store.
         if command.startswith("sed -n "):
             try:
@@ -50,6 +66,13 @@ class FakeOutputStorageOrchestrator:
                 return {"success": True, "output": lines[line_no - 1], "exit_code": 0}
             return {"success": True, "output": "", "exit_code": 0}
 
+        m = re.match(r"tail -c \+(\d+) (\S+) 2>/dev/null$", command)
+        if m:
+            if m.group(2) not in self.files:
+                return {"success": False, "output": "", "exit_code": 1}
+            data = self.files[m.group(2)].encode()[int(m.group(1)) - 1 :]
+            return {"success": True, "output": data.decode("utf-8", "replace"), "exit_code": 0}
+
         if command.startswith("cat >> ") or command.startswith("cat > "):
             operator = ">>" if command.startswith("cat >> ") else ">"
             path = command.split()[2]
@@ -115,14 +138,14 @@ def test_output_storage_uses_safe_container_writes_for_backticks(tmp_path):
     assert ref_id
     assert all('echo "' not in command for command in orchestrator.commands)
     assert "/workspace/.setup_agent/contexts/full_outputs.jsonl" in orchestrator.files
-    assert "/workspace/.setup_agent/contexts/output_index.json" in orchestrator.files
+    assert INDEX_PATH in orchestrator.files
     assert (
         "mvn` without arguments"
         in orchestrator.files["/workspace/.setup_agent/contexts/full_outputs.jsonl"]
     )
     assert (
         "mvn` without arguments"
-        in orchestrator.files["/workspace/.setup_agent/contexts/output_index.json"]
+        in orchestrator.files[INDEX_PATH]
     )
 
 
@@ -418,3 +441,135 @@ def test_store_and_retrieve_large_output_uses_chunked_write_and_round_trips():
     assert max(len(cmd) for cmd in orchestrator.commands) <= DEFAULT_MAX_CMD_CHARS + 200
 
     assert storage.retrieve_output(ref_id) == big
+
+
+def test_retrieval_is_one_ranged_read_and_stores_only_append_index_rows():
+    orchestrator = FakeOutputStorageOrchestrator()
+    storage = OutputStorageManager(Path("/workspace/.setup_agent/contexts"), orchestrator)
+    refs = [
+        storage.store_output(task_id=f"t{i}", tool_name="maven", output=f"log {i} é" * 200)
+        for i in range(5)
+    ]
+
+    assert len(orchestrator.files[INDEX_PATH].splitlines()) == 5
+    assert not any(command.startswith(f"cat > {INDEX_PATH}") for command in orchestrator.commands)
+    assert not any("wc -l <" in command for command in orchestrator.commands)
+
+    reader = OutputStorageManager(Path("/workspace/.setup_agent/contexts"), orchestrator)
+    orchestrator.commands.clear()
+    assert reader.retrieve_output(refs[3]) == "log 3 é" * 200
+    assert [command.split()[0] for command in orchestrator.commands] == ["tail"]
+
+
+def test_legacy_line_numbered_index_still_resolves():
+    orchestrator = FakeOutputStorageOrchestrator()
+    record = {"ref_id": "output_legacy00001", "task_id": "t", "tool_name": "maven", "output": "old"}
+    orchestrator.files[STORAGE_PATH] = json.dumps(record) + "\n"
+    orchestrator.files[LEGACY_INDEX_PATH] = json.dumps(
+        {"output_legacy00001": {"task_id": "t", "tool_name": "maven", "line_number": 1}}, indent=2
+    )
+
+    storage = OutputStorageManager(Path("/workspace/.setup_agent/contexts"), orchestrator)
+
+    assert storage.retrieve_output("output_legacy00001") == "old"
+
+
+def test_legacy_rows_stay_reachable_once_the_jsonl_index_exists():
+    orchestrator = FakeOutputStorageOrchestrator()
+    record = {"ref_id": "output_legacy00001", "task_id": "t", "tool_name": "maven", "output": "old"}
+    orchestrator.files[STORAGE_PATH] = json.dumps(record) + "\n"
+    orchestrator.files[LEGACY_INDEX_PATH] = json.dumps(
+        {"output_legacy00001": {"task_id": "t", "tool_name": "maven", "line_number": 1}}
+    )
+    storage = OutputStorageManager(Path("/workspace/.setup_agent/contexts"), orchestrator)
+    new_ref = storage.store_output(task_id="t", tool_name="gradle", output="new")
+
+    reader = OutputStorageManager(Path("/workspace/.setup_agent/contexts"), orchestrator)
+
+    assert reader.retrieve_output("output_legacy00001") == "old"
+    assert reader.retrieve_output(new_ref) == "new"
+    assert reader.has_output_ref("output_legacy00001")
+
+
+def test_misplaced_offset_recovers_from_the_store(tmp_path):
+    storage = OutputStorageManager(tmp_path)
+    first = storage.store_output(task_id="a", tool_name="maven", output="A" * 50)
+    second = storage.store_output(task_id="b", tool_name="maven", output="B" * 50)
+    storage.current_index[second]["offset"] = storage.current_index[first]["offset"]
+
+    assert storage.retrieve_output(second) == "B" * 50
+    assert OutputStorageManager(tmp_path).retrieve_output(first) == "A" * 50
+
+
+def _ranged_reads(orchestrator):
+    return [command for command in orchestrator.commands if command.startswith("tail -c +")]
+
+
+def test_pattern_search_loads_only_outputs_the_trigram_index_admits():
+    orchestrator = FakeOutputStorageOrchestrator()
+    writer = OutputStorageManager(Path("/workspace/.setup_agent/contexts"), orchestrator)
+    for i in range(6):
+        writer.store_output(task_id=f"t{i}", tool_name="maven", output=f"[INFO] module {i} ok\n")
+    failing = writer.store_output(
+        task_id="t6", tool_name="maven", output="[ERROR] Could not resolve dependencies\n"
+    )
+
+    reader = OutputStorageManager(Path("/workspace/.setup_agent/contexts"), orchestrator)
+    orchestrator.commands.clear()
+    [found] = reader.search_outputs(pattern=r"could not RESOLVE\s+dep")
+
+    assert found["ref_id"] == failing and found["match_count"] == 1
+    # One read of the trigram rows, one ranged read of the single admitted output.
+    assert len([c for c in _ranged_reads(orchestrator) if "| head -c" in c]) == 1
+
+    # Rows appended later by another manager are folded in incrementally.
+    late = writer.store_output(task_id="t7", tool_name="gradle", output="Could not resolve dep")
+    assert [r["ref_id"] for r in reader.search_outputs(pattern="could not resolve")] == [
+        late,
+        failing,
+    ]
+
+
+def test_grep_is_answered_from_the_trigram_index_without_loading_the_output(tmp_path):
+    tool = OutputSearchTool(contexts_dir=tmp_path)
+    ref_id = tool.storage_manager.store_output(
+        task_id="build", tool_name="maven", output="BUILD SUCCESS\n" * 100
+    )
+    tool.storage_manager.retrieve_output = lambda _ref: pytest.fail("output was loaded")
+
+    result = tool.execute(action="grep", ref_id=ref_id, grep_pattern="BUILD FAILURE")
+
+    assert result.succeeded is True
+    assert "No matches found" in result.output
+
+
+@pytest.mark.parametrize(
+    "pattern,text",
+    [
+        (r"could not resolve", "[ERROR] COULD NOT RESOLVE"),
+        (r"^Tests run: \d+, Failures: [1-9]", "Tests run: 12, Failures: 3"),
+        (r"(?:foo|bar)baz", "xbarbazx"),
+        (r"(abc)+def", "abcabcdef"),
+        (r"a.{0,3}bcd", "a--bcd"),
+        (r"kotlin", "\u212aotlin"),
+        (r"class", "cla\u017f\u017f"),
+        (r"[Ee]rror", "error"),
+        (r"x?yz", "yz"),
+    ],
+)
+def test_trigram_narrowing_never_drops_a_regex_match(pattern, text):
+    assert re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
+    postings = TrigramPostings()
+    postings.add("ref", text_trigrams(text))
+
+    assert postings.may_match(["ref"], required_trigrams(pattern)) == {"ref"}
+
+
+def test_trigram_narrowing_rejects_outputs_missing_a_literal():
+    postings = TrigramPostings()
+    postings.add("ok", text_trigrams("BUILD SUCCESS"))
+
+    assert postings.may_match(["ok", "unindexed"], required_trigrams("BUILD FAIL")) == {
+        "unindexed"
+    }
+    assert required_trigrams("(a|b)c.*") is None
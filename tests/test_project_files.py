@@ -0,0 +1,103 @@
+"""The run-scoped project-file cache behind the survey readers."""
+
+import subprocess
+
+from sag.agent.physical_survey import (
+    _properties_section,
+    analyze_build_configuration,
+    analyze_test_configuration,
+    scan_root_build_markers,
+)
+from sag.agent.project_files import attach_project_files, prefetch_survey_files
+from sag.tools.base import BaseTool, ToolResult
+from sag.tools.internal.python_env import _declared_project_name
+
+POM = """<project>
+  <groupId>org.example</groupId>
+  <artifactId>demo</artifactId>
+  <packaging>war</packaging>
+  <properties>
+    <maven.compiler.release>17</maven.compiler.release>
+  </properties>
+  <dependencies>
+    <dependency><groupId>org.junit.jupiter</groupId><artifactId>junit-jupiter</artifactId>
+    </dependency>
+  </dependencies>
+</project>
+"""
+
+
+def _maven_project(tmp_path):
+    (tmp_path / "pom.xml").write_text(POM)
+    (tmp_path / "src" / "test").mkdir(parents=True)
+    (tmp_path / "pyproject.toml").write_text('[project]\nname = "demo-py"\n')
+    return str(tmp_path)
+
+
+def _survey(orchestrator, root):
+    return (
+        analyze_build_configuration(orchestrator, root, "Java"),
+        analyze_test_configuration(orchestrator, root, "Java"),
+        scan_root_build_markers(orchestrator, root),
+        _declared_project_name(orchestrator, root),
+    )
+
+
+def test_a_survey_reads_each_file_once_and_answers_like_the_plain_reads(tmp_path, local_bash):
+    root = _maven_project(tmp_path)
+    cached = local_bash()
+    attach_project_files(cached)
+
+    prefetch_survey_files(cached, root)
+    assert len(cached.commands) == 1
+    answers = _survey(cached, root)
+
+    # pom.xml, build.gradle, src/test, ... all came with the prefetch; only the
+    # paths outside SURVEY_PATHS cost one exec each, the first time.
+    assert len(cached.commands) <= 3
+    assert answers == _survey(local_bash(), root)
+    build, tests, markers, name = answers
+    assert (build["build_system"], build["java_version"]) == ("Maven", "17")
+    assert tests["test_framework"] == "JUnit"
+    assert markers["packaging"] == "war"
+    assert name == "demo-py"
+
+
+def test_a_tool_run_revalidates_in_one_exec(tmp_path, local_bash):
+    root = _maven_project(tmp_path)
+    orchestrator = local_bash()
+    files = attach_project_files(orchestrator)
+    prefetch_survey_files(orchestrator, root)
+
+    class WritingTool(BaseTool):
+        def __init__(self):
+            super().__init__("bash", "writes the tree")
+            self.docker_orchestrator = orchestrator
+
+        def execute(self) -> ToolResult:
+            (tmp_path / "pom.xml").write_text(POM.replace("<packaging>war", "<packaging>jar"))
+            (tmp_path / "build.gradle").write_text("plugins { id 'java' }\n")
+            return ToolResult.completed_success(output="written")
+
+    WritingTool().safe_execute()
+    orchestrator.commands.clear()
+
+    assert "<packaging>jar" in files.read(f"{root}/pom.xml")
+    assert files.is_file(f"{root}/build.gradle")
+    assert files.read(f"{root}/pyproject.toml").startswith("[project]")
+    assert len(orchestrator.commands) == 1
+
+
+def test_properties_section_matches_sed(tmp_path):
+    pom = tmp_path / "parent.xml"
+    pom.write_text(
+        "<project>\n<properties>\n<a>1</a>\n</properties>\n<build/>\n"
+        "<profiles><profile><properties><b>2</b></properties>\n<c/>\n</properties>\n</project>"
+    )
+    sed = subprocess.run(
+        ["bash", "-c", f"sed -n '/<properties>/,/<\\/properties>/p' {pom} | head -200"],
+        capture_output=True,
+        text=True,
+    ).stdout
+
+    assert _properties_section(pom.read_text()) == sed
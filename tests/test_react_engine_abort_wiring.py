@@ -96,6 +96,20 @@ def test_setup_provider_failure_records_abort_naming_the_cause():
     _assert_setup_abort(engine, "LLM response unavailable: LLM transport failed")
 
 
+def test_a_failing_early_dispatch_does_not_mask_the_provider_failure():
+    engine = _engine(error=RuntimeError("LLM transport failed"))
+
+    def finish(turn=None):
+        raise RuntimeError("tool worker crashed")
+
+    engine._start_early_dispatch = lambda: SimpleNamespace(submit=lambda call: None, finish=finish)
+
+    termination = engine.run_setup_loop("set up project", max_iterations=3)
+
+    assert termination.termination is RunTerminationStatus.ABORTED
+    _assert_setup_abort(engine, "LLM response unavailable: LLM transport failed")
+
+
 def test_setup_iteration_exhaustion_records_abort_without_advancing():
     engine = _engine()
 
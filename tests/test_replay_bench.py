@@ -0,0 +1,97 @@
+"""`sag bench`: the offline control-layer benchmark over replay transcripts."""
+
+import json
+from pathlib import Path
+
+from click.testing import CliRunner
+
+import sag.config as config_module
+import sag.config.logger as logger_module
+from sag.agent.replay_bench import (
+    compare_to_baseline,
+    discover_transcripts,
+    report_to_baseline,
+    run_bench,
+)
+from sag.main import cli
+
+FIXTURES = Path(__file__).parent / "fixtures" / "control_layer"
+
+
+def test_every_fixture_is_benchmarked_with_deterministic_round_trips(tmp_path):
+    (tmp_path / "control_events.jsonl").write_text('{"sequence": 1, "kind": "tool_result"}\n')
+
+    first = run_bench([FIXTURES, tmp_path], iterations=1, warmup=0)
+    second = run_bench([FIXTURES], iterations=2, warmup=1, latency_ms=0.5)
+
+    assert not first.failures
+    assert {result.path for result in first.results} == {
+        str(path) for path in sorted(FIXTURES.glob("*.jsonl"))
+    }
+    assert first.skipped == [
+        (str(tmp_path / "control_events.jsonl"), "first row is not a replay header")
+    ]
+    for before, after in zip(first.results, second.results):
+        finalizer = before.components["verdict_finalizer"]
+        assert finalizer.calls == 1 and finalizer.round_trips > 0
+        assert before.components["phase_gate"].calls >= 1
+        assert {c: s.round_trips for c, s in before.components.items()} == {
+            c: s.round_trips for c, s in after.components.items()
+        }
+    # Every exec happened inside a measured component, and the simulated
+    # latency is paid once per round trip.
+    assert all("unattributed" not in result.components for result in first.results)
+    bigtop = next(result for result in second.results if result.path.endswith("bigtop.jsonl"))
+    assert bigtop.total_wall_ms >= bigtop.round_trips * 0.5
+
+
+def test_the_baseline_flags_an_extra_round_trip_but_not_noise():
+    report = run_bench([FIXTURES / "paramiko.jsonl"], iterations=1, warmup=0)
+    baseline = json.loads(json.dumps(report_to_baseline(report)))
+
+    assert compare_to_baseline(report, baseline) == []
+
+    finalizer = baseline["transcripts"]["replay-paramiko-20260712"]["components"]
+    finalizer["verdict_finalizer"]["round_trips"] -= 1
+    regressions = compare_to_baseline(report, baseline)
+
+    assert len(regressions) == 1
+    assert "replay-paramiko-20260712/verdict_finalizer" in regressions[0]
+    assert "round trips" in regressions[0]
+
+
+def test_discovery_skips_unreadable_and_missing_paths(tmp_path):
+    (tmp_path / "torn.jsonl").write_text("{not json\n")
+
+    transcripts, skipped = discover_transcripts([tmp_path, tmp_path / "absent.jsonl"])
+
+    assert transcripts == []
+    assert {Path(path).name: reason.split(":")[0] for path, reason in skipped} == {
+        "absent.jsonl": "no such file or directory",
+        "torn.jsonl": "not JSON lines",
+    }
+
+
+def test_bench_command_saves_and_checks_a_baseline(monkeypatch, tmp_path):
+    monkeypatch.setattr(config_module, "_config", None)
+    monkeypatch.setattr(logger_module, "_session_logger", None)
+    monkeypatch.chdir(tmp_path)
+    baseline = tmp_path / "bench" / "baseline.json"
+    args = ["bench", str(FIXTURES / "tvm.jsonl"), "--iterations", "1", "--warmup", "0"]
+
+    saved = CliRunner().invoke(cli, [*args, "--save-baseline", str(baseline)])
+    assert saved.exit_code == 0, saved.output
+    assert "Baseline written" in saved.output
+
+    document = json.loads(baseline.read_text())
+    document["transcripts"]["replay-tvm-20260713"]["components"]["verdict_finalizer"][
+        "round_trips"
+    ] = 0
+    baseline.write_text(json.dumps(document))
+    checked = CliRunner().invoke(cli, [*args, "--baseline", str(baseline), "--json"])
+
+    assert checked.exit_code == 1
+    result = json.loads(checked.output)
+    assert result["transcripts"]["replay-tvm-20260713"]["components"]["loop_memory"]["calls"] == 2
+    assert len(result["regressions"]) == 1
+    assert not (tmp_path / "logs").exists()
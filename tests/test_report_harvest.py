@@ -0,0 +1,277 @@
+"""Single-pass report harvesting: one listing, one archive, cached by (path, mtime, size).
+
+The fake Docker API serves archives from the host filesystem (container paths ==
+host paths under tmp_path) and runs execs in a local bash, so the `find
+-printf` listing and the in-container `tar` pack run for real.
+"""
+
+import io
+import json
+import os
+import stat
+import subprocess
+import tarfile
+
+import pytest
+from docker.errors import NotFound
+
+import sag.testcases.report_harvest as report_harvest
+from sag.agent.physical_validator import PhysicalValidator
+from sag.docker_orch.archive import GO_MODE_DIR
+from sag.docker_orch.orch import DockerOrchestrator
+from sag.testcases.report_harvest import ReportHarvester
+
+
+class LocalExecResult:
+    def __init__(self, exit_code, output):
+        self.exit_code = exit_code
+        self.output = output
+
+
+class LocalBashContainer:
+    def __init__(self):
+        self.exec_calls = []
+
+    def exec_run(self, exec_command, **kwargs):
+        self.exec_calls.append(exec_command)
+        proc = subprocess.run(exec_command, capture_output=True)
+        return LocalExecResult(proc.returncode, (proc.stdout or None, proc.stderr or None))
+
+
+class HostArchiveAPI:
+    def __init__(self):
+        self.get_calls = []
+
+    def get_archive(self, container, path):
+        self.get_calls.append(path)
+        if not os.path.lexists(path):
+            raise NotFound(f"Could not find the file {path} in container {container}")
+        buffer = io.BytesIO()
+        with tarfile.open(fileobj=buffer, mode="w") as tar:
+            tar.add(path, arcname=os.path.basename(path.rstrip("/")))
+        st = os.lstat(path)
+        mode = stat.S_IMODE(st.st_mode) | (GO_MODE_DIR if stat.S_ISDIR(st.st_mode) else 0)
+        return iter([buffer.getvalue()]), {"mode": mode}
+
+    def put_archive(self, container, path, data):
+        with tarfile.open(fileobj=io.BytesIO(data)) as tar:
+            for member in tar.getmembers():
+                target = os.path.join(path, member.name)
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                with open(target, "wb") as handle:
+                    handle.write(tar.extractfile(member).read())
+        return True
+
+
+class FakeContainers:
+    def __init__(self, container):
+        self.container = container
+
+    def get(self, _name):
+        return self.container
+
+
+class FakeClient:
+    def __init__(self, container):
+        self.containers = FakeContainers(container)
+        self.api = HostArchiveAPI()
+
+
+@pytest.fixture
+def orchestrator(tmp_path, monkeypatch):
+    monkeypatch.setattr(report_harvest, "HARVEST_STAGE_DIR", str(tmp_path / "stage"))
+    orchestrator = DockerOrchestrator.__new__(DockerOrchestrator)
+    orchestrator.client = FakeClient(LocalBashContainer())
+    orchestrator.container_name = "sag-demo"
+    orchestrator.is_container_running = lambda: True
+    orchestrator._runtime_profile_prefix = lambda: "true"
+    return orchestrator
+
+
+def _suite(name, cases):
+    rows = []
+    for case, status in cases:
+        body = {"failed": "<failure message='boom'/>", "error": "<error/>"}.get(status, "")
+        rows.append(f'<testcase classname="com.x.{name}" name="{case}">{body}</testcase>')
+    failures = sum(1 for _case, status in cases if status == "failed")
+    errors = sum(1 for _case, status in cases if status == "error")
+    return (
+        f'<testsuite name="com.x.{name}" tests="{len(cases)}" failures="{failures}" '
+        f'errors="{errors}" skipped="0">{"".join(rows)}</testsuite>'
+    )
+
+
+def _write(path, text, mtime=None):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+
+
+def test_harvest_reads_every_report_in_one_archive_then_only_changed_files(
+    orchestrator, tmp_path
+):
+    reports = tmp_path / "m" / "target" / "surefire-reports"
+    for i in range(5):
+        _write(reports / f"TEST-T{i}.xml", _suite(f"T{i}", [("a", "passed")]), 1_000_000)
+    (reports / "T0.txt").write_text("not a report")
+    parsed_paths = []
+
+    def parse(path, data):
+        parsed_paths.append(path)
+        return len(data)
+
+    harvester = ReportHarvester(orchestrator)
+    first = harvester.harvest([str(reports)], parse, kind="sizes")
+
+    assert sorted(first) == sorted(str(reports / f"TEST-T{i}.xml") for i in range(5))
+    assert len(parsed_paths) == 5
+    assert len(orchestrator.client.api.get_calls) == 1
+    assert not list((tmp_path / "stage").iterdir())
+
+    _write(reports / "TEST-T3.xml", _suite("T3", [("a", "passed"), ("b", "passed")]), 1_000_001)
+    parsed_paths.clear()
+    second = harvester.harvest([str(reports)], parse, kind="sizes")
+
+    assert parsed_paths == [str(reports / "TEST-T3.xml")]
+    assert second[str(reports / "TEST-T3.xml")] > first[str(reports / "TEST-T3.xml")]
+    assert len(orchestrator.client.api.get_calls) == 2
+
+    parsed_paths.clear()
+    harvester.harvest([str(reports)], parse, kind="sizes")
+    assert parsed_paths == []
+    assert len(orchestrator.client.api.get_calls) == 2
+
+
+def test_deleted_reports_are_dropped_from_the_cache(orchestrator, tmp_path):
+    reports = tmp_path / "m" / "target" / "surefire-reports"
+    other = tmp_path / "n" / "target" / "surefire-reports"
+    for directory in (reports, other):
+        _write(directory / "TEST-A.xml", _suite("A", [("a", "passed")]), 1_000_000)
+    _write(reports / "TEST-B.xml", _suite("B", [("b", "passed")]), 1_000_000)
+    harvester = ReportHarvester(orchestrator)
+    harvester.harvest([str(reports)], lambda path, data: len(data), kind="sizes")
+    harvester.harvest([str(other)], lambda path, data: len(data), kind="sizes")
+
+    (reports / "TEST-B.xml").unlink()
+    harvester.harvest([str(reports)], lambda path, data: len(data), kind="sizes")
+
+    assert sorted(path for _kind, path in harvester._cache) == [
+        str(reports / "TEST-A.xml"),
+        str(other / "TEST-A.xml"),  # outside the scanned roots: kept
+    ]
+
+
+def test_nested_roots_list_each_file_once(orchestrator, tmp_path):
+    nested = tmp_path / "m" / "build" / "test-results" / "test"
+    _write(nested / "TEST-a.xml", _suite("A", [("a", "passed")]))
+
+    harvested = ReportHarvester(orchestrator).harvest(
+        [str(nested), str(nested.parent)], lambda path, data: path, kind="paths"
+    )
+
+    assert list(harvested) == [str(nested / "TEST-a.xml")]
+
+
+def test_harvester_declines_test_doubles():
+    class Double:
+        def execute_command(self, command, **kwargs):
+            raise AssertionError("doubles keep the shell path")
+
+    assert ReportHarvester(Double()).harvest(["/r"], lambda p, d: d, kind="x") is None
+
+
+def test_module_reports_are_harvested_and_counted(orchestrator, tmp_path):
+    surefire = tmp_path / "m" / "target" / "surefire-reports"
+    failsafe = tmp_path / "m" / "target" / "failsafe-reports"
+    _write(surefire / "TEST-U.xml", _suite("U", [("a", "passed"), ("b", "failed")]))
+    _write(failsafe / "TEST-I.xml", _suite("I", [("c", "error"), ("d", "passed")]))
+    validator = PhysicalValidator(docker_orchestrator=orchestrator)
+
+    result = validator.parse_module_test_reports(
+        str(tmp_path / "m"), [str(surefire), str(failsafe)]
+    )
+
+    assert result["tests_total"] == 4
+    assert result["tests_failed"] == 1
+    assert result["tests_errors"] == 1
+    assert sorted(result["failing_names"]) == ["com.x.I.c", "com.x.U.b"]
+    assert len(orchestrator.client.api.get_calls) == 1
+
+
+def test_project_reports_are_harvested_when_the_compact_parser_cannot_run(
+    orchestrator, tmp_path, monkeypatch
+):
+    project = tmp_path / "proj"
+    reports = project / "target" / "surefire-reports"
+    _write(reports / "TEST-A.xml", _suite("A", [("ok", "passed"), ("bad", "failed")]))
+    _write(reports / "TEST-B.xml", _suite("B", [("ok", "passed")]))
+    validator = PhysicalValidator(docker_orchestrator=orchestrator, project_path=str(tmp_path))
+    monkeypatch.setattr(
+        validator, "_parse_test_reports_compact_in_container", lambda *a, **k: None
+    )
+
+    result = validator.parse_test_reports(str(project))
+
+    assert result["valid"] is True
+    assert result["total_tests"] == 3
+    assert result["failed_tests"] == 1
+    assert result["failing_test_names"] == ["com.x.A::bad"]
+    cat_calls = [
+        call for call in orchestrator.client.containers.container.exec_calls if "cat '" in call[-1]
+    ]
+    assert cat_calls == []
+
+
+@pytest.mark.parametrize(
+    "xml",
+    [
+        _suite("A", [("x", "passed"), ("y", "failed"), ("z", "error")]),
+        "<testsuites>" + _suite("A", [("x", "passed")]) + _suite("B", [("y", "failed")])
+        + "</testsuites>",
+        "<report><group>" + _suite("A", [("x", "skipped")]) + "</group></report>",
+        '<testsuite tests="1"><properties><property name="sag.attempt_id" value="2"/>'
+        '</properties><testcase classname="A" name="x"/></testsuite>',
+        '<testsuite tests="3" failures="1"><testcase classname="A" name="x"',
+    ],
+)
+def test_streaming_parse_matches_the_tree_parse(xml):
+    validator = PhysicalValidator(docker_orchestrator=None)
+
+    streamed = validator._parse_single_test_stream(xml.encode(), "/r/TEST-A.xml")
+
+    assert streamed == validator._parse_test_report_text(xml, "/r/TEST-A.xml")
+
+
+def test_compact_parser_reuses_cached_parses_until_a_report_changes(tmp_path):
+    from sag.agent.physical_validator import _COMPACT_REPORT_PARSER_BODY
+
+    project = tmp_path / "proj"
+    report = project / "target" / "surefire-reports" / "TEST-A.xml"
+    _write(report, _suite("A", [("x", "passed")]), 1_000_000)
+    cache_path = tmp_path / "cache" / "reports.json"
+
+    def run():
+        command = (
+            "python3 - <<'PY'\n"
+            f"project_dir = {json.dumps(str(project))}\n"
+            f"pytest_reports_dir = {json.dumps(str(tmp_path / 'pytest-reports'))}\n"
+            f"receipts_dir = {json.dumps(str(tmp_path / 'receipts'))}\n"
+            "primary_root = None\n"
+            f"report_cache_path = {json.dumps(str(cache_path))}\n"
+            f"{_COMPACT_REPORT_PARSER_BODY}\nPY"
+        )
+        proc = subprocess.run(["bash", "-c", command], capture_output=True, text=True)
+        return json.loads(proc.stdout)
+
+    assert run()["passed_tests"] == 1
+    cached = json.loads(cache_path.read_text())
+    entry = cached["entries"][str(report)]
+    # Prove the second pass answers from the cache: doctor the cached status.
+    entry["parsed"]["cases"][0][1] = "failed"
+    cache_path.write_text(json.dumps(cached))
+    assert run()["failed_tests"] == 1
+
+    _write(report, _suite("A", [("x", "passed"), ("y", "passed")]), 1_000_001)
+    result = run()
+    assert (result["passed_tests"], result["failed_tests"]) == (2, 0)
@@ -3,7 +3,11 @@ works on stopped containers), serve reads from disk. Guards against the resource
 drain where every 5s dashboard poll re-execed into every container."""
 
 import io
+import os
+import subprocess
 import tarfile
+import threading
+import time
 import types
 
 import pytest
@@ -55,8 +59,10 @@ ARCHIVES = {
 @pytest.fixture(autouse=True)
 def _clear_fetch_cache():
     session_mirror._last_fetch.clear()
+    session_mirror._manifests.clear()
     yield
     session_mirror._last_fetch.clear()
+    session_mirror._manifests.clear()
 
 
 def test_mirror_extracts_results_and_report(tmp_path):
@@ -118,3 +124,151 @@ def test_reader_answers_cat_and_finds(tmp_path):
 def test_reader_missing_file_is_exit_1(tmp_path):
     r = MirrorReader(tmp_path / "nope")
     assert r.execute_command("cat '/workspace/.setup_agent/sessions/index.json' 2>/dev/null")["exit_code"] == 1
+
+
+class LocalContainer:
+    """A running container whose /workspace is a host directory: execs run in a
+    local sh and get_archive tars the host path, so the delta sync runs for real."""
+
+    def __init__(self, root):
+        self.root = root
+        self.archive_calls = []
+        self.execs = []
+
+    def _host(self, path):
+        return str(self.root) + path.removeprefix("/workspace")
+
+    def get_archive(self, path):
+        self.archive_calls.append(path)
+        host = self._host(path)
+        if not os.path.exists(host):
+            raise Exception("Not Found")
+        buf = io.BytesIO()
+        with tarfile.open(fileobj=buf, mode="w") as t:
+            t.add(host, arcname=os.path.basename(path))
+        return iter([buf.getvalue()]), {}
+
+    def exec_run(self, cmd):
+        script = cmd[-1].replace("/workspace", str(self.root))
+        self.execs.append(script)
+        proc = subprocess.run(["sh", "-c", script], capture_output=True)
+        output = proc.stdout.replace(str(self.root).encode(), b"/workspace")
+        return types.SimpleNamespace(exit_code=proc.returncode, output=output)
+
+
+def _workspace(tmp_path):
+    root = tmp_path / "ws"
+    (root / ".setup_agent" / "sessions").mkdir(parents=True)
+    (root / ".setup_agent" / "sessions" / "index.json").write_text('{"sessions": []}')
+    (root / ".setup_agent" / "stale.json").write_text("{}")
+    (root / ".setup_agent" / "journal.jsonl").write_text('{"n": 1}\n')
+    return root
+
+
+def _sync(container, tmp_path, clock):
+    clock[0] += session_mirror.RUNNING_TTL_SECONDS + 1
+    return ensure_mirror(
+        FakeClient(container), "sag-x", running=True, logs_root=tmp_path / "logs",
+        now=lambda: clock[0])
+
+
+def test_running_container_syncs_only_changed_files_and_appends_jsonl(tmp_path):
+    root = _workspace(tmp_path)
+    container = LocalContainer(root)
+    clock = [1000.0]
+    dest = _sync(container, tmp_path, clock)
+    assert (dest / ".setup_agent" / "journal.jsonl").read_text() == '{"n": 1}\n'
+
+    with open(root / ".setup_agent" / "journal.jsonl", "a") as handle:
+        handle.write('{"n": 2}\n')
+    (root / ".setup_agent" / "sessions" / "index.json").write_text('{"sessions": [1]}')
+    (root / ".setup_agent" / "stale.json").unlink()
+    container.archive_calls.clear()
+    _sync(container, tmp_path, clock)
+
+    assert (dest / ".setup_agent" / "journal.jsonl").read_text() == '{"n": 1}\n{"n": 2}\n'
+    assert (dest / ".setup_agent" / "sessions" / "index.json").read_text() == '{"sessions": [1]}'
+    assert not (dest / ".setup_agent" / "stale.json").exists()
+    # Only the changed non-append file went through get_archive; no tree re-extraction.
+    assert container.archive_calls == ["/workspace/.setup_agent/sessions/index.json"]
+    # The tail fetch starts inside the mirrored bytes, which it must match.
+    assert any(script.startswith("tail -c +1 ") for script in container.execs)
+
+
+def test_refresh_budget_spreads_a_large_append_over_refreshes(tmp_path, monkeypatch):
+    monkeypatch.setattr(session_mirror, "REFRESH_BUDGET_BYTES", 64)
+    root = _workspace(tmp_path)
+    container = LocalContainer(root)
+    clock = [1000.0]
+    dest = _sync(container, tmp_path, clock)
+    lines = "".join(f'{{"line": {i:04d}}}\n' for i in range(10))  # 150 bytes
+    with open(root / ".setup_agent" / "journal.jsonl", "a") as handle:
+        handle.write(lines)
+
+    sizes = []
+    for _ in range(4):
+        _sync(container, tmp_path, clock)
+        sizes.append((dest / ".setup_agent" / "journal.jsonl").stat().st_size)
+
+    # 15-byte lines: only whole lines land, 4 per 64-byte refresh.
+    assert sizes == [9 + 60, 9 + 120, 9 + 150, 9 + 150]
+    assert (dest / ".setup_agent" / "journal.jsonl").read_text() == '{"n": 1}\n' + lines
+
+
+def test_rewritten_jsonl_is_fetched_whole(tmp_path):
+    root = _workspace(tmp_path)
+    container = LocalContainer(root)
+    clock = [1000.0]
+    dest = _sync(container, tmp_path, clock)
+
+    (root / ".setup_agent" / "journal.jsonl").write_text('{"m": 10}\n{"m": 20}\n')
+    _sync(container, tmp_path, clock)
+
+    assert (dest / ".setup_agent" / "journal.jsonl").read_text() == '{"m": 10}\n{"m": 20}\n'
+
+
+def test_concurrent_refreshes_append_a_record_once(tmp_path):
+    root = _workspace(tmp_path)
+
+    class SlowContainer(LocalContainer):
+        def exec_run(self, cmd):
+            time.sleep(0.05)  # both callers are inside the refresh at once
+            return super().exec_run(cmd)
+
+    container = SlowContainer(root)
+    clock = [1000.0]
+    dest = _sync(container, tmp_path, clock)
+    with open(root / ".setup_agent" / "journal.jsonl", "a") as handle:
+        handle.write('{"n": 2}\n')
+    clock[0] += session_mirror.RUNNING_TTL_SECONDS + 1
+
+    def refresh():
+        ensure_mirror(
+            FakeClient(container), "sag-x", running=True, logs_root=tmp_path / "logs",
+            now=lambda: clock[0])
+
+    threads = [threading.Thread(target=refresh) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert (dest / ".setup_agent" / "journal.jsonl").read_text() == '{"n": 1}\n{"n": 2}\n'
+
+
+def test_a_replayed_append_and_a_torn_line_never_reach_the_mirror(tmp_path):
+    root = _workspace(tmp_path)
+    container = LocalContainer(root)
+    clock = [1000.0]
+    dest = _sync(container, tmp_path, clock)
+    journal = root / ".setup_agent" / "journal.jsonl"
+    with open(journal, "a") as handle:
+        handle.write('{"n": 2}\n{"n": 3')  # the writer is mid-line
+    previous = dict(session_mirror._manifests["sag-x"])
+    manifest = session_mirror._probe_manifest(container)
+
+    session_mirror._sync_delta(container, dest, previous, manifest)
+    synced = session_mirror._sync_delta(container, dest, previous, manifest)  # lost race
+
+    assert (dest / ".setup_agent" / "journal.jsonl").read_text() == '{"n": 1}\n{"n": 2}\n'
+    assert synced["/workspace/.setup_agent/journal.jsonl"][0] == 18
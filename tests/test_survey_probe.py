@@ -0,0 +1,112 @@
+"""The one-exec survey probe that seeds the project-file cache."""
+
+import subprocess
+
+from sag.agent.physical_survey import (
+    README_MAX_CHARS,
+    analyze_documentation,
+    analyze_project_structure,
+    analyze_test_configuration,
+    enumerate_build_islands,
+    scan_root_build_markers,
+    scan_source_modules,
+    scan_test_module_dirs,
+)
+from sag.agent.project_files import attach_project_files
+from sag.agent.survey_probe import survey_project
+
+
+def _gradle_monorepo(tmp_path):
+    (tmp_path / "settings.gradle").write_text("include 'core', 'apps:web'\n")
+    (tmp_path / "build.gradle").write_text("plugins { id 'java' }\ntestImplementation 'junit'\n")
+    (tmp_path / "README.md").write_text("Build with gradle build, needs Java 17.\n")
+    for module in ("core", "apps/web", "core/build/gen"):
+        (tmp_path / module / "src" / "main" / "java").mkdir(parents=True)
+    (tmp_path / "core" / "src" / "test" / "java").mkdir(parents=True)
+    (tmp_path / "apps" / "web" / "src" / "test" / "kotlin").mkdir(parents=True)
+    (tmp_path / "tools" / "cli" / "src" / "main" / "scala").mkdir(parents=True)
+    (tmp_path / "tools" / "cli" / "pom.xml").write_text("<project/>\n")
+    (tmp_path / "apps" / "build.gradle").write_text("apply plugin: 'maven-publish'\n")
+    return str(tmp_path)
+
+
+def _survey(orchestrator, root):
+    modules = scan_source_modules(orchestrator, root)
+    return (
+        analyze_project_structure(orchestrator, root),
+        analyze_documentation(orchestrator, root),
+        analyze_test_configuration(orchestrator, root, "Java"),
+        scan_root_build_markers(orchestrator, root),
+        modules,
+        scan_test_module_dirs(orchestrator, root),
+        enumerate_build_islands(orchestrator, root, modules),
+    )
+
+
+def test_one_probe_answers_the_whole_survey_like_the_plain_commands(tmp_path, local_bash):
+    root = _gradle_monorepo(tmp_path)
+    probed = local_bash()
+    attach_project_files(probed)
+
+    assert survey_project(probed, root)
+    answers = _survey(probed, root)
+
+    assert len(probed.commands) == 1
+    assert answers == _survey(local_bash(), root)
+    modules = {module["module"]: module["lang"] for module in answers[4]}
+    assert modules == {"core": "java", "apps/web": "java", "tools/cli": "scala"}
+    islands = {island["root"][len(root) + 1 :]: island["system"] for island in answers[6]}
+    assert islands == {"apps": "gradle", "tools/cli": "maven"}
+
+
+def test_probe_stamps_match_stat_so_a_revalidation_rereads_nothing(tmp_path, local_bash):
+    root = _gradle_monorepo(tmp_path)
+    orchestrator = local_bash()
+    files = attach_project_files(orchestrator)
+    survey_project(orchestrator, root)
+
+    for name in ("build.gradle", "core", "apps/build.gradle", "pom.xml"):
+        path = f"{root}/{name}"
+        stat = subprocess.run(
+            ["bash", "-c", f"stat -L -c '%F|%s|%y|%i' -- {path} 2>/dev/null || echo missing"],
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+        assert files.entry(path).stamp == stat
+
+    files.invalidate()
+    orchestrator.commands.clear()
+    assert files.read(f"{root}/apps/build.gradle") == "apply plugin: 'maven-publish'\n"
+    assert len(orchestrator.commands) == 1
+    assert files.scan("source_dirs", root) is None  # scans are not kept past a tool run
+
+
+def test_without_python3_the_survey_falls_back_to_the_shell_prefetch(tmp_path, local_bash):
+    root = _gradle_monorepo(tmp_path)
+
+    class NoPython(local_bash):
+        def execute_command(self, command, workdir=None, **kwargs):
+            command = command.replace("python3 -", "sag-no-such-python3 -")
+            return super().execute_command(command, workdir, **kwargs)
+
+    orchestrator = NoPython()
+    attach_project_files(orchestrator)
+
+    assert not survey_project(orchestrator, root)
+    assert len(orchestrator.commands) == 2  # the probe, then the one-exec prefetch
+    assert _survey(orchestrator, root) == _survey(local_bash(), root)
+    assert not survey_project(local_bash(), root)  # no cache: nothing to seed
+
+
+def test_a_long_readme_is_read_to_the_same_prefix_cached_or_not(tmp_path, local_bash):
+    root = _gradle_monorepo(tmp_path)
+    (tmp_path / "README.md").write_text("Needs Java 17.\n" + ("x" * 79 + "\n") * 500)
+    probed = local_bash()
+    attach_project_files(probed)
+    survey_project(probed, root)
+
+    cached = analyze_documentation(probed, root)
+    plain = analyze_documentation(local_bash(), root)
+
+    assert len(cached["readme_content"]) == README_MAX_CHARS
+    assert cached == plain
@@ -1,9 +1,11 @@
+import asyncio
 import json
 
 from fastapi.testclient import TestClient
 
 import sag.web.app as app_module
 from sag.web.app import create_app
+from sag.web.dashboard_stream import DashboardBroadcaster, apply_patch
 from sag.web.demo_data import build_demo_dashboard, get_demo_session
 from sag.web.read_model import ReadModelBuilder
 
@@ -115,24 +117,74 @@ def test_session_endpoint_returns_session_detail():
     assert response.json()["reportDoc"]["title"].startswith("setup-report")
 
 
+class DisconnectingRequest:
+    """Connected for ``polls`` disconnect checks, then gone.
+
+    TestClient cannot end an open-ended stream, so stream tests drive the
+    endpoint's response iterator directly.
+    """
+
+    def __init__(self, polls=0, on_poll=None):
+        self.polls = polls
+        self.on_poll = on_poll
+
+    async def is_disconnected(self):
+        if self.on_poll is not None:
+            self.on_poll()
+            self.on_poll = None
+        self.polls -= 1
+        return self.polls < 0
+
+
+def _stream_endpoint(app):
+    return next(route.endpoint for route in app.routes if route.path == "/api/stream/dashboard")
+
+
+def _read_stream(response):
+    async def collect():
+        return [chunk async for chunk in response.body_iterator]
+
+    return "".join(asyncio.run(collect()))
+
+
 def test_dashboard_stream_emits_sse_snapshot():
     app = create_app(ReadModelBuilder(demo_mode=True))
-    client = TestClient(app)
 
-    with client.stream("GET", "/api/stream/dashboard") as response:
-        lines = []
-        for line in response.iter_lines():
-            lines.append(line)
-            if len(lines) >= 2:
-                break
+    response = _stream_endpoint(app)(DisconnectingRequest())
+    lines = _read_stream(response).splitlines()
 
-    assert response.status_code == 200
-    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.media_type == "text/event-stream"
     assert lines[0] == "event: snapshot"
-
     data_line = next(line for line in lines if line.startswith("data: "))
     payload = json.loads(data_line.removeprefix("data: "))
     assert payload["workspaces"][0]["latestSession"] == "CC-3"
+    assert "id: 0" in lines
+
+
+def test_dashboard_stream_sends_patches_from_one_shared_producer():
+    builder = ReadModelBuilder(demo_mode=True)
+    broadcaster = DashboardBroadcaster(builder, events=lambda: None, idle_refresh=60)
+    app = create_app(builder, dashboard_stream=broadcaster)
+    original = build_demo_dashboard()
+
+    def renamed():
+        dashboard = original.model_copy(deep=True)
+        dashboard.workspaces[0].task = "Renamed task"
+        return dashboard
+
+    other, (_event, version, snapshot) = broadcaster.subscribe()
+    builder.dashboard = renamed
+    response = _stream_endpoint(app)(DisconnectingRequest(polls=2, on_poll=broadcaster.refresh))
+    body = _read_stream(response)
+    other.close()
+
+    assert version == 0
+    assert "event: patch" in body and "id: 1" in body
+    ops = json.loads(body.split("event: patch\ndata: ")[1].split("\n")[0])
+    assert ops == [{"op": "replace", "path": "/workspaces/0/task", "value": "Renamed task"}]
+    assert apply_patch(snapshot, ops)["workspaces"][0]["task"] == "Renamed task"
+    assert other.get(timeout=0)[:2] == ("patch", 1)
+    assert broadcaster.rebuilds == 2  # one for all subscribers, one per change
 
 
 def test_unknown_session_returns_404_in_demo_mode():
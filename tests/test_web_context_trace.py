@@ -27,6 +27,8 @@ def test_context_trace_artifact_filenames_include_outputs_and_journals():
     assert _is_context_filename("trunk_20260612_010101.json")
     assert _is_context_filename("full_outputs.jsonl")
     assert _is_context_filename("journal/phase_build.journal.jsonl")
+    assert _is_context_filename("phase_build.events.jsonl")
+    assert not _is_context_filename("journal/phase_build.events.jsonl")
     assert not _is_context_filename("task_3.json")
     assert not _is_context_filename("../phase_build.json")
 
@@ -0,0 +1,171 @@
+import asyncio
+import threading
+import time
+
+from sag.web import dashboard_stream
+from sag.web.dashboard_stream import DashboardBroadcaster, apply_patch, json_patch
+from sag.web.demo_data import build_demo_dashboard
+
+
+class CountingBuilder:
+    demo_mode = False
+    workspace_registry = None
+
+    def __init__(self):
+        self.dashboard_value = build_demo_dashboard()
+        self.calls = 0
+
+    def dashboard(self):
+        self.calls += 1
+        return self.dashboard_value
+
+
+class FakeEvents:
+    """A Docker event stream the test feeds one event at a time."""
+
+    def __init__(self):
+        self.pending = []
+        self.ready = threading.Event()
+        self.closed = False
+
+    def push(self, name):
+        self.pending.append({"Type": "container", "Actor": {"Attributes": {"name": name}}})
+        self.ready.set()
+
+    def __iter__(self):
+        while not self.closed:
+            if self.ready.wait(0.05):
+                self.ready.clear()
+                while self.pending:
+                    yield self.pending.pop(0)
+
+    def close(self):
+        self.closed = True
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_json_patch_round_trips_nested_changes():
+    old = {"a/b": 1, "list": [{"x": 1}, {"x": 2}], "gone": True, "grow": [1]}
+    new = {"a/b": 2, "list": [{"x": 1}, {"x": 3, "y": 0}], "grow": [1, 2], "new": None}
+
+    ops = json_patch(old, new)
+
+    assert {"op": "replace", "path": "/a~1b", "value": 2} in ops
+    assert {"op": "add", "path": "/list/1/y", "value": 0} in ops
+    assert {"op": "remove", "path": "/gone"} in ops
+    assert {"op": "replace", "path": "/grow", "value": [1, 2]} in ops
+    assert apply_patch(old, ops) == new
+    assert json_patch(new, new) == []
+
+
+def test_container_events_drive_rebuilds_and_unchanged_rebuilds_send_nothing():
+    builder = CountingBuilder()
+    events = FakeEvents()
+    broadcaster = DashboardBroadcaster(builder, events=lambda: events, idle_refresh=60)
+    first, _ = broadcaster.subscribe()
+    second, _ = broadcaster.subscribe()
+
+    events.push("unrelated")
+    events.push("sag-commons-cli")
+    assert _wait_for(lambda: builder.calls == 2)
+    assert first.get(timeout=0.1) is None  # nothing changed
+
+    changed = builder.dashboard_value.model_copy(deep=True)
+    changed.workspaces[0].docker.status = "exited"
+    builder.dashboard_value = changed
+    events.push("sag-commons-cli")
+
+    for subscription in (first, second):
+        event, version, ops = subscription.get(timeout=5)
+        assert (event, version) == ("patch", 1)
+        assert ops == [{"op": "replace", "path": "/workspaces/0/docker/status", "value": "exited"}]
+    assert builder.calls == 3
+
+    first.close()
+    second.close()
+    assert _wait_for(lambda: events.closed)
+
+
+def test_producer_stops_when_the_last_client_leaves():
+    builder = CountingBuilder()
+    broadcaster = DashboardBroadcaster(builder, events=lambda: None, idle_refresh=60)
+    subscription, _ = broadcaster.subscribe()
+    producer = broadcaster._thread
+
+    subscription.close()
+
+    producer.join(timeout=5)
+    assert not producer.is_alive()
+    broadcaster.subscribe()[0].close()
+    assert builder.calls == 2  # the next client starts from a fresh build
+
+
+def test_a_subscriber_that_falls_behind_is_resynced_with_a_snapshot(monkeypatch):
+    monkeypatch.setattr(dashboard_stream, "SUBSCRIBER_BACKLOG", 2)
+    builder = CountingBuilder()
+    broadcaster = DashboardBroadcaster(builder, events=lambda: None, idle_refresh=60)
+    subscription, _ = broadcaster.subscribe()
+
+    for index in range(3):
+        changed = builder.dashboard_value.model_copy(deep=True)
+        changed.workspaces[0].task = f"task {index}"
+        builder.dashboard_value = changed
+        assert broadcaster.refresh()
+
+    event, version, data = subscription.get(timeout=0)
+    assert (event, version) == ("snapshot", 3)
+    assert data["workspaces"][0]["task"] == "task 2"
+    assert subscription.get(timeout=0) is None
+    subscription.close()
+
+
+def test_a_loop_bound_subscription_is_fed_on_its_loop():
+    builder = CountingBuilder()
+    broadcaster = DashboardBroadcaster(builder, events=lambda: None, idle_refresh=60)
+
+    async def scenario():
+        subscription, _ = broadcaster.subscribe(asyncio.get_running_loop())
+        assert await subscription.next(0.01) is None
+        changed = builder.dashboard_value.model_copy(deep=True)
+        changed.workspaces[0].task = "from the producer thread"
+        builder.dashboard_value = changed
+        threading.Thread(target=broadcaster.refresh).start()
+        message = await subscription.next(5)
+        subscription.close()
+        return message
+
+    event, version, ops = asyncio.run(scenario())
+
+    assert (event, version) == ("patch", 1)
+    assert ops[0]["value"] == "from the producer thread"
+
+
+def test_a_finished_producer_closes_only_its_own_event_stream():
+    builder = CountingBuilder()
+    streams = []
+
+    def open_events():
+        streams.append(FakeEvents())
+        return streams[-1]
+
+    broadcaster = DashboardBroadcaster(builder, events=open_events, idle_refresh=60)
+    first, _ = broadcaster.subscribe()
+    assert _wait_for(lambda: len(streams) == 1)
+    producer = broadcaster._thread
+    first.close()
+    producer.join(timeout=5)
+
+    second, _ = broadcaster.subscribe()
+    assert _wait_for(lambda: len(streams) == 2)
+
+    assert streams[0].closed and not streams[1].closed
+    second.close()
+    assert _wait_for(lambda: streams[1].closed)
@@ -1,6 +1,9 @@
+import os
+from dataclasses import replace
 from pathlib import Path
 
-from sag.web.file_tracker import FileChangeTracker
+from sag.web import file_tracker
+from sag.web.file_tracker import FileChangeTracker, FileSnapshot
 
 
 def test_file_tracker_detects_added_modified_and_deleted(tmp_path: Path):
@@ -47,7 +50,7 @@ def test_file_tracker_ignores_heavy_and_hidden_generated_dirs(tmp_path: Path):
     assert "target/app.jar" not in snap.files
 
 
-def test_file_tracker_prunes_ignored_subtrees_before_descending(tmp_path: Path):
+def test_file_tracker_prunes_ignored_subtrees_before_descending(tmp_path: Path, monkeypatch):
     root = tmp_path / "workspace"
     root.mkdir()
     (root / "node_modules" / "pkg").mkdir(parents=True)
@@ -58,19 +61,20 @@ def test_file_tracker_prunes_ignored_subtrees_before_descending(tmp_path: Path):
     (root / "src.py").write_text("tracked", encoding="utf-8")
 
     visited: list[str] = []
+    real_scandir = os.scandir
 
-    class RecordingTracker(FileChangeTracker):
-        def _ignored(self, path: Path) -> bool:
-            visited.append(path.relative_to(self.root).as_posix())
-            return super()._ignored(path)
+    def recording_scandir(path):
+        visited.append(Path(path).relative_to(root).as_posix())
+        return real_scandir(path)
 
-    tracker = RecordingTracker(root)
+    monkeypatch.setattr(file_tracker.os, "scandir", recording_scandir)
+    tracker = FileChangeTracker(root)
     snap = tracker.snapshot("base")
 
     assert "src.py" in snap.files
     assert "node_modules" not in snap.files
     assert "node_modules/pkg/index.js" not in snap.files
-    assert "node_modules/pkg/index.js" not in visited
+    assert visited == ["."]
 
 
 def test_file_tracker_records_broken_symlink_as_other(tmp_path: Path):
@@ -82,3 +86,82 @@ def test_file_tracker_records_broken_symlink_as_other(tmp_path: Path):
     snap = tracker.snapshot("base")
 
     assert snap.files["broken-link"].type == "other"
+
+
+def _tree(root: Path) -> None:
+    for rel, text in {
+        "src/main/App.java": "class App {}",
+        "src/main/Util.java": "class Util {}",
+        "src/test/AppTest.java": "class AppTest {}",
+        "docs/readme.md": "# docs",
+        "pom.xml": "<project/>",
+    }.items():
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+
+
+def test_parallel_walk_matches_a_serial_walk(tmp_path: Path):
+    root = tmp_path / "workspace"
+    _tree(root)
+
+    serial = FileChangeTracker(root, workers=1).snapshot("a")
+    parallel = FileChangeTracker(root, workers=4).snapshot("b")
+
+    assert serial.paths == parallel.paths == tuple(sorted(serial.paths))
+    assert serial.paths[:3] == ("docs", "docs/readme.md", "pom.xml")
+    assert list(serial.sizes) == list(parallel.sizes)
+
+
+def test_content_mode_reports_real_changes_and_renames(tmp_path: Path):
+    root = tmp_path / "workspace"
+    _tree(root)
+    tracker = FileChangeTracker(root, mode="content")
+    base = tracker.snapshot("base")
+
+    (root / "src" / "main" / "Util.java").rename(root / "src" / "main" / "Helpers.java")
+    os.utime(root / "pom.xml", ns=(1, 1))  # touched, same bytes
+    (root / "docs" / "readme.md").write_text("# changed", encoding="utf-8")
+
+    head = tracker.snapshot("head")
+    digest = tracker.diff(base, head)
+
+    changes = {item.path: (item.change, item.note) for item in digest.items}
+    assert changes == {
+        "docs/readme.md": ("modified", ""),
+        "src/main/Helpers.java": ("renamed", "from src/main/Util.java"),
+    }
+    assert (digest.counts.renamed, digest.counts.added, digest.counts.deleted) == (1, 0, 0)
+    assert digest.snapshot.mode == "content"
+
+
+def test_snapshots_persist_and_reload_after_a_restart(tmp_path: Path):
+    root = tmp_path / "workspace"
+    _tree(root)
+    store = tmp_path / "snapshots"
+    FileChangeTracker(root, mode="content", store_dir=store).snapshot("run/base")
+
+    (root / "pom.xml").write_text("<project>2</project>", encoding="utf-8")
+    restarted = FileChangeTracker(root, mode="content", store_dir=store)
+    base = restarted.load("run/base")
+    digest = restarted.diff(base, restarted.snapshot("head"))
+
+    assert base.files["pom.xml"].digest
+    assert [(item.path, item.change) for item in digest.items] == [("pom.xml", "modified")]
+    assert restarted.load("missing") is None
+    assert FileSnapshot.load(tmp_path / "nope.gz") is None
+
+
+def test_a_snapshot_with_a_short_column_loads_as_missing(tmp_path: Path):
+    root = tmp_path / "workspace"
+    _tree(root)
+    snapshot = FileChangeTracker(root, mode="content").snapshot("base")
+    assert len(snapshot.paths) > 1
+
+    short_digests = replace(snapshot, digests=snapshot.digests[:-1])
+    short_digests.save(tmp_path / "digests.gz")
+    short_sizes = replace(snapshot, sizes=snapshot.sizes[:-1])
+    short_sizes.save(tmp_path / "sizes.gz")
+
+    assert FileSnapshot.load(tmp_path / "digests.gz") is None
+    assert FileSnapshot.load(tmp_path / "sizes.gz") is None
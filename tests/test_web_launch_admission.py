@@ -0,0 +1,211 @@
+"""Tests for resource-aware launch admission."""
+
+from types import SimpleNamespace
+
+from sag.web.launch_admission import (
+    GIB,
+    CgroupStats,
+    ContainerUsage,
+    HostResources,
+    ResourceAdmission,
+    classify_ecosystem,
+    read_host_resources,
+)
+from sag.web.launch_queue import LaunchBatch, LaunchItem, LaunchQueueStore
+from sag.web.launch_runner import LaunchScheduler
+
+from test_web_launch_runner import FakeSpawner, wait_for
+
+NOW = "2026-06-07T10:00:00"
+GRADLE = "https://github.com/acme/heavy-gradle.git"
+PYTHON = "https://github.com/acme/light-python.git"
+
+
+def make_item(item_id, repo_url, row_index):
+    name = repo_url.rsplit("/", 1)[-1].removesuffix(".git")
+    return LaunchItem(
+        id=item_id,
+        batch_id="BATCH-20260607-abcdef",
+        row_index=row_index,
+        repo_url=repo_url,
+        project_name=name,
+        docker_label=f"{name}-{row_index}",
+        workspace_id=f"sag-{name}-{row_index}",
+        command=["python", "-m", "sag.main", "project", repo_url],
+        process_log=f"logs/project_launches/{item_id}.log",
+        created_at=NOW,
+    )
+
+
+def make_store(tmp_path, repos, concurrency=8):
+    store = LaunchQueueStore(tmp_path / "launch_queue.sqlite3")
+    items = [
+        make_item(f"LAUNCH-{index:08d}", repo, index) for index, repo in enumerate(repos)
+    ]
+    store.enqueue_batch(
+        LaunchBatch(
+            id="BATCH-20260607-abcdef",
+            created_at=NOW,
+            concurrency=concurrency,
+            total=len(items),
+            accepted=len(items),
+        ),
+        items,
+    )
+    return store
+
+
+def host(available_gib, total_gib=16, load1=0.5, cpus=8):
+    return lambda: HostResources(
+        mem_total=total_gib * GIB, mem_available=available_gib * GIB, load1=load1, cpus=cpus
+    )
+
+
+def started_repos(spawner):
+    return [argv[-1] for argv, _log in spawner.calls]
+
+
+def test_heavy_items_wait_for_headroom_while_light_ones_backfill(tmp_path):
+    store = make_store(tmp_path, [GRADLE, GRADLE, PYTHON])
+    store.record_footprint(GRADLE, 5 * GIB, NOW, ecosystem="gradle")
+    store.record_footprint(PYTHON, 1 * GIB, NOW, ecosystem="python")
+    usage = {}
+    admission = ResourceAdmission(store, host=host(10), containers=usage.get)
+    spawner = FakeSpawner()
+    scheduler = LaunchScheduler(store, spawn=spawner, global_cap=8, admission=admission)
+
+    scheduler.launch_ready()
+
+    # 10 GiB available - 1.6 GiB host reserve - 6 GiB still owed to the running
+    # Gradle build leaves room for the Python setup, not a second Gradle build.
+    assert started_repos(spawner) == [GRADLE, PYTHON]
+    assert admission.estimate(make_item("x", GRADLE, 9)) == 6 * GIB
+
+
+def test_an_oversized_item_still_runs_alone_and_high_load_holds_the_queue(tmp_path):
+    store = make_store(tmp_path, [GRADLE, PYTHON])
+    store.record_footprint(GRADLE, 64 * GIB, NOW)
+    admission = ResourceAdmission(store, host=host(8, load1=20), containers=lambda _: None)
+    spawner = FakeSpawner()
+
+    LaunchScheduler(store, spawn=spawner, global_cap=8, admission=admission).launch_ready()
+
+    assert started_repos(spawner) == [GRADLE]
+
+
+def test_a_blocked_item_is_jumped_at_most_max_bypasses_times(tmp_path, monkeypatch):
+    monkeypatch.setattr("sag.web.launch_admission.MAX_BYPASSES", 1)
+    store = make_store(tmp_path, [PYTHON, GRADLE, PYTHON, PYTHON])
+    store.record_footprint(GRADLE, 10 * GIB, NOW)
+    store.record_footprint(PYTHON, GIB // 2, NOW)
+    admission = ResourceAdmission(store, host=host(12), containers=lambda _: None)
+    spawner = FakeSpawner()
+
+    LaunchScheduler(store, spawn=spawner, global_cap=8, admission=admission).launch_ready()
+
+    assert started_repos(spawner) == [PYTHON, PYTHON]
+
+
+def test_finished_launches_record_their_peak_and_ecosystem(tmp_path):
+    store = make_store(tmp_path, [GRADLE])
+    usage = {"sag-heavy-gradle-0": ContainerUsage(current=GIB, peak=3 * GIB)}
+    admission = ResourceAdmission(store, host=host(8), containers=usage.get)
+    spawner = FakeSpawner()
+    scheduler = LaunchScheduler(store, spawn=spawner, global_cap=8, admission=admission)
+    unseen = make_item("LAUNCH-99999999", "https://github.com/acme/other.git", 9)
+
+    scheduler.launch_ready()
+    usage["sag-heavy-gradle-0"] = ContainerUsage(current=GIB, peak=3 * GIB, ecosystem="gradle")
+    admission.choose([unseen], store.unfinished_items())  # samples the running build
+    spawner.processes[0].finish(0)
+
+    assert wait_for(lambda: GRADLE in store.footprints())
+    footprint = store.footprints()[GRADLE]
+    assert (footprint.peak_bytes, footprint.ecosystem, footprint.runs) == (3 * GIB, "gradle", 1)
+    store.record_footprint(GRADLE, GIB, NOW)
+    assert store.footprints()[GRADLE].peak_bytes == 2 * GIB
+    # A repository seen for the first time borrows its ecosystem's mean peak.
+    admission._ecosystems[unseen.id] = "gradle"
+    admission._footprints = None
+    assert admission.estimate(unseen) == int(2 * GIB * 1.2)
+
+
+def test_the_ecosystem_seen_at_the_highest_sample_is_kept(tmp_path):
+    store = make_store(tmp_path, [GRADLE])
+    building = ContainerUsage(current=3 * GIB, peak=3 * GIB, ecosystem="gradle")
+    usage = {"sag-heavy-gradle-0": building}
+    admission = ResourceAdmission(store, host=host(8), containers=usage.get)
+    spawner = FakeSpawner()
+    scheduler = LaunchScheduler(store, spawn=spawner, global_cap=8, admission=admission)
+    unseen = make_item("LAUNCH-99999999", "https://github.com/acme/other.git", 9)
+
+    scheduler.launch_ready()
+    admission.choose([unseen], store.unfinished_items())
+    # After the build only a small python script is left running.
+    usage["sag-heavy-gradle-0"] = ContainerUsage(current=GIB // 4, peak=3 * GIB, ecosystem="python")
+    admission.choose([unseen], store.unfinished_items())
+    spawner.processes[0].finish(0)
+
+    assert wait_for(lambda: GRADLE in store.footprints())
+    assert store.footprints()[GRADLE].ecosystem == "gradle"
+
+
+def test_cgroup_stats_read_memory_and_classify_processes(tmp_path):
+    cgroup = tmp_path / "cgroup" / "system.slice" / "docker-abc123.scope"
+    cgroup.mkdir(parents=True)
+    (cgroup / "memory.current").write_text("1048576\n")
+    (cgroup / "memory.peak").write_text("4194304\n")
+    (cgroup / "cgroup.procs").write_text("41\n42\n")
+    proc = tmp_path / "proc"
+    for pid, cmdline in (("41", b"sleep\0infinity\0"), ("42", b"java\0-cp\0gradle-8.5\0")):
+        (proc / pid).mkdir(parents=True)
+        (proc / pid / "cmdline").write_bytes(cmdline)
+    lookups = []
+
+    def containers_get(name):
+        lookups.append(name)
+        return SimpleNamespace(id="abc123")
+
+    client = SimpleNamespace(containers=SimpleNamespace(get=containers_get))
+    stats = CgroupStats(lambda: client, cgroup_root=tmp_path / "cgroup", proc_root=proc)
+
+    assert stats("sag-demo") == ContainerUsage(current=1048576, peak=4194304, ecosystem="gradle")
+    assert stats("sag-demo").current == 1048576
+    assert lookups == ["sag-demo"]
+    assert classify_ecosystem(["/usr/bin/python3 -m pytest", "mvn -q test"]) == "maven"
+    # SAG's own helpers run in every container and say nothing about the build.
+    helpers = ["python3 -u -c import sys", "bash -c cd /w && python3 - <<'PY'\nsettings.gradle"]
+    assert classify_ecosystem([*helpers, "sleep 30"]) is None
+    assert classify_ecosystem([*helpers, "mvn -q test"]) == "maven"
+
+
+def test_cgroup_stats_look_up_a_recreated_container_again(tmp_path):
+    root = tmp_path / "cgroup"
+    ids = iter([("old111", 1000), ("new222", 2000)])
+
+    def containers_get(name):
+        container_id, current = next(ids)
+        cgroup = root / "system.slice" / f"docker-{container_id}.scope"
+        cgroup.mkdir(parents=True)
+        (cgroup / "memory.current").write_text(f"{current}\n")
+        return SimpleNamespace(id=container_id)
+
+    client = SimpleNamespace(containers=SimpleNamespace(get=containers_get))
+    stats = CgroupStats(lambda: client, cgroup_root=root, proc_root=tmp_path / "proc")
+    assert stats("sag-demo").current == 1000
+
+    (root / "system.slice" / "docker-old111.scope" / "memory.current").unlink()
+    (root / "system.slice" / "docker-old111.scope").rmdir()  # removed, then recreated
+
+    assert stats("sag-demo").current == 2000
+    assert stats._ids == {"sag-demo": "new222"}
+
+
+def test_read_host_resources_parses_meminfo(tmp_path):
+    meminfo = tmp_path / "meminfo"
+    meminfo.write_text("MemTotal:       16384000 kB\nMemAvailable:    8192000 kB\n")
+
+    resources = read_host_resources(meminfo)
+
+    assert (resources.mem_total, resources.mem_available) == (16384000 * 1024, 8192000 * 1024)
+    assert read_host_resources(tmp_path / "missing") is None
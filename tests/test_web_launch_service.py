@@ -130,6 +130,22 @@ def test_coverage_flag_absent_from_command_when_unset(tmp_path):
     assert "--coverage" not in claimed.command
 
 
+def test_shared_cache_threads_into_every_command_of_the_batch(tmp_path):
+    service, store, _ = make_service(tmp_path)
+
+    service.submit_batch(
+        LaunchBatchRequest(
+            shared_cache=True,
+            projects=[{"repo_url": REPO}, {"repo_url": "https://github.com/apache/commons-io.git"}],
+        )
+    )
+
+    first = store.claim_next(global_cap=8, now="2026-06-07T10:00:00")
+    store.mark_completed(first.id, 0, now="2026-06-07T10:05:00")
+    second = store.claim_next(global_cap=8, now="2026-06-07T10:05:00")
+    assert first.command[-1] == second.command[-1] == "--shared-cache"
+
+
 def test_optional_fields_are_trimmed_and_blank_becomes_none(tmp_path):
     service, store, _ = make_service(tmp_path)
 
@@ -56,6 +56,15 @@ def test_coverage_flag_absent_when_unset():
     assert "--coverage" not in args
 
 
+def test_shared_cache_flag_appended_only_when_set():
+    assert ProjectCliCommand(repo_url=REPO, shared_cache=True).project_args() == [
+        "project",
+        REPO,
+        "--shared-cache",
+    ]
+    assert "--shared-cache" not in ProjectCliCommand(repo_url=REPO).project_args()
+
+
 def test_all_options_together_match_manual_sag_project_invocation():
     command = ProjectCliCommand(
         repo_url=REPO,
@@ -370,3 +370,16 @@ def test_read_model_builder_returns_live_session_detail_when_available():
 
     assert detail.id == "UI-12345678"
     assert detail.outcome.startswith("Task completed")
+
+
+def test_system_reads_docker_usage_from_the_registry_cache():
+    class CachedRegistry:
+        client = None  # the daemon is never asked directly
+
+        def df(self):
+            return {"LayersSize": 100, "Volumes": [{"UsageData": {"Size": 20}}], "BuildCache": []}
+
+    summary = ReadModelBuilder(workspace_registry=CachedRegistry()).system()
+
+    assert summary.docker_disk_used == 120
+    assert summary.docker_reclaimable is None
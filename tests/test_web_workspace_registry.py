@@ -1,4 +1,8 @@
-from sag.web.workspace_registry import WorkspaceRegistry
+import queue
+import threading
+import time
+
+from sag.web.workspace_registry import CachedWorkspaceRegistry, WorkspaceRegistry
 
 
 class FakeImage:
@@ -140,3 +144,173 @@ def test_workspace_registry_bad_container_does_not_hide_good_container():
     assert [workspace.container for workspace in workspaces] == ["sag-good"]
     assert workspaces[0].project == "good-project"
     assert workspaces[0].docker.image == "sag/base:from-attrs"
+
+
+class EventClient:
+    """Containers by id plus a Docker event stream the test feeds."""
+
+    def __init__(self, containers):
+        self.by_id = {f"id-{container.name}": container for container in containers}
+        for container_id, container in self.by_id.items():
+            container.id = container_id
+        self.list_calls = 0
+        self.df_calls = 0
+        self.df_release = threading.Event()
+        self.feed = queue.Queue()
+        self.containers = self
+
+    def list(self, all=True, ignore_removed=False):
+        self.list_calls += 1
+        return list(self.by_id.values())
+
+    def get(self, container_id):
+        return self.by_id[container_id]
+
+    def events(self, decode=True, filters=None):
+        while True:
+            event = self.feed.get()
+            if event is None:
+                return
+            yield event
+
+    def df(self):
+        self.df_calls += 1
+        self.df_release.wait(5)
+        return {"LayersSize": self.df_calls}
+
+    def emit(self, action, container_id, name):
+        actor = {"ID": container_id, "Attributes": {"name": name}}
+        self.feed.put({"Action": action, "Actor": actor})
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_cached_registry_follows_container_events_without_relisting():
+    client = EventClient([FakeContainer(name="sag-alpha"), FakeContainer(name="redis")])
+    registry = CachedWorkspaceRegistry(client=client)
+    changes = []
+    registry.add_listener(lambda: changes.append(1))
+
+    assert [w.container for w in registry.list_workspaces()] == ["sag-alpha"]
+
+    client.by_id["id-sag-alpha"].status = "exited"
+    client.emit("die", "id-sag-alpha", "sag-alpha")
+    client.by_id["id-sag-beta"] = FakeContainer(name="sag-beta")
+    client.emit("create", "id-sag-beta", "sag-beta")
+    client.emit("start", "id-redis", "redis")
+    assert _wait_for(lambda: len(changes) == 2)
+
+    workspaces = registry.list_workspaces()
+    assert [(w.container, w.docker.status) for w in workspaces] == [
+        ("sag-alpha", "exited"),
+        ("sag-beta", "running"),
+    ]
+
+    client.emit("destroy", "id-sag-alpha", "sag-alpha")
+    assert _wait_for(lambda: len(changes) == 3)
+    assert [w.container for w in registry.list_workspaces()] == ["sag-beta"]
+    assert client.list_calls == 1
+    registry.close()
+    client.feed.put(None)
+
+
+def test_cached_registry_serves_df_stale_while_revalidating():
+    client = EventClient([])
+    clock = [0.0]
+    registry = CachedWorkspaceRegistry(client=client, df_interval=60, now=lambda: clock[0])
+
+    assert registry.df() is None  # nothing yet; a refresh starts in the background
+    client.df_release.set()
+    assert _wait_for(lambda: registry.df() == {"LayersSize": 1})
+
+    client.df_release.clear()
+    clock[0] += 61
+    assert registry.df() == {"LayersSize": 1}  # stale value, refresh in flight
+    assert registry.df() == {"LayersSize": 1}
+    client.df_release.set()
+    assert _wait_for(lambda: registry.df() == {"LayersSize": 2})
+    assert client.df_calls == 2
+
+
+def test_cached_registry_keeps_the_last_list_when_the_daemon_fails_and_retries():
+    client = EventClient([FakeContainer(name="sag-alpha")])
+    clock = [0.0]
+    registry = CachedWorkspaceRegistry(client=client, resync_interval=60, now=lambda: clock[0])
+    assert [w.container for w in registry.list_workspaces()] == ["sag-alpha"]
+
+    healthy_list = client.list
+
+    def failing_list(all=True, ignore_removed=False):
+        client.list_calls += 1
+        raise RuntimeError("docker daemon unavailable")
+
+    client.list = failing_list
+    clock[0] += 61
+    assert [w.container for w in registry.list_workspaces()] == ["sag-alpha"]
+    assert _wait_for(lambda: client.list_calls == 2 and not registry._resyncing)
+
+    client.list = healthy_list
+    client.by_id["id-sag-beta"] = FakeContainer(name="sag-beta")
+    clock[0] += 1  # well inside the resync interval: the failed list did not count
+    registry.list_workspaces()
+    assert _wait_for(
+        lambda: [w.container for w in registry.list_workspaces()] == ["sag-alpha", "sag-beta"]
+    )
+    assert client.list_calls == 3
+    registry.close()
+    client.feed.put(None)
+
+
+def test_cached_registry_resyncs_in_the_background_and_serves_the_cached_list():
+    client = EventClient([FakeContainer(name="sag-alpha")])
+    clock = [0.0]
+    registry = CachedWorkspaceRegistry(client=client, resync_interval=60, now=lambda: clock[0])
+    changes = []
+    registry.add_listener(lambda: changes.append(1))
+    registry.list_workspaces()
+
+    release = threading.Event()
+    healthy_list = client.list
+
+    def slow_list(all=True, ignore_removed=False):
+        release.wait(5)
+        return healthy_list(all=all, ignore_removed=ignore_removed)
+
+    client.list = slow_list
+    client.by_id["id-sag-beta"] = FakeContainer(name="sag-beta")  # an event was missed
+    clock[0] += 61
+
+    assert [w.container for w in registry.list_workspaces()] == ["sag-alpha"]  # not blocked
+    assert [w.container for w in registry.list_workspaces()] == ["sag-alpha"]
+    release.set()
+    assert _wait_for(lambda: changes == [1])
+    assert [w.container for w in registry.list_workspaces()] == ["sag-alpha", "sag-beta"]
+    assert client.list_calls == 2  # one background re-list, not one per read
+    registry.close()
+    client.feed.put(None)
+
+
+def test_cached_registry_subscribes_to_events_outside_its_lock():
+    client = EventClient([FakeContainer(name="sag-alpha")])
+    registry = CachedWorkspaceRegistry(client=client)
+    held = []
+    open_stream = client.events
+
+    def events(decode=True, filters=None):
+        held.append(registry._lock.locked())
+        return open_stream(decode=decode, filters=filters)
+
+    client.events = events
+    registry.list_workspaces()
+    registry.list_workspaces()
+
+    assert held == [False]
+    registry.close()
+    client.feed.put(None)
@@ -9,6 +9,7 @@ import {
   fetchSystem,
   submitProjectBatch,
   submitTask,
+  subscribeDashboard,
 } from "@/api/client"
 import type {
   DashboardResponse,
@@ -47,6 +48,9 @@ export function App() {
   const [launchNotice, setLaunchNotice] = useState<string | null>(null)
   const [highlightedWorkspaces, setHighlightedWorkspaces] = useState<string[]>([])
   const [lastUpdatedAt, setLastUpdatedAt] = useState<number | null>(null)
+  // The dashboard arrives over the live stream when the browser supports it;
+  // polling is the fallback.
+  const [streaming, setStreaming] = useState(() => typeof EventSource !== "undefined")
   const [selectedWorkspaceId, setSelectedWorkspaceId] = useState<string | null>(null)
   const [selectedSessionId, setSelectedSessionIdState] = useState<string | undefined>(undefined)
   const [selectedFacet, setSelectedFacet] = useState<string | undefined>(undefined)
@@ -117,14 +121,32 @@ export function App() {
     void loadLaunchQueue()
   }, [loadDashboard, loadLaunchQueue])
 
+  useEffect(() => {
+    const close = subscribeDashboard({
+      onDashboard: (nextDashboard) => {
+        setDashboard(nextDashboard)
+        setDashboardError(null)
+        setLastUpdatedAt(Date.now())
+      },
+      onClosed: () => setStreaming(false),
+    })
+    if (close === null) {
+      setStreaming(false)
+      return
+    }
+    return close
+  }, [])
+
   useEffect(() => {
     const interval = window.setInterval(() => {
-      void loadDashboard({ silent: true })
+      if (!streaming) {
+        void loadDashboard({ silent: true })
+      }
       void loadLaunchQueue()
     }, DASHBOARD_POLL_MS)
 
     return () => window.clearInterval(interval)
-  }, [loadDashboard, loadLaunchQueue])
+  }, [loadDashboard, loadLaunchQueue, streaming])
 
   const ensureSessionDetail = useCallback(
     async (sessionId: string, options?: { silent?: boolean }) => {
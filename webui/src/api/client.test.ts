@@ -7,6 +7,7 @@ import {
   fetchSession,
   submitProjectBatch,
   submitTask,
+  subscribeDashboard,
 } from "./client"
 
 const jsonResponse = (payload: unknown, init?: ResponseInit) =>
@@ -16,9 +17,67 @@ const jsonResponse = (payload: unknown, init?: ResponseInit) =>
     ...init,
   })
 
+class FakeEventSource {
+  static CLOSED = 2
+  static instances: FakeEventSource[] = []
+  readyState = 1
+  listeners: Record<string, (event: MessageEvent<string>) => void> = {}
+  onerror: (() => void) | null = null
+
+  constructor(public url: string) {
+    FakeEventSource.instances.push(this)
+  }
+
+  addEventListener(type: string, listener: (event: MessageEvent<string>) => void) {
+    this.listeners[type] = listener
+  }
+
+  emit(type: string, id: number, data: unknown) {
+    this.listeners[type](
+      new MessageEvent(type, { data: JSON.stringify(data), lastEventId: String(id) }),
+    )
+  }
+
+  close() {
+    this.readyState = FakeEventSource.CLOSED
+  }
+}
+
 describe("api client", () => {
   afterEach(() => {
     vi.restoreAllMocks()
+    vi.unstubAllGlobals()
+    FakeEventSource.instances = []
+  })
+
+  it("streams the dashboard as a snapshot plus versioned patches", () => {
+    vi.stubGlobal("EventSource", FakeEventSource)
+    const onDashboard = vi.fn()
+    const close = subscribeDashboard({ onDashboard, onClosed: vi.fn() })
+
+    const [source] = FakeEventSource.instances
+    expect(source.url).toBe("/api/stream/dashboard")
+    source.emit("snapshot", 4, { docker: { status: "connected" }, workspaces: [] })
+    source.emit("patch", 5, [{ op: "replace", path: "/docker/status", value: "unavailable" }])
+    expect(onDashboard).toHaveBeenLastCalledWith({
+      docker: { status: "unavailable" },
+      workspaces: [],
+    })
+
+    // A gap in versions means a missed delta: reconnect for a fresh snapshot.
+    source.emit("patch", 7, [])
+    expect(source.readyState).toBe(FakeEventSource.CLOSED)
+    expect(FakeEventSource.instances).toHaveLength(2)
+    expect(onDashboard).toHaveBeenCalledTimes(2)
+
+    close?.()
+    expect(FakeEventSource.instances[1].readyState).toBe(FakeEventSource.CLOSED)
+  })
+
+  it("returns null without EventSource so callers fall back to polling", () => {
+    vi.stubGlobal("EventSource", undefined)
+
+    expect(subscribeDashboard({ onDashboard: vi.fn(), onClosed: vi.fn() })).toBeNull()
   })
 
   it("fetches the dashboard from workspaces", async () => {
@@ -1,3 +1,5 @@
+import { applyPatch, type JsonPatchOp } from "@/lib/jsonPatch"
+
 import type {
   DashboardResponse,
   DeleteWorkspaceResult,
@@ -26,6 +28,61 @@ export function fetchDashboard(): Promise<DashboardResponse> {
   return getJson<DashboardResponse>("/api/workspaces")
 }
 
+export interface DashboardStreamHandlers {
+  onDashboard: (dashboard: DashboardResponse) => void
+  /** The server refused or ended the stream for good; fall back to polling. */
+  onClosed: () => void
+}
+
+/** Live dashboard over server-sent events: one snapshot, then JSON-patch deltas.
+ *
+ * Every event carries its version as the SSE id. A patch that does not follow
+ * the last applied version means a delta was missed, so the stream reconnects
+ * and starts over from a fresh snapshot. Network drops reconnect the same way
+ * (EventSource retries on its own). Returns a close function, or null when the
+ * browser has no EventSource.
+ */
+export function subscribeDashboard(handlers: DashboardStreamHandlers): (() => void) | null {
+  if (typeof EventSource === "undefined") {
+    return null
+  }
+
+  let source: EventSource
+  let current: DashboardResponse | null = null
+  let version = -1
+
+  const connect = () => {
+    source = new EventSource("/api/stream/dashboard")
+    source.addEventListener("snapshot", (event) => {
+      const message = event as MessageEvent<string>
+      current = JSON.parse(message.data) as DashboardResponse
+      version = Number(message.lastEventId)
+      handlers.onDashboard(current)
+    })
+    source.addEventListener("patch", (event) => {
+      const message = event as MessageEvent<string>
+      const next = Number(message.lastEventId)
+      if (current === null || next !== version + 1) {
+        source.close()
+        current = null
+        connect()
+        return
+      }
+      current = applyPatch(current, JSON.parse(message.data) as JsonPatchOp[])
+      version = next
+      handlers.onDashboard(current)
+    })
+    source.onerror = () => {
+      if (source.readyState === EventSource.CLOSED) {
+        handlers.onClosed()
+      }
+    }
+  }
+
+  connect()
+  return () => source.close()
+}
+
 export function fetchSystem(): Promise<SystemSummary> {
   return getJson<SystemSummary>("/api/system")
 }
@@ -312,6 +312,7 @@ export interface LaunchProjectRowInput {
 
 export interface LaunchBatchRequestBody {
   concurrency?: number | null
+  shared_cache?: boolean
   projects: LaunchProjectRowInput[]
 }
 
@@ -219,6 +219,19 @@ describe("LaunchSetupsDialog", () => {
     expect(boxes.every((b) => (b as HTMLInputElement).checked)).toBe(true)
   })
 
+  it("submits the shared dependency cache flag for the whole batch", async () => {
+    const { onSubmit, onSubmitted } = renderDialog()
+
+    fireEvent.change(screen.getByLabelText("Repository URL row 1"), {
+      target: { value: "https://github.com/apache/commons-cli.git" },
+    })
+    fireEvent.click(screen.getByLabelText("Shared dependency cache"))
+    fireEvent.click(screen.getByRole("button", { name: "Launch setups" }))
+
+    await waitFor(() => expect(onSubmitted).toHaveBeenCalled())
+    expect(onSubmit).toHaveBeenCalledWith(expect.objectContaining({ shared_cache: true }))
+  })
+
   it("submits the coverage flag per row", async () => {
     const { onSubmit, onSubmitted } = renderDialog()
 
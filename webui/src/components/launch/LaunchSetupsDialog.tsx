@@ -49,6 +49,7 @@ export function LaunchSetupsDialog({
 }: LaunchSetupsDialogProps) {
   const [rows, setRows] = useState<LaunchRowDraft[]>([emptyLaunchRow()])
   const [concurrency, setConcurrency] = useState(String(defaultConcurrency))
+  const [sharedCache, setSharedCache] = useState(false)
   const [rowErrors, setRowErrors] = useState<Record<number, string>>({})
   const [formError, setFormError] = useState<string | null>(null)
   const [submitting, setSubmitting] = useState(false)
@@ -145,6 +146,7 @@ export function LaunchSetupsDialog({
 
     const payload: LaunchBatchRequestBody = {
       concurrency: parsedConcurrency,
+      ...(sharedCache ? { shared_cache: true } : {}),
       projects: submittedIndexes.map((index) => {
         const row = rows[index]
         return {
@@ -222,6 +224,16 @@ export function LaunchSetupsDialog({
               <span className="text-[11px] text-muted-foreground">
                 parallel setups for this batch (1 or more)
               </span>
+              <label className="ml-auto flex items-center gap-2 text-[11px] text-muted-foreground">
+                <input
+                  aria-label="Shared dependency cache"
+                  checked={sharedCache}
+                  className="h-4 w-4 accent-blue-600"
+                  onChange={(event) => setSharedCache(event.target.checked)}
+                  type="checkbox"
+                />
+                shared dependency cache
+              </label>
             </div>
 
             <div className="mt-3 grid grid-cols-[2.2fr_1fr_1.2fr_1.6fr_56px_56px_36px] items-center gap-2">
@@ -0,0 +1,30 @@
+import { describe, expect, it } from "vitest"
+
+import { applyPatch } from "./jsonPatch"
+
+describe("applyPatch", () => {
+  it("applies add, remove and replace without mutating the input", () => {
+    const before = {
+      "a/b": 1,
+      list: [{ x: 1 }, { x: 2 }],
+      gone: true,
+      kept: { deep: [1] },
+    }
+
+    const after = applyPatch(before, [
+      { op: "replace", path: "/a~1b", value: 2 },
+      { op: "add", path: "/list/1/y", value: 0 },
+      { op: "remove", path: "/gone" },
+    ])
+
+    expect(after).toEqual({ "a/b": 2, list: [{ x: 1 }, { x: 2, y: 0 }], kept: { deep: [1] } })
+    expect(before.gone).toBe(true)
+    expect(before.list[1]).toEqual({ x: 2 })
+    expect(after.kept).toBe(before.kept)
+    expect(after.list[0]).toBe(before.list[0])
+  })
+
+  it("replaces the whole document on an empty path", () => {
+    expect(applyPatch({ a: 1 }, [{ op: "replace", path: "", value: { b: 2 } }])).toEqual({ b: 2 })
+  })
+})
@@ -0,0 +1,54 @@
+/** Apply the RFC 6902 subset the dashboard stream emits: add, remove, replace.
+ *
+ * Returns a new document; containers along each patched path are copied, the
+ * rest is shared, so React sees fresh references only where something changed.
+ */
+export interface JsonPatchOp {
+  op: "add" | "remove" | "replace"
+  path: string
+  value?: unknown
+}
+
+type Container = Record<string, unknown> | unknown[]
+
+function unescape(part: string): string {
+  return part.replace(/~1/g, "/").replace(/~0/g, "~")
+}
+
+function shallowCopy(value: unknown): Container {
+  return Array.isArray(value) ? [...value] : { ...(value as Record<string, unknown>) }
+}
+
+export function applyPatch<T>(document: T, ops: JsonPatchOp[]): T {
+  let root: unknown = document
+  for (const op of ops) {
+    if (op.path === "") {
+      root = op.value
+      continue
+    }
+    const parts = op.path.split("/").slice(1).map(unescape)
+    const last = parts.pop() as string
+    const nextRoot = shallowCopy(root)
+    let target: Container = nextRoot
+    for (const part of parts) {
+      const key = Array.isArray(target) ? Number(part) : part
+      const child = shallowCopy((target as Record<string | number, unknown>)[key])
+      ;(target as Record<string | number, unknown>)[key] = child
+      target = child
+    }
+    if (Array.isArray(target)) {
+      const index = Number(last)
+      if (op.op === "remove") {
+        target.splice(index, 1)
+      } else {
+        target[index] = op.value
+      }
+    } else if (op.op === "remove") {
+      delete target[last]
+    } else {
+      target[last] = op.value
+    }
+    root = nextRoot
+  }
+  return root as T
+}